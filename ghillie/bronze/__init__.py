@@ -7,9 +7,16 @@ from .services import (
     RawEventWriter,
     make_dedupe_key,
 )
-from .storage import GithubIngestionOffset, RawEvent, RawEventState, init_bronze_storage
+from .storage import (
+    GithubBackfillSlice,
+    GithubIngestionOffset,
+    RawEvent,
+    RawEventState,
+    init_bronze_storage,
+)
 
 __all__ = [
+    "GithubBackfillSlice",
     "GithubIngestionOffset",
     "RawEvent",
     "RawEventEnvelope",
@@ -7,7 +7,7 @@ import hashlib
 import json
 import typing as typ
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.exc import IntegrityError
 
 from ghillie.bronze.errors import (
@@ -122,6 +122,32 @@ def make_dedupe_key(
     return hashlib.sha256(material.encode("utf-8")).hexdigest()
 
 
+def _prepare_rows(
+    envelopes: cabc.Sequence[RawEventEnvelope],
+) -> dict[str, dict[str, typ.Any]]:
+    """Normalise envelopes into insert rows keyed (and de-duplicated) by dedupe key."""
+    rows: dict[str, dict[str, typ.Any]] = {}
+    for envelope in envelopes:
+        if envelope.occurred_at.tzinfo is None:
+            raise TimezoneAwareRequiredError.for_occurrence()
+        payload_copy = _normalise_payload(envelope.payload)
+        envelope_copy = dc.replace(envelope, payload=payload_copy)
+        dedupe_key = make_dedupe_key(envelope_copy, payload_is_normalised=True)
+        rows.setdefault(
+            dedupe_key,
+            {
+                "source_system": envelope_copy.source_system,
+                "source_event_id": envelope_copy.source_event_id,
+                "event_type": envelope_copy.event_type,
+                "repo_external_id": envelope_copy.repo_external_id,
+                "occurred_at": envelope_copy.occurred_at,
+                "payload": payload_copy,
+                "dedupe_key": dedupe_key,
+            },
+        )
+    return rows
+
+
 class RawEventWriter:
     """Append-only writer that records Bronze events."""
 
@@ -167,6 +193,69 @@ class RawEventWriter:
             await session.refresh(raw_event)
             return raw_event
 
+    async def ingest_many(self, envelopes: cabc.Sequence[RawEventEnvelope]) -> int:
+        """Persist a batch of raw events in one round trip, skipping duplicates.
+
+        Dedupe keys are computed up front, existing keys are looked up with a
+        single ``IN`` query, and the remaining rows are written with one bulk
+        ``INSERT``. If a concurrent writer wins a race and the bulk insert
+        violates the dedupe constraint, the batch falls back to row-by-row
+        inserts so already-present events are skipped rather than failing the
+        whole batch.
+
+        Parameters
+        ----------
+        envelopes : Sequence[RawEventEnvelope]
+            Events to persist. Callers should keep batches to a few hundred
+            rows so the dedupe ``IN`` clause stays within driver limits.
+
+        Returns
+        -------
+        int
+            The number of newly inserted Bronze rows.
+
+        """
+        rows = _prepare_rows(envelopes)
+        if not rows:
+            return 0
+
+        async with self._session_factory() as session:
+            existing = set(
+                (
+                    await session.scalars(
+                        select(RawEvent.dedupe_key).where(
+                            RawEvent.dedupe_key.in_(list(rows))
+                        )
+                    )
+                ).all()
+            )
+            fresh = [row for key, row in rows.items() if key not in existing]
+            if not fresh:
+                return 0
+            try:
+                await session.execute(insert(RawEvent), fresh)
+                await session.commit()
+            except IntegrityError:
+                await session.rollback()
+            else:
+                return len(fresh)
+
+        return await self._ingest_rows_individually(fresh)
+
+    async def _ingest_rows_individually(self, rows: list[dict[str, typ.Any]]) -> int:
+        """Insert prepared rows one at a time, skipping dedupe conflicts."""
+        inserted = 0
+        for row in rows:
+            async with self._session_factory() as session:
+                session.add(RawEvent(**row))
+                try:
+                    await session.commit()
+                except IntegrityError:
+                    await session.rollback()
+                    continue
+                inserted += 1
+        return inserted
+
     @staticmethod
     async def _load_existing(
         session: AsyncSession,
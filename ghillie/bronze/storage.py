@@ -130,6 +130,34 @@ class GithubIngestionOffset(Base):
     )
 
 
+class GithubBackfillSlice(Base):
+    """Completion record for one time slice of a historical GitHub backfill.
+
+    Backfill splits a long history window into slices that are fetched
+    concurrently. Each completed slice is recorded here so an interrupted
+    backfill can be restarted without refetching finished slices.
+    """
+
+    __tablename__ = "github_backfill_slices"
+    __table_args__ = (
+        UniqueConstraint(
+            "repo_external_id",
+            "kind",
+            "slice_start",
+            "slice_end",
+            name="uq_github_backfill_slice",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    repo_external_id: Mapped[str] = mapped_column(String(255))
+    kind: Mapped[str] = mapped_column(String(32))
+    slice_start: Mapped[dt.datetime] = mapped_column(UTCDateTime())
+    slice_end: Mapped[dt.datetime] = mapped_column(UTCDateTime())
+    events_ingested: Mapped[int] = mapped_column(Integer, default=0)
+    completed_at: Mapped[dt.datetime] = mapped_column(UTCDateTime(), default=utcnow)
+
+
 async def init_bronze_storage(engine: AsyncEngine) -> None:
     """Create all tables registered with Base if they are absent."""
     async with engine.begin() as conn:
@@ -23,7 +23,10 @@ The importer:
 
     * wraps each reconciliation in a **single transaction** to avoid partial writes;
     * is **idempotent per estate + commit_sha**; repeated imports of the same
-      commit for the same estate are skipped; and
+      commit for the same estate are skipped;
+    * records every import it applies in ``catalogue_imports``, including
+      imports without a commit SHA, so the latest record versions the estate;
+      and
     * prunes components and edges only within the current estate, and prunes
       repositories only when they are unused across *all* estates.
 """
@@ -221,13 +224,12 @@ class CatalogueImporter:
             )
             await self._reconcile_edges(session, component_index, catalogue, result)
 
-            if commit_sha and existing_import is None:
-                session.add(
-                    CatalogueImportRecord(
-                        estate_id=estate.id,
-                        commit_sha=commit_sha,
-                    )
+            session.add(
+                CatalogueImportRecord(
+                    estate_id=estate.id,
+                    commit_sha=commit_sha or None,
                 )
+            )
 
         return result
 
@@ -203,7 +203,12 @@ class ComponentEdgeRecord(Base):
 
 
 class CatalogueImportRecord(Base):
-    """Audit log of processed catalogue commits per estate."""
+    """Audit log of applied catalogue imports per estate.
+
+    Every import that reconciles the estate appends a record; ``commit_sha``
+    is ``None`` for imports made without one. The latest record therefore
+    versions the estate's catalogue.
+    """
 
     __tablename__ = "catalogue_imports"
     __table_args__ = (
@@ -4,13 +4,18 @@ from .classification import (
     DEFAULT_CLASSIFICATION_CONFIG,
     Classifiable,
     ClassificationConfig,
+    CompiledClassification,
     classify_by_labels,
     classify_by_title,
     classify_commit,
     classify_entity,
+    classify_many,
+    compile_classification,
     is_merge_commit,
 )
 from .models import (
+    BundleLimits,
+    BundleTruncation,
     CommitEvidence,
     ComponentDependencyEvidence,
     ComponentEvidence,
@@ -27,14 +32,32 @@ from .models import (
     WorkType,
     WorkTypeGrouping,
 )
-from .project_service import ProjectEvidenceBundleService
+from .project_service import (
+    ProjectEvidenceBundleService,
+    ProjectRollupInputs,
+    bundle_report_ids,
+)
+from .rolling import RollingBundleMaintainer
+from .rollup_cache import ProjectRollupCache, RollupStaleness
 from .service import EvidenceBundleService
+from .snapshots import (
+    SNAPSHOT_ENCODING,
+    decode_bundle_snapshot,
+    encode_bundle_snapshot,
+    load_bundle_snapshot,
+    store_bundle_snapshot,
+)
+from .storage import init_evidence_storage
 
 __all__ = [
     "DEFAULT_CLASSIFICATION_CONFIG",
+    "SNAPSHOT_ENCODING",
+    "BundleLimits",
+    "BundleTruncation",
     "Classifiable",
     "ClassificationConfig",
     "CommitEvidence",
+    "CompiledClassification",
     "ComponentDependencyEvidence",
     "ComponentEvidence",
     "ComponentRepositorySummary",
@@ -45,15 +68,27 @@ __all__ = [
     "ProjectEvidenceBundle",
     "ProjectEvidenceBundleService",
     "ProjectMetadata",
+    "ProjectRollupCache",
+    "ProjectRollupInputs",
     "PullRequestEvidence",
     "ReportStatus",
     "RepositoryEvidenceBundle",
     "RepositoryMetadata",
+    "RollingBundleMaintainer",
+    "RollupStaleness",
     "WorkType",
     "WorkTypeGrouping",
+    "bundle_report_ids",
     "classify_by_labels",
     "classify_by_title",
     "classify_commit",
     "classify_entity",
+    "classify_many",
+    "compile_classification",
+    "decode_bundle_snapshot",
+    "encode_bundle_snapshot",
+    "init_evidence_storage",
     "is_merge_commit",
+    "load_bundle_snapshot",
+    "store_bundle_snapshot",
 ]
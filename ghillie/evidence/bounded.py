@@ -0,0 +1,514 @@
+"""Memory-bounded evidence loading for very large reporting windows.
+
+``EvidenceBundleService`` uses this path when it is given ``BundleLimits``.
+Uncovered event facts are streamed as narrow rows to collect entity keys and
+fact IDs. Each entity kind is then read in two ways, chunked by key:
+
+- a streamed projection of only the columns classification needs (commit
+  messages, or titles and labels) feeds running counts, work type tallies
+  and sample titles, so no evidence structs are built for the bulk of the
+  window; and
+- a query ordered by significance then recency with ``LIMIT`` fetches the
+  top items, the only rows turned into evidence structs.
+
+Documentation changes are not grouped by work type, so they are counted with
+``COUNT`` in SQL. Bundles built from rolling state are cut to the same limits
+with ``truncate_evidence``, which applies the same significance order in
+Python.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses as dc
+import datetime as dt
+import heapq
+import typing as typ
+
+from sqlalchemy import case, func, or_, select, tuple_
+
+from ghillie.silver.storage import (
+    Commit,
+    DocumentationChange,
+    EventFact,
+    Issue,
+    PullRequest,
+)
+
+from .builders import (
+    COMMIT_EVIDENCE_COLUMNS,
+    DOCUMENTATION_EVIDENCE_COLUMNS,
+    ISSUE_EVIDENCE_COLUMNS,
+    PULL_REQUEST_EVIDENCE_COLUMNS,
+    commit_evidence,
+    documentation_evidence,
+    issue_evidence,
+    pull_request_evidence,
+)
+from .classification import classify_many
+from .event_targets import EventTargetExtractor, EventTargets
+from .models import BundleTruncation, WorkType, WorkTypeGrouping
+from .rolling import WindowEvidence
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from sqlalchemy import ColumnElement, Select
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from .builders import (
+        CommitRow,
+        DocumentationChangeRow,
+        IssueRow,
+        PullRequestRow,
+    )
+    from .classification import ClassificationConfig
+    from .models import (
+        BundleLimits,
+        CommitEvidence,
+        DocumentationEvidence,
+        IssueEvidence,
+        PullRequestEvidence,
+    )
+
+_EARLIEST = dt.datetime.min.replace(tzinfo=dt.UTC)
+_KEY_CHUNK_SIZE = 500
+_STREAM_BATCH_SIZE = 1000
+_SAMPLE_TITLE_LIMIT = 5
+_COMMIT_TITLE_LENGTH = 100
+
+# SQL significance ranks (lower is more significant). Each has a Python twin
+# below so top items can be merged across key chunks and so evidence loaded
+# by other paths is truncated in the same order.
+_COMMIT_RANK = case((func.lower(Commit.message).like("merge %"), 1), else_=0)
+_PULL_REQUEST_RANK = case(
+    (PullRequest.merged_at.is_not(None), 0),
+    (PullRequest.state == "open", 1),
+    else_=2,
+)
+_ISSUE_RANK = case((Issue.state == "open", 0), else_=1)
+_DOC_RANK = case(
+    (or_(DocumentationChange.is_roadmap, DocumentationChange.is_adr), 0), else_=1
+)
+
+
+def _recency(value: dt.datetime | None) -> tuple[bool, dt.datetime]:
+    """Sort key placing newer timestamps higher and missing ones lowest."""
+    return value is not None, value or _EARLIEST
+
+
+def _commit_rank(message: str | None, committed_at: dt.datetime | None) -> tuple:
+    lowered = (message or "").lower()
+    return -int(lowered.startswith("merge ")), *_recency(committed_at)
+
+
+def _pull_request_rank(
+    merged_at: dt.datetime | None, state: str, created_at: dt.datetime
+) -> tuple:
+    rank = 0 if merged_at is not None else 1 if state == "open" else 2
+    return -rank, *_recency(created_at)
+
+
+def _issue_rank(state: str, created_at: dt.datetime) -> tuple:
+    return -int(state != "open"), *_recency(created_at)
+
+
+def _doc_rank(*, is_significant: bool, occurred_at: dt.datetime) -> tuple:
+    return -int(not is_significant), *_recency(occurred_at)
+
+
+class _TopItems[T]:
+    """Keep the ``size`` items with the largest keys, stable for equal keys."""
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._heap: list[tuple[tuple, int, T]] = []
+        self._seen = 0
+
+    def push(self, key: tuple, item: T) -> None:
+        """Offer ``item``; earlier offers win ties."""
+        entry = (key, -self._seen, item)
+        self._seen += 1
+        if len(self._heap) < self._size:
+            heapq.heappush(self._heap, entry)
+        elif self._heap and entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self) -> list[T]:
+        """Return the kept items, largest key first."""
+        ordered = sorted(self._heap, key=lambda entry: entry[:2], reverse=True)
+        return [item for _, _, item in ordered]
+
+
+@dc.dataclass(slots=True)
+class _WorkTypeTally:
+    """Running counts and sample titles for one work type."""
+
+    commit_count: int = 0
+    pr_count: int = 0
+    issue_count: int = 0
+    commit_titles: _TopItems[str] = dc.field(
+        default_factory=lambda: _TopItems(_SAMPLE_TITLE_LIMIT)
+    )
+    pr_titles: _TopItems[str] = dc.field(
+        default_factory=lambda: _TopItems(_SAMPLE_TITLE_LIMIT)
+    )
+    issue_titles: _TopItems[str] = dc.field(
+        default_factory=lambda: _TopItems(_SAMPLE_TITLE_LIMIT)
+    )
+
+    def grouping(self, work_type: WorkType) -> WorkTypeGrouping | None:
+        """Return the grouping for this tally, or None if it is empty."""
+        if not any((self.commit_count, self.pr_count, self.issue_count)):
+            return None
+        titles = [
+            *self.commit_titles.items(),
+            *self.pr_titles.items(),
+            *self.issue_titles.items(),
+        ]
+        return WorkTypeGrouping(
+            work_type=work_type,
+            commit_count=self.commit_count,
+            pr_count=self.pr_count,
+            issue_count=self.issue_count,
+            sample_titles=tuple(titles[:_SAMPLE_TITLE_LIMIT]),
+        )
+
+
+def _chunks[K](keys: cabc.Collection[K]) -> cabc.Iterator[list[K]]:
+    ordered = list(keys)
+    for offset in range(0, len(ordered), _KEY_CHUNK_SIZE):
+        yield ordered[offset : offset + _KEY_CHUNK_SIZE]
+
+
+def _display_order[T](
+    items: list[T], recency: cabc.Callable[[T], dt.datetime | None]
+) -> list[T]:
+    """Order selected items newest first, as the unbounded bundle does."""
+    return sorted(items, key=lambda item: _recency(recency(item)), reverse=True)
+
+
+class BoundedEvidenceLoader:
+    """Aggregate a window in SQL and materialise only its top items."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        classification_config: ClassificationConfig,
+        limits: BundleLimits,
+    ) -> None:
+        """Configure the loader with a session factory and limits."""
+        self._session_factory = session_factory
+        self._classification_config = classification_config
+        self._limits = limits
+        self._tallies: dict[WorkType, _WorkTypeTally] = {}
+
+    async def load(
+        self,
+        repository_id: str,
+        fact_conditions: cabc.Sequence[ColumnElement[bool]],
+    ) -> WindowEvidence:
+        """Load bounded evidence for the facts matching ``fact_conditions``.
+
+        Parameters
+        ----------
+        repository_id
+            The Silver repository whose entities the facts reference.
+        fact_conditions
+            Filters selecting the window's uncovered event facts.
+
+        Returns
+        -------
+        WindowEvidence
+            Top items per category, window-wide work type groupings, all
+            event fact IDs, and a truncation record if any limit was hit.
+
+        """
+        targets, fact_ids = await self._scan_event_facts(fact_conditions)
+        self._tallies = {work_type: _WorkTypeTally() for work_type in WorkType}
+        (
+            (commits, commit_count),
+            (prs, pr_count),
+            (issues, issue_count),
+            (docs, doc_count),
+        ) = await asyncio.gather(
+            self._load_commits(repository_id, targets.commit_shas),
+            self._load_pull_requests(repository_id, targets.pull_request_ids),
+            self._load_issues(repository_id, targets.issue_ids),
+            self._load_doc_changes(repository_id, targets.doc_change_keys),
+        )
+        groupings = [
+            grouping
+            for work_type, tally in self._tallies.items()
+            if (grouping := tally.grouping(work_type)) is not None
+        ]
+        truncation = BundleTruncation(
+            limits=self._limits,
+            commit_count=commit_count,
+            pull_request_count=pr_count,
+            issue_count=issue_count,
+            documentation_change_count=doc_count,
+        )
+        kept = len(commits) + len(prs) + len(issues) + len(docs)
+        return WindowEvidence(
+            commits=commits,
+            pull_requests=prs,
+            issues=issues,
+            documentation_changes=docs,
+            event_fact_ids=fact_ids,
+            work_type_groupings=groupings,
+            truncation=truncation if kept < truncation.total_count else None,
+        )
+
+    async def _scan_event_facts(
+        self, fact_conditions: cabc.Sequence[ColumnElement[bool]]
+    ) -> tuple[EventTargets, list[int]]:
+        """Stream narrow fact rows, collecting entity keys and fact IDs."""
+        extractor = EventTargetExtractor()
+        targets = EventTargets()
+        fact_ids: list[int] = []
+        stmt = (
+            select(EventFact.id, EventFact.event_type, EventFact.payload)
+            .where(*fact_conditions)
+            .order_by(EventFact.occurred_at.desc(), EventFact.id.desc())
+            .execution_options(yield_per=_STREAM_BATCH_SIZE)
+        )
+        async with self._session_factory() as session:
+            result = await session.stream(stmt)
+            async for fact_id, event_type, payload in result:
+                fact_ids.append(fact_id)
+                extractor.add(targets, event_type, payload)
+        return targets, fact_ids
+
+    async def _stream_chunks(
+        self, session: AsyncSession, stmt: Select[typ.Any]
+    ) -> cabc.AsyncIterator[cabc.Sequence[typ.Any]]:
+        """Yield partitions of a streamed narrow projection."""
+        result = await session.stream(
+            stmt.execution_options(yield_per=_STREAM_BATCH_SIZE)
+        )
+        async for partition in result.partitions():
+            yield partition
+
+    async def _load_commits(
+        self, repository_id: str, shas: set[str]
+    ) -> tuple[list[CommitEvidence], int]:
+        config = self._classification_config
+        top: _TopItems[CommitRow] = _TopItems(self._limits.max_commits)
+        total = 0
+        async with self._session_factory() as session:
+            for chunk in _chunks(shas):
+                where = (Commit.repo_id == repository_id, Commit.sha.in_(chunk))
+                narrow = select(Commit.message, Commit.committed_at).where(*where)
+                async for rows in self._stream_chunks(session, narrow):
+                    total += len(rows)
+                    work_types = classify_many(
+                        (message for message, _ in rows), config=config
+                    )
+                    for (message, committed_at), work_type in zip(
+                        rows, work_types, strict=True
+                    ):
+                        if message is not None and message.lower().startswith("merge "):
+                            continue
+                        tally = self._tallies[work_type]
+                        tally.commit_count += 1
+                        if message:
+                            tally.commit_titles.push(
+                                _recency(committed_at),
+                                message[:_COMMIT_TITLE_LENGTH],
+                            )
+                ranked = (
+                    select(*COMMIT_EVIDENCE_COLUMNS)
+                    .where(*where)
+                    .order_by(
+                        _COMMIT_RANK,
+                        Commit.committed_at.is_(None),
+                        Commit.committed_at.desc(),
+                    )
+                    .limit(self._limits.max_commits)
+                )
+                for commit in (await session.execute(ranked)).all():
+                    top.push(_commit_rank(commit.message, commit.committed_at), commit)
+            selected = _display_order(top.items(), lambda c: c.committed_at)
+            evidence = [commit_evidence(c, config) for c in selected]
+        return evidence, total
+
+    async def _load_pull_requests(
+        self, repository_id: str, ids: set[int]
+    ) -> tuple[list[PullRequestEvidence], int]:
+        config = self._classification_config
+        top: _TopItems[PullRequestRow] = _TopItems(self._limits.max_pull_requests)
+        total = 0
+        async with self._session_factory() as session:
+            for chunk in _chunks(ids):
+                where = (
+                    PullRequest.repo_id == repository_id,
+                    PullRequest.id.in_(chunk),
+                )
+                narrow = select(
+                    PullRequest.title, PullRequest.labels, PullRequest.created_at
+                ).where(*where)
+                async for rows in self._stream_chunks(session, narrow):
+                    total += len(rows)
+                    work_types = classify_many(
+                        (title for title, _, _ in rows),
+                        (labels or [] for _, labels, _ in rows),
+                        config,
+                    )
+                    for (title, _, created_at), work_type in zip(
+                        rows, work_types, strict=True
+                    ):
+                        tally = self._tallies[work_type]
+                        tally.pr_count += 1
+                        tally.pr_titles.push(_recency(created_at), title)
+                ranked = (
+                    select(*PULL_REQUEST_EVIDENCE_COLUMNS)
+                    .where(*where)
+                    .order_by(_PULL_REQUEST_RANK, PullRequest.created_at.desc())
+                    .limit(self._limits.max_pull_requests)
+                )
+                for pr in (await session.execute(ranked)).all():
+                    top.push(
+                        _pull_request_rank(pr.merged_at, pr.state, pr.created_at), pr
+                    )
+            selected = _display_order(top.items(), lambda pr: pr.created_at)
+            evidence = [pull_request_evidence(pr, config) for pr in selected]
+        return evidence, total
+
+    async def _load_issues(
+        self, repository_id: str, ids: set[int]
+    ) -> tuple[list[IssueEvidence], int]:
+        config = self._classification_config
+        top: _TopItems[IssueRow] = _TopItems(self._limits.max_issues)
+        total = 0
+        async with self._session_factory() as session:
+            for chunk in _chunks(ids):
+                where = (Issue.repo_id == repository_id, Issue.id.in_(chunk))
+                narrow = select(Issue.title, Issue.labels, Issue.created_at).where(
+                    *where
+                )
+                async for rows in self._stream_chunks(session, narrow):
+                    total += len(rows)
+                    work_types = classify_many(
+                        (title for title, _, _ in rows),
+                        (labels or [] for _, labels, _ in rows),
+                        config,
+                    )
+                    for (title, _, created_at), work_type in zip(
+                        rows, work_types, strict=True
+                    ):
+                        tally = self._tallies[work_type]
+                        tally.issue_count += 1
+                        tally.issue_titles.push(_recency(created_at), title)
+                ranked = (
+                    select(*ISSUE_EVIDENCE_COLUMNS)
+                    .where(*where)
+                    .order_by(_ISSUE_RANK, Issue.created_at.desc())
+                    .limit(self._limits.max_issues)
+                )
+                for issue in (await session.execute(ranked)).all():
+                    top.push(_issue_rank(issue.state, issue.created_at), issue)
+            selected = _display_order(top.items(), lambda issue: issue.created_at)
+            evidence = [issue_evidence(issue, config) for issue in selected]
+        return evidence, total
+
+    async def _load_doc_changes(
+        self, repository_id: str, keys: set[tuple[str, str]]
+    ) -> tuple[list[DocumentationEvidence], int]:
+        top: _TopItems[DocumentationChangeRow] = _TopItems(
+            self._limits.max_documentation_changes
+        )
+        total = 0
+        async with self._session_factory() as session:
+            for chunk in _chunks(keys):
+                where = (
+                    DocumentationChange.repo_id == repository_id,
+                    tuple_(
+                        DocumentationChange.commit_sha, DocumentationChange.path
+                    ).in_(chunk),
+                )
+                total += (
+                    await session.scalar(
+                        select(func.count())
+                        .select_from(DocumentationChange)
+                        .where(*where)
+                    )
+                    or 0
+                )
+                ranked = (
+                    select(*DOCUMENTATION_EVIDENCE_COLUMNS)
+                    .where(*where)
+                    .order_by(_DOC_RANK, DocumentationChange.occurred_at.desc())
+                    .limit(self._limits.max_documentation_changes)
+                )
+                for doc in (await session.execute(ranked)).all():
+                    top.push(
+                        _doc_rank(
+                            is_significant=doc.is_roadmap or doc.is_adr,
+                            occurred_at=doc.occurred_at,
+                        ),
+                        doc,
+                    )
+            selected = _display_order(top.items(), lambda doc: doc.occurred_at)
+        return [documentation_evidence(doc) for doc in selected], total
+
+
+def _keep_top[T](
+    items: list[T], limit: int, rank: cabc.Callable[[T], tuple]
+) -> list[T]:
+    """Keep the ``limit`` most significant items in their original order."""
+    if len(items) <= limit:
+        return items
+    top: _TopItems[int] = _TopItems(limit)
+    for index, item in enumerate(items):
+        top.push(rank(item), index)
+    kept = set(top.items())
+    return [item for index, item in enumerate(items) if index in kept]
+
+
+def truncate_evidence(evidence: WindowEvidence, limits: BundleLimits) -> WindowEvidence:
+    """Cut fully loaded window evidence down to ``limits``.
+
+    Callers compute work type groupings from the full lists first; the
+    returned evidence carries a truncation record if any list was cut.
+    """
+    truncation = BundleTruncation(
+        limits=limits,
+        commit_count=len(evidence.commits),
+        pull_request_count=len(evidence.pull_requests),
+        issue_count=len(evidence.issues),
+        documentation_change_count=len(evidence.documentation_changes),
+    )
+    commits = _keep_top(
+        evidence.commits,
+        limits.max_commits,
+        lambda c: _commit_rank(c.message, c.committed_at),
+    )
+    prs = _keep_top(
+        evidence.pull_requests,
+        limits.max_pull_requests,
+        lambda pr: _pull_request_rank(pr.merged_at, pr.state, pr.created_at),
+    )
+    issues = _keep_top(
+        evidence.issues,
+        limits.max_issues,
+        lambda issue: _issue_rank(issue.state, issue.created_at),
+    )
+    docs = _keep_top(
+        evidence.documentation_changes,
+        limits.max_documentation_changes,
+        lambda doc: _doc_rank(
+            is_significant=doc.is_roadmap or doc.is_adr, occurred_at=doc.occurred_at
+        ),
+    )
+    kept = len(commits) + len(prs) + len(issues) + len(docs)
+    if kept == truncation.total_count:
+        return evidence
+    return dc.replace(
+        evidence,
+        commits=commits,
+        pull_requests=prs,
+        issues=issues,
+        documentation_changes=docs,
+        truncation=truncation,
+    )
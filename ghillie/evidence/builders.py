@@ -0,0 +1,193 @@
+"""Conversion of Silver entity rows into classified evidence structs.
+
+Both the full bundle rebuild in ``EvidenceBundleService`` and the rolling
+bundle maintainer build evidence through these functions, so the two paths
+always classify and shape items identically. Callers converting many rows may
+classify them up front with ``classify_many`` and pass each ``work_type`` in.
+
+The builders read only the columns listed in the ``*_EVIDENCE_COLUMNS``
+tuples. Bundle loaders select those columns as plain rows rather than whole
+ORM entities, which skips identity-map bookkeeping and never loads or decodes
+the JSON ``metadata`` columns; rows expose each column as an attribute, so the
+same builders accept rows and entity instances alike.
+"""
+
+from __future__ import annotations
+
+import typing as typ
+
+from ghillie.silver.storage import Commit, DocumentationChange, Issue, PullRequest
+
+from .classification import classify_commit, classify_entity, is_merge_commit
+from .models import (
+    CommitEvidence,
+    DocumentationEvidence,
+    IssueEvidence,
+    PullRequestEvidence,
+)
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+    import datetime as dt
+
+    from .classification import ClassificationConfig
+    from .models import WorkType
+
+COMMIT_EVIDENCE_COLUMNS = (
+    Commit.sha,
+    Commit.message,
+    Commit.author_name,
+    Commit.author_email,
+    Commit.committed_at,
+)
+PULL_REQUEST_EVIDENCE_COLUMNS = (
+    PullRequest.id,
+    PullRequest.number,
+    PullRequest.title,
+    PullRequest.author_login,
+    PullRequest.state,
+    PullRequest.labels,
+    PullRequest.created_at,
+    PullRequest.merged_at,
+    PullRequest.closed_at,
+    PullRequest.is_draft,
+)
+ISSUE_EVIDENCE_COLUMNS = (
+    Issue.id,
+    Issue.number,
+    Issue.title,
+    Issue.author_login,
+    Issue.state,
+    Issue.labels,
+    Issue.created_at,
+    Issue.closed_at,
+)
+DOCUMENTATION_EVIDENCE_COLUMNS = (
+    DocumentationChange.path,
+    DocumentationChange.change_type,
+    DocumentationChange.commit_sha,
+    DocumentationChange.occurred_at,
+    DocumentationChange.is_roadmap,
+    DocumentationChange.is_adr,
+)
+
+
+class CommitRow(typ.Protocol):
+    """Commit columns read by :func:`commit_evidence`."""
+
+    sha: str
+    message: str | None
+    author_name: str | None
+    author_email: str | None
+    committed_at: dt.datetime | None
+
+
+class PullRequestRow(typ.Protocol):
+    """Pull request columns read by :func:`pull_request_evidence`."""
+
+    id: int
+    number: int
+    title: str
+    author_login: str | None
+    state: str
+    labels: cabc.Sequence[str]
+    created_at: dt.datetime
+    merged_at: dt.datetime | None
+    closed_at: dt.datetime | None
+    is_draft: bool
+
+
+class IssueRow(typ.Protocol):
+    """Issue columns read by :func:`issue_evidence`."""
+
+    id: int
+    number: int
+    title: str
+    author_login: str | None
+    state: str
+    labels: cabc.Sequence[str]
+    created_at: dt.datetime
+    closed_at: dt.datetime | None
+
+
+class DocumentationChangeRow(typ.Protocol):
+    """Documentation change columns read by :func:`documentation_evidence`."""
+
+    path: str
+    change_type: str
+    commit_sha: str
+    occurred_at: dt.datetime
+    is_roadmap: bool
+    is_adr: bool
+
+
+def commit_evidence(
+    commit: CommitRow,
+    config: ClassificationConfig,
+    *,
+    work_type: WorkType | None = None,
+) -> CommitEvidence:
+    """Convert a commit row or entity into classified commit evidence."""
+    return CommitEvidence(
+        sha=commit.sha,
+        message=commit.message,
+        author_name=commit.author_name,
+        author_email=commit.author_email,
+        committed_at=commit.committed_at,
+        work_type=work_type or classify_commit(commit, config),
+        is_merge_commit=is_merge_commit(commit),
+    )
+
+
+def pull_request_evidence(
+    pr: PullRequestRow,
+    config: ClassificationConfig,
+    *,
+    work_type: WorkType | None = None,
+) -> PullRequestEvidence:
+    """Convert a pull request row or entity into classified pull request evidence."""
+    return PullRequestEvidence(
+        id=pr.id,
+        number=pr.number,
+        title=pr.title,
+        author_login=pr.author_login,
+        state=pr.state,
+        labels=tuple(pr.labels),
+        created_at=pr.created_at,
+        merged_at=pr.merged_at,
+        closed_at=pr.closed_at,
+        work_type=work_type or classify_entity(pr, config),
+        is_draft=pr.is_draft,
+    )
+
+
+def issue_evidence(
+    issue: IssueRow,
+    config: ClassificationConfig,
+    *,
+    work_type: WorkType | None = None,
+) -> IssueEvidence:
+    """Convert an issue row or entity into classified issue evidence."""
+    return IssueEvidence(
+        id=issue.id,
+        number=issue.number,
+        title=issue.title,
+        author_login=issue.author_login,
+        state=issue.state,
+        labels=tuple(issue.labels),
+        created_at=issue.created_at,
+        closed_at=issue.closed_at,
+        work_type=work_type or classify_entity(issue, config),
+    )
+
+
+def documentation_evidence(doc: DocumentationChangeRow) -> DocumentationEvidence:
+    """Convert a documentation change row or entity into documentation evidence."""
+    return DocumentationEvidence(
+        path=doc.path,
+        change_type=doc.change_type,
+        commit_sha=doc.commit_sha,
+        occurred_at=doc.occurred_at,
+        is_roadmap=doc.is_roadmap,
+        is_adr=doc.is_adr,
+    )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import dataclasses as dc
 import functools
 import re
 import typing as typ
@@ -13,8 +14,6 @@ from .models import WorkType
 if typ.TYPE_CHECKING:
     import collections.abc as cabc
 
-    from ghillie.silver.storage import Commit
-
 
 @typ.runtime_checkable
 class Classifiable(typ.Protocol):
@@ -34,6 +33,15 @@ class Classifiable(typ.Protocol):
         ...
 
 
+class CommitMessage(typ.Protocol):
+    """Protocol for commits, or commit rows, classified by their message."""
+
+    @property
+    def message(self) -> str | None:
+        """Commit message, if recorded."""
+        ...
+
+
 @functools.lru_cache(maxsize=32)
 def _compile_patterns(patterns: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
     """Compile a tuple of regex pattern strings into Pattern objects.
@@ -153,29 +161,121 @@ class ClassificationConfig(msgspec.Struct, kw_only=True, frozen=True):
 # Default configuration instance
 DEFAULT_CLASSIFICATION_CONFIG = ClassificationConfig()
 
+# Precedence of each rule set, highest first. Labels are checked before titles;
+# conventional-commit prefixes are checked before general title patterns, with
+# chore ahead of feature so "ci: fix X" is CHORE rather than BUG. General
+# patterns put bug first as it typically requires immediate attention and
+# chore last as the least specific category.
+_LABEL_PRECEDENCE = (
+    (WorkType.BUG, "bug_labels"),
+    (WorkType.FEATURE, "feature_labels"),
+    (WorkType.REFACTOR, "refactor_labels"),
+    (WorkType.DOCUMENTATION, "documentation_labels"),
+    (WorkType.CHORE, "chore_labels"),
+)
+_PREFIX_PRECEDENCE = (
+    (WorkType.BUG, "bug_title_patterns"),
+    (WorkType.CHORE, "chore_title_patterns"),
+    (WorkType.FEATURE, "feature_title_patterns"),
+    (WorkType.REFACTOR, "refactor_title_patterns"),
+)
+_GENERAL_PRECEDENCE = (
+    (WorkType.BUG, "bug_title_patterns"),
+    (WorkType.FEATURE, "feature_title_patterns"),
+    (WorkType.REFACTOR, "refactor_title_patterns"),
+    (WorkType.CHORE, "chore_title_patterns"),
+)
+
 
 def _normalise_label(label: str) -> str:
     """Normalise a label for comparison."""
     return label.strip().lower()
 
 
-def _labels_match(labels: cabc.Sequence[str], patterns: tuple[str, ...]) -> bool:
-    """Check if any label matches the pattern set."""
-    normalised_patterns = {_normalise_label(p) for p in patterns}
-    return any(_normalise_label(label) in normalised_patterns for label in labels)
+def _compile_title_regex(
+    branches: cabc.Sequence[tuple[WorkType, str]],
+) -> tuple[re.Pattern[str] | None, dict[str, WorkType]]:
+    r"""Combine title patterns into one regex matched at the start of a title.
 
+    Each branch is a lookahead that succeeds when its pattern matches anywhere
+    in the title, followed by an empty named group identifying the branch.
+    Alternation tries branches in order, so ``match(...).lastgroup`` names the
+    highest-precedence pattern that matches, exactly as testing each pattern
+    in turn would. ``^`` keeps its meaning inside the lookahead because
+    ``[\s\S]*?`` can only reach the start of the title by matching nothing.
+    """
+    if not branches:
+        return None, {}
+    groups = {f"_wt{index}": work_type for index, (work_type, _) in enumerate(branches)}
+    alternatives = (
+        rf"(?=[\s\S]*?(?:{pattern}))(?P<_wt{index}>)"
+        for index, (_, pattern) in enumerate(branches)
+    )
+    return re.compile("|".join(alternatives), re.IGNORECASE), groups
 
-def _title_matches_compiled(title: str, patterns: tuple[re.Pattern[str], ...]) -> bool:
-    """Check if title matches any precompiled regex pattern."""
-    lowered = title.lower()
-    return any(pattern.search(lowered) for pattern in patterns)
 
+@dc.dataclass(frozen=True, slots=True)
+class CompiledClassification:
+    """Classification rules compiled for single-pass evaluation.
 
-def _prefix_only_compiled(
-    patterns: tuple[re.Pattern[str], ...],
-) -> tuple[re.Pattern[str], ...]:
-    """Filter to keep only patterns that start with ^."""
-    return tuple(p for p in patterns if p.pattern.startswith("^"))
+    Labels are folded into one dictionary from normalised label to work type
+    and precedence rank, and every title pattern into a single regex, so
+    classifying an item costs one dictionary lookup per label and at most one
+    regex match regardless of how many rules are configured.
+    """
+
+    labels: dict[str, tuple[int, WorkType]]
+    title_regex: re.Pattern[str] | None
+    title_groups: dict[str, WorkType]
+
+    def by_labels(self, labels: cabc.Iterable[str]) -> WorkType | None:
+        """Return the highest-precedence work type named by ``labels``."""
+        best: tuple[int, WorkType] | None = None
+        for label in labels:
+            hit = self.labels.get(_normalise_label(label))
+            if hit is not None and (best is None or hit[0] < best[0]):
+                best = hit
+        return best[1] if best is not None else None
+
+    def by_title(self, title: str | None) -> WorkType | None:
+        """Return the work type of the first title rule ``title`` matches."""
+        if title is None or self.title_regex is None:
+            return None
+        match = self.title_regex.match(title.lower())
+        if match is None or match.lastgroup is None:
+            return None
+        return self.title_groups[match.lastgroup]
+
+    def classify(self, labels: cabc.Iterable[str], title: str | None) -> WorkType:
+        """Classify by labels, then title, falling back to UNKNOWN."""
+        return self.by_labels(labels) or self.by_title(title) or WorkType.UNKNOWN
+
+
+@functools.lru_cache(maxsize=32)
+def compile_classification(config: ClassificationConfig) -> CompiledClassification:
+    """Compile ``config`` into a reusable single-pass classifier.
+
+    Results are cached per configuration, so repeated calls are cheap.
+    """
+    labels: dict[str, tuple[int, WorkType]] = {}
+    for rank, (work_type, field) in enumerate(_LABEL_PRECEDENCE):
+        for label in getattr(config, field):
+            labels.setdefault(_normalise_label(label), (rank, work_type))
+    branches = [
+        (work_type, pattern)
+        for work_type, field in _PREFIX_PRECEDENCE
+        for pattern in getattr(config, field)
+        if pattern.startswith("^")
+    ]
+    branches.extend(
+        (work_type, pattern)
+        for work_type, field in _GENERAL_PRECEDENCE
+        for pattern in getattr(config, field)
+    )
+    title_regex, title_groups = _compile_title_regex(branches)
+    return CompiledClassification(
+        labels=labels, title_regex=title_regex, title_groups=title_groups
+    )
 
 
 def classify_by_labels(
@@ -197,63 +297,7 @@ def classify_by_labels(
         The classified work type, or None if no match.
 
     """
-    # Order matters: more specific types first
-    if _labels_match(labels, config.bug_labels):
-        return WorkType.BUG
-    if _labels_match(labels, config.feature_labels):
-        return WorkType.FEATURE
-    if _labels_match(labels, config.refactor_labels):
-        return WorkType.REFACTOR
-    if _labels_match(labels, config.documentation_labels):
-        return WorkType.DOCUMENTATION
-    if _labels_match(labels, config.chore_labels):
-        return WorkType.CHORE
-    return None
-
-
-def _classify_by_prefix_patterns(
-    title: str,
-    config: ClassificationConfig,
-) -> WorkType | None:
-    """Classify by prefix patterns (conventional commits).
-
-    Order: bug > chore > feature > refactor
-    (Chore before feature so "ci: fix X" is CHORE not BUG)
-    """
-    bug_prefixes = _prefix_only_compiled(config.compiled_bug_patterns)
-    if _title_matches_compiled(title, bug_prefixes):
-        return WorkType.BUG
-    chore_prefixes = _prefix_only_compiled(config.compiled_chore_patterns)
-    if _title_matches_compiled(title, chore_prefixes):
-        return WorkType.CHORE
-    feature_prefixes = _prefix_only_compiled(config.compiled_feature_patterns)
-    if _title_matches_compiled(title, feature_prefixes):
-        return WorkType.FEATURE
-    refactor_prefixes = _prefix_only_compiled(config.compiled_refactor_patterns)
-    if _title_matches_compiled(title, refactor_prefixes):
-        return WorkType.REFACTOR
-    return None
-
-
-def _classify_by_general_patterns(
-    title: str,
-    config: ClassificationConfig,
-) -> WorkType | None:
-    """Classify by general patterns.
-
-    Order: bug > feature > refactor > chore
-    (Bug first as it typically requires immediate attention;
-    chore last as it's the least specific category)
-    """
-    if _title_matches_compiled(title, config.compiled_bug_patterns):
-        return WorkType.BUG
-    if _title_matches_compiled(title, config.compiled_feature_patterns):
-        return WorkType.FEATURE
-    if _title_matches_compiled(title, config.compiled_refactor_patterns):
-        return WorkType.REFACTOR
-    if _title_matches_compiled(title, config.compiled_chore_patterns):
-        return WorkType.CHORE
-    return None
+    return compile_classification(config).by_labels(labels)
 
 
 def classify_by_title(
@@ -275,48 +319,39 @@ def classify_by_title(
         The classified work type, or None if no match.
 
     """
-    if title is None:
-        return None
-
-    # First check prefix patterns (conventional commits), then general patterns
-    return _classify_by_prefix_patterns(title, config) or _classify_by_general_patterns(
-        title, config
-    )
+    return compile_classification(config).by_title(title)
 
 
-def _classify_by_labels_then_title(
-    labels: cabc.Sequence[str],
-    title: str | None,
+def classify_many(
+    titles: cabc.Iterable[str | None],
+    labels: cabc.Iterable[cabc.Sequence[str]] | None = None,
     config: ClassificationConfig = DEFAULT_CLASSIFICATION_CONFIG,
-) -> WorkType:
-    """Classify work type by labels then title, with UNKNOWN as fallback.
-
-    Labels take precedence because they represent explicit author intent.
+) -> list[WorkType]:
+    """Classify a batch of items with one compiled rule set.
 
     Parameters
     ----------
+    titles
+        Title or commit message of each item.
     labels
-        Sequence of labels to check.
-    title
-        Title or message to check.
+        Labels of each item, parallel to ``titles``; omit for commits, which
+        are classified by message alone.
     config
         Classification configuration.
 
     Returns
     -------
-    WorkType
-        The classified work type.
+    list[WorkType]
+        The work type of each item, in input order.
 
     """
-    by_labels = classify_by_labels(labels, config)
-    if by_labels is not None:
-        return by_labels
-
-    by_title = classify_by_title(title, config)
-    if by_title is not None:
-        return by_title
-
-    return WorkType.UNKNOWN
+    compiled = compile_classification(config)
+    if labels is None:
+        return [compiled.by_title(title) or WorkType.UNKNOWN for title in titles]
+    return [
+        compiled.classify(item_labels, title)
+        for title, item_labels in zip(titles, labels, strict=True)
+    ]
 
 
 def classify_entity(
@@ -340,11 +375,11 @@ def classify_entity(
         The classified work type.
 
     """
-    return _classify_by_labels_then_title(entity.labels, entity.title, config)
+    return compile_classification(config).classify(entity.labels, entity.title)
 
 
 def classify_commit(
-    commit: Commit,
+    commit: CommitMessage,
     config: ClassificationConfig = DEFAULT_CLASSIFICATION_CONFIG,
 ) -> WorkType:
     """Classify a commit by its message.
@@ -362,13 +397,10 @@ def classify_commit(
         The classified work type.
 
     """
-    by_title = classify_by_title(commit.message, config)
-    if by_title is not None:
-        return by_title
-    return WorkType.UNKNOWN
+    return compile_classification(config).by_title(commit.message) or WorkType.UNKNOWN
 
 
-def is_merge_commit(commit: Commit) -> bool:
+def is_merge_commit(commit: CommitMessage) -> bool:
     """Determine if a commit appears to be a merge commit.
 
     Parameters
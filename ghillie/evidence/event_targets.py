@@ -76,13 +76,20 @@ class EventTargetExtractor:
         "github.doc_change": _handle_doc_change_event,
     }
 
+    def add(
+        self,
+        targets: EventTargets,
+        event_type: str,
+        payload: dict[str, typ.Any] | None,
+    ) -> None:
+        """Add the identifiers referenced by one event fact to ``targets``."""
+        handler = self._EVENT_HANDLERS.get(event_type)
+        if handler is not None:
+            handler(self, targets, payload or {})
+
     def extract(self, event_facts: list[EventFact]) -> EventTargets:
         """Extract entity identifiers from uncovered event facts."""
         targets = EventTargets()
-        handlers = self._EVENT_HANDLERS
         for fact in event_facts:
-            handler = handlers.get(fact.event_type)
-            if handler is None:
-                continue
-            handler(self, targets, fact.payload or {})
+            self.add(targets, fact.event_type, fact.payload)
         return targets
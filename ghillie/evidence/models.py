@@ -274,6 +274,78 @@ class WorkTypeGrouping(msgspec.Struct, kw_only=True, frozen=True):
     sample_titles: tuple[str, ...] = ()
 
 
+class BundleLimits(msgspec.Struct, kw_only=True, frozen=True):
+    """Caps on the evidence items a repository bundle materialises.
+
+    Bundles built with limits still count and group every item in the window,
+    but only carry the most significant items of each category as evidence.
+
+    Attributes
+    ----------
+    max_commits
+        Maximum commits included; non-merge commits rank first, then recency.
+    max_pull_requests
+        Maximum pull requests included; merged, then open, then closed pull
+        requests, each by recency.
+    max_issues
+        Maximum issues included; open issues rank first, then recency.
+    max_documentation_changes
+        Maximum documentation changes included; roadmap and ADR changes rank
+        first, then recency.
+
+    """
+
+    max_commits: int = 200
+    max_pull_requests: int = 100
+    max_issues: int = 100
+    max_documentation_changes: int = 100
+
+    @classmethod
+    def uniform(cls, limit: int) -> BundleLimits:
+        """Return limits that cap every category at ``limit`` items."""
+        return cls(
+            max_commits=limit,
+            max_pull_requests=limit,
+            max_issues=limit,
+            max_documentation_changes=limit,
+        )
+
+
+class BundleTruncation(msgspec.Struct, kw_only=True, frozen=True):
+    """Record of a bundle whose evidence was cut down to its limits.
+
+    Attributes
+    ----------
+    limits
+        The limits applied when the bundle was built.
+    commit_count
+        Commits in the window before truncation.
+    pull_request_count
+        Pull requests in the window before truncation.
+    issue_count
+        Issues in the window before truncation.
+    documentation_change_count
+        Documentation changes in the window before truncation.
+
+    """
+
+    limits: BundleLimits
+    commit_count: int = 0
+    pull_request_count: int = 0
+    issue_count: int = 0
+    documentation_change_count: int = 0
+
+    @property
+    def total_count(self) -> int:
+        """Return the number of events in the window before truncation."""
+        return (
+            self.commit_count
+            + self.pull_request_count
+            + self.issue_count
+            + self.documentation_change_count
+        )
+
+
 class RepositoryEvidenceBundle(msgspec.Struct, kw_only=True, frozen=True):
     """Complete evidence bundle for a repository reporting window.
 
@@ -304,6 +376,10 @@ class RepositoryEvidenceBundle(msgspec.Struct, kw_only=True, frozen=True):
         IDs of EventFact records covered by this bundle.
     generated_at
         When this bundle was generated.
+    truncation
+        Window totals and limits when the evidence lists hold only the most
+        significant items of a larger window; ``None`` for complete bundles.
+        Work type groupings always describe the whole window.
 
     """
 
@@ -318,10 +394,18 @@ class RepositoryEvidenceBundle(msgspec.Struct, kw_only=True, frozen=True):
     work_type_groupings: tuple[WorkTypeGrouping, ...] = ()
     event_fact_ids: tuple[int, ...] = ()
     generated_at: dt.datetime | None = None
+    truncation: BundleTruncation | None = None
+
+    @property
+    def is_truncated(self) -> bool:
+        """Return True if the evidence lists omit items from the window."""
+        return self.truncation is not None
 
     @property
     def total_event_count(self) -> int:
-        """Return total number of events in the bundle."""
+        """Return total number of events in the window."""
+        if self.truncation is not None:
+            return self.truncation.total_count
         return (
             len(self.commits)
             + len(self.pull_requests)
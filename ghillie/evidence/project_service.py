@@ -30,12 +30,14 @@ Example:
 
 from __future__ import annotations
 
+import dataclasses as dc
 import typing as typ
 
 from sqlalchemy import func, select
 from sqlalchemy.orm import selectinload
 
 from ghillie.catalogue.storage import (
+    CatalogueImportRecord,
     ComponentEdgeRecord,
     ComponentRecord,
     ProjectRecord,
@@ -55,9 +57,82 @@ from .models import (
 )
 
 if typ.TYPE_CHECKING:
+    from sqlalchemy import ColumnElement, Subquery
     from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 
+@dc.dataclass(frozen=True, slots=True)
+class ProjectRollupInputs:
+    """Identify the data a project evidence bundle is derived from.
+
+    Attributes
+    ----------
+    repository_ids
+        Catalogue repository IDs of the project's components.
+    report_ids
+        IDs of the Gold reports the bundle reads: the latest report of each
+        component repository and the previous project reports.
+    catalogue_version
+        ID of the estate's latest catalogue import, which moves whenever the
+        catalogue is re-imported, for example after a component edge changes.
+
+    """
+
+    repository_ids: frozenset[str] = frozenset()
+    report_ids: frozenset[str] = frozenset()
+    catalogue_version: int | None = None
+
+
+def _latest_repository_reports(
+    *repository_conditions: ColumnElement[bool],
+) -> Subquery:
+    """Rank repository reports newest first for matching Silver repositories.
+
+    The database discards older rows, so callers join on ``rn == 1`` instead
+    of loading every report into Python. The repository filter is applied as
+    a subquery so the statement does not grow with the estate.
+    """
+    row_num = (
+        func.row_number()
+        .over(
+            partition_by=Report.repository_id,
+            order_by=Report.generated_at.desc(),
+        )
+        .label("rn")
+    )
+    return (
+        select(Report.id, Report.repository_id, row_num)
+        .where(
+            Report.scope == ReportScope.REPOSITORY,
+            Report.repository_id.in_(
+                select(Repository.id).where(*repository_conditions)
+            ),
+        )
+        .subquery()
+    )
+
+
+def _ranked_project_reports(estate_id: str) -> Subquery:
+    """Rank each estate project's reports by descending window end."""
+    row_num = (
+        func.row_number()
+        .over(
+            partition_by=Report.project_id,
+            order_by=Report.window_end.desc(),
+        )
+        .label("rn")
+    )
+    return (
+        select(Report.id, ReportProject.key.label("project_key"), row_num)
+        .join(ReportProject, Report.project_id == ReportProject.id)
+        .where(
+            Report.scope == ReportScope.PROJECT,
+            ReportProject.estate_id == estate_id,
+        )
+        .subquery()
+    )
+
+
 class ProjectEvidenceBundleService:
     """Generates project-level evidence bundles from catalogue and Gold data.
 
@@ -126,21 +201,169 @@ class ProjectEvidenceBundleService:
             project_record = await self._fetch_project(
                 cat_session, project_key, estate_id
             )
-            components = project_record.components
-            edges = await self._fetch_edges(cat_session, components)
-            repo_slug_by_cat_id = self._collect_repo_slugs(components)
+            edges = await self._fetch_edges(cat_session, project_record.components)
+            repo_slug_by_cat_id = self._collect_repo_slugs(project_record.components)
 
         async with self._gold_session_factory() as gold_session:
             summaries_by_cat_id = await self._fetch_latest_summaries(
-                gold_session, set(repo_slug_by_cat_id.keys()), estate_id
+                gold_session,
+                Repository.catalogue_repository_id.in_(list(repo_slug_by_cat_id)),
+                Repository.estate_id == estate_id,
             )
             previous_reports = await self._fetch_previous_project_reports(
                 gold_session, project_key, estate_id
             )
 
+        return self._assemble_bundle(
+            project_record, edges, summaries_by_cat_id, previous_reports
+        )
+
+    async def build_bundles_for_estate(
+        self,
+        estate_id: str,
+    ) -> list[ProjectEvidenceBundle]:
+        """Build evidence bundles for every project in an estate.
+
+        Projects, components, edges, latest repository reports, and previous
+        project reports are each loaded once for the whole estate, so an
+        estate rollup costs a constant number of queries however many
+        projects it covers. Each bundle matches what :meth:`build_bundle`
+        returns for the same project.
+
+        Parameters
+        ----------
+        estate_id
+            The estate whose projects should be summarised.
+
+        Returns
+        -------
+        list[ProjectEvidenceBundle]
+            One bundle per catalogue project, ordered by project key.
+
+        """
+        async with self._catalogue_session_factory() as cat_session:
+            projects = await self._fetch_estate_projects(cat_session, estate_id)
+            edges_by_component = await self._fetch_estate_edges(cat_session, estate_id)
+
+        async with self._gold_session_factory() as gold_session:
+            summaries_by_cat_id = await self._fetch_latest_summaries(
+                gold_session,
+                Repository.catalogue_repository_id.is_not(None),
+                Repository.estate_id == estate_id,
+            )
+            previous_by_project = await self._fetch_estate_previous_reports(
+                gold_session, estate_id
+            )
+
+        return [
+            self._assemble_bundle(
+                project,
+                [
+                    edge
+                    for component in project.components
+                    for edge in edges_by_component.get(component.id, ())
+                ],
+                summaries_by_cat_id,
+                previous_by_project.get(project.key, []),
+            )
+            for project in projects
+        ]
+
+    async def fetch_rollup_inputs(
+        self,
+        estate_id: str,
+    ) -> dict[str, ProjectRollupInputs]:
+        """Identify the inputs of every project bundle in an estate.
+
+        Reads only identifiers, in four queries regardless of estate size, so
+        callers caching bundles can tell which ones are out of date without
+        rebuilding them. The report IDs match those recorded in a bundle built
+        from the same data (see :func:`bundle_report_ids`).
+
+        Parameters
+        ----------
+        estate_id
+            The estate whose projects should be inspected.
+
+        Returns
+        -------
+        dict[str, ProjectRollupInputs]
+            Inputs keyed by project key, including projects without
+            components or reports.
+
+        """
+        async with self._catalogue_session_factory() as cat_session:
+            component_stmt = (
+                select(ProjectRecord.key, ComponentRecord.repository_id)
+                .outerjoin(
+                    ComponentRecord, ComponentRecord.project_id == ProjectRecord.id
+                )
+                .where(ProjectRecord.estate_id == estate_id)
+            )
+            repository_ids: dict[str, set[str]] = {}
+            for project_key, repository_id in (
+                await cat_session.execute(component_stmt)
+            ).tuples():
+                project_repos = repository_ids.setdefault(project_key, set())
+                if repository_id is not None:
+                    project_repos.add(repository_id)
+            catalogue_version = await cat_session.scalar(
+                select(func.max(CatalogueImportRecord.id)).where(
+                    CatalogueImportRecord.estate_id == estate_id
+                )
+            )
+
+        async with self._gold_session_factory() as gold_session:
+            latest = _latest_repository_reports(
+                Repository.catalogue_repository_id.is_not(None),
+                Repository.estate_id == estate_id,
+            )
+            latest_stmt = (
+                select(Repository.catalogue_repository_id, latest.c.id)
+                .join(latest, latest.c.repository_id == Repository.id)
+                .where(latest.c.rn == 1)
+            )
+            report_by_cat_id = {
+                cat_id: report_id
+                for cat_id, report_id in (
+                    await gold_session.execute(latest_stmt)
+                ).tuples()
+                if cat_id is not None
+            }
+            ranked = _ranked_project_reports(estate_id)
+            previous_stmt = select(ranked.c.project_key, ranked.c.id).where(
+                ranked.c.rn <= self._max_previous_reports
+            )
+            previous_by_project: dict[str, set[str]] = {}
+            for project_key, report_id in (
+                await gold_session.execute(previous_stmt)
+            ).tuples():
+                previous_by_project.setdefault(project_key, set()).add(report_id)
+
+        return {
+            project_key: ProjectRollupInputs(
+                repository_ids=frozenset(repos),
+                report_ids=frozenset(
+                    report_by_cat_id[repo] for repo in repos if repo in report_by_cat_id
+                )
+                | frozenset(previous_by_project.get(project_key, ())),
+                catalogue_version=catalogue_version,
+            )
+            for project_key, repos in repository_ids.items()
+        }
+
+    def _assemble_bundle(
+        self,
+        project_record: ProjectRecord,
+        edges: list[ComponentEdgeRecord],
+        summaries_by_cat_id: dict[str, ComponentRepositorySummary],
+        previous_reports: list[PreviousReportSummary],
+    ) -> ProjectEvidenceBundle:
+        """Combine loaded catalogue and report data into a project bundle."""
+        components = project_record.components
         component_key_by_id = {c.id: c.key for c in components}
         component_evidence = self._build_component_evidence(
-            components, repo_slug_by_cat_id, summaries_by_cat_id
+            components, self._collect_repo_slugs(components), summaries_by_cat_id
         )
         dependency_evidence = self._build_dependency_evidence(
             edges, component_key_by_id
@@ -197,6 +420,44 @@ class ProjectEvidenceBundleService:
         )
         return list((await session.scalars(stmt)).all())
 
+    async def _fetch_estate_projects(
+        self,
+        session: AsyncSession,
+        estate_id: str,
+    ) -> list[ProjectRecord]:
+        """Fetch every project in an estate with eagerly loaded components."""
+        stmt = (
+            select(ProjectRecord)
+            .where(ProjectRecord.estate_id == estate_id)
+            .options(
+                selectinload(ProjectRecord.components).selectinload(
+                    ComponentRecord.repository
+                ),
+            )
+            .order_by(ProjectRecord.key)
+        )
+        return list((await session.scalars(stmt)).all())
+
+    async def _fetch_estate_edges(
+        self,
+        session: AsyncSession,
+        estate_id: str,
+    ) -> dict[str, list[ComponentEdgeRecord]]:
+        """Fetch all edges leaving an estate's components, keyed by source."""
+        stmt = (
+            select(ComponentEdgeRecord)
+            .join(
+                ComponentRecord,
+                ComponentEdgeRecord.from_component_id == ComponentRecord.id,
+            )
+            .join(ProjectRecord, ComponentRecord.project_id == ProjectRecord.id)
+            .where(ProjectRecord.estate_id == estate_id)
+        )
+        edges_by_component: dict[str, list[ComponentEdgeRecord]] = {}
+        for edge in await session.scalars(stmt):
+            edges_by_component.setdefault(edge.from_component_id, []).append(edge)
+        return edges_by_component
+
     def _collect_repo_slugs(self, components: list[ComponentRecord]) -> dict[str, str]:
         """Map catalogue_repository_id to owner/name slug."""
         result: dict[str, str] = {}
@@ -212,19 +473,15 @@ class ProjectEvidenceBundleService:
     async def _fetch_latest_summaries(
         self,
         session: AsyncSession,
-        catalogue_repo_ids: set[str],
-        estate_id: str,
+        *repository_conditions: ColumnElement[bool],
     ) -> dict[str, ComponentRepositorySummary]:
-        """Fetch latest repo reports for each catalogue repository ID."""
-        if not catalogue_repo_ids:
-            return {}
+        """Fetch latest repo reports for Silver repositories matching conditions.
 
-        # Find Silver repositories linked to these catalogue IDs,
-        # scoped to the requested estate.
-        repo_stmt = select(Repository).where(
-            Repository.catalogue_repository_id.in_(catalogue_repo_ids),
-            Repository.estate_id == estate_id,
-        )
+        The conditions select the Silver repositories of interest (for
+        example, those linked to a project's catalogue repositories within an
+        estate). Summaries are keyed by catalogue repository ID.
+        """
+        repo_stmt = select(Repository).where(*repository_conditions)
         silver_repos = list((await session.scalars(repo_stmt)).all())
         if not silver_repos:
             return {}
@@ -235,27 +492,8 @@ class ProjectEvidenceBundleService:
             for r in silver_repos
             if r.catalogue_repository_id is not None
         }
-        silver_repo_ids = list(cat_id_by_silver_id.keys())
-
-        # Fetch only the latest report per repository using a window
-        # function so the database discards older rows instead of
-        # loading them all into Python.
-        row_num = (
-            func.row_number()
-            .over(
-                partition_by=Report.repository_id,
-                order_by=Report.generated_at.desc(),
-            )
-            .label("rn")
-        )
-        ranked = (
-            select(Report.id, row_num)
-            .where(
-                Report.scope == ReportScope.REPOSITORY,
-                Report.repository_id.in_(silver_repo_ids),
-            )
-            .subquery()
-        )
+
+        ranked = _latest_repository_reports(*repository_conditions)
         report_stmt = select(Report).join(
             ranked,
             (Report.id == ranked.c.id) & (ranked.c.rn == 1),
@@ -314,6 +552,34 @@ class ProjectEvidenceBundleService:
 
         return [self._build_previous_report_summary(r) for r in reports]
 
+    async def _fetch_estate_previous_reports(
+        self,
+        session: AsyncSession,
+        estate_id: str,
+    ) -> dict[str, list[PreviousReportSummary]]:
+        """Fetch previous project-scope reports for every project in an estate.
+
+        Returns summaries keyed by project key, newest first, keeping at most
+        ``max_previous_reports`` per project.
+        """
+        ranked = _ranked_project_reports(estate_id)
+        stmt = (
+            select(ranked.c.project_key, Report)
+            .select_from(Report)
+            .join(
+                ranked,
+                (Report.id == ranked.c.id)
+                & (ranked.c.rn <= self._max_previous_reports),
+            )
+            .order_by(ranked.c.project_key, ranked.c.rn)
+        )
+        previous_by_project: dict[str, list[PreviousReportSummary]] = {}
+        for project_key, report in (await session.execute(stmt)).tuples():
+            previous_by_project.setdefault(project_key, []).append(
+                self._build_previous_report_summary(report)
+            )
+        return previous_by_project
+
     # ------------------------------------------------------------------
     # Evidence builders
     # ------------------------------------------------------------------
@@ -426,3 +692,12 @@ class ProjectEvidenceBundleService:
                     return ReportStatus(str(status).lower())
                 except ValueError:
                     return ReportStatus.UNKNOWN
+
+
+def bundle_report_ids(bundle: ProjectEvidenceBundle) -> frozenset[str]:
+    """Return the IDs of the Gold reports a project bundle was built from."""
+    return frozenset(
+        component.repository_summary.report_id
+        for component in bundle.components
+        if component.repository_summary is not None
+    ) | frozenset(report.report_id for report in bundle.previous_reports)
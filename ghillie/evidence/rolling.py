@@ -0,0 +1,450 @@
+"""Incrementally maintained rolling evidence bundles.
+
+``RollingBundleMaintainer`` is an ``EventFactObserver`` for the Silver
+transformer. As each event fact is transformed it records the fact in
+``rolling_evidence_facts`` and refreshes the classified evidence of the
+entity the fact references in ``rolling_evidence_entries``. Reading a bundle
+is then a single query over that state (``load_rolling_evidence``) instead
+of the fact scan, target extraction, and four entity fetches of a full
+rebuild, so its cost follows the repository's open-window activity rather
+than re-deriving every item from Silver.
+
+Wire the maintainer into the transformer and enable rolling reads on the
+bundle service:
+
+    transformer = RawEventTransformer(
+        session_factory, observers=[RollingBundleMaintainer()]
+    )
+    service = EvidenceBundleService(session_factory, rolling_state=True)
+
+``EvidenceBundleService.rebuild_bundle`` always rebuilds from Silver and is
+kept for verifying the rolling state. ``RollingBundleMaintainer.rebuild``
+repopulates the state of one repository, for example after enabling the
+maintainer on an existing database.
+"""
+
+from __future__ import annotations
+
+import dataclasses as dc
+import datetime as dt
+import typing as typ
+
+import msgspec
+from sqlalchemy import and_, case, delete, literal, or_, select
+
+from ghillie.bronze.storage import UTCDateTime
+from ghillie.common.slug import parse_repo_slug
+from ghillie.gold.coverage import covered_by_repository_report
+from ghillie.silver.storage import (
+    Commit,
+    DocumentationChange,
+    EventFact,
+    Issue,
+    PullRequest,
+    Repository,
+)
+
+from .builders import (
+    COMMIT_EVIDENCE_COLUMNS,
+    DOCUMENTATION_EVIDENCE_COLUMNS,
+    ISSUE_EVIDENCE_COLUMNS,
+    PULL_REQUEST_EVIDENCE_COLUMNS,
+    commit_evidence,
+    documentation_evidence,
+    issue_evidence,
+    pull_request_evidence,
+)
+from .classification import DEFAULT_CLASSIFICATION_CONFIG, ClassificationConfig
+from .event_targets import EventTargetExtractor
+from .models import (
+    BundleTruncation,
+    CommitEvidence,
+    DocumentationEvidence,
+    IssueEvidence,
+    PullRequestEvidence,
+    WorkTypeGrouping,
+)
+from .storage import EvidenceKind, RollingEvidenceEntry, RollingEvidenceFact
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from sqlalchemy import ColumnElement
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+type _Evidence = (
+    CommitEvidence | PullRequestEvidence | IssueEvidence | DocumentationEvidence
+)
+
+_EVIDENCE_TYPES: dict[str, type[_Evidence]] = {
+    EvidenceKind.COMMIT: CommitEvidence,
+    EvidenceKind.PULL_REQUEST: PullRequestEvidence,
+    EvidenceKind.ISSUE: IssueEvidence,
+    EvidenceKind.DOCUMENTATION_CHANGE: DocumentationEvidence,
+}
+_EARLIEST = dt.datetime.min.replace(tzinfo=dt.UTC)
+
+
+def _fact_target(fact: EventFact) -> tuple[EvidenceKind, str] | None:
+    """Return the entity kind and key referenced by a single fact."""
+    targets = EventTargetExtractor().extract([fact])
+    if targets.commit_shas:
+        return EvidenceKind.COMMIT, next(iter(targets.commit_shas))
+    if targets.pull_request_ids:
+        return EvidenceKind.PULL_REQUEST, str(next(iter(targets.pull_request_ids)))
+    if targets.issue_ids:
+        return EvidenceKind.ISSUE, str(next(iter(targets.issue_ids)))
+    if targets.doc_change_keys:
+        commit_sha, path = next(iter(targets.doc_change_keys))
+        return EvidenceKind.DOCUMENTATION_CHANGE, f"{commit_sha}:{path}"
+    return None
+
+
+@dc.dataclass(frozen=True, slots=True)
+class WindowEvidence:
+    """Uncovered evidence for one repository window, before grouping."""
+
+    commits: list[CommitEvidence]
+    pull_requests: list[PullRequestEvidence]
+    issues: list[IssueEvidence]
+    documentation_changes: list[DocumentationEvidence]
+    event_fact_ids: list[int]
+    # Set by loaders that aggregate the window without materialising every
+    # item; otherwise groupings are computed from the evidence lists.
+    work_type_groupings: list[WorkTypeGrouping] | None = None
+    truncation: BundleTruncation | None = None
+
+
+class RollingBundleMaintainer:
+    """Keep rolling evidence state current as event facts are transformed."""
+
+    def __init__(
+        self, classification_config: ClassificationConfig | None = None
+    ) -> None:
+        """Configure the classification rules applied to evidence."""
+        self._classification_config = (
+            classification_config or DEFAULT_CLASSIFICATION_CONFIG
+        )
+
+    async def on_event_fact(self, session: AsyncSession, fact: EventFact) -> None:
+        """Record ``fact`` and refresh the evidence of the entity it names."""
+        slug = fact.repo_external_id
+        if slug is None:
+            return
+        target = _fact_target(fact)
+        kind, key = target if target is not None else (None, None)
+        if await session.get(RollingEvidenceFact, fact.id) is None:
+            session.add(
+                RollingEvidenceFact(
+                    event_fact_id=fact.id,
+                    repo_external_id=slug,
+                    occurred_at=fact.occurred_at,
+                    kind=kind,
+                    entity_key=key,
+                )
+            )
+        if kind is not None and key is not None:
+            await self._refresh_entry(session, slug, kind, key)
+
+    async def rebuild(
+        self, session: AsyncSession, *, repository_id: str, repo_external_id: str
+    ) -> int:
+        """Discard and repopulate one repository's state from Silver.
+
+        Returns the number of uncovered facts replayed.
+        """
+        await _delete_state(session, repo_external_id)
+        facts = await session.stream_scalars(
+            select(EventFact)
+            .where(
+                EventFact.repo_external_id == repo_external_id,
+                ~covered_by_repository_report(repository_id, EventFact.id),
+            )
+            .order_by(EventFact.id)
+        )
+        replayed = 0
+        async for fact in facts:
+            await self.on_event_fact(session, fact)
+            replayed += 1
+        return replayed
+
+    async def _refresh_entry(
+        self, session: AsyncSession, slug: str, kind: EvidenceKind, key: str
+    ) -> None:
+        loaded = await self._load_evidence(session, slug, kind, key)
+        if loaded is None:
+            return
+        evidence, sort_at = loaded
+        entry = await session.scalar(
+            select(RollingEvidenceEntry).where(
+                RollingEvidenceEntry.repo_external_id == slug,
+                RollingEvidenceEntry.kind == kind,
+                RollingEvidenceEntry.entity_key == key,
+            )
+        )
+        if entry is None:
+            entry = RollingEvidenceEntry(
+                repo_external_id=slug, kind=kind, entity_key=key, evidence={}
+            )
+            session.add(entry)
+        entry.work_type = getattr(evidence, "work_type", None)
+        entry.sort_at = sort_at
+        entry.evidence = msgspec.to_builtins(evidence)
+        await session.flush()
+
+    async def _load_evidence(
+        self, session: AsyncSession, slug: str, kind: EvidenceKind, key: str
+    ) -> tuple[_Evidence, dt.datetime | None] | None:
+        """Build evidence for an entity from its current Silver row."""
+        try:
+            owner, name = parse_repo_slug(slug)
+        except ValueError:
+            return None
+        in_repo = and_(Repository.github_owner == owner, Repository.github_name == name)
+        loaders = {
+            EvidenceKind.COMMIT: self._load_commit,
+            EvidenceKind.PULL_REQUEST: self._load_pull_request,
+            EvidenceKind.ISSUE: self._load_issue,
+            EvidenceKind.DOCUMENTATION_CHANGE: self._load_doc_change,
+        }
+        return await loaders[kind](session, in_repo, key)
+
+    async def _load_commit(
+        self, session: AsyncSession, in_repo: ColumnElement[bool], key: str
+    ) -> tuple[_Evidence, dt.datetime | None] | None:
+        commit = (
+            await session.execute(
+                select(*COMMIT_EVIDENCE_COLUMNS)
+                .join(Repository, Commit.repo_id == Repository.id)
+                .where(in_repo, Commit.sha == key)
+            )
+        ).first()
+        if commit is None:
+            return None
+        return commit_evidence(commit, self._classification_config), commit.committed_at
+
+    async def _load_pull_request(
+        self, session: AsyncSession, in_repo: ColumnElement[bool], key: str
+    ) -> tuple[_Evidence, dt.datetime | None] | None:
+        pr = (
+            await session.execute(
+                select(*PULL_REQUEST_EVIDENCE_COLUMNS)
+                .join(Repository, PullRequest.repo_id == Repository.id)
+                .where(in_repo, PullRequest.id == int(key))
+            )
+        ).first()
+        if pr is None:
+            return None
+        return pull_request_evidence(pr, self._classification_config), pr.created_at
+
+    async def _load_issue(
+        self, session: AsyncSession, in_repo: ColumnElement[bool], key: str
+    ) -> tuple[_Evidence, dt.datetime | None] | None:
+        issue = (
+            await session.execute(
+                select(*ISSUE_EVIDENCE_COLUMNS)
+                .join(Repository, Issue.repo_id == Repository.id)
+                .where(in_repo, Issue.id == int(key))
+            )
+        ).first()
+        if issue is None:
+            return None
+        return issue_evidence(issue, self._classification_config), issue.created_at
+
+    async def _load_doc_change(
+        self, session: AsyncSession, in_repo: ColumnElement[bool], key: str
+    ) -> tuple[_Evidence, dt.datetime | None] | None:
+        commit_sha, path = key.split(":", 1)
+        doc = (
+            await session.execute(
+                select(*DOCUMENTATION_EVIDENCE_COLUMNS)
+                .join(Repository, DocumentationChange.repo_id == Repository.id)
+                .where(
+                    in_repo,
+                    DocumentationChange.commit_sha == commit_sha,
+                    DocumentationChange.path == path,
+                )
+            )
+        ).first()
+        if doc is None:
+            return None
+        return documentation_evidence(doc), doc.occurred_at
+
+
+async def _delete_state(session: AsyncSession, repo_external_id: str) -> None:
+    await session.execute(
+        delete(RollingEvidenceFact).where(
+            RollingEvidenceFact.repo_external_id == repo_external_id
+        )
+    )
+    await session.execute(
+        delete(RollingEvidenceEntry).where(
+            RollingEvidenceEntry.repo_external_id == repo_external_id
+        )
+    )
+
+
+async def prune_rolling_state(
+    session: AsyncSession,
+    *,
+    repository_id: str,
+    repo_external_id: str,
+    window_end: dt.datetime,
+) -> None:
+    """Drop covered and passed facts, then entries no fact references.
+
+    Called after a repository report records its coverage so the state only
+    holds the repository's open window. The next window starts at the
+    report's ``window_end``, so uncovered facts that occurred before it,
+    such as those arriving late for a window already reported, can never be
+    read again and are dropped too.
+    """
+    await session.execute(
+        delete(RollingEvidenceFact).where(
+            RollingEvidenceFact.repo_external_id == repo_external_id,
+            or_(
+                RollingEvidenceFact.occurred_at < window_end,
+                covered_by_repository_report(
+                    repository_id, RollingEvidenceFact.event_fact_id
+                ),
+            ),
+        )
+    )
+    referenced = (
+        select(RollingEvidenceFact.event_fact_id)
+        .where(
+            RollingEvidenceFact.repo_external_id
+            == RollingEvidenceEntry.repo_external_id,
+            RollingEvidenceFact.kind == RollingEvidenceEntry.kind,
+            RollingEvidenceFact.entity_key == RollingEvidenceEntry.entity_key,
+        )
+        .exists()
+    )
+    await session.execute(
+        delete(RollingEvidenceEntry).where(
+            RollingEvidenceEntry.repo_external_id == repo_external_id,
+            ~referenced,
+        )
+    )
+
+
+def _sorted(
+    entries: cabc.Iterable[tuple[dt.datetime | None, _Evidence]],
+) -> list[typ.Any]:
+    ordered = sorted(entries, key=lambda item: item[0] or _EARLIEST, reverse=True)
+    return [evidence for _, evidence in ordered]
+
+
+async def load_rolling_evidence(  # noqa: PLR0913
+    session: AsyncSession,
+    *,
+    repository_id: str,
+    repo_external_id: str,
+    window_start: dt.datetime,
+    window_end: dt.datetime,
+) -> WindowEvidence:
+    """Read uncovered evidence for a window from rolling state in one query.
+
+    Items and ordering match a full rebuild: event fact ids newest first,
+    and each entity once, newest first by its commit, creation, or change
+    timestamp.
+    """
+    evidence = await load_rolling_evidence_for(
+        session,
+        repo_external_ids={repository_id: repo_external_id},
+        windows={repository_id: (window_start, window_end)},
+    )
+    return evidence[repository_id]
+
+
+async def load_rolling_evidence_for(
+    session: AsyncSession,
+    *,
+    repo_external_ids: cabc.Mapping[str, str],
+    windows: cabc.Mapping[str, tuple[dt.datetime, dt.datetime]],
+) -> dict[str, WindowEvidence]:
+    """Read many repositories' window evidence from rolling state in one query.
+
+    Parameters
+    ----------
+    session
+        Session to read the rolling state with.
+    repo_external_ids
+        Repository slug for each Silver repository ID.
+    windows
+        ``(window_start, window_end)`` for each Silver repository ID.
+
+    Returns
+    -------
+    dict[str, WindowEvidence]
+        Evidence for each repository ID, as :func:`load_rolling_evidence`
+        returns it. Per-repository windows and coverage are applied in SQL
+        by mapping each fact's slug through ``CASE`` expressions.
+
+    """
+    repo_ids = {slug: repo_id for repo_id, slug in repo_external_ids.items()}
+    slug = RollingEvidenceFact.repo_external_id
+    start = case(
+        {s: literal(windows[r][0], UTCDateTime()) for s, r in repo_ids.items()},
+        value=slug,
+    )
+    end = case(
+        {s: literal(windows[r][1], UTCDateTime()) for s, r in repo_ids.items()},
+        value=slug,
+    )
+    rows = await session.execute(
+        select(
+            slug,
+            RollingEvidenceFact.event_fact_id,
+            RollingEvidenceEntry.kind,
+            RollingEvidenceEntry.entity_key,
+            RollingEvidenceEntry.sort_at,
+            RollingEvidenceEntry.evidence,
+        )
+        .outerjoin(
+            RollingEvidenceEntry,
+            and_(
+                RollingEvidenceEntry.repo_external_id == slug,
+                RollingEvidenceEntry.kind == RollingEvidenceFact.kind,
+                RollingEvidenceEntry.entity_key == RollingEvidenceFact.entity_key,
+            ),
+        )
+        .where(
+            slug.in_(repo_ids),
+            RollingEvidenceFact.occurred_at >= start,
+            RollingEvidenceFact.occurred_at < end,
+            ~covered_by_repository_report(
+                case(repo_ids, value=slug), RollingEvidenceFact.event_fact_id
+            ),
+        )
+        .order_by(
+            RollingEvidenceFact.occurred_at.desc(),
+            RollingEvidenceFact.event_fact_id.desc(),
+        )
+    )
+    fact_ids: dict[str, list[int]] = {repo_id: [] for repo_id in repo_external_ids}
+    by_kind: dict[str, dict[str, dict[str, tuple[dt.datetime | None, _Evidence]]]] = {
+        repo_id: {kind: {} for kind in EvidenceKind} for repo_id in repo_external_ids
+    }
+    for repo_slug, fact_id, kind, key, sort_at, payload in rows:
+        repo_id = repo_ids[repo_slug]
+        fact_ids[repo_id].append(fact_id)
+        entries = by_kind[repo_id]
+        if kind is None or key in entries[kind]:
+            continue
+        entries[kind][key] = (
+            sort_at,
+            msgspec.convert(payload, _EVIDENCE_TYPES[kind]),
+        )
+    return {
+        repo_id: WindowEvidence(
+            commits=_sorted(entries[EvidenceKind.COMMIT].values()),
+            pull_requests=_sorted(entries[EvidenceKind.PULL_REQUEST].values()),
+            issues=_sorted(entries[EvidenceKind.ISSUE].values()),
+            documentation_changes=_sorted(
+                entries[EvidenceKind.DOCUMENTATION_CHANGE].values()
+            ),
+            event_fact_ids=fact_ids[repo_id],
+        )
+        for repo_id, entries in by_kind.items()
+    }
@@ -0,0 +1,309 @@
+"""Dependency-tracked cache of project and estate evidence rollups.
+
+Project bundles are derived from the latest repository report of each
+component and from previous project reports, and an estate overview is the
+set of its project bundles. ``ProjectRollupCache`` keeps both levels in memory
+and keys every cached project bundle by the IDs of the reports it read. When a
+repository report lands, only the projects whose components use that
+repository are marked stale. The next read rebuilds just those projects and
+reassembles the estate overview, so refreshing an estate costs time
+proportional to what changed rather than a full rollup.
+
+Staleness is tracked two ways:
+
+- ``mark_repository_report`` flags dependants immediately, without touching
+  the database, for callers that know a report has just been written.
+- ``refresh_staleness`` compares the cached report IDs, component
+  repositories, and catalogue version with the current inputs from
+  ``ProjectEvidenceBundleService.fetch_rollup_inputs``. This costs a constant
+  number of identifier-only queries and catches reports written by other
+  processes, projects added to or removed from the catalogue, and catalogue
+  re-imports that change components or edges without a new report.
+
+Example:
+-------
+>>> cache = ProjectRollupCache(ProjectEvidenceBundleService(cat_sf, gold_sf))
+>>> bundles = await cache.estate_bundles("estate-1")
+>>> cache.mark_repository_report("estate-1", catalogue_repository_id)
+>>> cache.staleness("estate-1").stale_projects
+frozenset({'wildside'})
+
+"""
+
+from __future__ import annotations
+
+import dataclasses as dc
+import typing as typ
+
+from .project_service import bundle_report_ids
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from .models import ProjectEvidenceBundle
+    from .project_service import ProjectEvidenceBundleService, ProjectRollupInputs
+
+
+# Stale projects rebuilt one at a time before a whole-estate rollup, which
+# takes a constant number of queries, becomes cheaper.
+_MAX_PROJECT_REBUILDS = 8
+
+
+@dc.dataclass(frozen=True, slots=True)
+class RollupStaleness:
+    """Snapshot of which cached rollups for an estate are out of date.
+
+    Attributes
+    ----------
+    estate_id
+        The estate the snapshot describes.
+    cached
+        Whether the estate has been rolled up into the cache at all.
+    stale_projects
+        Keys of projects whose bundles must be rebuilt, including projects
+        newly added to the catalogue and not yet built.
+    removed_projects
+        Keys of cached projects that no longer exist in the catalogue.
+
+    """
+
+    estate_id: str
+    cached: bool = False
+    stale_projects: frozenset[str] = frozenset()
+    removed_projects: frozenset[str] = frozenset()
+
+    @property
+    def estate_stale(self) -> bool:
+        """Return True when the estate overview needs recomputing."""
+        return not self.cached or bool(self.stale_projects or self.removed_projects)
+
+
+@dc.dataclass(slots=True)
+class _EstateRollup:
+    """Cached project bundles and their dependency keys for one estate."""
+
+    bundles: dict[str, ProjectEvidenceBundle]
+    report_ids: dict[str, frozenset[str]]
+    repository_ids: dict[str, frozenset[str]]
+    catalogue_version: int | None = None
+    stale: set[str] = dc.field(default_factory=set)
+    removed: set[str] = dc.field(default_factory=set)
+    overview: tuple[ProjectEvidenceBundle, ...] | None = None
+
+
+class ProjectRollupCache:
+    """Cache project bundles and estate overviews, rebuilding only stale parts.
+
+    Parameters
+    ----------
+    service
+        Service used to build project bundles and read their inputs.
+
+    """
+
+    def __init__(self, service: ProjectEvidenceBundleService) -> None:
+        """Configure the cache with the bundle service it wraps."""
+        self._service = service
+        self._estates: dict[str, _EstateRollup] = {}
+
+    def staleness(self, estate_id: str) -> RollupStaleness:
+        """Return the staleness currently known for an estate.
+
+        This reflects ``mark_repository_report`` calls and the last
+        ``refresh_staleness`` check; it does not query the database.
+        """
+        rollup = self._estates.get(estate_id)
+        if rollup is None:
+            return RollupStaleness(estate_id=estate_id)
+        return RollupStaleness(
+            estate_id=estate_id,
+            cached=True,
+            stale_projects=frozenset(rollup.stale),
+            removed_projects=frozenset(rollup.removed),
+        )
+
+    def mark_repository_report(
+        self, estate_id: str, catalogue_repository_id: str
+    ) -> frozenset[str]:
+        """Mark the projects using a repository stale after it gets a report.
+
+        Parameters
+        ----------
+        estate_id
+            The estate the repository belongs to.
+        catalogue_repository_id
+            Catalogue ID of the repository that received a new report.
+
+        Returns
+        -------
+        frozenset[str]
+            Keys of the projects marked stale.
+
+        """
+        rollup = self._estates.get(estate_id)
+        if rollup is None:
+            return frozenset()
+        affected = frozenset(
+            project_key
+            for project_key, repository_ids in rollup.repository_ids.items()
+            if catalogue_repository_id in repository_ids
+        )
+        self._mark_stale(rollup, affected)
+        return affected
+
+    async def refresh_staleness(self, estate_id: str) -> RollupStaleness:
+        """Compare cached bundles with the current inputs of each project.
+
+        Projects whose input report IDs or component repositories have
+        changed, and projects new to the catalogue, are marked stale; a new
+        catalogue import marks every project stale. Cached projects missing
+        from the catalogue are marked removed.
+        """
+        rollup = self._estates.get(estate_id)
+        if rollup is not None:
+            self._apply_inputs(
+                rollup, await self._service.fetch_rollup_inputs(estate_id)
+            )
+        return self.staleness(estate_id)
+
+    async def project_bundle(
+        self, project_key: str, estate_id: str
+    ) -> ProjectEvidenceBundle:
+        """Return a project's bundle, rebuilding it only when stale.
+
+        Raises
+        ------
+        ValueError
+            If the project is not found in the catalogue.
+
+        """
+        rollup = self._estates.get(estate_id)
+        if rollup is None:
+            return await self._service.build_bundle(project_key, estate_id)
+        if project_key in rollup.bundles and project_key not in rollup.stale:
+            return rollup.bundles[project_key]
+        await self._rebuild(rollup, estate_id, {project_key})
+        if project_key not in rollup.bundles:
+            msg = f"Project not found: key={project_key!r}, estate_id={estate_id!r}"
+            raise ValueError(msg)
+        return rollup.bundles[project_key]
+
+    async def estate_bundles(self, estate_id: str) -> tuple[ProjectEvidenceBundle, ...]:
+        """Return every project bundle in an estate, ordered by project key.
+
+        The first call builds the whole estate in a constant number of
+        queries. Later calls refresh staleness and rebuild only the projects
+        whose inputs changed, reusing the cached overview when nothing did.
+        When every project, or more than ``_MAX_PROJECT_REBUILDS``, is stale,
+        as after a catalogue import, the estate is rebuilt in one pass
+        instead, since per-project builds cost queries for each project.
+        """
+        rollup = self._estates.get(estate_id)
+        if rollup is None:
+            return await self._build_estate(estate_id)
+        inputs = await self._service.fetch_rollup_inputs(estate_id)
+        self._apply_inputs(rollup, inputs)
+        if len(rollup.stale) > _MAX_PROJECT_REBUILDS or (
+            rollup.stale and rollup.stale >= inputs.keys()
+        ):
+            return await self._build_estate(estate_id, inputs)
+        await self._rebuild(rollup, estate_id, set(rollup.stale))
+        if rollup.overview is None:
+            rollup.overview = tuple(
+                rollup.bundles[key] for key in sorted(rollup.bundles)
+            )
+        return rollup.overview
+
+    def invalidate(self, estate_id: str) -> None:
+        """Drop everything cached for an estate."""
+        self._estates.pop(estate_id, None)
+
+    async def _build_estate(
+        self, estate_id: str, inputs: dict[str, ProjectRollupInputs] | None = None
+    ) -> tuple[ProjectEvidenceBundle, ...]:
+        """Roll up a whole estate and cache the results.
+
+        ``inputs`` may carry rollup inputs the caller has just read.
+        """
+        # Read inputs first: a report landing between the two reads then
+        # shows up as a needless rebuild rather than a missed one.
+        if inputs is None:
+            inputs = await self._service.fetch_rollup_inputs(estate_id)
+        bundles = await self._service.build_bundles_for_estate(estate_id)
+        overview = tuple(bundles)
+        rollup = _EstateRollup(
+            bundles={bundle.project.key: bundle for bundle in bundles},
+            report_ids={
+                bundle.project.key: bundle_report_ids(bundle) for bundle in bundles
+            },
+            repository_ids={
+                key: project_inputs.repository_ids
+                for key, project_inputs in inputs.items()
+            },
+            catalogue_version=_catalogue_version(inputs),
+            overview=overview,
+        )
+        self._estates[estate_id] = rollup
+        return overview
+
+    async def _rebuild(
+        self, rollup: _EstateRollup, estate_id: str, project_keys: set[str]
+    ) -> None:
+        """Rebuild the given projects and drop removed ones."""
+        if project_keys or rollup.removed:
+            rollup.overview = None
+        for project_key in sorted(project_keys):
+            try:
+                bundle = await self._service.build_bundle(project_key, estate_id)
+            except ValueError:
+                rollup.removed.add(project_key)
+            else:
+                rollup.bundles[project_key] = bundle
+                rollup.report_ids[project_key] = bundle_report_ids(bundle)
+            rollup.stale.discard(project_key)
+        for project_key in rollup.removed:
+            rollup.bundles.pop(project_key, None)
+            rollup.report_ids.pop(project_key, None)
+            rollup.repository_ids.pop(project_key, None)
+        rollup.removed.clear()
+
+    def _apply_inputs(
+        self, rollup: _EstateRollup, inputs: dict[str, ProjectRollupInputs]
+    ) -> None:
+        """Mark projects whose current inputs differ from the cached keys.
+
+        A catalogue import can change any project's components or edges
+        without a new report, so a new catalogue version marks every project.
+        """
+        version = _catalogue_version(inputs)
+        catalogue_changed = version != rollup.catalogue_version
+        rollup.catalogue_version = version
+        changed = {
+            project_key
+            for project_key, project_inputs in inputs.items()
+            if catalogue_changed
+            or rollup.report_ids.get(project_key) != project_inputs.report_ids
+            or rollup.repository_ids.get(project_key) != project_inputs.repository_ids
+        }
+        for project_key, project_inputs in inputs.items():
+            rollup.repository_ids[project_key] = project_inputs.repository_ids
+        removed = rollup.bundles.keys() - inputs.keys()
+        if removed:
+            rollup.removed.update(removed)
+            rollup.overview = None
+        self._mark_stale(rollup, changed)
+
+    @staticmethod
+    def _mark_stale(rollup: _EstateRollup, project_keys: cabc.Iterable[str]) -> None:
+        """Flag projects for rebuilding and invalidate the estate overview."""
+        rollup.stale.update(project_keys)
+        if rollup.stale:
+            rollup.overview = None
+
+
+def _catalogue_version(inputs: dict[str, ProjectRollupInputs]) -> int | None:
+    """Return the estate's catalogue version, shared by every project input."""
+    return next(
+        (project_inputs.catalogue_version for project_inputs in inputs.values()),
+        None,
+    )
@@ -42,14 +42,17 @@ Create an engine and session factory, then build a bundle for a repository:
 
 from __future__ import annotations
 
+import asyncio
 import dataclasses as dc
 import typing as typ
 
-from sqlalchemy import select, tuple_
+from sqlalchemy import case, func, literal, select, tuple_
 from sqlalchemy.orm import selectinload
 
+from ghillie.bronze.storage import UTCDateTime
 from ghillie.common.time import utcnow
-from ghillie.gold.storage import Report, ReportCoverage, ReportScope
+from ghillie.gold.coverage import covered_by_repository_report
+from ghillie.gold.storage import Report, ReportScope
 from ghillie.silver.storage import (
     Commit,
     DocumentationChange,
@@ -59,12 +62,21 @@ from ghillie.silver.storage import (
     Repository,
 )
 
+from .bounded import BoundedEvidenceLoader, truncate_evidence
+from .builders import (
+    COMMIT_EVIDENCE_COLUMNS,
+    DOCUMENTATION_EVIDENCE_COLUMNS,
+    ISSUE_EVIDENCE_COLUMNS,
+    PULL_REQUEST_EVIDENCE_COLUMNS,
+    commit_evidence,
+    documentation_evidence,
+    issue_evidence,
+    pull_request_evidence,
+)
 from .classification import (
     DEFAULT_CLASSIFICATION_CONFIG,
     ClassificationConfig,
-    classify_commit,
-    classify_entity,
-    is_merge_commit,
+    classify_many,
 )
 from .event_targets import EventTargetExtractor, EventTargets
 from .models import (
@@ -79,12 +91,50 @@ from .models import (
     WorkType,
     WorkTypeGrouping,
 )
+from .rolling import (
+    WindowEvidence,
+    load_rolling_evidence,
+    load_rolling_evidence_for,
+)
 
 if typ.TYPE_CHECKING:
     import collections.abc as cabc
     import datetime as dt
 
+    from sqlalchemy import ColumnElement, Result, Select
     from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+    from sqlalchemy.orm import InstrumentedAttribute
+
+    from .builders import CommitRow, DocumentationChangeRow, IssueRow, PullRequestRow
+    from .models import BundleLimits
+
+    class _RepositoryRow(typ.Protocol):
+        """Entity row of a batch fetch, tagged with its repository."""
+
+        repo_id: str
+
+    class _BatchCommitRow(CommitRow, _RepositoryRow, typ.Protocol):
+        """Commit row of a batch fetch."""
+
+    class _BatchPullRequestRow(PullRequestRow, _RepositoryRow, typ.Protocol):
+        """Pull request row of a batch fetch."""
+
+    class _BatchIssueRow(IssueRow, _RepositoryRow, typ.Protocol):
+        """Issue row of a batch fetch."""
+
+    class _BatchDocumentationChangeRow(
+        DocumentationChangeRow, _RepositoryRow, typ.Protocol
+    ):
+        """Documentation change row of a batch fetch."""
+
+
+type _Window = tuple[dt.datetime, dt.datetime]
+type _BundleEntities = tuple[
+    cabc.Sequence[CommitRow],
+    cabc.Sequence[PullRequestRow],
+    cabc.Sequence[IssueRow],
+    cabc.Sequence[DocumentationChangeRow],
+]
 
 
 @dc.dataclass(slots=True)
@@ -124,7 +174,42 @@ class _WindowQuery:
     window_end: dt.datetime
 
 
+@dc.dataclass(frozen=True, slots=True)
+class _EntityLookup[T]:
+    """Describe a multi-repository entity fetch keyed by repository and key.
+
+    Parameters
+    ----------
+    stmt
+        Select of ``repo_id`` and evidence columns, restricted to the
+        batch's repositories.
+    key_column
+        Column (or tuple of columns) matched against the wanted keys.
+    row_key
+        Return ``(repository_id, key)`` for a fetched row.
+    sort_at
+        Timestamp each repository's rows are ordered by, newest first.
+
+    """
+
+    stmt: Select[*tuple[typ.Any, ...]]
+    key_column: ColumnElement[typ.Any] | InstrumentedAttribute[typ.Any]
+    row_key: cabc.Callable[[T], tuple[str, typ.Any]]
+    sort_at: cabc.Callable[[T], dt.datetime | None]
+
+
 _DOC_CHANGE_KEY_CHUNK_SIZE = 500
+# Repositories per set-based bundle batch and keys per entity IN clause; both
+# bound the bind parameters of a single statement.
+_BUNDLE_BATCH_SIZE = 500
+# Memory-bounded loaders running at once for a batch; each uses up to four
+# pooled connections.
+_BOUNDED_LOADER_CONCURRENCY = 3
+
+
+def _rows(result: Result[*tuple[typ.Any, ...]]) -> list[typ.Any]:
+    """Return plain result rows; each exposes its columns as attributes."""
+    return list(result.all())
 
 
 class EvidenceBundleService:
@@ -136,11 +221,14 @@ class EvidenceBundleService:
 
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         session_factory: async_sessionmaker[AsyncSession],
         classification_config: ClassificationConfig | None = None,
         max_previous_reports: int = 2,
+        *,
+        rolling_state: bool = False,
+        limits: BundleLimits | None = None,
     ) -> None:
         """Configure the service with a session factory.
 
@@ -152,6 +240,15 @@ class EvidenceBundleService:
             Optional custom classification rules.
         max_previous_reports
             Maximum number of previous reports to include (default 2).
+        rolling_state
+            Read bundle evidence from the rolling state maintained by
+            ``RollingBundleMaintainer`` instead of rebuilding it from Silver.
+            Only enable this when the maintainer observes every transform.
+        limits
+            Cap the evidence items each bundle carries. Counts and work type
+            groupings still cover the whole window; bundles over a limit
+            record the window totals in ``truncation``. Full rebuilds then
+            aggregate in SQL and materialise only the top items.
 
         """
         self._session_factory = session_factory
@@ -159,6 +256,13 @@ class EvidenceBundleService:
             classification_config or DEFAULT_CLASSIFICATION_CONFIG
         )
         self._max_previous_reports = max_previous_reports
+        self._rolling_state = rolling_state
+        self._limits = limits
+
+    @property
+    def rolling_state(self) -> bool:
+        """Return whether bundles are read from rolling evidence state."""
+        return self._rolling_state
 
     _extractor = EventTargetExtractor()
 
@@ -166,33 +270,34 @@ class EvidenceBundleService:
         self,
         session: AsyncSession,
         repo_external_id: str,
-        repository_id: str,
         window: _WindowQuery,
     ) -> list[EventFact]:
-        """Fetch EventFacts in the window, excluding repository-scope coverage."""
-        coverage_exists = (
-            select(ReportCoverage.id)
-            .join(Report, ReportCoverage.report_id == Report.id)
-            .where(
-                ReportCoverage.event_fact_id == EventFact.id,
-                Report.scope == ReportScope.REPOSITORY,
-                Report.repository_id == repository_id,
-            )
-            .exists()
-        )
+        """Fetch EventFacts in the window, excluding repository-scope coverage.
+
+        Coverage is checked against the repository's covered-set range index,
+        so the anti-join probes a handful of ranges per fact instead of
+        joining per-fact coverage rows through their reports.
 
+        """
         stmt = (
             select(EventFact)
-            .where(
-                EventFact.repo_external_id == repo_external_id,
-                EventFact.occurred_at >= window.window_start,
-                EventFact.occurred_at < window.window_end,
-                ~coverage_exists,
-            )
+            .where(*self._uncovered_fact_conditions(repo_external_id, window))
             .order_by(EventFact.occurred_at.desc(), EventFact.id.desc())
         )
         return list((await session.scalars(stmt)).all())
 
+    @staticmethod
+    def _uncovered_fact_conditions(
+        repo_external_id: str, window: _WindowQuery
+    ) -> tuple[ColumnElement[bool], ...]:
+        """Return filters for a repository's uncovered facts in a window."""
+        return (
+            EventFact.repo_external_id == repo_external_id,
+            EventFact.occurred_at >= window.window_start,
+            EventFact.occurred_at < window.window_end,
+            ~covered_by_repository_report(window.repository_id, EventFact.id),
+        )
+
     # Type-safe fetch wrappers: These methods appear similar but provide
     # distinct type signatures for different entity types, keeping call sites
     # clear and type checking reliable.
@@ -201,65 +306,65 @@ class EvidenceBundleService:
         session: AsyncSession,
         repository_id: str,
         shas: set[str],
-    ) -> list[Commit]:
-        """Fetch commits by SHA for a repository."""
+    ) -> list[CommitRow]:
+        """Fetch commit evidence rows by SHA for a repository."""
         if not shas:
             return []
         stmt = (
-            select(Commit)
+            select(*COMMIT_EVIDENCE_COLUMNS)
             .where(
                 Commit.repo_id == repository_id,
                 Commit.sha.in_(shas),
             )
             .order_by(Commit.committed_at.desc())
         )
-        return list((await session.scalars(stmt)).all())
+        return _rows(await session.execute(stmt))
 
     async def _fetch_pull_requests_by_id(
         self,
         session: AsyncSession,
         repository_id: str,
         ids: set[int],
-    ) -> list[PullRequest]:
-        """Fetch pull requests by id for a repository."""
+    ) -> list[PullRequestRow]:
+        """Fetch pull request evidence rows by id for a repository."""
         if not ids:
             return []
         stmt = (
-            select(PullRequest)
+            select(*PULL_REQUEST_EVIDENCE_COLUMNS)
             .where(
                 PullRequest.repo_id == repository_id,
                 PullRequest.id.in_(ids),
             )
             .order_by(PullRequest.created_at.desc())
         )
-        return list((await session.scalars(stmt)).all())
+        return _rows(await session.execute(stmt))
 
     async def _fetch_issues_by_id(
         self,
         session: AsyncSession,
         repository_id: str,
         ids: set[int],
-    ) -> list[Issue]:
-        """Fetch issues by id for a repository."""
+    ) -> list[IssueRow]:
+        """Fetch issue evidence rows by id for a repository."""
         if not ids:
             return []
         stmt = (
-            select(Issue)
+            select(*ISSUE_EVIDENCE_COLUMNS)
             .where(
                 Issue.repo_id == repository_id,
                 Issue.id.in_(ids),
             )
             .order_by(Issue.created_at.desc())
         )
-        return list((await session.scalars(stmt)).all())
+        return _rows(await session.execute(stmt))
 
     async def _fetch_doc_changes_by_key(
         self,
         session: AsyncSession,
         repository_id: str,
         keys: set[tuple[str, str]],
-    ) -> list[DocumentationChange]:
-        """Fetch documentation changes by commit/path keys.
+    ) -> list[DocumentationChangeRow]:
+        """Fetch documentation change evidence rows by commit/path keys.
 
         Chunk large key sets to avoid parameter explosion in tuple IN clauses.
 
@@ -269,7 +374,7 @@ class EvidenceBundleService:
         key_list = list(keys)
         if len(key_list) <= _DOC_CHANGE_KEY_CHUNK_SIZE:
             stmt = (
-                select(DocumentationChange)
+                select(*DOCUMENTATION_EVIDENCE_COLUMNS)
                 .where(
                     DocumentationChange.repo_id == repository_id,
                     tuple_(
@@ -278,13 +383,13 @@ class EvidenceBundleService:
                 )
                 .order_by(DocumentationChange.occurred_at.desc())
             )
-            return list((await session.scalars(stmt)).all())
+            return _rows(await session.execute(stmt))
 
-        docs: list[DocumentationChange] = []
+        docs: list[DocumentationChangeRow] = []
         for offset in range(0, len(key_list), _DOC_CHANGE_KEY_CHUNK_SIZE):
             chunk = key_list[offset : offset + _DOC_CHANGE_KEY_CHUNK_SIZE]
             stmt = (
-                select(DocumentationChange)
+                select(*DOCUMENTATION_EVIDENCE_COLUMNS)
                 .where(
                     DocumentationChange.repo_id == repository_id,
                     tuple_(
@@ -293,7 +398,7 @@ class EvidenceBundleService:
                 )
                 .order_by(DocumentationChange.occurred_at.desc())
             )
-            docs.extend((await session.scalars(stmt)).all())
+            docs.extend(_rows(await session.execute(stmt)))
         return sorted(docs, key=lambda doc: doc.occurred_at, reverse=True)
 
     async def _fetch_repository_context(
@@ -311,45 +416,55 @@ class EvidenceBundleService:
         )
         return repo, previous_reports
 
+    async def _fetch_in_session[K, T](
+        self,
+        fetch: cabc.Callable[[AsyncSession, str, set[K]], cabc.Awaitable[list[T]]],
+        repository_id: str,
+        keys: set[K],
+    ) -> list[T]:
+        """Run one entity fetch on its own session, skipping empty key sets."""
+        if not keys:
+            return []
+        async with self._session_factory() as session:
+            return await fetch(session, repository_id, keys)
+
     async def _fetch_bundle_entities(
         self,
-        session: AsyncSession,
         repository_id: str,
-        repo_slug: str,
-        window: _WindowQuery,
-    ) -> tuple[
-        list[Commit],
-        list[PullRequest],
-        list[Issue],
-        list[DocumentationChange],
-        list[int],
-    ]:
-        """Fetch entity lists and event fact identifiers for a bundle."""
-        event_facts = await self._fetch_uncovered_event_facts(
-            session, repo_slug, repository_id, window
-        )
-        targets: EventTargets = self._extractor.extract(event_facts)
-        commits = await self._fetch_commits_by_sha(
-            session, repository_id, targets.commit_shas
-        )
-        prs = await self._fetch_pull_requests_by_id(
-            session, repository_id, targets.pull_request_ids
-        )
-        issues = await self._fetch_issues_by_id(
-            session, repository_id, targets.issue_ids
-        )
-        doc_changes = await self._fetch_doc_changes_by_key(
-            session, repository_id, targets.doc_change_keys
+        targets: EventTargets,
+    ) -> _BundleEntities:
+        """Fetch the entities referenced by a bundle's event facts.
+
+        The four lookups are independent once the targets are known, so each
+        runs concurrently on its own pooled connection rather than queuing
+        behind the others on a single session.
+
+        """
+        return await asyncio.gather(
+            self._fetch_in_session(
+                self._fetch_commits_by_sha, repository_id, targets.commit_shas
+            ),
+            self._fetch_in_session(
+                self._fetch_pull_requests_by_id,
+                repository_id,
+                targets.pull_request_ids,
+            ),
+            self._fetch_in_session(
+                self._fetch_issues_by_id, repository_id, targets.issue_ids
+            ),
+            self._fetch_in_session(
+                self._fetch_doc_changes_by_key,
+                repository_id,
+                targets.doc_change_keys,
+            ),
         )
-        event_fact_ids = [fact.id for fact in event_facts]
-        return commits, prs, issues, doc_changes, event_fact_ids
 
     def _build_all_evidence(
         self,
-        commits: list[Commit],
-        prs: list[PullRequest],
-        issues: list[Issue],
-        doc_changes: list[DocumentationChange],
+        commits: cabc.Sequence[CommitRow],
+        prs: cabc.Sequence[PullRequestRow],
+        issues: cabc.Sequence[IssueRow],
+        doc_changes: cabc.Sequence[DocumentationChangeRow],
     ) -> tuple[
         list[CommitEvidence],
         list[PullRequestEvidence],
@@ -375,6 +490,9 @@ class EvidenceBundleService:
         repository reports are excluded, while project or estate coverage does
         not affect repository bundles.
 
+        When the service was created with ``rolling_state=True`` the evidence
+        is read from the materialised rolling state in a single query.
+
         Parameters
         ----------
         repository_id
@@ -395,6 +513,37 @@ class EvidenceBundleService:
             If the repository is not found.
 
         """
+        return await self._build_bundle(
+            repository_id,
+            window_start,
+            window_end,
+            use_rolling_state=self._rolling_state,
+        )
+
+    async def rebuild_bundle(
+        self,
+        repository_id: str,
+        window_start: dt.datetime,
+        window_end: dt.datetime,
+    ) -> RepositoryEvidenceBundle:
+        """Build a bundle from Silver entities, ignoring any rolling state.
+
+        Use this to verify that the rolling state matches a full rebuild;
+        parameters and errors are as for :meth:`build_bundle`.
+        """
+        return await self._build_bundle(
+            repository_id, window_start, window_end, use_rolling_state=False
+        )
+
+    async def _build_bundle(
+        self,
+        repository_id: str,
+        window_start: dt.datetime,
+        window_end: dt.datetime,
+        *,
+        use_rolling_state: bool,
+    ) -> RepositoryEvidenceBundle:
+        """Assemble a bundle from rolling state or a full Silver rebuild."""
         window = _WindowQuery(
             repository_id=repository_id,
             window_start=window_start,
@@ -404,29 +553,363 @@ class EvidenceBundleService:
             repo, previous_reports = await self._fetch_repository_context(
                 session, repository_id, window_start
             )
-            entities = await self._fetch_bundle_entities(
-                session, repository_id, repo.slug, window
+            repository = self._build_repository_metadata(repo)
+            evidence: WindowEvidence | None = None
+            event_facts: list[EventFact] = []
+            if use_rolling_state:
+                evidence = await load_rolling_evidence(
+                    session,
+                    repository_id=repository_id,
+                    repo_external_id=repo.slug,
+                    window_start=window_start,
+                    window_end=window_end,
+                )
+            elif self._limits is None:
+                event_facts = await self._fetch_uncovered_event_facts(
+                    session, repo.slug, window
+                )
+        if evidence is None and self._limits is not None:
+            evidence = await BoundedEvidenceLoader(
+                self._session_factory, self._classification_config, self._limits
+            ).load(repository_id, self._uncovered_fact_conditions(repo.slug, window))
+        elif evidence is None:
+            evidence = await self._rebuild_evidence(repository_id, event_facts)
+        return self._assemble_bundle(
+            repository, (window_start, window_end), previous_reports, evidence
+        )
+
+    def _assemble_bundle(
+        self,
+        repository: RepositoryMetadata,
+        window: _Window,
+        previous_reports: list[PreviousReportSummary],
+        evidence: WindowEvidence,
+    ) -> RepositoryEvidenceBundle:
+        """Combine repository context and window evidence into a bundle."""
+        window_start, window_end = window
+        groupings = evidence.work_type_groupings
+        if groupings is None:
+            groupings = self._compute_work_type_groupings(
+                evidence.commits, evidence.pull_requests, evidence.issues
             )
-            commits, prs, issues, doc_changes, event_fact_ids = entities
-            commit_evidence, pr_evidence, issue_evidence, doc_evidence = (
-                self._build_all_evidence(commits, prs, issues, doc_changes)
+            if self._limits is not None:
+                evidence = truncate_evidence(evidence, self._limits)
+        return RepositoryEvidenceBundle(
+            repository=repository,
+            window_start=window_start,
+            window_end=window_end,
+            previous_reports=tuple(previous_reports),
+            commits=tuple(evidence.commits),
+            pull_requests=tuple(evidence.pull_requests),
+            issues=tuple(evidence.issues),
+            documentation_changes=tuple(evidence.documentation_changes),
+            work_type_groupings=tuple(groupings),
+            event_fact_ids=tuple(evidence.event_fact_ids),
+            generated_at=utcnow(),
+            truncation=evidence.truncation,
+        )
+
+    async def _rebuild_evidence(
+        self, repository_id: str, event_facts: list[EventFact]
+    ) -> WindowEvidence:
+        """Fetch and classify the entities referenced by ``event_facts``."""
+        targets: EventTargets = self._extractor.extract(event_facts)
+        entities = await self._fetch_bundle_entities(repository_id, targets)
+        return self._window_evidence(event_facts, entities)
+
+    def _window_evidence(
+        self, event_facts: list[EventFact], entities: _BundleEntities
+    ) -> WindowEvidence:
+        """Classify fetched entities into one repository's window evidence."""
+        commit_items, pr_items, issue_items, doc_items = self._build_all_evidence(
+            *entities
+        )
+        return WindowEvidence(
+            commits=commit_items,
+            pull_requests=pr_items,
+            issues=issue_items,
+            documentation_changes=doc_items,
+            event_fact_ids=[fact.id for fact in event_facts],
+        )
+
+    async def build_bundles(
+        self,
+        repository_ids: cabc.Sequence[str],
+        windows: cabc.Sequence[tuple[dt.datetime, dt.datetime]],
+    ) -> list[RepositoryEvidenceBundle]:
+        """Build bundles for many repositories with set-based queries.
+
+        Each batch of repositories is served by one query for repository
+        metadata and one for previous reports. Evidence comes from one query
+        over the rolling state when it is enabled; otherwise from one query
+        for uncovered event facts and one per entity type (chunked by key
+        count), with the rows partitioned per repository in Python. With
+        ``BundleLimits`` and no rolling state, each repository's evidence is
+        loaded by ``BoundedEvidenceLoader`` as in :meth:`build_bundle`, so
+        large windows are never fully materialised. Bundles are therefore
+        identical to those returned by :meth:`build_bundle` for the same
+        repository and window.
+
+        Parameters
+        ----------
+        repository_ids
+            Distinct Silver layer repository IDs.
+        windows
+            ``(window_start, window_end)`` for each repository, in the same
+            order as ``repository_ids``.
+
+        Returns
+        -------
+        list[RepositoryEvidenceBundle]
+            One bundle per repository, in the order requested.
+
+        Raises
+        ------
+        ValueError
+            If the arguments differ in length, repeat a repository, or name
+            a repository that does not exist.
+
+        """
+        if len(repository_ids) != len(windows):
+            msg = (
+                f"Expected one window per repository, got {len(windows)} "
+                f"windows for {len(repository_ids)} repositories"
             )
-            groupings = self._compute_work_type_groupings(
-                commit_evidence, pr_evidence, issue_evidence
+            raise ValueError(msg)
+        requested = dict(zip(repository_ids, windows, strict=True))
+        if len(requested) != len(repository_ids):
+            msg = "Repository IDs must be distinct"
+            raise ValueError(msg)
+        items = list(requested.items())
+        bundles: list[RepositoryEvidenceBundle] = []
+        for offset in range(0, len(items), _BUNDLE_BATCH_SIZE):
+            batch = dict(items[offset : offset + _BUNDLE_BATCH_SIZE])
+            bundles.extend(await self._build_bundle_batch(batch))
+        return bundles
+
+    async def _build_bundle_batch(
+        self, windows: dict[str, _Window]
+    ) -> list[RepositoryEvidenceBundle]:
+        """Build the bundles of one batch of repositories."""
+        evidence: dict[str, WindowEvidence] = {}
+        facts: dict[str, list[EventFact]] = {}
+        async with self._session_factory() as session:
+            repos = await self._fetch_repositories(session, windows)
+            previous = await self._fetch_previous_reports_for(
+                session, {repo_id: start for repo_id, (start, _) in windows.items()}
+            )
+            if self._rolling_state:
+                evidence = await load_rolling_evidence_for(
+                    session,
+                    repo_external_ids={
+                        repo_id: repo.slug for repo_id, repo in repos.items()
+                    },
+                    windows=windows,
+                )
+            elif self._limits is None:
+                facts = await self._fetch_uncovered_event_facts_for(
+                    session, repos, windows
+                )
+        if self._limits is not None and not self._rolling_state:
+            evidence = await self._load_bounded_evidence_for(
+                repos, windows, self._limits
+            )
+        elif not self._rolling_state:
+            evidence = await self._rebuild_evidence_for(facts)
+        return [
+            self._assemble_bundle(
+                self._build_repository_metadata(repos[repo_id]),
+                window,
+                previous.get(repo_id, []),
+                evidence[repo_id],
+            )
+            for repo_id, window in windows.items()
+        ]
+
+    async def _load_bounded_evidence_for(
+        self,
+        repos: dict[str, Repository],
+        windows: dict[str, _Window],
+        limits: BundleLimits,
+    ) -> dict[str, WindowEvidence]:
+        """Load each repository's window with the memory-bounded loader.
+
+        Loaders run concurrently, at most ``_BOUNDED_LOADER_CONCURRENCY`` at
+        once: each holds up to four pooled connections and its own top-K
+        rows, so the bound keeps a batch within the connection pool and a
+        small multiple of one loader's memory.
+        """
+        slots = asyncio.Semaphore(_BOUNDED_LOADER_CONCURRENCY)
+
+        async def load(
+            repo_id: str, start: dt.datetime, end: dt.datetime
+        ) -> WindowEvidence:
+            window = _WindowQuery(
+                repository_id=repo_id, window_start=start, window_end=end
             )
-            return RepositoryEvidenceBundle(
-                repository=self._build_repository_metadata(repo),
-                window_start=window_start,
-                window_end=window_end,
-                previous_reports=tuple(previous_reports),
-                commits=tuple(commit_evidence),
-                pull_requests=tuple(pr_evidence),
-                issues=tuple(issue_evidence),
-                documentation_changes=tuple(doc_evidence),
-                work_type_groupings=tuple(groupings),
-                event_fact_ids=tuple(event_fact_ids),
-                generated_at=utcnow(),
+            async with slots:
+                return await BoundedEvidenceLoader(
+                    self._session_factory, self._classification_config, limits
+                ).load(
+                    repo_id,
+                    self._uncovered_fact_conditions(repos[repo_id].slug, window),
+                )
+
+        loaded = await asyncio.gather(
+            *(load(repo_id, start, end) for repo_id, (start, end) in windows.items())
+        )
+        return dict(zip(windows, loaded, strict=True))
+
+    async def _fetch_repositories(
+        self, session: AsyncSession, repository_ids: cabc.Collection[str]
+    ) -> dict[str, Repository]:
+        """Fetch repositories by ID, failing if any are missing."""
+        repos = {
+            repo.id: repo
+            for repo in await session.scalars(
+                select(Repository).where(Repository.id.in_(repository_ids))
             )
+        }
+        if missing := sorted(set(repository_ids) - repos.keys()):
+            raise ValueError(f"Repository not found: {', '.join(missing)}")  # noqa: TRY003
+        return repos
+
+    async def _fetch_uncovered_event_facts_for(
+        self,
+        session: AsyncSession,
+        repos: dict[str, Repository],
+        windows: dict[str, _Window],
+    ) -> dict[str, list[EventFact]]:
+        """Fetch every repository's uncovered window facts in one query.
+
+        Per-repository windows and coverage are applied in SQL by mapping
+        each fact's repository slug through ``CASE`` expressions.
+        """
+        repo_ids = {repo.slug: repo_id for repo_id, repo in repos.items()}
+        slug = EventFact.repo_external_id
+        repository_id = case(repo_ids, value=slug)
+        start = case(
+            {s: literal(windows[r][0], UTCDateTime()) for s, r in repo_ids.items()},
+            value=slug,
+        )
+        end = case(
+            {s: literal(windows[r][1], UTCDateTime()) for s, r in repo_ids.items()},
+            value=slug,
+        )
+        stmt = (
+            select(EventFact)
+            .where(
+                slug.in_(repo_ids),
+                EventFact.occurred_at >= start,
+                EventFact.occurred_at < end,
+                ~covered_by_repository_report(repository_id, EventFact.id),
+            )
+            .order_by(EventFact.occurred_at.desc(), EventFact.id.desc())
+        )
+        facts: dict[str, list[EventFact]] = {repo_id: [] for repo_id in repos}
+        for fact in await session.scalars(stmt):
+            facts[repo_ids[typ.cast("str", fact.repo_external_id)]].append(fact)
+        return facts
+
+    async def _rebuild_evidence_for(
+        self, facts: dict[str, list[EventFact]]
+    ) -> dict[str, WindowEvidence]:
+        """Fetch and classify the entities of many repositories at once."""
+        targets = {
+            repo_id: self._extractor.extract(event_facts)
+            for repo_id, event_facts in facts.items()
+        }
+        repo_ids = list(targets)
+        commit_lookup: _EntityLookup[_BatchCommitRow] = _EntityLookup(
+            select(Commit.repo_id, *COMMIT_EVIDENCE_COLUMNS).where(
+                Commit.repo_id.in_(repo_ids)
+            ),
+            Commit.sha,
+            lambda row: (row.repo_id, row.sha),
+            lambda row: row.committed_at,
+        )
+        pr_lookup: _EntityLookup[_BatchPullRequestRow] = _EntityLookup(
+            select(PullRequest.repo_id, *PULL_REQUEST_EVIDENCE_COLUMNS).where(
+                PullRequest.repo_id.in_(repo_ids)
+            ),
+            PullRequest.id,
+            lambda row: (row.repo_id, row.id),
+            lambda row: row.created_at,
+        )
+        issue_lookup: _EntityLookup[_BatchIssueRow] = _EntityLookup(
+            select(Issue.repo_id, *ISSUE_EVIDENCE_COLUMNS).where(
+                Issue.repo_id.in_(repo_ids)
+            ),
+            Issue.id,
+            lambda row: (row.repo_id, row.id),
+            lambda row: row.created_at,
+        )
+        doc_lookup: _EntityLookup[_BatchDocumentationChangeRow] = _EntityLookup(
+            select(DocumentationChange.repo_id, *DOCUMENTATION_EVIDENCE_COLUMNS).where(
+                DocumentationChange.repo_id.in_(repo_ids)
+            ),
+            tuple_(DocumentationChange.commit_sha, DocumentationChange.path),
+            lambda row: (row.repo_id, (row.commit_sha, row.path)),
+            lambda row: row.occurred_at,
+        )
+        commits, prs, issues, doc_changes = await asyncio.gather(
+            self._fetch_partitioned(
+                commit_lookup,
+                {(r, sha) for r, t in targets.items() for sha in t.commit_shas},
+            ),
+            self._fetch_partitioned(
+                pr_lookup,
+                {(r, pr) for r, t in targets.items() for pr in t.pull_request_ids},
+            ),
+            self._fetch_partitioned(
+                issue_lookup,
+                {(r, issue) for r, t in targets.items() for issue in t.issue_ids},
+            ),
+            self._fetch_partitioned(
+                doc_lookup,
+                {(r, key) for r, t in targets.items() for key in t.doc_change_keys},
+            ),
+        )
+        return {
+            repo_id: self._window_evidence(
+                event_facts,
+                (
+                    commits.get(repo_id, []),
+                    prs.get(repo_id, []),
+                    issues.get(repo_id, []),
+                    doc_changes.get(repo_id, []),
+                ),
+            )
+            for repo_id, event_facts in facts.items()
+        }
+
+    async def _fetch_partitioned[T](
+        self, lookup: _EntityLookup[T], wanted: set[tuple[str, typ.Any]]
+    ) -> dict[str, list[T]]:
+        """Fetch wanted entities on their own session and group by repository.
+
+        Keys are matched across the whole batch, so rows whose key belongs to
+        another repository are dropped before partitioning. Each repository's
+        rows are ordered newest first with undated rows last.
+        """
+        if not wanted:
+            return {}
+        keys = list({key for _, key in wanted})
+        rows: dict[str, list[T]] = {}
+        async with self._session_factory() as session:
+            for offset in range(0, len(keys), _BUNDLE_BATCH_SIZE):
+                chunk = keys[offset : offset + _BUNDLE_BATCH_SIZE]
+                stmt = lookup.stmt.where(lookup.key_column.in_(chunk))
+                for row in _rows(await session.execute(stmt)):
+                    repo_id, key = lookup.row_key(row)
+                    if (repo_id, key) in wanted:
+                        rows.setdefault(repo_id, []).append(row)
+        for items in rows.values():
+            items.sort(
+                key=lambda row: (lookup.sort_at(row) is not None, lookup.sort_at(row)),
+                reverse=True,
+            )
+        return rows
 
     async def _fetch_repository(
         self, session: AsyncSession, repository_id: str
@@ -461,32 +944,71 @@ class EvidenceBundleService:
             )
             .order_by(Report.window_end.desc())
             .limit(self._max_previous_reports)
-            .options(selectinload(Report.coverage_records))
+            .options(selectinload(Report.coverage_ranges))
         )
 
         reports = (await session.scalars(stmt)).all()
+        return [self._summarise_report(report) for report in reports]
 
-        summaries = []
-        for report in reports:
-            summary = report.machine_summary or {}
-            status = self._parse_status(summary.get("status"))
-            highlights = tuple(summary.get("highlights", []))
-            risks = tuple(summary.get("risks", []))
-
-            summaries.append(
-                PreviousReportSummary(
-                    report_id=report.id,
-                    window_start=report.window_start,
-                    window_end=report.window_end,
-                    status=status,
-                    highlights=highlights,
-                    risks=risks,
-                    event_count=len(report.coverage_records),
-                )
-            )
+    async def _fetch_previous_reports_for(
+        self, session: AsyncSession, before: dict[str, dt.datetime]
+    ) -> dict[str, list[PreviousReportSummary]]:
+        """Fetch previous reports for many repositories in one query.
 
+        Reports are ranked per repository with a window function, keeping
+        the latest ``max_previous_reports`` that end before each window.
+        """
+        rank = (
+            func.row_number()
+            .over(
+                partition_by=Report.repository_id,
+                order_by=Report.window_end.desc(),
+            )
+            .label("rank")
+        )
+        cutoff = case(
+            {
+                repo_id: literal(window_start, UTCDateTime())
+                for repo_id, window_start in before.items()
+            },
+            value=Report.repository_id,
+        )
+        ranked = (
+            select(Report.id, rank)
+            .where(
+                Report.scope == ReportScope.REPOSITORY,
+                Report.repository_id.in_(before),
+                Report.window_end <= cutoff,
+            )
+            .subquery()
+        )
+        stmt = (
+            select(Report)
+            .join(ranked, ranked.c.id == Report.id)
+            .where(ranked.c.rank <= self._max_previous_reports)
+            .order_by(Report.repository_id, Report.window_end.desc())
+            .options(selectinload(Report.coverage_ranges))
+        )
+        summaries: dict[str, list[PreviousReportSummary]] = {}
+        for report in await session.scalars(stmt):
+            summaries.setdefault(typ.cast("str", report.repository_id), []).append(
+                self._summarise_report(report)
+            )
         return summaries
 
+    def _summarise_report(self, report: Report) -> PreviousReportSummary:
+        """Convert a previous report into its bundle summary."""
+        summary = report.machine_summary or {}
+        return PreviousReportSummary(
+            report_id=report.id,
+            window_start=report.window_start,
+            window_end=report.window_end,
+            status=self._parse_status(summary.get("status")),
+            highlights=tuple(summary.get("highlights", [])),
+            risks=tuple(summary.get("risks", [])),
+            event_count=sum(item.event_count for item in report.coverage_ranges),
+        )
+
     def _parse_status(self, status: typ.Any) -> ReportStatus:  # noqa: ANN401
         """Parse status string into ReportStatus enum."""
         match status:
@@ -503,79 +1025,51 @@ class EvidenceBundleService:
                 except ValueError:
                     return ReportStatus.UNKNOWN
 
-    # Evidence builders: These methods follow a consistent transformation
-    # pattern (ORM → Evidence struct) but handle entity-specific fields and
-    # classification logic. The structural similarity is inherent to the
-    # domain model and aids consistency across evidence types.
-    def _build_commit_evidence(self, commits: list[Commit]) -> list[CommitEvidence]:
-        """Convert Commit models to CommitEvidence structs."""
-
-        def build_commit(c: Commit) -> CommitEvidence:
-            return CommitEvidence(
-                sha=c.sha,
-                message=c.message,
-                author_name=c.author_name,
-                author_email=c.author_email,
-                committed_at=c.committed_at,
-                work_type=classify_commit(c, self._classification_config),
-                is_merge_commit=is_merge_commit(c),
-            )
-
-        return [build_commit(c) for c in commits]
-
-    def _build_pr_evidence(self, prs: list[PullRequest]) -> list[PullRequestEvidence]:
-        """Convert PullRequest models to PullRequestEvidence structs."""
-
-        def build_pr(pr: PullRequest) -> PullRequestEvidence:
-            return PullRequestEvidence(
-                id=pr.id,
-                number=pr.number,
-                title=pr.title,
-                author_login=pr.author_login,
-                state=pr.state,
-                labels=tuple(pr.labels),
-                created_at=pr.created_at,
-                merged_at=pr.merged_at,
-                closed_at=pr.closed_at,
-                work_type=classify_entity(pr, self._classification_config),
-                is_draft=pr.is_draft,
-            )
+    # Evidence builders convert entity rows to classified evidence structs; the
+    # per-row conversions are module-level so the rolling bundle maintainer
+    # builds identical evidence. Each kind is classified as one batch.
+    def _build_commit_evidence(
+        self, commits: cabc.Sequence[CommitRow]
+    ) -> list[CommitEvidence]:
+        """Convert commit rows to CommitEvidence structs."""
+        config = self._classification_config
+        work_types = classify_many((c.message for c in commits), config=config)
+        return [
+            commit_evidence(c, config, work_type=work_type)
+            for c, work_type in zip(commits, work_types, strict=True)
+        ]
 
-        return [build_pr(pr) for pr in prs]
-
-    def _build_issue_evidence(self, issues: list[Issue]) -> list[IssueEvidence]:
-        """Convert Issue models to IssueEvidence structs."""
-
-        def build_issue(i: Issue) -> IssueEvidence:
-            return IssueEvidence(
-                id=i.id,
-                number=i.number,
-                title=i.title,
-                author_login=i.author_login,
-                state=i.state,
-                labels=tuple(i.labels),
-                created_at=i.created_at,
-                closed_at=i.closed_at,
-                work_type=classify_entity(i, self._classification_config),
-            )
+    def _build_pr_evidence(
+        self, prs: cabc.Sequence[PullRequestRow]
+    ) -> list[PullRequestEvidence]:
+        """Convert pull request rows to PullRequestEvidence structs."""
+        config = self._classification_config
+        work_types = classify_many(
+            (pr.title for pr in prs), (pr.labels for pr in prs), config
+        )
+        return [
+            pull_request_evidence(pr, config, work_type=work_type)
+            for pr, work_type in zip(prs, work_types, strict=True)
+        ]
 
-        return [build_issue(i) for i in issues]
+    def _build_issue_evidence(
+        self, issues: cabc.Sequence[IssueRow]
+    ) -> list[IssueEvidence]:
+        """Convert issue rows to IssueEvidence structs."""
+        config = self._classification_config
+        work_types = classify_many(
+            (i.title for i in issues), (i.labels for i in issues), config
+        )
+        return [
+            issue_evidence(i, config, work_type=work_type)
+            for i, work_type in zip(issues, work_types, strict=True)
+        ]
 
     def _build_doc_evidence(
-        self, doc_changes: list[DocumentationChange]
+        self, doc_changes: cabc.Sequence[DocumentationChangeRow]
     ) -> list[DocumentationEvidence]:
-        """Convert DocumentationChange models to DocumentationEvidence structs."""
-        return [
-            DocumentationEvidence(
-                path=doc.path,
-                change_type=doc.change_type,
-                commit_sha=doc.commit_sha,
-                occurred_at=doc.occurred_at,
-                is_roadmap=doc.is_roadmap,
-                is_adr=doc.is_adr,
-            )
-            for doc in doc_changes
-        ]
+        """Convert documentation change rows to DocumentationEvidence structs."""
+        return [documentation_evidence(doc) for doc in doc_changes]
 
     def _populate_entity_bucket[E: _ClassifiableEvidence](
         self,
@@ -0,0 +1,96 @@
+"""Compressed evidence bundle snapshots stored with Gold reports.
+
+Each repository report persists the exact ``RepositoryEvidenceBundle`` its
+status model saw as a ``ReportEvidenceSnapshot`` row: the bundle is encoded
+with ``msgspec.msgpack`` and compressed with ``zlib``. Loading a snapshot is a
+single primary-key read, so a report can be debugged, reproduced, or
+re-summarised after a prompt or model change without querying Silver, whose
+contents may have moved on since the report was generated.
+"""
+
+from __future__ import annotations
+
+import typing as typ
+import zlib
+
+import msgspec
+
+from ghillie.gold.storage import ReportEvidenceSnapshot
+
+from .models import RepositoryEvidenceBundle
+
+if typ.TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+SNAPSHOT_ENCODING = "msgpack+zlib"
+
+_ENCODER = msgspec.msgpack.Encoder()
+_DECODER = msgspec.msgpack.Decoder(RepositoryEvidenceBundle)
+# Bundles are mostly repetitive text; a mid-range level keeps compression
+# cheap relative to report generation while capturing most of the saving.
+_COMPRESSION_LEVEL = 6
+
+
+def encode_bundle_snapshot(bundle: RepositoryEvidenceBundle) -> tuple[bytes, int]:
+    """Encode and compress a bundle.
+
+    Returns
+    -------
+    tuple[bytes, int]
+        The compressed payload and the size of the encoding before
+        compression.
+
+    """
+    encoded = _ENCODER.encode(bundle)
+    return zlib.compress(encoded, _COMPRESSION_LEVEL), len(encoded)
+
+
+def decode_bundle_snapshot(
+    payload: bytes, encoding: str = SNAPSHOT_ENCODING
+) -> RepositoryEvidenceBundle:
+    """Decompress and decode a bundle snapshot payload.
+
+    Raises
+    ------
+    ValueError
+        If ``encoding`` is not a supported snapshot encoding.
+
+    """
+    if encoding != SNAPSHOT_ENCODING:
+        msg = f"Unsupported evidence snapshot encoding: {encoding!r}"
+        raise ValueError(msg)
+    return _DECODER.decode(zlib.decompress(payload))
+
+
+async def store_bundle_snapshot(
+    session: AsyncSession, report_id: str, bundle: RepositoryEvidenceBundle
+) -> None:
+    """Add the snapshot of ``bundle`` for ``report_id`` to the session."""
+    payload, raw_size = encode_bundle_snapshot(bundle)
+    session.add(
+        ReportEvidenceSnapshot(
+            report_id=report_id,
+            encoding=SNAPSHOT_ENCODING,
+            payload=payload,
+            raw_size=raw_size,
+        )
+    )
+    await session.flush()
+
+
+async def load_bundle_snapshot(
+    session: AsyncSession, report_id: str
+) -> RepositoryEvidenceBundle | None:
+    """Load the evidence bundle a report was generated from.
+
+    Returns
+    -------
+    RepositoryEvidenceBundle | None
+        The stored bundle, or ``None`` if the report has no snapshot (for
+        example, reports generated before snapshots were recorded).
+
+    """
+    snapshot = await session.get(ReportEvidenceSnapshot, report_id)
+    if snapshot is None:
+        return None
+    return decode_bundle_snapshot(snapshot.payload, snapshot.encoding)
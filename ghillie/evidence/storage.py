@@ -0,0 +1,90 @@
+"""Materialised open-window evidence state for repository bundles.
+
+The Silver transformer keeps these tables current as event facts arrive (see
+``ghillie.evidence.rolling``), so a repository bundle can be read from
+pre-classified evidence instead of being rebuilt from Silver entities on
+every reporting run.
+
+``rolling_evidence_facts`` records each event fact of a repository with the
+entity it references, if any. ``rolling_evidence_entries`` holds one
+classified evidence struct per referenced entity, refreshed whenever a new
+fact for that entity is transformed. Facts are removed once a repository
+report covers them, and entries once no remaining fact references them.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import enum
+import typing as typ
+
+from sqlalchemy import JSON, ForeignKey, Index, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ghillie.bronze.storage import Base, UTCDateTime
+from ghillie.common.time import utcnow
+
+if typ.TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class EvidenceKind(enum.StrEnum):
+    """Kinds of entity evidence held in rolling bundle state."""
+
+    COMMIT = "commit"
+    PULL_REQUEST = "pull_request"
+    ISSUE = "issue"
+    DOCUMENTATION_CHANGE = "documentation_change"
+
+
+class RollingEvidenceFact(Base):
+    """An uncovered event fact and the entity it references."""
+
+    __tablename__ = "rolling_evidence_facts"
+    __table_args__ = (
+        Index(
+            "ix_rolling_evidence_facts_repo_occurred",
+            "repo_external_id",
+            "occurred_at",
+        ),
+    )
+
+    event_fact_id: Mapped[int] = mapped_column(
+        ForeignKey("event_facts.id", ondelete="CASCADE"), primary_key=True
+    )
+    repo_external_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    occurred_at: Mapped[dt.datetime] = mapped_column(UTCDateTime(), nullable=False)
+    kind: Mapped[str | None] = mapped_column(String(32), default=None)
+    entity_key: Mapped[str | None] = mapped_column(String(1024), default=None)
+
+
+class RollingEvidenceEntry(Base):
+    """Classified evidence for one entity referenced by uncovered facts."""
+
+    __tablename__ = "rolling_evidence_entries"
+    __table_args__ = (
+        UniqueConstraint(
+            "repo_external_id",
+            "kind",
+            "entity_key",
+            name="uq_rolling_evidence_entries_entity",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    repo_external_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    kind: Mapped[str] = mapped_column(String(32), nullable=False)
+    entity_key: Mapped[str] = mapped_column(String(1024), nullable=False)
+    work_type: Mapped[str | None] = mapped_column(String(32), default=None)
+    sort_at: Mapped[dt.datetime | None] = mapped_column(UTCDateTime(), default=None)
+    # msgspec builtins of the evidence struct named by ``kind``.
+    evidence: Mapped[dict[str, typ.Any]] = mapped_column(JSON, nullable=False)
+    updated_at: Mapped[dt.datetime] = mapped_column(
+        UTCDateTime(), default=utcnow, onupdate=utcnow, nullable=False
+    )
+
+
+async def init_evidence_storage(engine: AsyncEngine) -> None:
+    """Create all tables registered with Base if they are absent."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
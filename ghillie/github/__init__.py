@@ -1,12 +1,33 @@
 """GitHub ingestion client and worker primitives."""
 
-from .client import GitHubActivityClient, GitHubGraphQLClient, GitHubGraphQLConfig
+from .backfill import (
+    BackfillSlice,
+    GitHubBackfillConfig,
+    GitHubBackfillResult,
+    GitHubBackfillWorker,
+    plan_backfill_slices,
+)
+from .client import (
+    GitHubActivityClient,
+    GitHubGraphQLClient,
+    GitHubGraphQLConfig,
+    GitHubHistoryClient,
+)
+from .credentials import (
+    AppInstallationCredential,
+    FileInstallationTokenCache,
+    GitHubCredential,
+    GitHubTokenPool,
+    StaticTokenCredential,
+)
 from .ingestion import (
     GitHubIngestionConfig,
     GitHubIngestionResult,
     GitHubIngestionWorker,
 )
 from .lag import IngestionHealthConfig, IngestionHealthService, IngestionLagMetrics
+from .mirror import GitMirrorActivityClient, GitMirrorConfig
+from .noise_cache import NoiseFilterCache
 from .observability import (
     ErrorCategory,
     IngestionEventLogger,
@@ -16,18 +37,32 @@ from .observability import (
 )
 
 __all__ = [
+    "AppInstallationCredential",
+    "BackfillSlice",
     "ErrorCategory",
+    "FileInstallationTokenCache",
     "GitHubActivityClient",
+    "GitHubBackfillConfig",
+    "GitHubBackfillResult",
+    "GitHubBackfillWorker",
+    "GitHubCredential",
     "GitHubGraphQLClient",
     "GitHubGraphQLConfig",
+    "GitHubHistoryClient",
     "GitHubIngestionConfig",
     "GitHubIngestionResult",
     "GitHubIngestionWorker",
+    "GitHubTokenPool",
+    "GitMirrorActivityClient",
+    "GitMirrorConfig",
     "IngestionEventLogger",
     "IngestionEventType",
     "IngestionHealthConfig",
     "IngestionHealthService",
     "IngestionLagMetrics",
     "IngestionRunContext",
+    "NoiseFilterCache",
+    "StaticTokenCredential",
     "categorize_error",
+    "plan_backfill_slices",
 ]
@@ -0,0 +1,350 @@
+"""Parallel, restartable historical backfill for GitHub repositories.
+
+Steady-state ingestion walks newest-first with a per-kind event cap, which
+makes onboarding a repository with years of history take hundreds of
+truncated runs. The backfill worker instead splits ``(start, end]`` into
+time slices, fetches the slices concurrently, and writes each page of events
+through bulk Bronze inserts. Completed slices are recorded in
+``github_backfill_slices`` so an interrupted backfill can be re-run and will
+only fetch the slices that did not finish.
+
+Commit history (and therefore documentation changes) supports ``since`` and
+``until`` bounds, so those kinds are sliced. Pull request and issue
+connections can only be bounded from below, so each is fetched as a single
+slice spanning the whole window.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import datetime as dt
+import typing as typ
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from ghillie.bronze import GithubBackfillSlice, GithubIngestionOffset, RawEventWriter
+from ghillie.common.time import utcnow
+from ghillie.logging import get_logger, log_info
+
+from .ingestion import envelope_from_event
+from .noise_cache import NoiseFilterCache
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from ghillie.bronze import RawEventEnvelope
+    from ghillie.registry.models import RepositoryInfo
+
+    from .client import GitHubHistoryClient
+    from .models import GitHubIngestedEvent
+    from .noise import CompiledNoiseFilters
+
+    type SessionFactory = async_sessionmaker[AsyncSession]
+
+logger = get_logger(__name__)
+
+type BackfillKind = typ.Literal["commit", "pull_request", "issue", "doc_change"]
+
+_SLICED_KINDS: frozenset[BackfillKind] = frozenset({"commit", "doc_change"})
+
+# (cursor attribute, watermark attribute) on GithubIngestionOffset per kind.
+_OFFSET_ATTRS: dict[BackfillKind, tuple[str, str]] = {
+    "commit": ("last_commit_cursor", "last_commit_ingested_at"),
+    "pull_request": ("last_pr_cursor", "last_pr_ingested_at"),
+    "issue": ("last_issue_cursor", "last_issue_ingested_at"),
+    "doc_change": ("last_doc_cursor", "last_doc_ingested_at"),
+}
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitHubBackfillConfig:
+    """Runtime knobs for historical backfill."""
+
+    slice_span: dt.timedelta = dt.timedelta(days=30)
+    max_concurrent_slices: int = 8
+    batch_size: int = 500
+    kinds: tuple[BackfillKind, ...] = ("commit", "pull_request", "issue", "doc_change")
+    catalogue_session_factory: SessionFactory | None = None
+    noise_filter_cache: NoiseFilterCache | None = None
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class BackfillSlice:
+    """A single unit of backfill work: one kind over ``(start, end]``."""
+
+    kind: BackfillKind
+    start: dt.datetime
+    end: dt.datetime
+
+    def contains(self, occurred_at: dt.datetime) -> bool:
+        """Return True when the timestamp falls inside this slice."""
+        return self.start < occurred_at <= self.end
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitHubBackfillResult:
+    """Summary of a repository backfill run."""
+
+    repo_slug: str
+    slices_total: int = 0
+    slices_skipped: int = 0
+    slices_completed: int = 0
+    events_ingested: int = 0
+
+
+def _require_utc(value: dt.datetime, *, field: str) -> dt.datetime:
+    if value.tzinfo is None:
+        msg = f"{field} must be timezone-aware"
+        raise ValueError(msg)
+    return value.astimezone(dt.UTC)
+
+
+def plan_backfill_slices(
+    start: dt.datetime,
+    end: dt.datetime,
+    *,
+    slice_span: dt.timedelta,
+    kinds: cabc.Sequence[BackfillKind],
+) -> list[BackfillSlice]:
+    """Split ``(start, end]`` into backfill slices for each requested kind.
+
+    Commit and documentation-change history is cut into consecutive slices of
+    ``slice_span``; the final slice is clipped to ``end``. Pull requests and
+    issues are planned as one slice covering the whole window because their
+    GraphQL connections cannot be bounded from above.
+
+    Raises
+    ------
+    ValueError
+        If either bound is naive, ``start`` is not before ``end``, or
+        ``slice_span`` is not positive.
+
+    """
+    start_utc = _require_utc(start, field="start")
+    end_utc = _require_utc(end, field="end")
+    if start_utc >= end_utc:
+        msg = "backfill start must be before end"
+        raise ValueError(msg)
+    if slice_span <= dt.timedelta(0):
+        msg = "slice_span must be positive"
+        raise ValueError(msg)
+
+    slices: list[BackfillSlice] = []
+    for kind in dict.fromkeys(kinds):
+        if kind not in _SLICED_KINDS:
+            slices.append(BackfillSlice(kind=kind, start=start_utc, end=end_utc))
+            continue
+        cursor = start_utc
+        while cursor < end_utc:
+            slice_end = min(cursor + slice_span, end_utc)
+            slices.append(BackfillSlice(kind=kind, start=cursor, end=slice_end))
+            cursor = slice_end
+    return slices
+
+
+type _SliceKey = tuple[str, dt.datetime, dt.datetime]
+
+
+def _slice_key(backfill_slice: BackfillSlice) -> _SliceKey:
+    return (backfill_slice.kind, backfill_slice.start, backfill_slice.end)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _SliceRunContext:
+    """State shared by every slice of one repository backfill."""
+
+    repo: RepositoryInfo
+    writer: RawEventWriter
+    noise: CompiledNoiseFilters
+    semaphore: asyncio.Semaphore
+
+
+class GitHubBackfillWorker:
+    """Fetch historical GitHub activity in concurrent, restartable time slices."""
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        client: GitHubHistoryClient,
+        *,
+        config: GitHubBackfillConfig | None = None,
+    ) -> None:
+        """Create a backfill worker bound to a session factory and client."""
+        self._session_factory = session_factory
+        self._client = client
+        resolved_config = config or GitHubBackfillConfig()
+        if resolved_config.max_concurrent_slices < 1:
+            msg = "max_concurrent_slices must be at least 1"
+            raise ValueError(msg)
+        if resolved_config.batch_size < 1:
+            msg = "batch_size must be at least 1"
+            raise ValueError(msg)
+        self._config = resolved_config
+        self._noise_cache = resolved_config.noise_filter_cache or NoiseFilterCache(
+            resolved_config.catalogue_session_factory or session_factory
+        )
+
+    async def backfill_repository(
+        self,
+        repo: RepositoryInfo,
+        *,
+        start: dt.datetime,
+        end: dt.datetime,
+    ) -> GitHubBackfillResult:
+        """Backfill ``(start, end]`` for a repository.
+
+        Slices already recorded as complete are skipped, so re-running with
+        the same bounds and slice span resumes an interrupted backfill. Once
+        every slice has finished, steady-state watermarks that lag behind
+        ``end`` are advanced to ``end`` so incremental ingestion picks up
+        where the backfill ended. If any slice fails, the remaining slices
+        still run to completion (and are recorded) before the first failure
+        is re-raised.
+        """
+        slices = plan_backfill_slices(
+            start,
+            end,
+            slice_span=self._config.slice_span,
+            kinds=self._config.kinds,
+        )
+        completed = await self._load_completed_slices(repo.slug)
+        pending = [item for item in slices if _slice_key(item) not in completed]
+
+        context = _SliceRunContext(
+            repo=repo,
+            writer=RawEventWriter(self._session_factory),
+            noise=await self._noise_cache.filters_for(repo),
+            semaphore=asyncio.Semaphore(self._config.max_concurrent_slices),
+        )
+        gathered = await asyncio.gather(
+            *(self._run_slice(context, item) for item in pending),
+            return_exceptions=True,
+        )
+        for outcome in gathered:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+        ingested = sum(typ.cast("list[int]", gathered))
+        await self._advance_offsets(repo.slug, end_utc=end.astimezone(dt.UTC))
+        log_info(
+            logger,
+            "Backfill for %s complete: %d slices fetched, %d skipped, %d events",
+            repo.slug,
+            len(pending),
+            len(slices) - len(pending),
+            ingested,
+        )
+        return GitHubBackfillResult(
+            repo_slug=repo.slug,
+            slices_total=len(slices),
+            slices_skipped=len(slices) - len(pending),
+            slices_completed=len(pending),
+            events_ingested=ingested,
+        )
+
+    def _stream_for_slice(
+        self, repo: RepositoryInfo, backfill_slice: BackfillSlice
+    ) -> cabc.AsyncIterator[GitHubIngestedEvent]:
+        """Select the bounded activity stream for a slice."""
+        kind = backfill_slice.kind
+        if kind == "commit":
+            return self._client.iter_commits(
+                repo, since=backfill_slice.start, until=backfill_slice.end
+            )
+        if kind == "doc_change":
+            return self._client.iter_doc_changes(
+                repo,
+                since=backfill_slice.start,
+                documentation_paths=repo.documentation_paths,
+                until=backfill_slice.end,
+            )
+        if kind == "pull_request":
+            return self._client.iter_pull_requests(repo, since=backfill_slice.start)
+        return self._client.iter_issues(repo, since=backfill_slice.start)
+
+    async def _run_slice(
+        self, context: _SliceRunContext, backfill_slice: BackfillSlice
+    ) -> int:
+        """Fetch, filter, and bulk-write one slice, then record its completion."""
+        async with context.semaphore:
+            ingested = 0
+            batch: list[RawEventEnvelope] = []
+            stream = self._stream_for_slice(context.repo, backfill_slice)
+            async for event in stream:
+                # Pull request and issue streams are only bounded below, so
+                # events updated after the window are left to steady state.
+                if not backfill_slice.contains(event.occurred_at):
+                    continue
+                if context.noise.should_drop(event):
+                    continue
+                batch.append(envelope_from_event(context.repo, event))
+                if len(batch) >= self._config.batch_size:
+                    ingested += await context.writer.ingest_many(batch)
+                    batch = []
+            if batch:
+                ingested += await context.writer.ingest_many(batch)
+
+            await self._mark_slice_completed(
+                context.repo.slug, backfill_slice, ingested
+            )
+            return ingested
+
+    async def _load_completed_slices(self, repo_slug: str) -> set[_SliceKey]:
+        async with self._session_factory() as session:
+            rows = await session.execute(
+                select(
+                    GithubBackfillSlice.kind,
+                    GithubBackfillSlice.slice_start,
+                    GithubBackfillSlice.slice_end,
+                ).where(GithubBackfillSlice.repo_external_id == repo_slug)
+            )
+            return {(kind, start, end) for kind, start, end in rows}
+
+    async def _mark_slice_completed(
+        self, repo_slug: str, backfill_slice: BackfillSlice, ingested: int
+    ) -> None:
+        async with self._session_factory() as session:
+            session.add(
+                GithubBackfillSlice(
+                    repo_external_id=repo_slug,
+                    kind=backfill_slice.kind,
+                    slice_start=backfill_slice.start,
+                    slice_end=backfill_slice.end,
+                    events_ingested=ingested,
+                    completed_at=utcnow(),
+                )
+            )
+            try:
+                await session.commit()
+            except IntegrityError:
+                # A concurrent backfill already recorded this slice.
+                await session.rollback()
+
+    async def _advance_offsets(self, repo_slug: str, *, end_utc: dt.datetime) -> None:
+        """Move steady-state watermarks forward to the end of the backfill.
+
+        Kinds with an in-flight resume cursor are left alone so an
+        interrupted incremental run can finish its own pagination.
+        """
+        async with self._session_factory() as session, session.begin():
+            offsets = await session.scalar(
+                select(GithubIngestionOffset).where(
+                    GithubIngestionOffset.repo_external_id == repo_slug
+                )
+            )
+            if offsets is None:
+                offsets = GithubIngestionOffset(repo_external_id=repo_slug)
+                session.add(offsets)
+            for kind in self._config.kinds:
+                cursor_attr, watermark_attr = _OFFSET_ATTRS[kind]
+                if getattr(offsets, cursor_attr) is not None:
+                    continue
+                current = typ.cast(
+                    "dt.datetime | None", getattr(offsets, watermark_attr)
+                )
+                if current is None or current < end_utc:
+                    setattr(offsets, watermark_attr, end_utc)
@@ -15,6 +15,9 @@ from ghillie.registry.models import RepositoryInfo
 from .errors import GitHubAPIError, GitHubConfigError, GitHubResponseShapeError
 from .models import GitHubIngestedEvent
 
+if typ.TYPE_CHECKING:
+    from .credentials import GitHubTokenPool
+
 
 class GitHubActivityClient(typ.Protocol):
     """Interface for fetching GitHub activity for ingestion."""
@@ -49,11 +52,46 @@ class GitHubActivityClient(typ.Protocol):
         ...
 
 
+class GitHubHistoryClient(GitHubActivityClient, typ.Protocol):
+    """Activity client that can bound commit history on both ends.
+
+    Historical backfill splits a long window into slices and needs to fetch
+    commit history between two timestamps. GitHub commit history supports
+    ``until`` alongside ``since``; pull request and issue connections do not.
+    """
+
+    def iter_commits(
+        self,
+        repo: RepositoryInfo,
+        *,
+        since: dt.datetime,
+        after: str | None = None,
+        until: dt.datetime | None = None,
+    ) -> cabc.AsyncIterator[GitHubIngestedEvent]:
+        """Yield commit events committed after ``since`` and up to ``until``."""
+        ...
+
+    def iter_doc_changes(  # noqa: PLR0913
+        self,
+        repo: RepositoryInfo,
+        *,
+        since: dt.datetime,
+        documentation_paths: cabc.Sequence[str],
+        after: str | None = None,
+        until: dt.datetime | None = None,
+    ) -> cabc.AsyncIterator[GitHubIngestedEvent]:
+        """Yield documentation change events between ``since`` and ``until``."""
+        ...
+
+
 @dataclasses.dataclass(frozen=True, slots=True)
 class GitHubGraphQLConfig:
-    """Configuration for the GitHub GraphQL API client."""
+    """Configuration for the GitHub GraphQL API client.
 
-    token: str
+    ``token`` may be left empty when the client is given a token pool.
+    """
+
+    token: str = ""
     endpoint: str = "https://api.github.com/graphql"
     timeout_s: float = 20.0
     user_agent: str = "ghillie/0.1"
@@ -67,12 +105,13 @@ class GitHubGraphQLConfig:
         return cls(token=token)
 
 
-_COMMITS_QUERY = """
+COMMITS_QUERY = """
 query(
   $owner: String!
   $name: String!
   $qualifiedName: String!
   $since: GitTimestamp!
+  $until: GitTimestamp
   $after: String
   $path: String
 ) {
@@ -80,7 +119,13 @@ query(
     ref(qualifiedName: $qualifiedName) {
       target {
         ... on Commit {
-          history(first: 100, since: $since, after: $after, path: $path) {
+          history(
+            first: 100
+            since: $since
+            until: $until
+            after: $after
+            path: $path
+          ) {
             pageInfo {
               hasNextPage
               endCursor
@@ -106,7 +151,7 @@ query(
 }
 """
 
-_PULL_REQUESTS_QUERY = """
+PULL_REQUESTS_QUERY = """
 query($owner: String!, $name: String!, $after: String) {
   repository(owner: $owner, name: $name) {
     pullRequests(
@@ -141,7 +186,7 @@ query($owner: String!, $name: String!, $after: String) {
 }
 """
 
-_ISSUES_QUERY = """
+ISSUES_QUERY = """
 query($owner: String!, $name: String!, $after: String) {
   repository(owner: $owner, name: $name) {
     issues(
@@ -175,13 +220,21 @@ query($owner: String!, $name: String!, $after: String) {
 _HTTP_ERROR_STATUS_THRESHOLD = int(HTTPStatus.BAD_REQUEST)
 
 
-def _ensure_tzaware(value: dt.datetime, *, field: str) -> dt.datetime:
+def ensure_tzaware(value: dt.datetime, *, field: str) -> dt.datetime:
+    """Return ``value`` in UTC, rejecting naive datetimes."""
     if value.tzinfo is None:
         msg = f"{field} must be timezone-aware"
         raise ValueError(msg)
     return value.astimezone(dt.UTC)
 
 
+def _optional_timestamp(value: dt.datetime | None, *, field: str) -> str | None:
+    """Return an ISO-8601 UTC timestamp for optional query bounds."""
+    if value is None:
+        return None
+    return ensure_tzaware(value, field=field).isoformat()
+
+
 def _parse_github_datetime(value: str) -> dt.datetime:
     text = value.replace("Z", "+00:00")
     parsed = dt.datetime.fromisoformat(text)
@@ -191,6 +244,11 @@ def _parse_github_datetime(value: str) -> dt.datetime:
     return parsed.astimezone(dt.UTC)
 
 
+def format_github_datetime(value: dt.datetime) -> str:
+    """Format a timestamp as GitHub's GraphQL API does, e.g. ``...T12:00:00Z``."""
+    return value.astimezone(dt.UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 def _label_names(labels: dict[str, typ.Any] | None) -> list[str]:
     if not labels:
         return []
@@ -220,7 +278,8 @@ def _coerce_pr_state(state: str, merged_at: str | None) -> str:
     return lowered
 
 
-def _classify_documentation_path(path: str) -> tuple[bool, bool]:
+def classify_documentation_path(path: str) -> tuple[bool, bool]:
+    """Return whether ``path`` is a roadmap and whether it is an ADR."""
     lowered = path.lower()
     is_roadmap = "roadmap" in lowered
     normalised = PureWindowsPath(lowered).as_posix()
@@ -337,12 +396,13 @@ class _DocChangePathContext:
     qualified_name: str
     cursor: str | None
     spec: _DocChangeSpec
+    until: dt.datetime | None = None
 
 
 _DOC_CURSOR_SEPARATOR = "\n"
 
 
-def _decode_doc_cursor(after: str | None) -> tuple[str | None, str | None]:
+def decode_doc_cursor(after: str | None) -> tuple[str | None, str | None]:
     """Decode a stored doc cursor into (path, cursor) components."""
     if after is None:
         return (None, None)
@@ -352,7 +412,7 @@ def _decode_doc_cursor(after: str | None) -> tuple[str | None, str | None]:
     return (path, cursor or None)
 
 
-def _encode_doc_cursor(path: str, cursor: str | None) -> str | None:
+def encode_doc_cursor(path: str, cursor: str | None) -> str | None:
     """Encode a doc cursor by pairing a path with a history cursor."""
     if cursor is None:
         return None
@@ -397,7 +457,7 @@ def _doc_change_event_from_edge(
         source_event_id=f"{oid}:{spec.path}",
         occurred_at=occurred_at,
         payload=payload,
-        cursor=_encode_doc_cursor(spec.path, cursor_value),
+        cursor=encode_doc_cursor(spec.path, cursor_value),
     )
 
 
@@ -485,7 +545,7 @@ class _EntitySpec:
 
 _ENTITY_SPECS: dict[typ.Literal["pull_request", "issue"], _EntitySpec] = {
     "pull_request": _EntitySpec(
-        query=_PULL_REQUESTS_QUERY,
+        query=PULL_REQUESTS_QUERY,
         connection_path=["repository", "pullRequests"],
         entity_name="pull request",
         node_to_event=lambda repo, edge, since: _event_from_edge(
@@ -493,7 +553,7 @@ _ENTITY_SPECS: dict[typ.Literal["pull_request", "issue"], _EntitySpec] = {
         ),
     ),
     "issue": _EntitySpec(
-        query=_ISSUES_QUERY,
+        query=ISSUES_QUERY,
         connection_path=["repository", "issues"],
         entity_name="issue",
         node_to_event=lambda repo, edge, since: _event_from_edge(
@@ -639,20 +699,25 @@ class GitHubGraphQLClient:
         config: GitHubGraphQLConfig,
         *,
         http_client: httpx.AsyncClient | None = None,
+        token_pool: GitHubTokenPool | None = None,
     ) -> None:
-        """Initialise the client with the provided API configuration."""
-        if not config.token.strip():
+        """Initialise the client with the provided API configuration.
+
+        When ``token_pool`` is given, each request is authenticated with the
+        credential the pool selects for its repository and the pool is fed
+        the rate-limit headers of every response; ``config.token`` is unused.
+        """
+        if token_pool is None and not config.token.strip():
             raise GitHubConfigError.empty_token()
 
         self._config = config
+        self._token_pool = token_pool
         self._owns_client = http_client is None
+        headers = {"User-Agent": config.user_agent, "Accept": "application/json"}
+        if token_pool is None:
+            headers["Authorization"] = f"Bearer {config.token}"
         self._client = http_client or httpx.AsyncClient(
-            timeout=config.timeout_s,
-            headers={
-                "Authorization": f"Bearer {config.token}",
-                "User-Agent": config.user_agent,
-                "Accept": "application/json",
-            },
+            timeout=config.timeout_s, headers=headers
         )
 
     async def aclose(self) -> None:
@@ -666,23 +731,31 @@ class GitHubGraphQLClient:
         *,
         since: dt.datetime,
         after: str | None = None,
+        until: dt.datetime | None = None,
     ) -> cabc.AsyncIterator[GitHubIngestedEvent]:
-        """Yield commit snapshot events on the default branch."""
-        since_utc = _ensure_tzaware(since, field="since")
+        """Yield commit snapshot events on the default branch.
+
+        ``until`` optionally bounds the history so historical backfill can
+        fetch disjoint time slices concurrently.
+        """
+        since_utc = ensure_tzaware(since, field="since")
+        until_text = _optional_timestamp(until, field="until")
         qualified_name = f"refs/heads/{repo.default_branch}"
         after_cursor: str | None = after
 
         while True:
             data = await self._graphql(
-                _COMMITS_QUERY,
+                COMMITS_QUERY,
                 {
                     "owner": repo.owner,
                     "name": repo.name,
                     "qualifiedName": qualified_name,
                     "since": since_utc.isoformat(),
+                    "until": until_text,
                     "after": after_cursor,
                     "path": None,
                 },
+                repo=repo,
             )
             history = _extract_commit_history(data)
             edges = _connection_edges(history, field="commit history")
@@ -723,6 +796,7 @@ class GitHubGraphQLClient:
             data = await self._graphql(
                 query,
                 {"owner": repo.owner, "name": repo.name, "after": after_cursor},
+                repo=repo,
             )
             connection = _extract_connection(data, connection_path)
             edges = _connection_edges(connection, field=entity_name)
@@ -749,7 +823,7 @@ class GitHubGraphQLClient:
         after: str | None = None,
     ) -> cabc.AsyncIterator[GitHubIngestedEvent]:
         """Yield pull request snapshot events updated since a timestamp."""
-        since_utc = _ensure_tzaware(since, field="since")
+        since_utc = ensure_tzaware(since, field="since")
         async for event in self._iter_paginated_entities(
             repo,
             since=since_utc,
@@ -766,7 +840,7 @@ class GitHubGraphQLClient:
         after: str | None = None,
     ) -> cabc.AsyncIterator[GitHubIngestedEvent]:
         """Yield issue snapshot events updated since a timestamp."""
-        since_utc = _ensure_tzaware(since, field="since")
+        since_utc = ensure_tzaware(since, field="since")
         async for event in self._iter_paginated_entities(
             repo,
             since=since_utc,
@@ -782,15 +856,17 @@ class GitHubGraphQLClient:
         path_cursor = context.cursor
         while True:
             data = await self._graphql(
-                _COMMITS_QUERY,
+                COMMITS_QUERY,
                 {
                     "owner": context.repo.owner,
                     "name": context.repo.name,
                     "qualifiedName": context.qualified_name,
                     "since": context.since.isoformat(),
+                    "until": _optional_timestamp(context.until, field="until"),
                     "after": path_cursor,
                     "path": context.path,
                 },
+                repo=context.repo,
             )
             history = _extract_commit_history(data)
             edges = _connection_edges(history, field="doc change commit history")
@@ -806,18 +882,19 @@ class GitHubGraphQLClient:
             if not isinstance(path_cursor, str):
                 break
 
-    async def iter_doc_changes(
+    async def iter_doc_changes(  # noqa: PLR0913
         self,
         repo: RepositoryInfo,
         *,
         since: dt.datetime,
         documentation_paths: cabc.Sequence[str],
         after: str | None = None,
+        until: dt.datetime | None = None,
     ) -> cabc.AsyncIterator[GitHubIngestedEvent]:
         """Yield documentation change events for documentation path commits."""
-        since_utc = _ensure_tzaware(since, field="since")
+        since_utc = ensure_tzaware(since, field="since")
         qualified_name = f"refs/heads/{repo.default_branch}"
-        resume_path, resume_cursor = _decode_doc_cursor(after)
+        resume_path, resume_cursor = decode_doc_cursor(after)
 
         for path in documentation_paths:
             # If resuming, skip earlier paths; apply the resume cursor once on the
@@ -826,7 +903,7 @@ class GitHubGraphQLClient:
                 continue
             path_cursor, resume_cursor = resume_cursor, None
             resume_path = None
-            is_roadmap, is_adr = _classify_documentation_path(path)
+            is_roadmap, is_adr = classify_documentation_path(path)
             spec = _DocChangeSpec(path=path, is_roadmap=is_roadmap, is_adr=is_adr)
             context = _DocChangePathContext(
                 repo=repo,
@@ -835,18 +912,32 @@ class GitHubGraphQLClient:
                 qualified_name=qualified_name,
                 cursor=path_cursor,
                 spec=spec,
+                until=until,
             )
             async for event in self._iter_doc_changes_for_path(context):
                 yield event
 
     async def _graphql(
-        self, query: str, variables: dict[str, typ.Any]
+        self,
+        query: str,
+        variables: dict[str, typ.Any],
+        *,
+        repo: RepositoryInfo | None = None,
     ) -> dict[str, typ.Any]:
         """Execute a GraphQL query and return the validated data field."""
-        response = await self._client.post(
-            self._config.endpoint,
-            json={"query": query, "variables": variables},
-        )
+        if self._token_pool is None:
+            response = await self._client.post(
+                self._config.endpoint,
+                json={"query": query, "variables": variables},
+            )
+        else:
+            credential = self._token_pool.select(repo)
+            response = await self._client.post(
+                self._config.endpoint,
+                json={"query": query, "variables": variables},
+                headers={"Authorization": f"Bearer {await credential.token()}"},
+            )
+            self._token_pool.record(credential, response.headers)
         if response.status_code >= _HTTP_ERROR_STATUS_THRESHOLD:
             raise GitHubAPIError.http_error(response.status_code)
         payload_raw = response.json()
@@ -0,0 +1,349 @@
+"""Pooled GitHub credentials with per-credential rate-limit budgets.
+
+A single token caps the whole estate at one GraphQL budget (5,000 points per
+hour) regardless of how many workers run. ``GitHubTokenPool`` holds several
+credentials, tracks the budget GitHub reports for each through the
+``X-RateLimit-*`` response headers, and routes every request to the
+credential with the most remaining budget. Repositories (or whole owners) can
+instead be pinned to a named credential, which is how GitHub App
+installations are used: each installation can only read its own
+repositories.
+
+Installation credentials mint short-lived tokens through the GitHub REST API
+and cache them until shortly before expiry. The cache is pluggable; the
+file-backed cache lets every worker process on a host reuse the same minted
+token instead of each exchanging its own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import datetime as dt
+import json
+import os
+import pathlib
+import tempfile
+import typing as typ
+
+from ghillie.common.time import utcnow
+
+from .errors import GitHubAPIError, GitHubConfigError, GitHubResponseShapeError
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    import httpx
+
+    from ghillie.registry.models import RepositoryInfo
+
+# GitHub's hourly GraphQL budget; assumed for credentials not yet observed.
+DEFAULT_RATE_LIMIT = 5000
+
+_HTTP_ERROR_STATUS_THRESHOLD = 400
+
+
+class GitHubCredential(typ.Protocol):
+    """A named source of GitHub bearer tokens."""
+
+    @property
+    def name(self) -> str:
+        """Return the stable name used for routing and budget tracking."""
+        ...
+
+    async def token(self) -> str:
+        """Return a bearer token that is valid for at least one request."""
+        ...
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class StaticTokenCredential:
+    """A personal access token or externally refreshed installation token."""
+
+    name: str
+    value: str = dataclasses.field(repr=False)
+
+    def __post_init__(self) -> None:
+        """Reject empty tokens."""
+        if not self.value.strip():
+            raise GitHubConfigError.empty_token()
+
+    async def token(self) -> str:
+        """Return the configured token."""
+        return self.value
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class InstallationToken:
+    """A minted installation access token and its expiry."""
+
+    token: str = dataclasses.field(repr=False)
+    expires_at: dt.datetime
+
+
+class InstallationTokenCache(typ.Protocol):
+    """Storage for minted installation tokens shared between workers."""
+
+    async def get(self, key: str) -> InstallationToken | None:
+        """Return the cached token for ``key``, if any."""
+        ...
+
+    async def put(self, key: str, token: InstallationToken) -> None:
+        """Store a freshly minted token under ``key``."""
+        ...
+
+
+class MemoryInstallationTokenCache:
+    """Process-local installation token cache."""
+
+    def __init__(self) -> None:
+        """Create an empty cache."""
+        self._tokens: dict[str, InstallationToken] = {}
+
+    async def get(self, key: str) -> InstallationToken | None:
+        """Return the cached token for ``key``, if any."""
+        return self._tokens.get(key)
+
+    async def put(self, key: str, token: InstallationToken) -> None:
+        """Store a token under ``key``."""
+        self._tokens[key] = token
+
+
+class FileInstallationTokenCache:
+    """Installation token cache shared by processes through a directory.
+
+    Each token is written to ``<directory>/<key>.json`` with owner-only
+    permissions and replaced atomically, so concurrent readers never observe
+    a partial file.
+    """
+
+    def __init__(self, directory: pathlib.Path) -> None:
+        """Create a cache rooted at ``directory``."""
+        self._directory = directory
+
+    async def get(self, key: str) -> InstallationToken | None:
+        """Return the cached token for ``key``, if any."""
+        return await asyncio.to_thread(self._read, key)
+
+    async def put(self, key: str, token: InstallationToken) -> None:
+        """Atomically store a token under ``key``."""
+        await asyncio.to_thread(self._write, key, token)
+
+    def _read(self, key: str) -> InstallationToken | None:
+        try:
+            raw = json.loads((self._directory / f"{key}.json").read_text("utf-8"))
+            return InstallationToken(
+                token=raw["token"],
+                expires_at=dt.datetime.fromisoformat(raw["expires_at"]),
+            )
+        except (
+            OSError,
+            ValueError,
+            KeyError,
+            TypeError,
+        ):
+            return None
+
+    def _write(self, key: str, token: InstallationToken) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True, mode=0o700)
+        payload = json.dumps(
+            {"token": token.token, "expires_at": token.expires_at.isoformat()}
+        )
+        fd, tmp_name = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        tmp_path = pathlib.Path(tmp_name)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(payload)
+            tmp_path.replace(self._directory / f"{key}.json")
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+
+class AppInstallationCredential:
+    """Mint and cache GitHub App installation tokens.
+
+    ``jwt_factory`` returns a freshly signed App JWT (RS256 over the App ID
+    and private key); signing is left to the caller so Ghillie does not
+    depend on a particular JWT or cryptography library. Tokens are reused
+    from ``cache`` until ``refresh_margin`` before they expire, and
+    concurrent callers in one process share a single exchange.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        name: str,
+        installation_id: int,
+        jwt_factory: cabc.Callable[[], str],
+        http_client: httpx.AsyncClient,
+        api_url: str = "https://api.github.com",
+        cache: InstallationTokenCache | None = None,
+        refresh_margin: dt.timedelta = dt.timedelta(minutes=5),
+    ) -> None:
+        """Configure the installation and its token exchange."""
+        self._name = name
+        self._installation_id = installation_id
+        self._jwt_factory = jwt_factory
+        self._http_client = http_client
+        self._api_url = api_url.rstrip("/")
+        self._cache = cache or MemoryInstallationTokenCache()
+        self._refresh_margin = refresh_margin
+        self._lock = asyncio.Lock()
+
+    @property
+    def name(self) -> str:
+        """Return the credential name."""
+        return self._name
+
+    @property
+    def _cache_key(self) -> str:
+        return f"installation-{self._installation_id}"
+
+    async def token(self) -> str:
+        """Return a cached installation token, minting one when needed."""
+        cached = await self._fresh_cached()
+        if cached is not None:
+            return cached.token
+        async with self._lock:
+            cached = await self._fresh_cached()
+            if cached is None:
+                cached = await self._mint()
+                await self._cache.put(self._cache_key, cached)
+            return cached.token
+
+    async def _fresh_cached(self) -> InstallationToken | None:
+        cached = await self._cache.get(self._cache_key)
+        if cached is None or cached.expires_at - self._refresh_margin <= utcnow():
+            return None
+        return cached
+
+    async def _mint(self) -> InstallationToken:
+        response = await self._http_client.post(
+            f"{self._api_url}/app/installations/{self._installation_id}/access_tokens",
+            headers={
+                "Authorization": f"Bearer {self._jwt_factory()}",
+                "Accept": "application/vnd.github+json",
+            },
+        )
+        if response.status_code >= _HTTP_ERROR_STATUS_THRESHOLD:
+            raise GitHubAPIError.token_exchange_failed(response.status_code)
+        payload = response.json()
+        token = payload.get("token") if isinstance(payload, dict) else None
+        expires_at = payload.get("expires_at") if isinstance(payload, dict) else None
+        if not isinstance(token, str):
+            raise GitHubResponseShapeError.missing("token")
+        if not isinstance(expires_at, str):
+            raise GitHubResponseShapeError.missing("expires_at")
+        return InstallationToken(
+            token=token,
+            expires_at=dt.datetime.fromisoformat(expires_at),
+        )
+
+
+@dataclasses.dataclass(slots=True)
+class _Budget:
+    """Last observed rate-limit budget for one credential."""
+
+    remaining: int = DEFAULT_RATE_LIMIT
+    reset_at: dt.datetime | None = None
+
+    def effective(self, now: dt.datetime) -> int:
+        if self.reset_at is not None and self.reset_at <= now:
+            return DEFAULT_RATE_LIMIT
+        return self.remaining
+
+
+def _parse_int(value: str | None) -> int | None:
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+class GitHubTokenPool:
+    """Route GitHub requests across credentials by remaining budget.
+
+    ``routes`` pins repositories to a credential by name; keys are either a
+    repository slug (``owner/name``) or an owner, with the slug taking
+    precedence. Unrouted repositories use the credential with the largest
+    remaining budget. Each selection provisionally spends one point so
+    concurrent requests spread across credentials before GitHub reports the
+    real budget back.
+
+    One pool should be shared by every client in a process.
+    """
+
+    def __init__(
+        self,
+        credentials: cabc.Sequence[GitHubCredential],
+        *,
+        routes: cabc.Mapping[str, str] | None = None,
+    ) -> None:
+        """Create a pool over ``credentials`` with optional pinned routes."""
+        if not credentials:
+            raise GitHubConfigError.empty_pool()
+        self._credentials: dict[str, GitHubCredential] = {}
+        for credential in credentials:
+            if credential.name in self._credentials:
+                raise GitHubConfigError.duplicate_credential(credential.name)
+            self._credentials[credential.name] = credential
+        self._routes = dict(routes or {})
+        for target in self._routes.values():
+            if target not in self._credentials:
+                raise GitHubConfigError.unknown_credential(target)
+        self._budgets = {name: _Budget() for name in self._credentials}
+
+    @classmethod
+    def from_env(cls) -> GitHubTokenPool:
+        """Build a pool of static tokens from the environment.
+
+        ``GHILLIE_GITHUB_TOKENS`` holds a comma-separated list of tokens; when
+        unset, the pool falls back to the single ``GHILLIE_GITHUB_TOKEN``.
+        """
+        raw = os.environ.get("GHILLIE_GITHUB_TOKENS") or os.environ.get(
+            "GHILLIE_GITHUB_TOKEN", ""
+        )
+        tokens = [token.strip() for token in raw.split(",") if token.strip()]
+        if not tokens:
+            raise GitHubConfigError.missing_token()
+        return cls(
+            [
+                StaticTokenCredential(name=f"token-{index}", value=token)
+                for index, token in enumerate(tokens, start=1)
+            ]
+        )
+
+    def remaining(self, name: str) -> int:
+        """Return the budget currently assumed for a credential."""
+        return self._budgets[name].effective(utcnow())
+
+    def select(self, repo: RepositoryInfo | None = None) -> GitHubCredential:
+        """Choose the credential for a request about ``repo``."""
+        if repo is not None:
+            target = self._routes.get(repo.slug) or self._routes.get(repo.owner)
+            if target is not None:
+                self._budgets[target].remaining -= 1
+                return self._credentials[target]
+        now = utcnow()
+        name = max(self._budgets, key=lambda key: self._budgets[key].effective(now))
+        budget = self._budgets[name]
+        budget.remaining = budget.effective(now) - 1
+        if budget.reset_at is not None and budget.reset_at <= now:
+            budget.reset_at = None
+        return self._credentials[name]
+
+    def record(
+        self, credential: GitHubCredential, headers: cabc.Mapping[str, str]
+    ) -> None:
+        """Update a credential's budget from GitHub rate-limit headers."""
+        remaining = _parse_int(headers.get("x-ratelimit-remaining"))
+        if remaining is None:
+            return
+        budget = self._budgets[credential.name]
+        budget.remaining = remaining
+        reset = _parse_int(headers.get("x-ratelimit-reset"))
+        if reset is not None:
+            budget.reset_at = dt.datetime.fromtimestamp(reset, tz=dt.UTC)
@@ -19,6 +19,14 @@ class GitHubAPIError(RuntimeError):
         """Return an error for GraphQL `errors` payloads."""
         return cls(f"GitHub GraphQL errors: {errors}")
 
+    @classmethod
+    def token_exchange_failed(cls, status_code: int) -> GitHubAPIError:
+        """Return an error when minting an installation token fails."""
+        return cls(
+            f"GitHub installation token exchange HTTP {status_code}",
+            status_code=status_code,
+        )
+
 
 class GitHubResponseShapeError(RuntimeError):
     """Raised when GitHub GraphQL responses are missing expected fields."""
@@ -41,3 +49,39 @@ class GitHubConfigError(RuntimeError):
     def empty_token(cls) -> GitHubConfigError:
         """Return an error when the provided token is empty."""
         return cls("GitHub token must be non-empty")
+
+    @classmethod
+    def empty_pool(cls) -> GitHubConfigError:
+        """Return an error when a token pool has no credentials."""
+        return cls("GitHub token pool requires at least one credential")
+
+    @classmethod
+    def duplicate_credential(cls, name: str) -> GitHubConfigError:
+        """Return an error when two pooled credentials share a name."""
+        return cls(f"duplicate GitHub credential name: {name}")
+
+    @classmethod
+    def unknown_credential(cls, name: str) -> GitHubConfigError:
+        """Return an error when a route names a credential not in the pool."""
+        return cls(f"unknown GitHub credential: {name}")
+
+
+class GitMirrorError(RuntimeError):
+    """Raised when a local git mirror cannot be read."""
+
+    @classmethod
+    def missing_mirror(cls, path: str) -> GitMirrorError:
+        """Return an error when no mirror exists for a repository."""
+        return cls(f"git mirror not found: {path}")
+
+    @classmethod
+    def missing_executable(cls) -> GitMirrorError:
+        """Return an error when git is not available on PATH."""
+        return cls("git executable not found on PATH")
+
+    @classmethod
+    def command_failed(
+        cls, command: str, returncode: int, stderr: str
+    ) -> GitMirrorError:
+        """Return an error for a git command that exited unsuccessfully."""
+        return cls(f"git {command} exited with status {returncode}: {stderr.strip()}")
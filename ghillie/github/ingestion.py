@@ -9,35 +9,24 @@ consistency.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import dataclasses
 import datetime as dt
 import typing as typ
 
-import msgspec
 from sqlalchemy import select
-from sqlalchemy.exc import (
-    IntegrityError,
-    InterfaceError,
-    OperationalError,
-    SQLAlchemyError,
-)
+from sqlalchemy.exc import IntegrityError
 
 from ghillie.bronze import (
     GithubIngestionOffset,
     RawEventEnvelope,
     RawEventWriter,
 )
-from ghillie.catalogue.models import NoiseFilters
-from ghillie.catalogue.storage import ComponentRecord, ProjectRecord, RepositoryRecord
 from ghillie.common.time import utcnow
-from ghillie.logging import (
-    format_log_message,
-    get_logger,
-    log_exception,
-    log_warning,
-)
+from ghillie.logging import get_logger
 
-from .noise import CompiledNoiseFilters, compile_noise_filters
+from .noise_cache import NoiseFilterCache
 from .observability import (
     IngestionEventLogger,
     IngestionRunContext,
@@ -53,6 +42,7 @@ if typ.TYPE_CHECKING:
 
     from .client import GitHubActivityClient
     from .models import GitHubIngestedEvent
+    from .noise import CompiledNoiseFilters
 
     type SessionFactory = async_sessionmaker[AsyncSession]
 
@@ -61,12 +51,21 @@ logger = get_logger(__name__)
 
 @dataclasses.dataclass(frozen=True, slots=True)
 class GitHubIngestionConfig:
-    """Runtime knobs for incremental ingestion."""
+    """Runtime knobs for incremental ingestion.
+
+    ``write_batch_size`` controls how many fetched events are grouped into a
+    single bulk Bronze insert, and ``pipeline_depth`` bounds how many fetched
+    batches may wait for the database before fetching pauses. Pass a shared
+    ``noise_filter_cache`` to reuse compiled noise filters across workers.
+    """
 
     initial_lookback: dt.timedelta = dt.timedelta(days=7)
     overlap: dt.timedelta = dt.timedelta(minutes=5)
     max_events_per_kind: int = 500
     catalogue_session_factory: SessionFactory | None = None
+    write_batch_size: int = 100
+    pipeline_depth: int = 2
+    noise_filter_cache: NoiseFilterCache | None = None
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
@@ -90,6 +89,33 @@ class _StreamIngestionResult:
     truncated: bool
 
 
+@dataclasses.dataclass(slots=True)
+class _StreamProgress:
+    """Mutable fetch-side bookkeeping for one activity stream.
+
+    Every fetched event counts towards the per-kind limit and advances the
+    cursor and ``max_seen`` tracking, whether or not it is later dropped as
+    noise.
+    """
+
+    limit: int
+    seen: int = 0
+    max_seen: dt.datetime | None = None
+    last_cursor: str | None = None
+    truncated: bool = False
+
+    def admit(self, event: GitHubIngestedEvent) -> bool:
+        """Record a fetched event; return False once the limit is exceeded."""
+        if self.seen >= self.limit:
+            self.truncated = True
+            return False
+        self.seen += 1
+        self.last_cursor = event.cursor
+        if self.max_seen is None or event.occurred_at > self.max_seen:
+            self.max_seen = event.occurred_at
+        return True
+
+
 @dataclasses.dataclass(frozen=True, slots=True)
 class _KindIngestionContext:
     """Context for ingesting a specific entity kind."""
@@ -161,6 +187,9 @@ class GitHubIngestionWorker:
         self._catalogue_sf = (
             resolved_config.catalogue_session_factory or session_factory
         )
+        self._noise_cache = resolved_config.noise_filter_cache or NoiseFilterCache(
+            self._catalogue_sf
+        )
         self._event_logger = event_logger or IngestionEventLogger()
 
     async def ingest_repository(self, repo: RepositoryInfo) -> GitHubIngestionResult:
@@ -428,43 +457,91 @@ class GitHubIngestionWorker:
         *,
         noise: CompiledNoiseFilters,
     ) -> _StreamIngestionResult:
-        max_seen: dt.datetime | None = None
-        last_cursor: str | None = None
-        ingested = 0
-        limit = self._config.max_events_per_kind
-        seen = 0
-        truncated = False
-
-        async for event in events:
-            if seen >= limit:
-                truncated = True
-                break
-            seen += 1
-            last_cursor = event.cursor
-            if max_seen is None or event.occurred_at > max_seen:
-                max_seen = event.occurred_at
-            if noise.should_drop(event):
-                continue
-
-            envelope = RawEventEnvelope(
-                source_system="github",
-                source_event_id=event.source_event_id,
-                event_type=event.event_type,
-                repo_external_id=repo.slug,
-                occurred_at=event.occurred_at,
-                payload=event.payload,
+        """Fetch and persist a stream with network and database overlapped.
+
+        A producer task drains the GitHub iterator into batches on a bounded
+        queue while this coroutine noise-filters and bulk-writes them, so the
+        client can prefetch the next page while the previous one is written.
+        When the queue is full the producer blocks, which applies
+        backpressure to GitHub fetching if the database falls behind.
+
+        Watermarks are unaffected by the overlap: offsets are only persisted
+        after every stream for the repository has been written.
+        """
+        progress = _StreamProgress(limit=self._config.max_events_per_kind)
+        queue: asyncio.Queue[list[GitHubIngestedEvent]] = asyncio.Queue(
+            maxsize=max(1, self._config.pipeline_depth)
+        )
+        producer = asyncio.create_task(
+            self._produce_event_batches(events, queue, progress)
+        )
+        try:
+            ingested = await self._consume_event_batches(
+                repo, writer, queue, noise=noise
             )
-            await writer.ingest(envelope)
-            ingested += 1
+        except BaseException:
+            producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await producer
+            raise
+        # Re-raise any fetch error after the batches fetched before it have
+        # been written, matching the sequential behaviour.
+        await producer
 
-        resume_cursor = last_cursor if truncated else None
+        resume_cursor = progress.last_cursor if progress.truncated else None
         return _StreamIngestionResult(
             ingested=ingested,
-            max_seen=max_seen,
+            max_seen=progress.max_seen,
             resume_cursor=resume_cursor,
-            truncated=truncated,
+            truncated=progress.truncated,
         )
 
+    async def _produce_event_batches(
+        self,
+        events: cabc.AsyncIterator[GitHubIngestedEvent],
+        queue: asyncio.Queue[list[GitHubIngestedEvent]],
+        progress: _StreamProgress,
+    ) -> None:
+        """Fetch events into write batches until the stream or limit ends."""
+        batch_size = max(1, self._config.write_batch_size)
+        batch: list[GitHubIngestedEvent] = []
+        try:
+            async for event in events:
+                if not progress.admit(event):
+                    break
+                batch.append(event)
+                if len(batch) >= batch_size:
+                    await queue.put(batch)
+                    batch = []
+            if batch:
+                await queue.put(batch)
+        finally:
+            # Shutting down lets the consumer drain queued batches and stop
+            # without a sentinel, even when the producer fails or is cancelled.
+            queue.shutdown()
+
+    async def _consume_event_batches(
+        self,
+        repo: RepositoryInfo,
+        writer: RawEventWriter,
+        queue: asyncio.Queue[list[GitHubIngestedEvent]],
+        *,
+        noise: CompiledNoiseFilters,
+    ) -> int:
+        """Noise-filter and bulk-write queued batches; return the kept count."""
+        ingested = 0
+        while True:
+            try:
+                batch = await queue.get()
+            except asyncio.QueueShutDown:
+                return ingested
+            kept, _ = noise.partition(batch)
+            if kept:
+                await writer.ingest_many(
+                    [envelope_from_event(repo, event) for event in kept]
+                )
+            ingested += len(kept)
+
     def _since_for(
         self, watermark: dt.datetime | None, *, now: dt.datetime
     ) -> dt.datetime:
@@ -506,55 +583,22 @@ class GitHubIngestionWorker:
     async def _compile_noise_filters(
         self, repo: RepositoryInfo
     ) -> CompiledNoiseFilters:
-        """Load project noise configuration for the repository and compile it."""
-        try:
-            async with self._catalogue_sf() as session:
-                query = (
-                    select(ProjectRecord.noise)
-                    .join(
-                        ComponentRecord, ComponentRecord.project_id == ProjectRecord.id
-                    )
-                    .join(
-                        RepositoryRecord,
-                        ComponentRecord.repository_id == RepositoryRecord.id,
-                    )
-                    .where(
-                        RepositoryRecord.owner == repo.owner,
-                        RepositoryRecord.name == repo.name,
-                    )
-                )
-                if repo.estate_id is not None:
-                    query = query.where(ProjectRecord.estate_id == repo.estate_id)
-                rows = (await session.scalars(query)).all()
-        except (OperationalError, InterfaceError) as exc:
-            log_warning(
-                logger,
-                (
-                    "Failed to load noise filters for repo %s due to DB "
-                    "connectivity issue; defaulting to no noise filters."
-                ),
-                repo.slug,
-                exc_info=exc,
-            )
-            rows = []
-        except SQLAlchemyError as exc:
-            log_exception(
-                logger,
-                format_log_message(
-                    (
-                        "Failed to load noise filters for repo %s due to "
-                        "SQLAlchemy error; failing ingestion."
-                    ),
-                    repo.slug,
-                ),
-                exc,
-            )
-            raise
-
-        filters = [
-            msgspec.convert(row, NoiseFilters) for row in rows if isinstance(row, dict)
-        ]
-        return compile_noise_filters(filters)
+        """Return the compiled project noise filters for the repository."""
+        return await self._noise_cache.filters_for(repo)
+
+
+def envelope_from_event(
+    repo: RepositoryInfo, event: GitHubIngestedEvent
+) -> RawEventEnvelope:
+    """Wrap a fetched GitHub event in a Bronze envelope for the repository."""
+    return RawEventEnvelope(
+        source_system="github",
+        source_event_id=event.source_event_id,
+        event_type=event.event_type,
+        repo_external_id=repo.slug,
+        occurred_at=event.occurred_at,
+        payload=event.payload,
+    )
 
 
 def _max_dt(left: dt.datetime | None, right: dt.datetime | None) -> dt.datetime | None:
@@ -0,0 +1,337 @@
+"""Read commit and documentation history from local bare git mirrors.
+
+Commit and documentation-change ingestion account for most GraphQL traffic,
+yet both can be answered by a local ``git clone --mirror`` kept current with
+``git fetch``. ``GitMirrorActivityClient`` walks ``git log`` output from such
+a mirror for those streams and delegates pull requests and issues, which only
+exist in the GitHub API, to another activity client.
+
+Events carry the same event types, source identifiers, and payloads as the
+GraphQL client, down to GitHub's ``...Z`` timestamp format and its
+``modified`` change type for every documentation change, so both backends
+produce the same Bronze dedupe keys. Resume cursors are commit SHAs: a cursor
+names the last commit that was ingested, and resuming skips history up to and
+including it. A cursor that is not in the mirror (for example one written by
+the GraphQL client, or a commit removed by a force push) restarts from the
+newest commit and relies on Bronze deduplication.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import dataclasses
+import datetime as dt
+import shutil
+import typing as typ
+
+from .client import (
+    classify_documentation_path,
+    decode_doc_cursor,
+    encode_doc_cursor,
+    ensure_tzaware,
+    format_github_datetime,
+)
+from .errors import GitMirrorError
+from .models import GitHubIngestedEvent
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+    import pathlib
+
+    from ghillie.registry.models import RepositoryInfo
+
+    from .client import GitHubActivityClient
+
+_RECORD_SEPARATOR = "\x1e"
+_FIELD_SEPARATOR = "\x1f"
+_LOG_FORMAT = "%x1e%H%x1f%an%x1f%ae%x1f%aI%x1f%cI%x1f%B"
+_LOG_FIELD_COUNT = 6
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitMirrorConfig:
+    """Location and tooling for local repository mirrors.
+
+    Mirrors are expected at ``root/<owner>/<name>.git``, as created by
+    ``git clone --mirror https://github.com/<owner>/<name>.git``.
+    """
+
+    root: pathlib.Path
+    git_executable: str | None = None
+    fetch_timeout_s: float = 300.0
+
+    def mirror_path(self, repo: RepositoryInfo) -> pathlib.Path:
+        """Return the mirror directory for a repository."""
+        return self.root / repo.owner / f"{repo.name}.git"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _LogEntry:
+    """A single commit parsed from ``git log`` output."""
+
+    sha: str
+    author_name: str
+    author_email: str
+    authored_at: dt.datetime
+    committed_at: dt.datetime
+    message: str
+
+
+def _parse_log_record(record: str) -> _LogEntry | None:
+    """Parse one NUL-terminated ``_LOG_FORMAT`` record."""
+    header, _, _ = record.partition("\0")
+    fields = header.split(_FIELD_SEPARATOR, _LOG_FIELD_COUNT - 1)
+    if len(fields) != _LOG_FIELD_COUNT:
+        return None
+    sha, author_name, author_email, authored_at, committed_at, message = fields
+    return _LogEntry(
+        sha=sha,
+        author_name=author_name,
+        author_email=author_email,
+        authored_at=dt.datetime.fromisoformat(authored_at).astimezone(dt.UTC),
+        committed_at=dt.datetime.fromisoformat(committed_at).astimezone(dt.UTC),
+        message=message.rstrip("\n"),
+    )
+
+
+def _parse_log_records(records: cabc.Iterable[str]) -> cabc.Iterator[_LogEntry]:
+    for record in records:
+        if record and (entry := _parse_log_record(record)) is not None:
+            yield entry
+
+
+def _log_args(
+    repo: RepositoryInfo,
+    *,
+    since: dt.datetime,
+    until: dt.datetime | None,
+    path: str | None,
+) -> list[str]:
+    """Build ``git log`` arguments for the default branch, optionally by path."""
+    args = ["log", "-z", f"--format={_LOG_FORMAT}", f"--since={since.isoformat()}"]
+    if until is not None:
+        args.append(f"--until={until.isoformat()}")
+    args.append(f"refs/heads/{repo.default_branch}")
+    if path is not None:
+        args.extend(["--", path])
+    return args
+
+
+def _in_window(entry: _LogEntry, since: dt.datetime, until: dt.datetime | None) -> bool:
+    if entry.committed_at <= since:
+        return False
+    return until is None or entry.committed_at <= until
+
+
+def _commit_event(repo: RepositoryInfo, entry: _LogEntry) -> GitHubIngestedEvent:
+    return GitHubIngestedEvent(
+        event_type="github.commit",
+        source_event_id=entry.sha,
+        occurred_at=entry.committed_at,
+        payload={
+            "sha": entry.sha,
+            "message": entry.message,
+            "author_email": entry.author_email or None,
+            "author_name": entry.author_name or None,
+            "authored_at": format_github_datetime(entry.authored_at),
+            "committed_at": format_github_datetime(entry.committed_at),
+            "repo_owner": repo.owner,
+            "repo_name": repo.name,
+            "default_branch": repo.default_branch,
+            "metadata": {"branch": repo.default_branch},
+        },
+        cursor=entry.sha,
+    )
+
+
+def _doc_change_event(
+    repo: RepositoryInfo, path: str, entry: _LogEntry
+) -> GitHubIngestedEvent:
+    is_roadmap, is_adr = classify_documentation_path(path)
+    return GitHubIngestedEvent(
+        event_type="github.doc_change",
+        source_event_id=f"{entry.sha}:{path}",
+        occurred_at=entry.committed_at,
+        payload={
+            "commit_sha": entry.sha,
+            "path": path,
+            # GitHub's commit history does not say how a path changed.
+            "change_type": "modified",
+            "is_roadmap": is_roadmap,
+            "is_adr": is_adr,
+            "repo_owner": repo.owner,
+            "repo_name": repo.name,
+            "occurred_at": format_github_datetime(entry.committed_at),
+            "metadata": {"message": entry.message},
+        },
+        cursor=encode_doc_cursor(path, entry.sha),
+    )
+
+
+class GitMirrorActivityClient:
+    """Serve commits and documentation changes from local git mirrors.
+
+    Implements :class:`~ghillie.github.client.GitHubHistoryClient`; pull
+    requests and issues are delegated to ``api_client``, typically a
+    :class:`~ghillie.github.client.GitHubGraphQLClient`.
+    """
+
+    def __init__(
+        self, config: GitMirrorConfig, *, api_client: GitHubActivityClient
+    ) -> None:
+        """Initialise the client with a mirror root and an API client."""
+        git_executable = config.git_executable or shutil.which("git")
+        if git_executable is None:
+            raise GitMirrorError.missing_executable()
+        self._config = config
+        self._git = git_executable
+        self._api_client = api_client
+
+    async def refresh(self, repo: RepositoryInfo) -> None:
+        """Run ``git fetch --prune`` in the repository mirror."""
+        process = await self._spawn(repo, "fetch", "--prune", "--quiet")
+        try:
+            _, stderr = await asyncio.wait_for(
+                process.communicate(), timeout=self._config.fetch_timeout_s
+            )
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+        if process.returncode:
+            raise GitMirrorError.command_failed(
+                "fetch", process.returncode, stderr.decode(errors="replace")
+            )
+
+    async def iter_commits(
+        self,
+        repo: RepositoryInfo,
+        *,
+        since: dt.datetime,
+        after: str | None = None,
+        until: dt.datetime | None = None,
+    ) -> cabc.AsyncIterator[GitHubIngestedEvent]:
+        """Yield default-branch commits newest first from the mirror."""
+        since_utc = ensure_tzaware(since, field="since")
+        until_utc = None if until is None else ensure_tzaware(until, field="until")
+        async for entry in self._log(
+            repo, since=since_utc, until=until_utc, after=after
+        ):
+            yield _commit_event(repo, entry)
+
+    def iter_pull_requests(
+        self, repo: RepositoryInfo, *, since: dt.datetime, after: str | None = None
+    ) -> cabc.AsyncIterator[GitHubIngestedEvent]:
+        """Delegate pull request snapshots to the API client."""
+        return self._api_client.iter_pull_requests(repo, since=since, after=after)
+
+    def iter_issues(
+        self, repo: RepositoryInfo, *, since: dt.datetime, after: str | None = None
+    ) -> cabc.AsyncIterator[GitHubIngestedEvent]:
+        """Delegate issue snapshots to the API client."""
+        return self._api_client.iter_issues(repo, since=since, after=after)
+
+    async def iter_doc_changes(  # noqa: PLR0913
+        self,
+        repo: RepositoryInfo,
+        *,
+        since: dt.datetime,
+        documentation_paths: cabc.Sequence[str],
+        after: str | None = None,
+        until: dt.datetime | None = None,
+    ) -> cabc.AsyncIterator[GitHubIngestedEvent]:
+        """Yield documentation change events per path from the mirror."""
+        since_utc = ensure_tzaware(since, field="since")
+        until_utc = None if until is None else ensure_tzaware(until, field="until")
+        resume_path, resume_sha = decode_doc_cursor(after)
+
+        for path in documentation_paths:
+            # Mirror the GraphQL client: skip paths before the resume path and
+            # apply the resume SHA only to that path.
+            if resume_path is not None and path != resume_path:
+                continue
+            path_after, resume_sha = resume_sha, None
+            resume_path = None
+            async for entry in self._log(
+                repo, since=since_utc, until=until_utc, after=path_after, path=path
+            ):
+                yield _doc_change_event(repo, path, entry)
+
+    async def _log(  # noqa: PLR0913
+        self,
+        repo: RepositoryInfo,
+        *,
+        since: dt.datetime,
+        until: dt.datetime | None,
+        after: str | None,
+        path: str | None = None,
+    ) -> cabc.AsyncIterator[_LogEntry]:
+        """Yield in-window log entries, skipping through the ``after`` SHA."""
+        entries = self._read_log(repo, since=since, until=until, path=path)
+        if after is not None:
+            buffered: list[_LogEntry] = []
+            async for entry in entries:
+                buffered.append(entry)
+                if entry.sha == after:
+                    buffered.clear()
+                    break
+            # An unknown cursor replays everything read; Bronze dedupes it.
+            for entry in buffered:
+                if _in_window(entry, since, until):
+                    yield entry
+        async for entry in entries:
+            if _in_window(entry, since, until):
+                yield entry
+
+    async def _read_log(
+        self,
+        repo: RepositoryInfo,
+        *,
+        since: dt.datetime,
+        until: dt.datetime | None,
+        path: str | None,
+    ) -> cabc.AsyncIterator[_LogEntry]:
+        """Stream ``git log`` records for the default branch."""
+        process = await self._spawn(
+            repo, *_log_args(repo, since=since, until=until, path=path)
+        )
+        stdout = typ.cast("asyncio.StreamReader", process.stdout)
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        try:
+            pending = ""
+            while chunk := await stdout.read(_READ_CHUNK_SIZE):
+                *records, pending = (pending + decoder.decode(chunk)).split(
+                    _RECORD_SEPARATOR
+                )
+                for entry in _parse_log_records(records):
+                    yield entry
+            tail = pending + decoder.decode(b"", final=True)
+            for entry in _parse_log_records([tail]):
+                yield entry
+            stderr = await typ.cast("asyncio.StreamReader", process.stderr).read()
+            if await process.wait():
+                raise GitMirrorError.command_failed(
+                    "log",
+                    typ.cast("int", process.returncode),
+                    stderr.decode(errors="replace"),
+                )
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+
+    async def _spawn(
+        self, repo: RepositoryInfo, *args: str
+    ) -> asyncio.subprocess.Process:
+        mirror = self._config.mirror_path(repo)
+        if not mirror.is_dir():
+            raise GitMirrorError.missing_mirror(str(mirror))
+        return await asyncio.create_subprocess_exec(
+            self._git,
+            f"--git-dir={mirror}",
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
@@ -10,6 +10,8 @@ from __future__ import annotations
 
 import dataclasses
 import fnmatch
+import functools
+import re
 import typing as typ
 from pathlib import PurePosixPath
 
@@ -21,6 +23,7 @@ if typ.TYPE_CHECKING:
     from .models import GitHubIngestedEvent
 
 
+@functools.lru_cache(maxsize=4096)
 def _normalise_path(path: str) -> str:
     stripped = path.strip()
     if not stripped:
@@ -76,14 +79,63 @@ def _path_for_payload(payload: dict[str, typ.Any]) -> str | None:
     return None
 
 
+def _compile_path_regex(patterns: cabc.Sequence[str]) -> re.Pattern[str] | None:
+    """Combine glob patterns into one regex equivalent to any ``fnmatchcase``.
+
+    ``fnmatch.translate`` emits a pattern anchored at the end; ``re.match``
+    anchors the start, so the alternation matches exactly when one of the
+    globs matches the whole path.
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+
+
+def _compile_prefix_regex(prefixes: cabc.Sequence[str]) -> re.Pattern[str] | None:
+    """Combine literal prefixes into one alternation matched at the start."""
+    if not prefixes:
+        return None
+    # Longest first so the regex engine settles on the most specific branch.
+    ordered = sorted(prefixes, key=len, reverse=True)
+    return re.compile("|".join(re.escape(prefix) for prefix in ordered))
+
+
 @dataclasses.dataclass(frozen=True, slots=True)
 class CompiledNoiseFilters:
-    """Compiled noise filters ready for ingestion-time evaluation."""
+    """Compiled noise filters ready for ingestion-time evaluation.
+
+    Path globs and title prefixes are compiled into a single regex each when
+    the filters are built, so evaluating an event costs one regex match per
+    dimension regardless of how many patterns the catalogue configures.
+    """
 
     ignore_authors: frozenset[str] = frozenset()
     ignore_labels: frozenset[str] = frozenset()
     ignore_paths: tuple[str, ...] = ()
     ignore_title_prefixes: tuple[str, ...] = ()
+    _path_regex: re.Pattern[str] | None = dataclasses.field(
+        init=False, repr=False, compare=False, default=None
+    )
+    _prefix_regex: re.Pattern[str] | None = dataclasses.field(
+        init=False, repr=False, compare=False, default=None
+    )
+
+    def __post_init__(self) -> None:
+        """Compile the pattern-based filters once per instance."""
+        object.__setattr__(self, "_path_regex", _compile_path_regex(self.ignore_paths))
+        object.__setattr__(
+            self, "_prefix_regex", _compile_prefix_regex(self.ignore_title_prefixes)
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        """Return True when no filter dimension is configured."""
+        return not (
+            self.ignore_authors
+            or self.ignore_labels
+            or self.ignore_paths
+            or self.ignore_title_prefixes
+        )
 
     def should_drop(self, event: GitHubIngestedEvent) -> bool:
         """Return True when the event should be dropped as noise."""
@@ -95,6 +147,23 @@ class CompiledNoiseFilters:
             or self._matches_path(payload)
         )
 
+    def partition(
+        self, events: cabc.Iterable[GitHubIngestedEvent]
+    ) -> tuple[list[GitHubIngestedEvent], list[GitHubIngestedEvent]]:
+        """Split a page of events into ``(kept, dropped)`` preserving order.
+
+        Evaluating a whole GraphQL page at once skips per-event filter work
+        entirely when no filters are configured.
+        """
+        if self.is_empty:
+            return (list(events), [])
+        kept: list[GitHubIngestedEvent] = []
+        dropped: list[GitHubIngestedEvent] = []
+        should_drop = self.should_drop
+        for event in events:
+            (dropped if should_drop(event) else kept).append(event)
+        return (kept, dropped)
+
     def _matches_author(self, payload: dict[str, typ.Any]) -> bool:
         if not self.ignore_authors:
             return False
@@ -112,16 +181,17 @@ class CompiledNoiseFilters:
         )
 
     def _matches_title_prefix(self, payload: dict[str, typ.Any]) -> bool:
-        if not self.ignore_title_prefixes:
+        regex = self._prefix_regex
+        if regex is None:
             return False
         title = _title_for_payload(payload)
         if title is None:
             return False
-        lowered = _normalise_text(title)
-        return any(lowered.startswith(prefix) for prefix in self.ignore_title_prefixes)
+        return regex.match(_normalise_text(title)) is not None
 
     def _matches_path(self, payload: dict[str, typ.Any]) -> bool:
-        if not self.ignore_paths:
+        regex = self._path_regex
+        if regex is None:
             return False
         path = _path_for_payload(payload)
         if path is None:
@@ -129,9 +199,7 @@ class CompiledNoiseFilters:
         normalised = _normalise_path(path)
         if not normalised:
             return False
-        return any(
-            fnmatch.fnmatchcase(normalised, pattern) for pattern in self.ignore_paths
-        )
+        return regex.match(normalised) is not None
 
 
 def _merge_author_filters(noise: NoiseFilters, target: set[str]) -> None:
@@ -0,0 +1,261 @@
+"""Estate-wide cache of compiled GitHub ingestion noise filters.
+
+Every ingestion or backfill run needs the compiled noise filters for its
+repository. Loading them directly costs a three-table catalogue join and a
+fresh compilation per repository per run, which dominates small incremental
+runs across a large estate. ``NoiseFilterCache`` instead compiles the filters
+for every repository in an estate with a single query and reuses them until
+the catalogue changes.
+
+Catalogue changes are detected through ``CatalogueImportRecord``: every
+import that reconciles an estate appends a record, with or without a commit
+SHA, so the latest record id for an estate acts as a version stamp. Checking
+that stamp is a single indexed lookup, made at most once per
+``revalidate_after_s`` for each estate rather than once per repository, and
+the estate's filters are only reloaded when it moves.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import dataclasses
+import time
+import typing as typ
+
+import msgspec
+from sqlalchemy import select
+from sqlalchemy.exc import InterfaceError, OperationalError, SQLAlchemyError
+
+from ghillie.catalogue.models import NoiseFilters
+from ghillie.catalogue.storage import (
+    CatalogueImportRecord,
+    ComponentRecord,
+    ProjectRecord,
+    RepositoryRecord,
+)
+from ghillie.logging import (
+    format_log_message,
+    get_logger,
+    log_exception,
+    log_warning,
+)
+
+from .noise import CompiledNoiseFilters, compile_noise_filters
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from ghillie.registry.models import RepositoryInfo
+
+    type SessionFactory = async_sessionmaker[AsyncSession]
+
+logger = get_logger(__name__)
+
+# Id of the latest catalogue import record for an estate.
+type _CatalogueVersion = int
+
+
+def _log_connectivity_failure(repo: RepositoryInfo, exc: Exception) -> None:
+    log_warning(
+        logger,
+        (
+            "Failed to load noise filters for repo %s due to DB "
+            "connectivity issue; defaulting to no noise filters."
+        ),
+        repo.slug,
+        exc_info=exc,
+    )
+
+
+def _log_query_failure(repo: RepositoryInfo, exc: Exception) -> None:
+    log_exception(
+        logger,
+        format_log_message(
+            (
+                "Failed to load noise filters for repo %s due to "
+                "SQLAlchemy error; failing ingestion."
+            ),
+            repo.slug,
+        ),
+        exc,
+    )
+
+
+def _convert_noise(rows: typ.Iterable[object]) -> list[NoiseFilters]:
+    return [msgspec.convert(row, NoiseFilters) for row in rows if isinstance(row, dict)]
+
+
+async def load_noise_filters(
+    catalogue_session_factory: SessionFactory, repo: RepositoryInfo
+) -> CompiledNoiseFilters:
+    """Load the catalogue noise filters that apply to a repository.
+
+    Connectivity failures degrade to no filtering so ingestion can continue;
+    other SQLAlchemy errors are logged and re-raised.
+    """
+    try:
+        async with catalogue_session_factory() as session:
+            query = (
+                select(ProjectRecord.noise)
+                .join(ComponentRecord, ComponentRecord.project_id == ProjectRecord.id)
+                .join(
+                    RepositoryRecord,
+                    ComponentRecord.repository_id == RepositoryRecord.id,
+                )
+                .where(
+                    RepositoryRecord.owner == repo.owner,
+                    RepositoryRecord.name == repo.name,
+                )
+            )
+            if repo.estate_id is not None:
+                query = query.where(ProjectRecord.estate_id == repo.estate_id)
+            rows = (await session.scalars(query)).all()
+    except (OperationalError, InterfaceError) as exc:
+        _log_connectivity_failure(repo, exc)
+        rows = []
+    except SQLAlchemyError as exc:
+        _log_query_failure(repo, exc)
+        raise
+
+    return compile_noise_filters(_convert_noise(rows))
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _EstateFilters:
+    """Compiled filters for every repository in an estate at one version."""
+
+    version: _CatalogueVersion
+    checked_at: float
+    by_repository: dict[tuple[str, str], CompiledNoiseFilters]
+
+
+class NoiseFilterCache:
+    """Share compiled noise filters across repositories and ingestion runs.
+
+    Repositories that belong to an estate are served from an estate-wide
+    table compiled with one catalogue query; the table is rebuilt when a newer
+    ``CatalogueImportRecord`` appears for the estate. Repositories without an
+    estate, or estates that have never recorded an import, fall back to
+    ``load_noise_filters`` because there is no version stamp to validate a
+    cached entry against.
+
+    One instance may be shared by several workers in the same event loop.
+
+    Parameters
+    ----------
+    catalogue_session_factory
+        Session factory for the catalogue database.
+    revalidate_after_s
+        Seconds an estate's table is served before its version is checked
+        again (default 60). Zero checks the version on every call.
+    clock
+        Monotonic clock returning seconds; injectable for tests.
+
+    """
+
+    def __init__(
+        self,
+        catalogue_session_factory: SessionFactory,
+        *,
+        revalidate_after_s: float = 60.0,
+        clock: cabc.Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a cache reading from the catalogue session factory."""
+        self._session_factory = catalogue_session_factory
+        self._revalidate_after_s = revalidate_after_s
+        self._clock = clock
+        self._estates: dict[str, _EstateFilters] = {}
+        self._locks: collections.defaultdict[str, asyncio.Lock] = (
+            collections.defaultdict(asyncio.Lock)
+        )
+
+    def invalidate(self, estate_id: str | None = None) -> None:
+        """Drop cached filters for one estate, or for every estate."""
+        if estate_id is None:
+            self._estates.clear()
+        else:
+            self._estates.pop(estate_id, None)
+
+    async def filters_for(self, repo: RepositoryInfo) -> CompiledNoiseFilters:
+        """Return the compiled noise filters that apply to ``repo``.
+
+        Connectivity failures degrade to no filtering (and are not cached);
+        other SQLAlchemy errors are logged and re-raised.
+        """
+        estate_id = repo.estate_id
+        if estate_id is None:
+            return await load_noise_filters(self._session_factory, repo)
+
+        key = (repo.owner, repo.name)
+        cached = self._estates.get(estate_id)
+        if cached is not None and self._is_fresh(cached):
+            return cached.by_repository.get(key, CompiledNoiseFilters())
+
+        try:
+            version = await self._latest_version(estate_id)
+            if version is None:
+                return await load_noise_filters(self._session_factory, repo)
+            entry = await self._estate_filters(estate_id, version)
+        except (OperationalError, InterfaceError) as exc:
+            _log_connectivity_failure(repo, exc)
+            return CompiledNoiseFilters()
+        except SQLAlchemyError as exc:
+            _log_query_failure(repo, exc)
+            raise
+
+        return entry.by_repository.get(key, CompiledNoiseFilters())
+
+    def _is_fresh(self, entry: _EstateFilters) -> bool:
+        return self._clock() - entry.checked_at < self._revalidate_after_s
+
+    async def _latest_version(self, estate_id: str) -> _CatalogueVersion | None:
+        async with self._session_factory() as session:
+            return await session.scalar(
+                select(CatalogueImportRecord.id)
+                .where(CatalogueImportRecord.estate_id == estate_id)
+                .order_by(CatalogueImportRecord.id.desc())
+                .limit(1)
+            )
+
+    async def _estate_filters(
+        self, estate_id: str, version: _CatalogueVersion
+    ) -> _EstateFilters:
+        async with self._locks[estate_id]:
+            cached = self._estates.get(estate_id)
+            if cached is not None and cached.version == version:
+                entry = dataclasses.replace(cached, checked_at=self._clock())
+            else:
+                entry = await self._load_estate(estate_id, version)
+            self._estates[estate_id] = entry
+            return entry
+
+    async def _load_estate(
+        self, estate_id: str, version: _CatalogueVersion
+    ) -> _EstateFilters:
+        async with self._session_factory() as session:
+            rows = await session.execute(
+                select(
+                    RepositoryRecord.owner, RepositoryRecord.name, ProjectRecord.noise
+                )
+                .join(ComponentRecord, ComponentRecord.project_id == ProjectRecord.id)
+                .join(
+                    RepositoryRecord,
+                    ComponentRecord.repository_id == RepositoryRecord.id,
+                )
+                .where(ProjectRecord.estate_id == estate_id)
+            )
+            grouped: dict[tuple[str, str], list[object]] = {}
+            for owner, name, noise in rows:
+                grouped.setdefault((owner, name), []).append(noise)
+
+        return _EstateFilters(
+            version=version,
+            checked_at=self._clock(),
+            by_repository={
+                key: compile_noise_filters(_convert_noise(noise_rows))
+                for key, noise_rows in grouped.items()
+            },
+        )
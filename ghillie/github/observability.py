@@ -21,7 +21,12 @@ from sqlalchemy.exc import (
 
 from ghillie.logging import get_logger, log_error, log_info, log_warning
 
-from .errors import GitHubAPIError, GitHubConfigError, GitHubResponseShapeError
+from .errors import (
+    GitHubAPIError,
+    GitHubConfigError,
+    GitHubResponseShapeError,
+    GitMirrorError,
+)
 
 if typ.TYPE_CHECKING:
     import datetime as dt
@@ -79,6 +84,7 @@ class StreamTruncationDetails:
 _EXCEPTION_CATEGORY_MAP: tuple[tuple[type[BaseException], ErrorCategory], ...] = (
     (GitHubResponseShapeError, ErrorCategory.SCHEMA_DRIFT),
     (GitHubConfigError, ErrorCategory.CONFIGURATION),
+    (GitMirrorError, ErrorCategory.CONFIGURATION),
     (OperationalError, ErrorCategory.DATABASE_CONNECTIVITY),
     (InterfaceError, ErrorCategory.DATABASE_CONNECTIVITY),
     (IntegrityError, ErrorCategory.DATA_INTEGRITY),
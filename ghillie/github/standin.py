@@ -0,0 +1,363 @@
+"""Offline stand-in for the GitHub GraphQL API.
+
+``create_standin_app`` builds a Falcon ASGI application that answers the
+commit history, pull request, and issue queries issued by
+:class:`~ghillie.github.client.GitHubGraphQLClient` from a synthetic,
+seedable history. It lets ingestion be exercised and benchmarked without a
+network connection or a GitHub token:
+
+    app = create_standin_app(StandInConfig(seed=7, commits=2_000))
+    http_client = httpx.AsyncClient(transport=standin_transport(app))
+
+The stand-in only accepts the exact query documents the client sends, so a
+query change that is not mirrored here fails loudly instead of silently
+benchmarking the wrong shape. Responses paginate with opaque cursors, carry
+``X-RateLimit-*`` headers per bearer token, and can be slowed down or made
+to fail at a configurable rate.
+
+The app can also be served over HTTP, for example with
+``granian --interface asgi --factory ghillie.github.standin:create_standin_app``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import datetime as dt
+import random
+import typing as typ
+
+import falcon
+import falcon.asgi
+import httpx
+
+from .client import COMMITS_QUERY, ISSUES_QUERY, PULL_REQUESTS_QUERY
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+type QueryKind = typ.Literal["commits", "pull_requests", "issues"]
+type _ASGIScope = cabc.MutableMapping[str, typ.Any]
+# The ASGI callable httpx.ASGITransport accepts.
+type _ASGIApp = cabc.Callable[
+    [
+        _ASGIScope,
+        cabc.Callable[[], cabc.Awaitable[_ASGIScope]],
+        cabc.Callable[[_ASGIScope], cabc.Awaitable[None]],
+    ],
+    cabc.Awaitable[None],
+]
+
+_QUERY_KINDS: dict[str, QueryKind] = {
+    COMMITS_QUERY: "commits",
+    PULL_REQUESTS_QUERY: "pull_requests",
+    ISSUES_QUERY: "issues",
+}
+
+_CURSOR_PREFIX = "standin:"
+_RATE_LIMIT_WINDOW = dt.timedelta(hours=1)
+_PATHS = (
+    "src/app.py",
+    "src/service.py",
+    "tests/test_app.py",
+    "README.md",
+    "docs/roadmap.md",
+    "docs/adr/0001-record-architecture.md",
+)
+_LOGINS = ("alice", "bob", "carol", "dependabot[bot]")
+_LABELS = ("bug", "feature", "chore", "documentation")
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class StandInConfig:
+    """Shape, timing, and failure behaviour of the stand-in API.
+
+    Each repository receives ``commits``, ``pull_requests``, and ``issues``
+    synthetic items spread over ``span`` ending at ``end``. Histories are
+    derived from ``seed`` and the repository slug, so every run with the
+    same configuration serves identical data.
+    """
+
+    seed: int = 0
+    commits: int = 500
+    pull_requests: int = 200
+    issues: int = 200
+    end: dt.datetime = dt.datetime(2025, 1, 1, tzinfo=dt.UTC)
+    span: dt.timedelta = dt.timedelta(days=365)
+    page_size: int = 100
+    latency_s: float = 0.0
+    latency_jitter_s: float = 0.0
+    rate_limit: int = 5000
+    error_rate: float = 0.0
+    error_status: int = 502
+
+
+@dataclasses.dataclass(slots=True)
+class StandInStats:
+    """Counters describing the traffic a stand-in app has served."""
+
+    requests: int = 0
+    by_kind: dict[str, int] = dataclasses.field(default_factory=dict)
+    injected_errors: int = 0
+    rate_limited: int = 0
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Commit:
+    node: dict[str, typ.Any]
+    committed_at: dt.datetime
+    paths: tuple[str, ...]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _History:
+    """Synthetic repository activity, newest first."""
+
+    commits: tuple[_Commit, ...]
+    pull_requests: tuple[dict[str, typ.Any], ...]
+    issues: tuple[dict[str, typ.Any], ...]
+
+
+def _timestamp(value: dt.datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _spread(rng: random.Random, config: StandInConfig, count: int) -> list[dt.datetime]:
+    """Return ``count`` distinct second-resolution timestamps, newest first."""
+    seconds = max(int(config.span.total_seconds()), count)
+    offsets = sorted(rng.sample(range(seconds), count))
+    return [config.end - dt.timedelta(seconds=offset) for offset in offsets]
+
+
+def _build_commits(rng: random.Random, config: StandInConfig) -> tuple[_Commit, ...]:
+    commits: list[_Commit] = []
+    for index, committed_at in enumerate(_spread(rng, config, config.commits)):
+        oid = f"{rng.getrandbits(160):040x}"
+        login = rng.choice(_LOGINS)
+        commits.append(
+            _Commit(
+                node={
+                    "oid": oid,
+                    "message": f"Change {config.commits - index}",
+                    "authoredDate": _timestamp(committed_at),
+                    "committedDate": _timestamp(committed_at),
+                    "author": {"name": login, "email": f"{login}@example.com"},
+                },
+                committed_at=committed_at,
+                paths=tuple(rng.sample(_PATHS, rng.randint(1, 3))),
+            )
+        )
+    return tuple(commits)
+
+
+def _entity_node(
+    rng: random.Random, *, number: int, updated_at: dt.datetime, kind: QueryKind
+) -> dict[str, typ.Any]:
+    created_at = updated_at - dt.timedelta(hours=rng.randint(1, 24 * 30))
+    is_pull_request = kind == "pull_requests"
+    states = ("OPEN", "CLOSED", "MERGED") if is_pull_request else ("OPEN", "CLOSED")
+    state = rng.choice(states)
+    closed_at = _timestamp(updated_at) if state != "OPEN" else None
+    node: dict[str, typ.Any] = {
+        "databaseId": number * 1000 + (1 if is_pull_request else 2),
+        "number": number,
+        "title": f"{'PR' if is_pull_request else 'Issue'} {number}",
+        "state": state,
+        "createdAt": _timestamp(created_at),
+        "updatedAt": _timestamp(updated_at),
+        "closedAt": closed_at,
+        "author": {"login": rng.choice(_LOGINS)},
+        "labels": {"nodes": [{"name": rng.choice(_LABELS)}]},
+    }
+    if is_pull_request:
+        node |= {
+            "isDraft": rng.random() < 0.1,  # noqa: PLR2004 - synthetic ratio
+            "mergedAt": closed_at if state == "MERGED" else None,
+            "baseRefName": "main",
+            "headRefName": f"feature/{number}",
+        }
+    return node
+
+
+def _build_entities(
+    rng: random.Random, config: StandInConfig, kind: QueryKind, count: int
+) -> tuple[dict[str, typ.Any], ...]:
+    return tuple(
+        _entity_node(rng, number=count - index, updated_at=updated_at, kind=kind)
+        for index, updated_at in enumerate(_spread(rng, config, count))
+    )
+
+
+def _page(
+    items: cabc.Sequence[dict[str, typ.Any]], after: str | None, page_size: int
+) -> dict[str, typ.Any]:
+    """Return a GraphQL connection page over ``items``."""
+    start = 0
+    if after is not None and after.startswith(_CURSOR_PREFIX):
+        start = int(after.removeprefix(_CURSOR_PREFIX)) + 1
+    window = items[start : start + page_size]
+    edges = [
+        {"cursor": f"{_CURSOR_PREFIX}{start + offset}", "node": node}
+        for offset, node in enumerate(window)
+    ]
+    end = start + len(window)
+    return {
+        "pageInfo": {
+            "hasNextPage": end < len(items),
+            "endCursor": edges[-1]["cursor"] if edges else None,
+        },
+        "edges": edges,
+    }
+
+
+def _parse_bound(value: object) -> dt.datetime | None:
+    if not isinstance(value, str):
+        return None
+    return dt.datetime.fromisoformat(value).astimezone(dt.UTC)
+
+
+def _touches(commit: _Commit, path: str) -> bool:
+    prefix = path.rstrip("/") + "/"
+    return any(item == path or item.startswith(prefix) for item in commit.paths)
+
+
+@dataclasses.dataclass(slots=True)
+class _Budget:
+    remaining: int
+    reset_at: dt.datetime
+
+
+class _GraphQLResource:
+    """Answer the ingestion client's GraphQL queries from synthetic data."""
+
+    def __init__(self, config: StandInConfig, stats: StandInStats) -> None:
+        self._config = config
+        self._stats = stats
+        self._rng = random.Random(config.seed)  # noqa: S311 - synthetic data
+        self._budgets: dict[str, _Budget] = {}
+        self._histories: dict[tuple[str, str], _History] = {}
+
+    def _history(self, owner: str, name: str) -> _History:
+        history = self._histories.get((owner, name))
+        if history is None:
+            rng = random.Random(f"{self._config.seed}:{owner}/{name}")  # noqa: S311
+            history = _History(
+                commits=_build_commits(rng, self._config),
+                pull_requests=_build_entities(
+                    rng, self._config, "pull_requests", self._config.pull_requests
+                ),
+                issues=_build_entities(
+                    rng, self._config, "issues", self._config.issues
+                ),
+            )
+            self._histories[owner, name] = history
+        return history
+
+    async def on_post(
+        self, req: falcon.asgi.Request, resp: falcon.asgi.Response
+    ) -> None:
+        """Serve one GraphQL request."""
+        self._stats.requests += 1
+        await self._delay()
+        if not self._apply_rate_limit(req, resp):
+            self._stats.rate_limited += 1
+            resp.status = falcon.HTTP_403
+            resp.media = {"message": "API rate limit exceeded"}
+            return
+        if self._rng.random() < self._config.error_rate:
+            self._stats.injected_errors += 1
+            resp.status = self._config.error_status
+            resp.media = {"message": "injected failure"}
+            return
+
+        body = await req.get_media()
+        kind = _QUERY_KINDS.get(body.get("query", ""))
+        if kind is None:
+            resp.media = {"errors": [{"message": "stand-in: unsupported query"}]}
+            return
+        self._stats.by_kind[kind] = self._stats.by_kind.get(kind, 0) + 1
+        variables = body.get("variables") or {}
+        history = self._history(str(variables.get("owner")), str(variables.get("name")))
+        resp.media = {
+            "data": {"repository": self._repository(kind, history, variables)}
+        }
+
+    def _repository(
+        self, kind: QueryKind, history: _History, variables: dict[str, typ.Any]
+    ) -> dict[str, typ.Any]:
+        after = variables.get("after")
+        if kind == "pull_requests":
+            return {
+                "pullRequests": _page(
+                    history.pull_requests, after, self._config.page_size
+                )
+            }
+        if kind == "issues":
+            return {"issues": _page(history.issues, after, self._config.page_size)}
+
+        since = _parse_bound(variables.get("since"))
+        until = _parse_bound(variables.get("until"))
+        path = variables.get("path")
+        nodes = [
+            commit.node
+            for commit in history.commits
+            if (since is None or commit.committed_at >= since)
+            and (until is None or commit.committed_at <= until)
+            and (not isinstance(path, str) or _touches(commit, path))
+        ]
+        return {
+            "ref": {"target": {"history": _page(nodes, after, self._config.page_size)}}
+        }
+
+    async def _delay(self) -> None:
+        delay = self._config.latency_s
+        if self._config.latency_jitter_s:
+            delay += self._rng.uniform(0, self._config.latency_jitter_s)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _apply_rate_limit(
+        self, req: falcon.asgi.Request, resp: falcon.asgi.Response
+    ) -> bool:
+        """Spend one point of the caller's budget and emit rate-limit headers."""
+        now = dt.datetime.now(dt.UTC)
+        key = req.get_header("Authorization") or ""
+        budget = self._budgets.get(key)
+        if budget is None or budget.reset_at <= now:
+            budget = _Budget(self._config.rate_limit, now + _RATE_LIMIT_WINDOW)
+            self._budgets[key] = budget
+        allowed = budget.remaining > 0
+        if allowed:
+            budget.remaining -= 1
+        resp.set_header("X-RateLimit-Limit", str(self._config.rate_limit))
+        resp.set_header("X-RateLimit-Remaining", str(budget.remaining))
+        resp.set_header(
+            "X-RateLimit-Used", str(self._config.rate_limit - budget.remaining)
+        )
+        resp.set_header("X-RateLimit-Reset", str(int(budget.reset_at.timestamp())))
+        return allowed
+
+
+class StandInApp(falcon.asgi.App):
+    """Falcon ASGI app exposing the stand-in at ``/graphql``."""
+
+    def __init__(self, config: StandInConfig) -> None:
+        """Build the app and its traffic counters."""
+        super().__init__()
+        self.config = config
+        self.stats = StandInStats()
+        self.add_route("/graphql", _GraphQLResource(config, self.stats))
+
+
+def create_standin_app(config: StandInConfig | None = None) -> StandInApp:
+    """Create a GitHub GraphQL stand-in serving synthetic history."""
+    return StandInApp(config or StandInConfig())
+
+
+def standin_transport(app: StandInApp) -> httpx.ASGITransport:
+    """Return an httpx transport that serves requests from ``app`` in process.
+
+    Falcon annotates ``App.__call__`` more loosely than httpx's ASGI
+    callable, so the app is cast to the signature httpx expects.
+    """
+    return httpx.ASGITransport(app=typ.cast("_ASGIApp", app))
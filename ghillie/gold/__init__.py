@@ -1,21 +1,43 @@
 """Gold layer primitives: report metadata and coverage tracking."""
 
+from .coverage import (
+    CoverageRange,
+    covered_by_repository_report,
+    encode_coverage_ranges,
+    record_repository_coverage,
+)
 from .storage import (
     Report,
     ReportCoverage,
+    ReportCoverageRange,
+    ReportEvidenceSnapshot,
     ReportProject,
     ReportReview,
     ReportScope,
     ReviewState,
+    StatusModelBatchRequest,
+    StatusModelCacheEntry,
+    StatusModelRateLimit,
+    StatusModelUsage,
     init_gold_storage,
 )
 
 __all__ = [
+    "CoverageRange",
     "Report",
     "ReportCoverage",
+    "ReportCoverageRange",
+    "ReportEvidenceSnapshot",
     "ReportProject",
     "ReportReview",
     "ReportScope",
     "ReviewState",
+    "StatusModelBatchRequest",
+    "StatusModelCacheEntry",
+    "StatusModelRateLimit",
+    "StatusModelUsage",
+    "covered_by_repository_report",
+    "encode_coverage_ranges",
     "init_gold_storage",
+    "record_repository_coverage",
 ]
@@ -0,0 +1,193 @@
+"""Bulk writes and range encoding for repository report coverage.
+
+Repository reports record coverage as a compact set of
+``ReportCoverageRange`` rows, written with one multi-row ``INSERT``, that
+evidence selection anti-joins against. Per-fact ``ReportCoverage`` rows are
+no longer written for them; rows still added through the ORM are indexed as
+single-fact ranges as they are inserted.
+
+Ranges are run-length encoded over the repository's own event fact sequence,
+so only the repository's facts between the smallest and largest covered id
+are read; facts of other repositories interleaving in the global id space do
+not split a run. A range must not cover the id of a fact of the repository
+that another transaction has yet to commit: on PostgreSQL, sequence values
+are handed out before commit. Facts are only created while transforming a
+raw event, which stays unprocessed until that transaction commits, so when
+none of the repository's raw events are unprocessed no such fact exists.
+Otherwise runs are also split wherever the repository's sequence skips an
+id.
+"""
+
+from __future__ import annotations
+
+import typing as typ
+
+from sqlalchemy import ColumnElement, insert, select
+
+from ghillie.bronze.storage import RawEvent, RawEventState
+from ghillie.silver.storage import EventFact
+
+from .storage import ReportCoverageRange
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import InstrumentedAttribute
+
+
+class CoverageRange(typ.NamedTuple):
+    """An inclusive run of covered event fact ids and its size."""
+
+    start: int
+    end: int
+    count: int
+
+
+def covered_by_repository_report(
+    repository_id: str | ColumnElement[str] | InstrumentedAttribute[str],
+    event_fact_id: ColumnElement[int] | InstrumentedAttribute[int],
+) -> ColumnElement[bool]:
+    """Return an ``EXISTS`` clause testing coverage against the range index.
+
+    ``event_fact_id`` is the correlated event fact id column of the outer
+    query and ``repository_id`` may be a literal or an expression over it;
+    negate the clause for an uncovered-fact anti-join.
+    """
+    return (
+        select(ReportCoverageRange.id)
+        .where(
+            ReportCoverageRange.repository_id == repository_id,
+            ReportCoverageRange.start_event_fact_id <= event_fact_id,
+            ReportCoverageRange.end_event_fact_id >= event_fact_id,
+        )
+        .exists()
+    )
+
+
+def encode_coverage_ranges(
+    covered_ids: cabc.Iterable[int], sequence_ids: cabc.Iterable[int]
+) -> list[CoverageRange]:
+    """Run-length encode ``covered_ids`` over an ordered fact sequence.
+
+    Parameters
+    ----------
+    covered_ids
+        Event fact ids covered by a report, in any order.
+    sequence_ids
+        Every event fact id of the repository between the smallest and
+        largest covered id, in ascending order, including any ids that may
+        belong to facts of the repository not yet visible.
+
+    Returns
+    -------
+    list[CoverageRange]
+        Maximal runs of consecutive covered entries of ``sequence_ids``.
+        A fact of the repository that is not covered ends the current run.
+
+    """
+    covered = set(covered_ids)
+    ranges: list[CoverageRange] = []
+    start: int | None = None
+    end = count = 0
+    for fact_id in sequence_ids:
+        if fact_id in covered:
+            if start is None:
+                start, count = fact_id, 0
+            end = fact_id
+            count += 1
+        elif start is not None:
+            ranges.append(CoverageRange(start, end, count))
+            start = None
+    if start is not None:
+        ranges.append(CoverageRange(start, end, count))
+    return ranges
+
+
+async def record_repository_coverage(  # noqa: PLR0913
+    session: AsyncSession,
+    *,
+    report_id: str,
+    repository_id: str,
+    repo_external_id: str,
+    event_fact_ids: cabc.Collection[int],
+) -> list[CoverageRange]:
+    """Bulk-insert the coverage range index for a report.
+
+    Parameters
+    ----------
+    session
+        Session whose transaction also persists the report.
+    report_id
+        The repository-scope report that consumed the facts.
+    repository_id
+        The Silver repository id the report belongs to.
+    repo_external_id
+        The repository slug stored on ``EventFact.repo_external_id``.
+    event_fact_ids
+        Event facts included in the report's evidence bundle.
+
+    Returns
+    -------
+    list[CoverageRange]
+        The ranges written to the covered-set index.
+
+    """
+    if not event_fact_ids:
+        return []
+    # Check for transforms in flight before reading the sequence, so a fact
+    # committed in between is either seen here or caught by the check.
+    in_flight = await session.scalar(
+        select(
+            select(RawEvent.id)
+            .where(
+                RawEvent.repo_external_id == repo_external_id,
+                RawEvent.transform_state != RawEventState.PROCESSED.value,
+            )
+            .exists()
+        )
+    )
+    sequence_ids = await session.scalars(
+        select(EventFact.id)
+        .where(
+            EventFact.repo_external_id == repo_external_id,
+            EventFact.id.between(min(event_fact_ids), max(event_fact_ids)),
+        )
+        .order_by(EventFact.id)
+    )
+    ranges = encode_coverage_ranges(
+        event_fact_ids,
+        _repository_sequence(sequence_ids, split_at_gaps=bool(in_flight)),
+    )
+    await session.execute(
+        insert(ReportCoverageRange),
+        [
+            {
+                "report_id": report_id,
+                "repository_id": repository_id,
+                "start_event_fact_id": item.start,
+                "end_event_fact_id": item.end,
+                "event_count": item.count,
+            }
+            for item in ranges
+        ],
+    )
+    return ranges
+
+
+def _repository_sequence(
+    fact_ids: cabc.Iterable[int], *, split_at_gaps: bool
+) -> cabc.Iterator[int]:
+    """Yield the repository's fact ids, standing in one id for each gap.
+
+    ``fact_ids`` are the repository's visible facts in ascending id order.
+    With ``split_at_gaps``, the first id skipped between two of them is
+    yielded as an uncovered fact of the repository, ending any run that
+    would span it.
+    """
+    expected: int | None = None
+    for fact_id in fact_ids:
+        if split_at_gaps and expected is not None and fact_id > expected:
+            yield expected
+        yield fact_id
+        expected = fact_id + 1
@@ -13,10 +13,15 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
+    event,
+    insert,
     inspect,
+    literal,
+    select,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -25,6 +30,7 @@ from ghillie.common.ids import new_uuid7_str
 from ghillie.common.time import utcnow
 
 if typ.TYPE_CHECKING:
+    from sqlalchemy import Select
     from sqlalchemy.engine import Connection
     from sqlalchemy.ext.asyncio import AsyncEngine
 
@@ -134,6 +140,12 @@ class Report(Base):
     coverage_records: Mapped[list[ReportCoverage]] = relationship(
         back_populates="report", cascade="all, delete-orphan"
     )
+    coverage_ranges: Mapped[list[ReportCoverageRange]] = relationship(
+        back_populates="report", cascade="all, delete-orphan"
+    )
+    evidence_snapshot: Mapped[ReportEvidenceSnapshot | None] = relationship(
+        back_populates="report", cascade="all, delete-orphan"
+    )
 
 
 class ReportCoverage(Base):
@@ -159,6 +171,196 @@ class ReportCoverage(Base):
     event_fact: Mapped[EventFact] = relationship("EventFact")
 
 
+class ReportCoverageRange(Base):
+    """Covered-set index of event fact ranges per repository.
+
+    Each row states that every event fact of ``repository_id`` whose id lies
+    in ``[start_event_fact_id, end_event_fact_id]`` is covered by a
+    repository-scope report. Ranges are contiguous in the repository's own
+    fact sequence rather than in the global id space, so a report over a
+    busy window usually needs a handful of rows instead of one per event.
+    Evidence selection anti-joins against this table, and it is the only
+    coverage recorded for new repository reports; ``ReportCoverage`` rows
+    remain for coverage written through the ORM or before this index.
+    """
+
+    __tablename__ = "report_coverage_ranges"
+    __table_args__ = (
+        CheckConstraint(
+            "end_event_fact_id >= start_event_fact_id",
+            name="ck_report_coverage_ranges_bounds",
+        ),
+        Index(
+            "ix_report_coverage_ranges_repo_start",
+            "repository_id",
+            "start_event_fact_id",
+            "end_event_fact_id",
+        ),
+        Index("ix_report_coverage_ranges_report", "report_id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    report_id: Mapped[str] = mapped_column(
+        ForeignKey("reports.id", ondelete="CASCADE"), nullable=False
+    )
+    repository_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("repositories.id", ondelete="CASCADE"), nullable=False
+    )
+    start_event_fact_id: Mapped[int] = mapped_column(Integer(), nullable=False)
+    end_event_fact_id: Mapped[int] = mapped_column(Integer(), nullable=False)
+    event_count: Mapped[int] = mapped_column(Integer(), nullable=False)
+
+    report: Mapped[Report] = relationship(back_populates="coverage_ranges")
+
+
+class ReportEvidenceSnapshot(Base):
+    """Serialised evidence bundle a repository report was generated from.
+
+    ``payload`` holds the exact ``RepositoryEvidenceBundle`` passed to the
+    status model, encoded as named by ``encoding``; see
+    ``ghillie.evidence.snapshots``. Keeping it beside the report lets the
+    report be reproduced or re-summarised without re-reading Silver.
+    """
+
+    __tablename__ = "report_evidence_snapshots"
+
+    report_id: Mapped[str] = mapped_column(
+        ForeignKey("reports.id", ondelete="CASCADE"), primary_key=True
+    )
+    encoding: Mapped[str] = mapped_column(String(32), nullable=False)
+    payload: Mapped[bytes] = mapped_column(LargeBinary(), nullable=False)
+    # Size of the encoded bundle before compression, for storage reporting.
+    raw_size: Mapped[int] = mapped_column(Integer(), nullable=False)
+    created_at: Mapped[dt.datetime] = mapped_column(
+        UTCDateTime(), default=utcnow, nullable=False
+    )
+
+    report: Mapped[Report] = relationship(back_populates="evidence_snapshot")
+
+
+class StatusModelCacheEntry(Base):
+    """Status model result cached by the fingerprint of its prompt.
+
+    ``fingerprint`` hashes the model identifier, generation parameters,
+    system prompt, and rendered user prompt, so an identical request is
+    answered from ``result`` instead of calling the model again; see
+    ``ghillie.status.cache``. Token counts record what the original call
+    cost.
+    """
+
+    __tablename__ = "status_model_cache"
+    __table_args__ = (Index("ix_status_model_cache_last_used_at", "last_used_at"),)
+
+    fingerprint: Mapped[str] = mapped_column(String(64), primary_key=True)
+    model: Mapped[str] = mapped_column(String(255), nullable=False)
+    result: Mapped[dict[str, typ.Any]] = mapped_column(JSON, nullable=False)
+    prompt_tokens: Mapped[int | None] = mapped_column(Integer(), nullable=True)
+    completion_tokens: Mapped[int | None] = mapped_column(Integer(), nullable=True)
+    total_tokens: Mapped[int | None] = mapped_column(Integer(), nullable=True)
+    created_at: Mapped[dt.datetime] = mapped_column(
+        UTCDateTime(), default=utcnow, nullable=False
+    )
+    last_used_at: Mapped[dt.datetime] = mapped_column(
+        UTCDateTime(), default=utcnow, nullable=False
+    )
+
+
+class StatusModelBatchRequest(Base):
+    """Status model request submitted in a provider batch still in flight.
+
+    ``request_key`` hashes the chat completion payload, so a redelivered
+    report job that makes the same request resumes polling ``batch_id``
+    instead of submitting and paying for it again; see
+    ``ghillie.status.batch``. Rows are deleted once the batch finishes.
+    """
+
+    __tablename__ = "status_model_batch_requests"
+    __table_args__ = (Index("ix_status_model_batch_requests_batch_id", "batch_id"),)
+
+    request_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    batch_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    created_at: Mapped[dt.datetime] = mapped_column(
+        UTCDateTime(), default=utcnow, nullable=False
+    )
+
+
+class StatusModelRateLimit(Base):
+    """Coordination row for a shared status model rate limiter.
+
+    Each reservation updates the limiter's row before reading its usage, so
+    concurrent reservations from any process are serialised by the row lock;
+    see ``ghillie.status.rate_limit``.
+    """
+
+    __tablename__ = "status_model_rate_limits"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    updated_at: Mapped[dt.datetime] = mapped_column(
+        UTCDateTime(), default=utcnow, nullable=False
+    )
+
+
+class StatusModelUsage(Base):
+    """Tokens reserved against a rate limiter within its sliding window."""
+
+    __tablename__ = "status_model_usage"
+    __table_args__ = (
+        Index("ix_status_model_usage_limiter_reserved", "limiter", "reserved_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer(), primary_key=True, autoincrement=True)
+    limiter: Mapped[str] = mapped_column(
+        ForeignKey("status_model_rate_limits.name", ondelete="CASCADE"),
+        nullable=False,
+    )
+    reserved_at: Mapped[dt.datetime] = mapped_column(UTCDateTime(), nullable=False)
+    tokens: Mapped[int] = mapped_column(Integer(), nullable=False)
+
+
+def _repository_range_select(report_id: str, event_fact_id: int) -> Select[typ.Any]:
+    """Select a single-fact range row for a repository-scope report."""
+    return select(
+        Report.id,
+        Report.repository_id,
+        literal(event_fact_id),
+        literal(event_fact_id),
+        literal(1),
+    ).where(
+        Report.id == report_id,
+        Report.scope == ReportScope.REPOSITORY,
+        Report.repository_id.is_not(None),
+    )
+
+
+_RANGE_COLUMNS = (
+    "report_id",
+    "repository_id",
+    "start_event_fact_id",
+    "end_event_fact_id",
+    "event_count",
+)
+
+
+@event.listens_for(ReportCoverage, "after_insert")
+def _index_orm_coverage(
+    _mapper: typ.Any,  # noqa: ANN401
+    connection: Connection,
+    target: ReportCoverage,
+) -> None:
+    """Keep the range index in step with coverage added through the ORM.
+
+    ``record_repository_coverage`` writes only the range index; this hook
+    covers rows still created one at a time via ``Report.coverage_records``
+    so the range index never misses coverage, whichever path wrote it.
+    """
+    connection.execute(
+        insert(ReportCoverageRange).from_select(
+            _RANGE_COLUMNS,
+            _repository_range_select(target.report_id, target.event_fact_id),
+        )
+    )
+
+
 class ValidationIssuePayload(typ.TypedDict):
     """Serialized report validation issue persisted in ``ReportReview`` JSON."""
 
@@ -259,8 +461,36 @@ def _ensure_report_metric_columns(sync_connection: Connection) -> None:
         )
 
 
+def _backfill_coverage_ranges(sync_connection: Connection) -> None:
+    """Index coverage recorded before the range table existed.
+
+    Runs only while the range table is empty, turning each legacy
+    repository-scope ``report_coverage`` row into a single-fact range.
+    """
+    if sync_connection.scalar(select(ReportCoverageRange.id).limit(1)) is not None:
+        return
+    legacy = (
+        select(
+            ReportCoverage.report_id,
+            Report.repository_id,
+            ReportCoverage.event_fact_id,
+            ReportCoverage.event_fact_id,
+            literal(1),
+        )
+        .join(Report, ReportCoverage.report_id == Report.id)
+        .where(
+            Report.scope == ReportScope.REPOSITORY,
+            Report.repository_id.is_not(None),
+        )
+    )
+    sync_connection.execute(
+        insert(ReportCoverageRange).from_select(_RANGE_COLUMNS, legacy)
+    )
+
+
 async def init_gold_storage(engine: AsyncEngine) -> None:
     """Create all tables registered with Base if they are absent."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
         await conn.run_sync(_ensure_report_metric_columns)
+        await conn.run_sync(_backfill_coverage_ranges)
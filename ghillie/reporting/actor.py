@@ -19,11 +19,23 @@ Queue reports for all repositories in an estate:
 ...     estate_id="estate-1",
 ... )
 
+Each worker thread runs its messages on one long-lived event loop. The
+database engines, reporting services, and status model HTTP clients bound to
+that loop are built on a thread's first message and reused by later ones, so
+short jobs do not pay for a new loop, connection pool, and TLS handshake each
+time. They are closed when Dramatiq stops the worker thread.
+
+A report job sent without ``as_of_iso`` has it set to the time of its first
+delivery, so a retry reports on the same window. The batch status model
+relies on this: a retried job builds the same requests and resumes the batch
+its first attempt submitted.
+
 """
 
 from __future__ import annotations
 
 import asyncio
+import dataclasses as dc
 import datetime as dt
 import threading
 import typing as typ
@@ -37,101 +49,244 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
-from ghillie.evidence import EvidenceBundleService
+from ghillie.common.time import utcnow
+from ghillie.logging import get_logger, log_warning
 from ghillie.reporting._broker import ensure_broker_configured
-from ghillie.reporting.config import ReportingConfig
 from ghillie.reporting.errors import EstateReportError
-from ghillie.reporting.observability import ReportingEventLogger
-from ghillie.reporting.service import ReportingService, ReportingServiceDependencies
+from ghillie.reporting.factory import build_reporting_service
 from ghillie.silver.storage import Repository
-from ghillie.status.factory import create_status_model
+from ghillie.status.batch import OpenAIBatchStatusModel
 
 if typ.TYPE_CHECKING:
     import collections.abc as cabc
 
+    from dramatiq.broker import MessageProxy
+
     from ghillie.gold.storage import Report
-    from ghillie.reporting.sink import ReportSink
+    from ghillie.reporting.service import ReportingService
+    from ghillie.status.protocol import StatusModel
 
 type SessionFactory = async_sessionmaker[AsyncSession]
 
-# Module-level caches for reusing expensive resources across actor invocations
-_ENGINE_CACHE: dict[str, AsyncEngine] = {}
-_SESSION_FACTORY_CACHE: dict[str, SessionFactory] = {}
-_CACHE_LOCK = threading.Lock()
+logger = get_logger(__name__)
 
 # Maximum concurrent report generations to prevent database connection exhaustion
 _MAX_CONCURRENT_REPORTS = 10
+# Longest a report job may run. Batch backend jobs stop polling sooner (see
+# BatchSubmissionConfig.max_wait_s) and are retried to resume their batch.
+_REPORT_JOB_TIME_LIMIT_MS = 60 * 60 * 1000
 
 
-def _ensure_engine(database_url: str) -> AsyncEngine:
-    """Return the cached engine for *database_url*, creating it if absent.
+@dc.dataclass(slots=True)
+class _WorkerResources:
+    """Event loop and loop-bound resources owned by one worker thread.
 
-    Precondition: the caller **must** hold ``_CACHE_LOCK``.
+    Engines, connection pools, and HTTP clients belong to the loop that
+    created them, so they are cached beside it and closed with it.
     """
-    if database_url not in _ENGINE_CACHE:
-        _ENGINE_CACHE[database_url] = create_async_engine(database_url)
-    return _ENGINE_CACHE[database_url]
+
+    loop: asyncio.AbstractEventLoop | None = None
+    engines: dict[str, AsyncEngine] = dc.field(default_factory=dict)
+    session_factories: dict[str, SessionFactory] = dc.field(default_factory=dict)
+    services: dict[str, ReportingService] = dc.field(default_factory=dict)
+
+    def run[T](self, awaitable: cabc.Coroutine[object, object, T]) -> T:
+        """Run *awaitable* to completion on this thread's loop.
+
+        Tasks it leaves behind are cancelled before returning, as
+        ``asyncio.run`` does, so a failed or interrupted message cannot
+        leak work into the next message on this thread.
+        """
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+        loop = self.loop
+        try:
+            return loop.run_until_complete(awaitable)
+        finally:
+            _cancel_leftover_tasks(loop)
+
+    def close(self) -> None:
+        """Close HTTP clients and engines, then the loop itself."""
+        loop, self.loop = self.loop, None
+        try:
+            if loop is not None:
+                loop.run_until_complete(self._aclose_resources())
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            self.engines.clear()
+            self.session_factories.clear()
+            self.services.clear()
+            if loop is not None:
+                loop.close()
+
+    async def _aclose_resources(self) -> None:
+        """Close every status model client, then dispose of every engine."""
+        closers = [
+            aclose
+            for service in self.services.values()
+            if (aclose := _find_aclose(service.status_model)) is not None
+        ]
+        outcomes = await asyncio.gather(
+            *(close() for close in closers),
+            *(engine.dispose() for engine in self.engines.values()),
+            return_exceptions=True,
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                log_warning(logger, "Failed to close worker resource: %s", outcome)
+
+
+def _cancel_leftover_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """Cancel every task left on *loop* and wait for them to finish."""
+    tasks = asyncio.all_tasks(loop)
+    if not tasks:
+        return
+    for task in tasks:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+    for task in tasks:
+        if not task.cancelled() and task.exception() is not None:
+            loop.call_exception_handler(
+                {
+                    "message": "unhandled exception in a leftover worker task",
+                    "exception": task.exception(),
+                    "task": task,
+                }
+            )
+
+
+def _find_aclose(
+    status_model: object,
+) -> cabc.Callable[[], cabc.Awaitable[object]] | None:
+    """Return the ``aclose`` of *status_model* or of the model it wraps."""
+    current: object | None = status_model
+    while current is not None:
+        aclose = getattr(current, "aclose", None)
+        if callable(aclose):
+            return aclose
+        current = getattr(current, "wrapped", None)
+    return None
+
+
+_THREAD_STATE = threading.local()
 
 
-def _ensure_session_factory_locked(database_url: str) -> SessionFactory:
-    """Return the cached session factory for *database_url*, creating it if absent.
+def _thread_resources() -> _WorkerResources:
+    """Return the calling thread's resources, creating them if absent."""
+    resources = getattr(_THREAD_STATE, "resources", None)
+    if resources is None:
+        resources = _WorkerResources()
+        _THREAD_STATE.resources = resources
+    return resources
 
-    Precondition: the caller **must** hold ``_CACHE_LOCK``.  The session
-    factory is cached alongside its engine so a single instance is shared
-    across service construction and direct session usage.
+
+def _close_thread_resources() -> None:
+    """Close the calling thread's event loop and loop-bound resources."""
+    resources = getattr(_THREAD_STATE, "resources", None)
+    if resources is not None:
+        _THREAD_STATE.resources = None
+        resources.close()
+
+
+class _WorkerResourcesMiddleware(dramatiq.Middleware):
+    """Close each worker thread's loop and resources when the thread stops."""
+
+    def before_worker_thread_shutdown(
+        self, broker: dramatiq.Broker, thread: threading.Thread
+    ) -> None:
+        """Run on the stopping worker thread itself."""
+        _close_thread_resources()
+
+
+class _PinAsOfMiddleware(dramatiq.Middleware):
+    """Fix the report window of a job on its first delivery.
+
+    Retries re-enqueue the same message, so writing ``as_of_iso`` into its
+    keyword arguments makes every attempt compute the same window.
     """
-    if database_url not in _SESSION_FACTORY_CACHE:
-        engine = _ensure_engine(database_url)
-        _SESSION_FACTORY_CACHE[database_url] = async_sessionmaker(
-            engine, expire_on_commit=False
-        )
-    return _SESSION_FACTORY_CACHE[database_url]
+
+    def __init__(self, actor_names: cabc.Collection[str]) -> None:
+        """Pin the messages of the actors named in *actor_names*."""
+        self._actor_names = frozenset(actor_names)
+
+    def before_process_message(
+        self, broker: dramatiq.Broker, message: MessageProxy
+    ) -> None:
+        """Set a missing ``as_of_iso`` to the current time."""
+        if (
+            message.actor_name in self._actor_names
+            and message.kwargs.get("as_of_iso") is None
+        ):
+            message.kwargs["as_of_iso"] = utcnow().isoformat()
+
+
+_MIDDLEWARE_LOCK = threading.Lock()
+_middleware_installed = False
+
+
+def _ensure_worker_resources_middleware() -> None:
+    """Register the shutdown middleware with the broker once per process."""
+    global _middleware_installed
+
+    if _middleware_installed:
+        return
+    with _MIDDLEWARE_LOCK:
+        if not _middleware_installed:
+            dramatiq.get_broker().add_middleware(_WorkerResourcesMiddleware())
+            _middleware_installed = True
 
 
 def _get_or_create_session_factory(database_url: str) -> SessionFactory:
-    """Get or create an async session factory for the given database URL.
+    """Return this thread's session factory for *database_url*.
 
-    Thread-safe: uses a lock to prevent race conditions in Dramatiq workers.
+    Engines are bound to the loop that first uses them, so each worker
+    thread keeps its own beside its event loop; no lock is needed.
     """
-    with _CACHE_LOCK:
-        return _ensure_session_factory_locked(database_url)
+    resources = _thread_resources()
+    session_factory = resources.session_factories.get(database_url)
+    if session_factory is None:
+        engine = create_async_engine(database_url)
+        resources.engines[database_url] = engine
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        resources.session_factories[database_url] = session_factory
+    return session_factory
 
 
 def _build_service(database_url: str) -> ReportingService:
-    """Build a fresh ReportingService for *database_url*.
+    """Build a ReportingService for *database_url*.
 
-    A new service is created on every call because the status model may
-    hold event-loop-bound resources (e.g. ``httpx.AsyncClient``) that
-    cannot be reused across ``asyncio.run()`` boundaries.  The session
-    factory and engine underneath are still cached and safe to share.
+    The status model may hold event-loop-bound resources (e.g.
+    ``httpx.AsyncClient``), so ``_run_actor_async`` caches the service per
+    worker thread, beside the loop it runs on, along with this thread's
+    session factory and engine. Configuration is therefore read once per
+    thread.
 
-    When ``GHILLIE_REPORT_SINK_PATH`` is set, a
+    The wiring itself lives in
+    :func:`ghillie.reporting.factory.build_reporting_service`, shared with
+    the API. When ``GHILLIE_REPORT_SINK_PATH`` is set, a
     :class:`~ghillie.reporting.filesystem_sink.FilesystemReportSink` is
     injected so that each generated report is also written to the
     filesystem as Markdown.
     """
-    session_factory = _get_or_create_session_factory(database_url)
-    evidence_service = EvidenceBundleService(session_factory)
-    status_model = create_status_model()
-    config = ReportingConfig.from_env()
+    return build_reporting_service(_get_or_create_session_factory(database_url))
 
-    report_sink: ReportSink | None = None
-    if config.report_sink_path is not None:
-        from ghillie.reporting.filesystem_sink import FilesystemReportSink
 
-        report_sink = FilesystemReportSink(config.report_sink_path)
+def _estate_concurrency(status_model: StatusModel, repository_count: int) -> int:
+    """Return how many estate reports may be generated at once.
 
-    dependencies = ReportingServiceDependencies(
-        session_factory=session_factory,
-        evidence_service=evidence_service,
-        status_model=status_model,
-    )
-    return ReportingService(
-        dependencies,
-        config=config,
-        report_sink=report_sink,
-        event_logger=ReportingEventLogger(),
-    )
+    A batch only holds the requests in flight together, and a queued request
+    holds no database connection, so the batch backend admits every
+    repository at once rather than one batch of ten per provider turnaround.
+    Database writes stay bounded by ``ReportingService`` when the batch
+    returns.
+    """
+    inner: object = status_model
+    while (wrapped := getattr(inner, "wrapped", None)) is not None:
+        inner = wrapped
+    if isinstance(inner, OpenAIBatchStatusModel):
+        return max(repository_count, 1)
+    return _MAX_CONCURRENT_REPORTS
 
 
 async def _generate_report_async(
@@ -237,15 +392,13 @@ async def _generate_reports_for_estate_async(
         ).all()
         repo_ids = [repo.id for repo in repos]
 
-    # Generate reports concurrently with bounded concurrency to protect DB connections
-    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REPORTS)
-
-    async def bounded_report(repo_id: str) -> Report | None:
-        async with semaphore:
-            return await service.run_for_repository(repo_id, as_of=as_of)
-
-    coroutines = [bounded_report(repo_id) for repo_id in repo_ids]
-    gathered = await asyncio.gather(*coroutines, return_exceptions=True)
+    # Bundles for the whole estate are built with set-based queries; reports
+    # are then generated with bounded concurrency to protect DB connections
+    gathered = await service.run_for_repositories(
+        repo_ids,
+        as_of=as_of,
+        max_concurrency=_estate_concurrency(service.status_model, len(repo_ids)),
+    )
 
     return _process_gathered_results(gathered)
 
@@ -287,7 +440,7 @@ def _run_actor_async[T](
     as_of_iso: str | None,
     async_fn: cabc.Callable[
         [ReportingService, SessionFactory, dt.datetime | None],
-        cabc.Awaitable[T],
+        cabc.Coroutine[object, object, T],
     ],
 ) -> T:
     """Execute common async scaffolding for Dramatiq actors.
@@ -308,18 +461,20 @@ def _run_actor_async[T](
 
     """
     ensure_broker_configured()
+    _ensure_worker_resources_middleware()
     as_of = _parse_as_of_iso(as_of_iso)
 
+    resources = _thread_resources()
     session_factory = _get_or_create_session_factory(database_url)
-
-    async def run() -> T:
+    service = resources.services.get(database_url)
+    if service is None:
         service = _build_service(database_url)
-        return await async_fn(service, session_factory, as_of)
+        resources.services[database_url] = service
 
-    return asyncio.run(run())
+    return resources.run(async_fn(service, session_factory, as_of))
 
 
-@dramatiq.actor
+@dramatiq.actor(time_limit=_REPORT_JOB_TIME_LIMIT_MS)
 def generate_report_job(
     database_url: str,
     repository_id: str,
@@ -336,7 +491,8 @@ def generate_report_job(
         The Silver layer repository ID.
     as_of_iso
         Optional ISO format timestamp for window computation. Must include
-        timezone information (e.g., '2024-07-14T10:00:00Z').
+        timezone information (e.g., '2024-07-14T10:00:00Z'). Defaults to
+        the time the job is first delivered, kept across retries.
 
     Returns
     -------
@@ -361,7 +517,7 @@ def generate_report_job(
     return _run_actor_async(database_url, as_of_iso, execute)
 
 
-@dramatiq.actor
+@dramatiq.actor(time_limit=_REPORT_JOB_TIME_LIMIT_MS)
 def generate_reports_for_estate_job(
     database_url: str,
     estate_id: str,
@@ -378,7 +534,8 @@ def generate_reports_for_estate_job(
         The estate ID to scope repository selection.
     as_of_iso
         Optional ISO format timestamp for window computation. Must include
-        timezone information (e.g., '2024-07-14T10:00:00Z').
+        timezone information (e.g., '2024-07-14T10:00:00Z'). Defaults to
+        the time the job is first delivered, kept across retries.
 
     Returns
     -------
@@ -406,3 +563,12 @@ def generate_reports_for_estate_job(
         return [r.id if r else None for r in reports]
 
     return _run_actor_async(database_url, as_of_iso, execute)
+
+
+# Registered with the actors' broker at import, as the actors themselves are,
+# so that a job's first delivery is already pinned.
+generate_report_job.broker.add_middleware(
+    _PinAsOfMiddleware(
+        {generate_report_job.actor_name, generate_reports_for_estate_job.actor_name}
+    )
+)
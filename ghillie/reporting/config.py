@@ -22,9 +22,13 @@ Or load from environment variables:
 """
 
 import dataclasses as dc
+import datetime as dt
 import os
 from pathlib import Path
 
+from ghillie.evidence.models import BundleLimits
+from ghillie.status.rate_limit import RateLimitBudget
+
 
 @dc.dataclass(frozen=True, slots=True)
 class ReportingConfig:
@@ -45,12 +49,68 @@ class ReportingConfig:
         Maximum number of status-model invocations attempted when report
         validation fails.  The first invocation always happens; retries
         are ``validation_max_attempts - 1``.  Default is 2 (one retry).
+    evidence_item_limit
+        Optional cap on the commits, pull requests, issues, and documentation
+        changes each evidence bundle carries. Larger windows are still
+        counted in full, but only the most significant items are loaded.
+        When ``None`` (the default), bundles hold every item in the window.
+    status_cache_ttl_hours
+        How long status model results are reused for identical prompts.
+        Default is 720 hours (30 days); ``None`` disables the cache.
+    status_cache_max_entries
+        Maximum number of cached status model results; the least recently
+        used are evicted beyond this. Default is 10,000.
+    status_model_tokens_per_minute
+        Optional provider token budget shared by every worker calling the
+        status model. When ``None`` (the default), tokens are not metered.
+    status_model_requests_per_minute
+        Optional provider request budget shared by every worker calling the
+        status model. When ``None`` (the default), requests are not metered.
 
     """
 
     window_days: int = 7
     report_sink_path: Path | None = None
     validation_max_attempts: int = 2
+    evidence_item_limit: int | None = None
+    status_cache_ttl_hours: int | None = 720
+    status_cache_max_entries: int = 10_000
+    status_model_tokens_per_minute: int | None = None
+    status_model_requests_per_minute: int | None = None
+
+    @property
+    def bundle_limits(self) -> BundleLimits | None:
+        """Return evidence bundle limits, or None when bundles are unbounded."""
+        if self.evidence_item_limit is None:
+            return None
+        return BundleLimits.uniform(self.evidence_item_limit)
+
+    @property
+    def status_cache_ttl(self) -> dt.timedelta | None:
+        """Return the status model cache TTL, or None when caching is off."""
+        if self.status_cache_ttl_hours is None:
+            return None
+        return dt.timedelta(hours=self.status_cache_ttl_hours)
+
+    @property
+    def rate_limit_budget(self) -> RateLimitBudget | None:
+        """Return the shared status model budget, or None when unmetered."""
+        if (
+            self.status_model_tokens_per_minute is None
+            and self.status_model_requests_per_minute is None
+        ):
+            return None
+        return RateLimitBudget(
+            tokens_per_minute=self.status_model_tokens_per_minute,
+            requests_per_minute=self.status_model_requests_per_minute,
+        )
+
+    @classmethod
+    def _parse_optional_positive_int(cls, env_var: str) -> int | None:
+        """Read an optional positive integer env var."""
+        if not os.environ.get(env_var, "").strip():
+            return None
+        return cls._parse_positive_int(env_var, 0)
 
     @staticmethod
     def _parse_positive_int(env_var: str, default: int) -> int:
@@ -80,6 +140,16 @@ class ReportingConfig:
           Markdown output.
         - ``GHILLIE_VALIDATION_MAX_ATTEMPTS``: Maximum number of status-model
           invocations when validation fails.  Must be a positive integer.
+        - ``GHILLIE_EVIDENCE_ITEM_LIMIT``: Optional cap on the items per
+          category in each evidence bundle.  Must be a positive integer.
+        - ``GHILLIE_STATUS_CACHE_TTL_HOURS``: Hours a cached status model
+          result stays valid.  Must be a non-negative integer; ``0``
+          disables the cache.
+        - ``GHILLIE_STATUS_CACHE_MAX_ENTRIES``: Maximum number of cached
+          status model results.  Must be a positive integer.
+        - ``GHILLIE_STATUS_MODEL_TPM`` and ``GHILLIE_STATUS_MODEL_RPM``:
+          Optional provider tokens-per-minute and requests-per-minute budgets
+          shared by every worker.  Must be positive integers.
 
         Returns
         -------
@@ -103,8 +173,29 @@ class ReportingConfig:
             "GHILLIE_VALIDATION_MAX_ATTEMPTS", 2
         )
 
+        evidence_item_limit = cls._parse_optional_positive_int(
+            "GHILLIE_EVIDENCE_ITEM_LIMIT"
+        )
+
+        status_cache_ttl_hours: int | None = None
+        if os.environ.get("GHILLIE_STATUS_CACHE_TTL_HOURS", "").strip() != "0":
+            status_cache_ttl_hours = cls._parse_positive_int(
+                "GHILLIE_STATUS_CACHE_TTL_HOURS", 720
+            )
+
         return cls(
             window_days=window_days,
             report_sink_path=report_sink_path,
             validation_max_attempts=validation_max_attempts,
+            evidence_item_limit=evidence_item_limit,
+            status_cache_ttl_hours=status_cache_ttl_hours,
+            status_cache_max_entries=cls._parse_positive_int(
+                "GHILLIE_STATUS_CACHE_MAX_ENTRIES", 10_000
+            ),
+            status_model_tokens_per_minute=cls._parse_optional_positive_int(
+                "GHILLIE_STATUS_MODEL_TPM"
+            ),
+            status_model_requests_per_minute=cls._parse_optional_positive_int(
+                "GHILLIE_STATUS_MODEL_RPM"
+            ),
         )
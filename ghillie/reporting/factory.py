@@ -0,0 +1,113 @@
+"""Factory for assembling a ReportingService from environment configuration.
+
+Both report entry points build their service here: the Dramatiq actors
+through ``_build_service()`` and the API through
+``ghillie.api.factory.build_reporting_service()``. Keeping the wiring in one
+place keeps the status model decorators, their ordering, and the batch
+backend's special cases the same for every caller.
+
+Usage
+-----
+Build a service for a caller waiting on the report::
+
+    from ghillie.reporting.factory import build_reporting_service
+
+    service = build_reporting_service(session_factory, interactive=True)
+
+"""
+
+from __future__ import annotations
+
+import dataclasses as dc
+import typing as typ
+
+from ghillie.evidence import EvidenceBundleService
+from ghillie.reporting.config import ReportingConfig
+from ghillie.reporting.observability import ReportingEventLogger
+from ghillie.reporting.service import ReportingService, ReportingServiceDependencies
+from ghillie.reporting.validation import is_valid_report
+from ghillie.status.batch import OpenAIBatchStatusModel
+from ghillie.status.cache import CachingStatusModel
+from ghillie.status.factory import create_status_model
+from ghillie.status.rate_limit import SharedRateLimiter
+
+if typ.TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from ghillie.reporting.sink import ReportSink
+
+__all__ = ["build_reporting_service"]
+
+
+def build_reporting_service(
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    interactive: bool = False,
+) -> ReportingService:
+    """Build a ``ReportingService`` from environment configuration.
+
+    Creates the evidence service, status model, reporting config, and
+    optional filesystem sink from the current environment, then assembles
+    a fully configured ``ReportingService``.
+
+    Parameters
+    ----------
+    session_factory
+        Async session factory for database access.
+    interactive
+        Build the service for a caller waiting on the report, such as an
+        API request. The 'openai-batch' backend is then replaced by the
+        synchronous 'openai' model, since a batch may take hours.
+
+    Returns
+    -------
+    ReportingService
+        Configured service ready for report generation.
+
+    """
+    config = ReportingConfig.from_env()
+    evidence_service = EvidenceBundleService(
+        session_factory, limits=config.bundle_limits
+    )
+    # The synchronous OpenAI models meter each request they send, retries
+    # and hedges included; batch requests draw on the provider's separate
+    # batch quota and are left unmetered.
+    rate_limiter = (
+        SharedRateLimiter(session_factory, config.rate_limit_budget)
+        if config.rate_limit_budget is not None
+        else None
+    )
+    status_model = create_status_model(
+        session_factory, interactive=interactive, rate_limiter=rate_limiter
+    )
+    if isinstance(status_model, OpenAIBatchStatusModel):
+        # A validation retry would wait for a whole new batch inside this
+        # job; rejected reports get a review marker and rerun next time.
+        config = dc.replace(config, validation_max_attempts=1)
+    # Cache outside the limiter so cache hits consume no provider budget.
+    if config.status_cache_ttl is not None:
+        status_model = CachingStatusModel(
+            status_model,
+            session_factory,
+            ttl=config.status_cache_ttl,
+            max_entries=config.status_cache_max_entries,
+            accept=is_valid_report,
+        )
+
+    report_sink: ReportSink | None = None
+    if config.report_sink_path is not None:
+        from ghillie.reporting.filesystem_sink import FilesystemReportSink
+
+        report_sink = FilesystemReportSink(config.report_sink_path)
+
+    dependencies = ReportingServiceDependencies(
+        session_factory=session_factory,
+        evidence_service=evidence_service,
+        status_model=status_model,
+    )
+    return ReportingService(
+        dependencies,
+        config=config,
+        report_sink=report_sink,
+        event_logger=ReportingEventLogger(),
+    )
@@ -1,7 +1,9 @@
 """Emit structured observability events for reporting lifecycle execution.
 
 This module defines event identifiers and a logger wrapper used by
-``ReportingService`` to emit start, success, and failure telemetry.
+``ReportingService`` to emit start, success, and failure telemetry. The same
+logger receives status model retry and circuit breaker events, so provider
+trouble appears alongside the reports it affects.
 
 Usage
 -----
@@ -21,12 +23,13 @@ from __future__ import annotations
 import enum
 import typing as typ
 
-from ghillie.logging import get_logger, log_error, log_info
+from ghillie.logging import get_logger, log_error, log_info, log_warning
 
 if typ.TYPE_CHECKING:
     import datetime as dt
 
     from ghillie.status.metrics import ModelInvocationMetrics
+    from ghillie.status.resilience import CircuitState
 
 logger = get_logger(__name__)
 
@@ -37,6 +40,8 @@ class ReportingEventType(enum.StrEnum):
     REPORT_STARTED = "reporting.report.started"
     REPORT_COMPLETED = "reporting.report.completed"
     REPORT_FAILED = "reporting.report.failed"
+    MODEL_RETRY = "reporting.model.retry"
+    CIRCUIT_STATE_CHANGED = "reporting.model.circuit_state_changed"
 
 
 class ReportingEventLogger:
@@ -103,11 +108,16 @@ class ReportingEventLogger:
         prompt_tokens = metrics.prompt_tokens if metrics is not None else None
         completion_tokens = metrics.completion_tokens if metrics is not None else None
         total_tokens = metrics.total_tokens if metrics is not None else None
+        estimated_prompt_tokens = (
+            metrics.estimated_prompt_tokens if metrics is not None else None
+        )
+        hedge_winner = metrics.hedge_winner if metrics is not None else None
         latency_text = "None" if latency is None else f"{latency:.3f}"
         log_info(
             logger,
             "[%s] repo_slug=%s model=%s latency_ms=%s "
-            "prompt_tokens=%s completion_tokens=%s total_tokens=%s",
+            "prompt_tokens=%s completion_tokens=%s total_tokens=%s "
+            "estimated_prompt_tokens=%s hedge_winner=%s",
             ReportingEventType.REPORT_COMPLETED,
             repo_slug,
             model,
@@ -115,6 +125,8 @@ class ReportingEventLogger:
             prompt_tokens,
             completion_tokens,
             total_tokens,
+            estimated_prompt_tokens,
+            hedge_winner,
         )
 
     def log_report_failed(
@@ -151,3 +163,79 @@ class ReportingEventLogger:
             str(error),
             exc_info=error,
         )
+
+    def log_model_retry(
+        self,
+        *,
+        model: str,
+        attempt: int,
+        delay_s: float,
+        error: BaseException,
+    ) -> None:
+        """Log that a transient status model failure will be retried.
+
+        Parameters
+        ----------
+        model
+            Model identifier the request was sent to.
+        attempt
+            One-based number of the attempt that failed.
+        delay_s
+            Seconds waited before the next attempt.
+        error
+            Failure raised by the attempt.
+
+        Returns
+        -------
+        None
+            This method emits a structured log event and returns ``None``.
+
+        """
+        log_warning(
+            logger,
+            "[%s] model=%s attempt=%s delay_seconds=%.3f error_type=%s "
+            "error_message=%s",
+            ReportingEventType.MODEL_RETRY,
+            model,
+            attempt,
+            delay_s,
+            type(error).__name__,
+            str(error),
+        )
+
+    def log_circuit_state_changed(
+        self,
+        *,
+        name: str,
+        state: CircuitState,
+        consecutive_failures: int,
+    ) -> None:
+        """Log a status model circuit breaker state transition.
+
+        Opening the breaker is logged as an error, since reports fail fast
+        until it closes; other transitions are informational.
+
+        Parameters
+        ----------
+        name
+            Name of the circuit breaker, usually the endpoint URL.
+        state
+            State the breaker moved to.
+        consecutive_failures
+            Transient failures counted when the transition happened.
+
+        Returns
+        -------
+        None
+            This method emits a structured log event and returns ``None``.
+
+        """
+        log = log_error if state == "open" else log_info
+        log(
+            logger,
+            "[%s] breaker=%s state=%s consecutive_failures=%s",
+            ReportingEventType.CIRCUIT_STATE_CHANGED,
+            name,
+            state,
+            consecutive_failures,
+        )
@@ -31,18 +31,21 @@ Create a service and generate a report:
 
 from __future__ import annotations
 
+import asyncio
 import dataclasses as dc
 import datetime as dt
 import time
 import typing as typ
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError
 
 from ghillie.common.time import utcnow
+from ghillie.evidence.rolling import prune_rolling_state
+from ghillie.evidence.snapshots import load_bundle_snapshot, store_bundle_snapshot
+from ghillie.gold.coverage import record_repository_coverage
 from ghillie.gold.storage import (
     Report,
-    ReportCoverage,
     ReportReview,
     ReportScope,
     ReviewState,
@@ -52,9 +55,11 @@ from ghillie.logging import get_logger, log_warning
 from ghillie.reporting.errors import ReportValidationError
 from ghillie.reporting.markdown import render_report_markdown
 from ghillie.reporting.validation import (
+    ReportValidationIssue,
     ReportValidationResult,
     validate_repository_report,
 )
+from ghillie.status.errors import StatusGenerationAbortedError
 from ghillie.status.metrics import ModelInvocationMetrics
 from ghillie.status.models import RepositoryStatusResult, to_machine_summary
 
@@ -63,7 +68,13 @@ from .sink import ReportMetadata
 
 logger = get_logger(__name__)
 
+# Reports persisted at once. Status model calls may run far wider (the batch
+# backend admits a whole estate), but each write holds a pooled connection.
+_MAX_CONCURRENT_WRITES = 10
+
 if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
     from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
     from ghillie.evidence.models import RepositoryEvidenceBundle
@@ -157,6 +168,12 @@ class ReportingService:
         self._config = config or ReportingConfig()
         self._report_sink = report_sink
         self._event_logger = event_logger
+        self._write_slots = asyncio.Semaphore(_MAX_CONCURRENT_WRITES)
+
+    @property
+    def status_model(self) -> StatusModel:
+        """Return the status model that summarises repositories."""
+        return self._status_model
 
     async def compute_next_window(
         self,
@@ -187,19 +204,49 @@ class ReportingService:
         async with self._session_factory() as session:
             last_report = await self._fetch_last_report(session, repository_id)
 
-        if last_report is not None:
-            if last_report.window_end > window_end:
-                msg = (
-                    f"Cannot compute window for repository {repository_id}: "
-                    f"as_of ({window_end.isoformat()}) predates the last report's "
-                    f"window_end ({last_report.window_end.isoformat()})"
-                )
-                raise ValueError(msg)
-            window_start = last_report.window_end
-        else:
+        return self._next_window(
+            repository_id,
+            last_report.window_end if last_report is not None else None,
+            window_end,
+        )
+
+    def _next_window(
+        self,
+        repository_id: str,
+        last_window_end: dt.datetime | None,
+        window_end: dt.datetime,
+    ) -> ReportingWindow:
+        """Return the window following a repository's last report."""
+        if last_window_end is None:
             window_start = window_end - dt.timedelta(days=self._config.window_days)
+            return ReportingWindow(start=window_start, end=window_end)
+        if last_window_end > window_end:
+            msg = (
+                f"Cannot compute window for repository {repository_id}: "
+                f"as_of ({window_end.isoformat()}) predates the last report's "
+                f"window_end ({last_window_end.isoformat()})"
+            )
+            raise ValueError(msg)
+        return ReportingWindow(start=last_window_end, end=window_end)
 
-        return ReportingWindow(start=window_start, end=window_end)
+    async def _fetch_last_window_ends(
+        self, repository_ids: cabc.Collection[str]
+    ) -> dict[str, dt.datetime]:
+        """Fetch the latest repository report window end for many repositories."""
+        stmt = (
+            select(Report.repository_id, func.max(Report.window_end))
+            .where(
+                Report.scope == ReportScope.REPOSITORY,
+                Report.repository_id.in_(repository_ids),
+            )
+            .group_by(Report.repository_id)
+        )
+        async with self._session_factory() as session:
+            rows = await session.execute(stmt)
+            return {
+                typ.cast("str", repo_id): typ.cast("dt.datetime", window_end)
+                for repo_id, window_end in rows
+            }
 
     async def _fetch_last_report(
         self,
@@ -326,22 +373,24 @@ class ReportingService:
     ) -> tuple[Report, ModelInvocationMetrics | None]:
         """Generate, validate, and persist a report for an evidence bundle."""
         status_result, validation, metrics = await self._invoke_with_retries(bundle)
-        if not validation.is_valid:
-            review_id = await self._create_review_marker(
-                repository_id=repository_id,
-                window_start=window_start,
-                window_end=window_end,
-                validation=validation,
-            )
-            raise ReportValidationError(
-                issues=validation.issues,
-                review_id=review_id,
+        async with self._write_slots:
+            if status_result is None or not validation.is_valid:
+                review_id = await self._create_review_marker(
+                    repository_id=repository_id,
+                    window_start=window_start,
+                    window_end=window_end,
+                    validation=validation,
+                    metrics=metrics,
+                )
+                raise ReportValidationError(
+                    issues=validation.issues,
+                    review_id=review_id,
+                )
+            report = await self._persist_report(
+                status_result=status_result,
+                bundle=bundle,
+                metrics=metrics,
             )
-        report = await self._persist_report(
-            status_result=status_result,
-            bundle=bundle,
-            metrics=metrics,
-        )
         return report, metrics
 
     def _log_started(
@@ -393,13 +442,15 @@ class ReportingService:
         self,
         bundle: RepositoryEvidenceBundle,
     ) -> tuple[
-        RepositoryStatusResult,
+        RepositoryStatusResult | None,
         ReportValidationResult,
         ModelInvocationMetrics | None,
     ]:
         """Invoke the status model with validation retries.
 
-        Returns the last status result and its validation outcome.
+        Returns the last status result and its validation outcome. A
+        streaming model that abandons generation early counts as a failed
+        attempt with no result.
         """
         max_attempts = self._config.validation_max_attempts
         if max_attempts < 1:
@@ -412,14 +463,21 @@ class ReportingService:
 
         for _attempt in range(max_attempts):
             started_at = time.monotonic()
-            status_result = await self._status_model.summarize_repository(bundle)
+            try:
+                status_result = await self._status_model.summarize_repository(bundle)
+            except StatusGenerationAbortedError as exc:
+                status_result = None
+                validation = ReportValidationResult(
+                    issues=(ReportValidationIssue(code=exc.code, message=exc.reason),)
+                )
+            else:
+                validation = validate_repository_report(bundle, status_result)
             elapsed_ms = (time.monotonic() - started_at) * 1000.0
             invocation_metrics = self._merge_invocation_metrics(elapsed_ms)
-            validation = validate_repository_report(bundle, status_result)
             if validation.is_valid:
                 break
 
-        if status_result is None or validation is None:
+        if validation is None:
             msg = (
                 "Status model did not run; this indicates an invalid retry "
                 f"configuration (max_attempts={max_attempts})."
@@ -441,16 +499,17 @@ class ReportingService:
 
         return ModelInvocationMetrics(latency_ms=latency_ms)
 
-    async def _create_review_marker(
+    async def _create_review_marker(  # noqa: PLR0913
         self,
         *,
         repository_id: str,
         window_start: dt.datetime,
         window_end: dt.datetime,
         validation: ReportValidationResult,
+        metrics: ModelInvocationMetrics | None = None,
     ) -> str:
         """Persist a ``ReportReview`` row and return its ID."""
-        model = self._get_model_identifier()
+        model = self._get_model_identifier(metrics)
         attempt_count = self._config.validation_max_attempts
         validation_issues: list[ValidationIssuePayload] = [
             ValidationIssuePayload(code=issue.code, message=issue.message)
@@ -510,7 +569,7 @@ class ReportingService:
         bundle: RepositoryEvidenceBundle,
         metrics: ModelInvocationMetrics | None,
     ) -> Report:
-        """Persist the validated report and write to sink."""
+        """Persist the validated report, its evidence snapshot, and sink output."""
         repository_id = bundle.repository.id
         machine_summary = to_machine_summary(status_result)
         model_latency_ms = self._to_latency_milliseconds(metrics)
@@ -521,7 +580,7 @@ class ReportingService:
                 repository_id=repository_id,
                 window_start=bundle.window_start,
                 window_end=bundle.window_end,
-                model=self._get_model_identifier(),
+                model=self._get_model_identifier(metrics),
                 human_text=status_result.summary,
                 machine_summary=machine_summary,
                 model_latency_ms=model_latency_ms,
@@ -533,7 +592,8 @@ class ReportingService:
             )
             session.add(report)
             await session.flush()
-            self._create_coverage_records(session, report, bundle)
+            await self._create_coverage_records(session, report, bundle)
+            await store_bundle_snapshot(session, report.id, bundle)
             report_id = report.id
 
         async with self._session_factory() as session:
@@ -555,31 +615,59 @@ class ReportingService:
             return None
         return round(metrics.latency_ms)
 
-    def _get_model_identifier(self) -> str:
-        """Return the model identifier for report metadata."""
-        # Check for model_id attribute on the status model
-        model_id = getattr(self._status_model, "model_id", None)
-        if model_id is not None:
-            return str(model_id)
-        # Fall back to class-based identification
-        model_class = type(self._status_model).__name__
+    def _get_model_identifier(
+        self, metrics: ModelInvocationMetrics | None = None
+    ) -> str:
+        """Return the model identifier for report metadata.
+
+        A ``model_id`` in the invocation's metrics wins, since composite
+        models such as ``HedgedStatusModel`` report which model answered.
+        """
+        if metrics is not None and metrics.model_id is not None:
+            return metrics.model_id
+        # Check for a model_id attribute on the status model and on any
+        # models it wraps (for example, a caching wrapper).
+        status_model: object = self._status_model
+        while True:
+            model_id = getattr(status_model, "model_id", None)
+            if model_id is not None:
+                return str(model_id)
+            wrapped = getattr(status_model, "wrapped", None)
+            if wrapped is None:
+                break
+            status_model = wrapped
+        # Fall back to class-based identification of the innermost model
+        model_class = type(status_model).__name__
         if model_class == "MockStatusModel":
             return "mock-v1"
         return model_class.lower()
 
-    def _create_coverage_records(
+    async def _create_coverage_records(
         self,
         session: AsyncSession,
         report: Report,
         bundle: RepositoryEvidenceBundle,
     ) -> None:
-        """Create ReportCoverage records linking events to the report."""
-        for event_fact_id in bundle.event_fact_ids:
-            coverage = ReportCoverage(
-                report_id=report.id,
-                event_fact_id=event_fact_id,
+        """Bulk-record which event facts the report consumed.
+
+        When the evidence service reads rolling state, covered facts and
+        facts before the report's window end also leave it, since it only
+        tracks the open reporting window.
+        """
+        await record_repository_coverage(
+            session,
+            report_id=report.id,
+            repository_id=bundle.repository.id,
+            repo_external_id=bundle.repository.slug,
+            event_fact_ids=bundle.event_fact_ids,
+        )
+        if self._evidence_service.rolling_state:
+            await prune_rolling_state(
+                session,
+                repository_id=bundle.repository.id,
+                repo_external_id=bundle.repository.slug,
+                window_end=report.window_end,
             )
-            session.add(coverage)
 
     async def _write_to_sink(
         self,
@@ -672,3 +760,136 @@ class ReportingService:
             window_end=window.end,
             bundle=bundle,
         )
+
+    async def run_for_repositories(
+        self,
+        repository_ids: cabc.Sequence[str],
+        as_of: dt.datetime | None = None,
+        *,
+        max_concurrency: int = 1,
+    ) -> list[Report | BaseException | None]:
+        """Run the reporting workflow for many repositories at once.
+
+        Windows and evidence bundles for every repository are loaded with a
+        fixed number of set-based queries via
+        ``EvidenceBundleService.build_bundles``, so database time before the
+        status model runs barely grows with the number of repositories.
+        Reports are then generated concurrently for repositories with events.
+
+        Parameters
+        ----------
+        repository_ids
+            Silver layer repository IDs; duplicates are reported once.
+        as_of
+            Reference time for window computation; defaults to now.
+        max_concurrency
+            Maximum number of reports generated at the same time.
+
+        Returns
+        -------
+        list[Report | BaseException | None]
+            One outcome per distinct repository in request order: the
+            generated report, ``None`` when its window has no events, or the
+            exception raised while computing its window or generating its
+            report, as ``asyncio.gather(..., return_exceptions=True)`` would.
+
+        """
+        window_end = as_of or utcnow()
+        ordered = list(dict.fromkeys(repository_ids))
+        last_ends = await self._fetch_last_window_ends(ordered)
+        outcomes: dict[str, Report | BaseException | None] = {}
+        windows: dict[str, ReportingWindow] = {}
+        for repo_id in ordered:
+            try:
+                windows[repo_id] = self._next_window(
+                    repo_id, last_ends.get(repo_id), window_end
+                )
+            except ValueError as exc:
+                outcomes[repo_id] = exc
+
+        bundles = await self._evidence_service.build_bundles(
+            list(windows), [(window.start, window.end) for window in windows.values()]
+        )
+        active = [bundle for bundle in bundles if bundle.total_event_count]
+        outcomes.update(
+            (bundle.repository.id, None)
+            for bundle in bundles
+            if not bundle.total_event_count
+        )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _generate(bundle: RepositoryEvidenceBundle) -> Report:
+            async with semaphore:
+                return await self.generate_report(
+                    repository_id=bundle.repository.id,
+                    window_start=bundle.window_start,
+                    window_end=bundle.window_end,
+                    bundle=bundle,
+                )
+
+        gathered = await asyncio.gather(
+            *(_generate(bundle) for bundle in active), return_exceptions=True
+        )
+        outcomes.update(
+            zip((bundle.repository.id for bundle in active), gathered, strict=True)
+        )
+        return [outcomes[repo_id] for repo_id in ordered]
+
+    async def load_report_bundle(
+        self, report_id: str
+    ) -> RepositoryEvidenceBundle | None:
+        """Return the evidence bundle a report was generated from.
+
+        The bundle is read from the report's stored snapshot, not rebuilt
+        from Silver, so it is exactly what the status model saw.
+
+        Parameters
+        ----------
+        report_id
+            The Gold layer report ID.
+
+        Returns
+        -------
+        RepositoryEvidenceBundle | None
+            The stored bundle, or ``None`` if the report has no snapshot.
+
+        """
+        async with self._session_factory() as session:
+            return await load_bundle_snapshot(session, report_id)
+
+    async def regenerate_report(self, report_id: str) -> Report:
+        """Generate a new report from an earlier report's evidence snapshot.
+
+        Use this after a prompt or model change to re-summarise a window
+        without querying Silver. The new report covers the same window and
+        event facts as the original, which is left in place.
+
+        Parameters
+        ----------
+        report_id
+            The Gold layer ID of the report to regenerate.
+
+        Returns
+        -------
+        Report
+            The newly persisted report.
+
+        Raises
+        ------
+        ValueError
+            If the report has no stored evidence snapshot.
+        ReportValidationError
+            If report validation fails after all retry attempts.
+
+        """
+        bundle = await self.load_report_bundle(report_id)
+        if bundle is None:
+            msg = f"Report {report_id} has no evidence snapshot"
+            raise ValueError(msg)
+        return await self.generate_report(
+            repository_id=bundle.repository.id,
+            window_start=bundle.window_start,
+            window_end=bundle.window_end,
+            bundle=bundle,
+        )
@@ -13,6 +13,12 @@ ReportValidationResult
     Frozen dataclass aggregating zero or more issues.
 validate_repository_report
     Pure function that applies all checks and returns a result.
+check_partial_report
+    Stream check applying the summary rules to a partial completion, so
+    streaming status models can stop generating output that would fail.
+is_valid_report
+    Result check for status model wrappers that must only keep results
+    validation accepts, such as the result cache.
 """
 
 from __future__ import annotations
@@ -23,6 +29,7 @@ import typing as typ
 if typ.TYPE_CHECKING:
     from ghillie.evidence.models import RepositoryEvidenceBundle
     from ghillie.status.models import RepositoryStatusResult
+    from ghillie.status.streaming import PartialStatusReport
 
 # Highlights exceeding this multiple of the event count are implausible.
 _HIGHLIGHT_EVENT_RATIO = 5
@@ -64,11 +71,9 @@ class ReportValidationResult:
         return len(self.issues) == 0
 
 
-def _check_empty_summary(
-    result: RepositoryStatusResult,
-) -> ReportValidationIssue | None:
+def _check_empty_summary(summary: str) -> ReportValidationIssue | None:
     """Return an issue when summary text is empty or whitespace-only."""
-    if not result.summary or not result.summary.strip():
+    if not summary or not summary.strip():
         return ReportValidationIssue(
             code="empty_summary",
             message="Summary is empty or contains only whitespace.",
@@ -76,12 +81,9 @@ def _check_empty_summary(
     return None
 
 
-def _check_truncated_summary(
-    result: RepositoryStatusResult,
-) -> ReportValidationIssue | None:
+def _check_truncated_summary(summary: str) -> ReportValidationIssue | None:
     """Return an issue when summary text appears truncated."""
-    summary = result.summary.rstrip()
-    if summary.endswith(("...", "\u2026")):
+    if summary.rstrip().endswith(("...", "\u2026")):
         return ReportValidationIssue(
             code="truncated_summary",
             message="Summary appears truncated (trailing ellipsis).",
@@ -128,11 +130,11 @@ def validate_repository_report(
     """
     checks: list[ReportValidationIssue] = []
 
-    empty = _check_empty_summary(result)
+    empty = _check_empty_summary(result.summary)
     if empty is not None:
         checks.append(empty)
 
-    truncated = _check_truncated_summary(result)
+    truncated = _check_truncated_summary(result.summary)
     if truncated is not None:
         checks.append(truncated)
 
@@ -141,3 +143,39 @@ def validate_repository_report(
         checks.append(implausible)
 
     return ReportValidationResult(issues=tuple(checks))
+
+
+def is_valid_report(
+    bundle: RepositoryEvidenceBundle,
+    result: RepositoryStatusResult,
+) -> bool:
+    """Return whether ``result`` passes :func:`validate_repository_report`."""
+    return validate_repository_report(bundle, result).is_valid
+
+
+def check_partial_report(
+    partial: PartialStatusReport,
+) -> ReportValidationIssue | None:
+    """Return the first summary issue a partial completion already has.
+
+    Only the summary rules can be decided before the completion ends, and
+    only once the summary string is closed; until then this returns
+    ``None``.
+
+    Parameters
+    ----------
+    partial
+        Output assembled so far from a streamed completion.
+
+    Returns
+    -------
+    ReportValidationIssue | None
+        The issue that makes the completion certain to fail validation, or
+        ``None`` when generation should continue.
+
+    """
+    if partial.summary is None:
+        return None
+    return _check_empty_summary(partial.summary) or _check_truncated_summary(
+        partial.summary
+    )
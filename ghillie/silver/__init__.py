@@ -1,7 +1,7 @@
 """Silver staging helpers for transforming Bronze raw events."""
 
 from .errors import RawEventTransformError
-from .services import RawEventTransformer
+from .services import EventFactObserver, RawEventTransformer
 from .storage import (
     Commit,
     DocumentationChange,
@@ -16,6 +16,7 @@ __all__ = [
     "Commit",
     "DocumentationChange",
     "EventFact",
+    "EventFactObserver",
     "Issue",
     "PullRequest",
     "RawEventTransformError",
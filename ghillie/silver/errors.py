@@ -11,6 +11,7 @@ class RawEventTransformReason(enum.StrEnum):
     INVALID_PAYLOAD = "invalid_payload"
     REPOSITORY_MISMATCH = "repository_mismatch"
     ENTITY_TRANSFORM_FAILED = "entity_transform_failed"
+    FACT_OBSERVER_FAILED = "fact_observer_failed"
     OCCURRED_AT_REQUIRED = "occurred_at_required"
 
 
@@ -63,6 +64,14 @@ class RawEventTransformError(Exception):
             reason=RawEventTransformReason.ENTITY_TRANSFORM_FAILED,
         )
 
+    @classmethod
+    def fact_observer_failed(cls, exc: Exception) -> RawEventTransformError:
+        """Create an error when an event fact observer raises unexpectedly."""
+        return cls(
+            f"event fact observer failed: {exc}",
+            reason=RawEventTransformReason.FACT_OBSERVER_FAILED,
+        )
+
     @classmethod
     def datetime_requires_timezone(cls, field: str) -> RawEventTransformError:
         """Ensure datetime payloads remain timezone aware."""
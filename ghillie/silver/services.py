@@ -23,12 +23,33 @@ type ProcessedIds = list[int]
 logger = get_logger(__name__)
 
 
+class EventFactObserver(typ.Protocol):
+    """Hook notified of each event fact as it is transformed.
+
+    Observers run inside the same nested transaction as the fact and its
+    entity transform, after both have been applied, so derived state they
+    maintain commits or rolls back together with the Silver rows. They must
+    be idempotent: replaying a raw event notifies them again with the
+    existing fact.
+    """
+
+    async def on_event_fact(self, session: AsyncSession, fact: EventFact) -> None:
+        """Update derived state for a transformed event fact."""
+        ...
+
+
 class RawEventTransformer:
     """Idempotent Bronze→Silver transformer for raw events."""
 
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
-        """Store the session factory used by transform runs."""
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        observers: cabc.Sequence[EventFactObserver] = (),
+    ) -> None:
+        """Store the session factory and fact observers used by transform runs."""
         self._session_factory = session_factory
+        self._observers = tuple(observers)
 
     async def process_pending(self, limit: int | None = None) -> ProcessedIds:
         """Transform pending raw events in insertion order."""
@@ -84,8 +105,9 @@ class RawEventTransformer:
         """Process a single raw event, returning its ID if processed successfully."""
         try:
             async with session.begin_nested():
-                await self._upsert_event_fact(session, raw_event)
+                fact = await self._upsert_event_fact(session, raw_event)
                 await self._apply_entity_transform(session, raw_event)
+                await self._notify_observers(session, fact)
             return self._mark_processed(raw_event)
         except RawEventTransformError as exc:
             return await self._handle_transform_error(session, raw_event, exc)
@@ -105,6 +127,16 @@ class RawEventTransformer:
         except Exception as exc:
             raise RawEventTransformError.entity_transform_failed(exc) from exc
 
+    async def _notify_observers(self, session: AsyncSession, fact: EventFact) -> None:
+        """Let observers update derived state for the transformed fact."""
+        for observer in self._observers:
+            try:
+                await observer.on_event_fact(session, fact)
+            except RawEventTransformError:
+                raise
+            except Exception as exc:
+                raise RawEventTransformError.fact_observer_failed(exc) from exc
+
     async def _handle_transform_error(
         self, session: AsyncSession, raw_event: RawEvent, exc: RawEventTransformError
     ) -> int | None:
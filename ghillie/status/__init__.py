@@ -17,8 +17,22 @@ OpenAIStatusModel
     OpenAI-compatible LLM implementation.
 OpenAIStatusModelConfig
     Configuration dataclass for OpenAI client.
+OpenAIBatchStatusModel
+    OpenAI-compatible implementation that submits requests as batches.
+BatchSubmissionConfig
+    Batch size, collection window, and polling settings for batch mode.
 ModelInvocationMetrics
     Token and latency metrics captured per status-model invocation.
+CachingStatusModel
+    Wrapper that serves repeated prompts from a persistent Gold cache.
+RateLimitedStatusModel
+    Wrapper that meters invocations against shared TPM and RPM budgets.
+RetryPolicy
+    Retry and backoff settings for transient provider failures.
+CircuitBreaker
+    Fails requests fast while a provider is failing persistently.
+CircuitBreakerPolicy
+    Failure threshold and reset timeout for a circuit breaker.
 create_status_model
     Factory function to create StatusModel from environment configuration.
 OpenAIStatusError
@@ -31,6 +45,10 @@ OpenAIConfigError
     Exception for configuration errors.
 StatusModelConfigError
     Exception for factory configuration errors.
+StatusGenerationAbortedError
+    Exception for streamed completions abandoned before they finish.
+PartialStatusReport
+    Partial output of a streamed completion, passed to early-abort checks.
 to_machine_summary
     Helper to convert results for Report.machine_summary storage.
 
@@ -49,33 +67,68 @@ Examples
 
 """
 
-from ghillie.status.config import OpenAIStatusModelConfig
+from ghillie.status.batch import OpenAIBatchStatusModel
+from ghillie.status.cache import CachingStatusModel, status_prompt_fingerprint
+from ghillie.status.config import BatchSubmissionConfig, OpenAIStatusModelConfig
 from ghillie.status.errors import (
     OpenAIAPIError,
     OpenAIConfigError,
     OpenAIResponseShapeError,
     OpenAIStatusError,
+    StatusGenerationAbortedError,
     StatusModelConfigError,
 )
 from ghillie.status.factory import create_status_model
+from ghillie.status.hedging import HedgedStatusModel, HedgingPolicy
 from ghillie.status.metrics import ModelInvocationMetrics
 from ghillie.status.mock import MockStatusModel
 from ghillie.status.models import RepositoryStatusResult, to_machine_summary
 from ghillie.status.openai_client import OpenAIStatusModel
 from ghillie.status.protocol import StatusModel
+from ghillie.status.rate_limit import (
+    RateLimitBudget,
+    RateLimitedStatusModel,
+    SharedRateLimiter,
+    estimate_request_tokens,
+)
+from ghillie.status.resilience import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitState,
+    RetryPolicy,
+    shared_circuit_breaker,
+)
+from ghillie.status.streaming import PartialStatusReport
 
 __all__ = [
+    "BatchSubmissionConfig",
+    "CachingStatusModel",
+    "CircuitBreaker",
+    "CircuitBreakerPolicy",
+    "CircuitState",
+    "HedgedStatusModel",
+    "HedgingPolicy",
     "MockStatusModel",
     "ModelInvocationMetrics",
     "OpenAIAPIError",
+    "OpenAIBatchStatusModel",
     "OpenAIConfigError",
     "OpenAIResponseShapeError",
     "OpenAIStatusError",
     "OpenAIStatusModel",
     "OpenAIStatusModelConfig",
+    "PartialStatusReport",
+    "RateLimitBudget",
+    "RateLimitedStatusModel",
     "RepositoryStatusResult",
+    "RetryPolicy",
+    "SharedRateLimiter",
+    "StatusGenerationAbortedError",
     "StatusModel",
     "StatusModelConfigError",
     "create_status_model",
+    "estimate_request_tokens",
+    "shared_circuit_breaker",
+    "status_prompt_fingerprint",
     "to_machine_summary",
 ]
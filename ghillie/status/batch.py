@@ -0,0 +1,455 @@
+"""Batch-submission backend for OpenAI-compatible status models.
+
+Scheduled estate runs do not need interactive latency, and OpenAI-compatible
+providers process batch requests at roughly half the synchronous price.
+``OpenAIBatchStatusModel`` keeps the ``StatusModel`` interface: each
+``summarize_repository`` call queues its chat completion request and waits.
+Requests that arrive together, as they do when
+``ReportingService.run_for_repositories`` generates an estate's reports
+concurrently, are written to one JSONL file, uploaded, and submitted as a
+batch. The model polls the batch until it finishes and resolves each waiting
+call with its own completion, which the reporting service then validates and
+persists as usual.
+
+A batch is submitted once ``max_batch_size`` requests are queued, or
+``collect_window_s`` seconds after the first request, whichever comes first.
+Identical requests share one batch line.
+
+Batches can take hours, far longer than a report job may run. Given a session
+factory, the model records each submitted request in the Gold
+``status_model_batch_requests`` table under a hash of its payload. Polling
+gives up after ``max_wait_s`` with a retryable error and leaves the batch
+running; when the job is retried, the same requests find their batch there
+and resume polling it instead of being submitted, and paid for, again. The
+report actors keep a job's window across retries, so the retried job's
+prompts, and therefore their keys, match. Rows are deleted once the batch
+finishes.
+
+Example:
+-------
+>>> from ghillie.status.config import OpenAIStatusModelConfig
+>>> config = OpenAIStatusModelConfig(api_key="sk-...")
+>>> model = OpenAIBatchStatusModel(config)
+>>> # reports = await service.run_for_repositories(repo_ids, max_concurrency=500)
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import typing as typ
+
+import httpx
+from sqlalchemy import delete
+
+from ghillie.gold.storage import StatusModelBatchRequest
+from ghillie.status.errors import (
+    OpenAIAPIError,
+    OpenAIConfigError,
+    OpenAIResponseShapeError,
+)
+from ghillie.status.openai_client import OpenAIStatusModel
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from ghillie.common.json import JSONLike
+    from ghillie.status.config import OpenAIStatusModelConfig
+    from ghillie.status.resilience import CircuitBreaker, ResilienceEventListener
+
+type _BatchOutcome = JSONLike | OpenAIAPIError
+type _QueuedRequest = tuple[str, dict[str, object]]
+type _BatchResults = tuple[dict[str, _BatchOutcome], OpenAIAPIError | None, bool]
+
+_CHAT_COMPLETIONS_SUFFIX = "/chat/completions"
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+_HTTP_OK = 200
+
+
+class OpenAIBatchStatusModel(OpenAIStatusModel):
+    """OpenAI-compatible status model that submits requests as batches.
+
+    Requests are sent to the batch API next to the configured chat
+    completions endpoint: an endpoint of ``https://host/v1/chat/completions``
+    uses ``https://host/v1/files`` and ``https://host/v1/batches``. Grouping
+    and polling follow ``config.batch``; streaming settings do not apply.
+
+    Parameters
+    ----------
+    config
+        Configuration for the OpenAI API client.
+    session_factory
+        Optional Gold database session factory. When given, submitted
+        requests are recorded so a retried job resumes their batch.
+    http_client
+        Optional httpx.AsyncClient for testing. If not provided,
+        the instance creates and owns its own client.
+    circuit_breaker
+        Breaker guarding the provider, shared as for ``OpenAIStatusModel``.
+    event_listener
+        Optional receiver of retry events.
+    sleep
+        Awaitable used between status checks and retries; injectable for
+        tests.
+
+    Raises
+    ------
+    OpenAIConfigError
+        If the endpoint is not a chat completions endpoint.
+
+    """
+
+    def __init__(  # noqa: PLR0913 - keyword-only injection points
+        self,
+        config: OpenAIStatusModelConfig,
+        *,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        event_listener: ResilienceEventListener | None = None,
+        sleep: cabc.Callable[[float], cabc.Awaitable[object]] = asyncio.sleep,
+    ) -> None:
+        """Initialise the client and an empty request queue."""
+        if not config.endpoint.endswith(_CHAT_COMPLETIONS_SUFFIX):
+            raise OpenAIConfigError.unsupported_batch_endpoint(config.endpoint)
+        super().__init__(
+            config,
+            http_client=http_client,
+            circuit_breaker=circuit_breaker,
+            event_listener=event_listener,
+            sleep=sleep,
+        )
+        self._session_factory = session_factory
+        self._base_url = config.endpoint.removesuffix(_CHAT_COMPLETIONS_SUFFIX)
+        self._request_path = httpx.URL(config.endpoint).path
+        self._queued: list[_QueuedRequest] = []
+        self._waiting: dict[str, asyncio.Future[JSONLike]] = {}
+        self._batch_keys: dict[str, set[str]] = {}
+        self._submit_timer: asyncio.TimerHandle | None = None
+        self._batches: set[asyncio.Task[None]] = set()
+
+    async def _call_chat_completion(self, user_prompt: str) -> str:
+        """Queue the request for a batch and wait for its completion.
+
+        A request already waiting, or recorded against a batch still in
+        flight, waits for that batch instead of being submitted again.
+
+        Parameters
+        ----------
+        user_prompt
+            User message content for the completion request.
+
+        Returns
+        -------
+        str
+            Assistant message content from the batch output.
+
+        Raises
+        ------
+        OpenAIAPIError
+            If submitting or polling the batch fails, the batch ends without
+            completing or is still running after ``max_wait_s``, or the
+            provider rejected this request.
+
+        """
+        payload = self._build_payload(user_prompt)
+        key = _request_key(payload)
+        future = self._waiting.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._waiting[key] = future
+            batch_id = await self._recorded_batch(key)
+            if batch_id is None:
+                self._enqueue(key, payload)
+            else:
+                self._follow(batch_id, {key})
+        # Shielded so one cancelled caller does not fail others sharing it.
+        body = await asyncio.shield(future)
+        self._last_invocation_metrics = self._extract_usage_metrics(body)
+        return self._extract_content(body)
+
+    def _enqueue(self, key: str, payload: dict[str, object]) -> None:
+        """Add a request to the next batch, submitting it when due."""
+        self._queued.append((key, payload))
+        if len(self._queued) >= self._config.batch.max_batch_size:
+            self._submit_queued()
+        elif self._submit_timer is None:
+            self._submit_timer = asyncio.get_running_loop().call_later(
+                self._config.batch.collect_window_s, self._submit_queued
+            )
+
+    def _submit_queued(self) -> None:
+        """Start a batch for every queued request."""
+        if self._submit_timer is not None:
+            self._submit_timer.cancel()
+            self._submit_timer = None
+        queued, self._queued = self._queued, []
+        if queued:
+            self._spawn(self._run_batch(queued))
+
+    def _follow(self, batch_id: str, keys: set[str]) -> None:
+        """Resolve ``keys`` from a recorded batch, polling it if nobody is."""
+        followed = batch_id in self._batch_keys
+        self._batch_keys.setdefault(batch_id, set()).update(keys)
+        if not followed:
+            self._spawn(self._await_batch(batch_id))
+
+    def _spawn(self, coroutine: cabc.Coroutine[object, object, None]) -> None:
+        """Run ``coroutine`` as a task kept alive until it finishes."""
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, queued: list[_QueuedRequest]) -> None:
+        """Submit and record one batch, then wait for its results."""
+        keys = {key for key, _ in queued}
+        try:
+            batch = await self._submit_batch(queued)
+            batch_id = _require_str(batch, "id")
+            await self._record_batch(batch_id, keys)
+        except asyncio.CancelledError:
+            self._abandon(keys)
+            raise
+        except Exception as exc:  # noqa: BLE001 - delivered to every waiting caller
+            self._resolve(keys, {}, exc)
+            return
+        self._batch_keys.setdefault(batch_id, set()).update(keys)
+        await self._await_batch(batch_id, batch)
+
+    async def _await_batch(
+        self, batch_id: str, batch: dict[str, object] | None = None
+    ) -> None:
+        """Poll a batch and resolve the requests waiting on it.
+
+        Recorded requests are forgotten once the batch has finished, but kept
+        when polling failed, ran out of time, or was cancelled, so a retry
+        resumes the batch.
+        """
+        failure: Exception | None
+        try:
+            outcomes, failure, finished = await self._poll_batch(batch_id, batch)
+        except asyncio.CancelledError:
+            self._abandon(self._batch_keys.pop(batch_id, set()))
+            raise
+        except Exception as exc:  # noqa: BLE001 - delivered to every waiting caller
+            outcomes, failure, finished = {}, exc, False
+        self._resolve(self._batch_keys.pop(batch_id, set()), outcomes, failure)
+        if finished:
+            await self._forget_batch(batch_id)
+
+    def _abandon(self, keys: cabc.Iterable[str]) -> None:
+        """Cancel the waiting futures for ``keys`` so later calls start over."""
+        for key in keys:
+            future = self._waiting.pop(key, None)
+            if future is not None:
+                future.cancel()
+
+    def _resolve(
+        self,
+        keys: cabc.Iterable[str],
+        outcomes: dict[str, _BatchOutcome],
+        failure: Exception | None,
+    ) -> None:
+        """Complete the waiting futures for ``keys`` from batch outcomes."""
+        for key in keys:
+            future = self._waiting.pop(key, None)
+            if future is None or future.done():
+                continue
+            outcome = outcomes.get(key)
+            if outcome is None:
+                future.set_exception(
+                    failure
+                    or OpenAIResponseShapeError.missing(f"batch output for {key}")
+                )
+            elif isinstance(outcome, OpenAIAPIError):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    async def _submit_batch(self, queued: list[_QueuedRequest]) -> dict[str, object]:
+        """Upload the requests and create a batch, returning the batch."""
+        input_file_id = await self._upload_requests(queued)
+        return await self._request_json(
+            self._client.build_request(
+                "POST",
+                f"{self._base_url}/batches",
+                json={
+                    "input_file_id": input_file_id,
+                    "endpoint": self._request_path,
+                    "completion_window": self._config.batch.completion_window,
+                },
+            )
+        )
+
+    async def _poll_batch(
+        self, batch_id: str, batch: dict[str, object] | None
+    ) -> _BatchResults:
+        """Wait for a batch to finish and return outcomes by request.
+
+        Returns
+        -------
+        _BatchResults
+            Completion bodies or per-request errors keyed by request, the
+            error for requests without an outcome, and whether the batch
+            finished. A batch that did not complete still returns its
+            finished requests, as an expired batch does.
+
+        """
+        if batch is None:
+            batch = await self._get_batch(batch_id)
+        status = _require_str(batch, "status")
+        waited_s = 0.0
+        while status not in _TERMINAL_STATUSES:
+            if waited_s >= self._config.batch.max_wait_s:
+                return {}, OpenAIAPIError.batch_pending(batch_id, waited_s), False
+            await self._sleep(self._config.batch.poll_interval_s)
+            waited_s += self._config.batch.poll_interval_s
+            batch = await self._get_batch(batch_id)
+            status = _require_str(batch, "status")
+
+        outcomes: dict[str, _BatchOutcome] = {}
+        for file_field in ("output_file_id", "error_file_id"):
+            file_id = batch.get(file_field)
+            if isinstance(file_id, str):
+                outcomes.update(_parse_results(await self._download(file_id)))
+        if status == "completed":
+            return outcomes, None, True
+        return outcomes, OpenAIAPIError.batch_failed(batch_id, status), True
+
+    async def _get_batch(self, batch_id: str) -> dict[str, object]:
+        """Return the provider's current view of a batch."""
+        return await self._request_json(
+            self._client.build_request("GET", f"{self._base_url}/batches/{batch_id}")
+        )
+
+    async def _recorded_batch(self, key: str) -> str | None:
+        """Return the in-flight batch a request was submitted in, if any."""
+        if self._session_factory is None:
+            return None
+        async with self._session_factory() as session:
+            row = await session.get(StatusModelBatchRequest, key)
+            return None if row is None else row.batch_id
+
+    async def _record_batch(self, batch_id: str, keys: cabc.Iterable[str]) -> None:
+        """Record the requests submitted in a batch."""
+        if self._session_factory is None:
+            return
+        async with self._session_factory() as session, session.begin():
+            for key in keys:
+                await session.merge(
+                    StatusModelBatchRequest(request_key=key, batch_id=batch_id)
+                )
+
+    async def _forget_batch(self, batch_id: str) -> None:
+        """Delete the records of a finished batch."""
+        if self._session_factory is None:
+            return
+        async with self._session_factory() as session, session.begin():
+            await session.execute(
+                delete(StatusModelBatchRequest).where(
+                    StatusModelBatchRequest.batch_id == batch_id
+                )
+            )
+
+    async def _upload_requests(self, queued: list[_QueuedRequest]) -> str:
+        """Upload the batch input file and return its ID."""
+        lines = (
+            json.dumps(
+                {
+                    "custom_id": key,
+                    "method": "POST",
+                    "url": self._request_path,
+                    "body": payload,
+                }
+            )
+            for key, payload in queued
+        )
+        content = "".join(f"{line}\n" for line in lines).encode()
+        uploaded = await self._request_json(
+            self._client.build_request(
+                "POST",
+                f"{self._base_url}/files",
+                data={"purpose": "batch"},
+                files={"file": ("status-requests.jsonl", content, "application/jsonl")},
+            )
+        )
+        return _require_str(uploaded, "id")
+
+    async def _download(self, file_id: str) -> str:
+        """Return the content of a batch output or error file."""
+        request = self._client.build_request(
+            "GET", f"{self._base_url}/files/{file_id}/content"
+        )
+        response = await self._with_retries(lambda: self._send(request))
+        return response.text
+
+    async def _request_json(self, request: httpx.Request) -> dict[str, object]:
+        """Send a batch API request and return its JSON object response."""
+        response = await self._with_retries(lambda: self._send(request))
+        try:
+            body = response.json()
+        except ValueError as exc:
+            raise OpenAIResponseShapeError.invalid_json(response.text) from exc
+        if not isinstance(body, dict):
+            raise OpenAIResponseShapeError.invalid_json(response.text)
+        return body
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        """Send ``request``, mapping transport failures to API errors."""
+        try:
+            return await self._client.send(request)
+        except httpx.TimeoutException as exc:
+            raise OpenAIAPIError.timeout() from exc
+        except httpx.RequestError as exc:
+            raise OpenAIAPIError.network_error(str(exc)) from exc
+
+
+def _request_key(payload: dict[str, object]) -> str:
+    """Return the hex SHA-256 digest identifying a request payload."""
+    material = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+def _require_str(data: dict[str, object], field: str) -> str:
+    """Return a string field of a batch API object or raise."""
+    value = data.get(field)
+    if not isinstance(value, str):
+        raise OpenAIResponseShapeError.missing(field)
+    return value
+
+
+def _parse_results(content: str) -> dict[str, _BatchOutcome]:
+    """Map each line of a batch output or error file to its outcome."""
+    outcomes: dict[str, _BatchOutcome] = {}
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise OpenAIResponseShapeError.invalid_json(line) from exc
+        if not isinstance(record, dict) or not isinstance(
+            custom_id := record.get("custom_id"), str
+        ):
+            raise OpenAIResponseShapeError.missing("custom_id")
+        outcomes[custom_id] = _parse_result(custom_id, record)
+    return outcomes
+
+
+def _parse_result(custom_id: str, record: dict[str, object]) -> _BatchOutcome:
+    """Return the completion body of a result line, or its error."""
+    response = record.get("response")
+    status_code = response.get("status_code") if isinstance(response, dict) else None
+    if isinstance(response, dict) and status_code == _HTTP_OK:
+        return typ.cast("JSONLike", response.get("body"))
+    error = record.get("error")
+    message = error.get("message") if isinstance(error, dict) else None
+    if isinstance(message, str):
+        return OpenAIAPIError.batch_request_failed(custom_id, message)
+    if isinstance(status_code, int):
+        return OpenAIAPIError.batch_request_failed(custom_id, f"HTTP {status_code}")
+    return OpenAIAPIError.batch_request_failed(custom_id, "no response")
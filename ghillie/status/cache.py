@@ -0,0 +1,279 @@
+"""Persistent cache of status model results keyed by prompt fingerprint.
+
+Re-running a report over an identical evidence bundle (after a crash, a
+duplicate API trigger, or regeneration of an unchanged window) would otherwise
+pay for the same completion again. ``CachingStatusModel`` wraps any
+``StatusModel`` and stores each result in the Gold ``status_model_cache``
+table under a SHA-256 fingerprint of the model identifier, generation
+parameters, system prompt, and rendered user prompt. Any change to those
+inputs changes the fingerprint, so cached results are never served for a
+different request.
+
+Only results the optional ``accept`` check passes are stored or served, so a
+completion that fails report validation is never pinned for its window:
+validation retries reach the model again rather than the cached failure.
+Entries expire after a time-to-live, and the least recently used entries are
+evicted once the table exceeds its size limit. Each invocation records a cache
+hit or miss in its ``ModelInvocationMetrics``; hits report zero tokens because
+no completion was paid for.
+
+Example:
+-------
+>>> model = CachingStatusModel(create_status_model(), session_factory)
+>>> result = await model.summarize_repository(bundle)
+>>> model.last_invocation_metrics.cache_misses
+1
+
+"""
+
+from __future__ import annotations
+
+import dataclasses as dc
+import datetime as dt
+import hashlib
+import typing as typ
+
+import msgspec
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+
+from ghillie.common.time import utcnow
+from ghillie.gold.storage import StatusModelCacheEntry
+from ghillie.status.hedging import SECONDARY
+from ghillie.status.metrics import ModelInvocationMetrics
+from ghillie.status.models import RepositoryStatusResult
+from ghillie.status.prompts import SYSTEM_PROMPT, build_user_prompt
+
+if typ.TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from ghillie.evidence.models import RepositoryEvidenceBundle
+    from ghillie.status.protocol import ResultCheck, StatusModel
+
+_DEFAULT_TTL = dt.timedelta(days=30)
+_DEFAULT_MAX_ENTRIES = 10_000
+# Configuration fields that do not affect the completion and must not be
+# hashed (the API key in particular should never reach storage).
+_UNHASHED_PARAMETERS = frozenset(
+    {
+        "api_key",
+        "timeout_s",
+        "retry",
+        "circuit_breaker",
+        "stream",
+        "max_completion_chars",
+        "batch",
+        "hedge_model",
+        "hedge_endpoint",
+        "hedging",
+    }
+)
+
+
+def _model_identity(model: object) -> tuple[str, dict[str, object]]:
+    """Return the identifier and generation parameters of a status model.
+
+    Wrappers exposing ``wrapped`` (such as a rate limiter) are looked
+    through, since they do not change what the model is asked.
+    """
+    while (wrapped := getattr(model, "wrapped", None)) is not None:
+        model = wrapped
+    model_id = getattr(model, "model_id", None)
+    identifier = str(model_id) if model_id is not None else type(model).__qualname__
+    config = getattr(model, "config", None)
+    parameters: dict[str, object] = {}
+    if dc.is_dataclass(config) and not isinstance(config, type):
+        parameters = {
+            field.name: getattr(config, field.name)
+            for field in dc.fields(config)
+            if field.name not in _UNHASHED_PARAMETERS
+        }
+    return identifier, parameters
+
+
+def status_prompt_fingerprint(
+    model: StatusModel, evidence: RepositoryEvidenceBundle
+) -> str:
+    """Fingerprint the request ``model`` would make for ``evidence``.
+
+    The user prompt is rendered with the model's ``prompt_token_budget``,
+    as the model renders it, so bundles that differ only in evidence the
+    budget admits are not conflated.
+
+    Returns
+    -------
+    str
+        Hex SHA-256 digest of the model identifier, generation parameters,
+        system prompt, and user prompt.
+
+    """
+    identifier, parameters = _model_identity(model)
+    budget = parameters.get("prompt_token_budget")
+    user_prompt = build_user_prompt(
+        evidence, token_budget=budget if isinstance(budget, int) else None
+    )
+    material = msgspec.json.encode(
+        [identifier, parameters, SYSTEM_PROMPT, user_prompt],
+        order="sorted",
+    )
+    return hashlib.sha256(material).hexdigest()
+
+
+class CachingStatusModel:
+    """Status model wrapper that serves repeated prompts from the Gold layer.
+
+    Parameters
+    ----------
+    model
+        Status model that produces results on a cache miss.
+    session_factory
+        Async session factory for the Gold database.
+    ttl
+        How long a cached result stays valid (default 30 days).
+    max_entries
+        Maximum number of cached results kept; the least recently used are
+        evicted beyond this (default 10,000).
+    accept
+        Optional check a result must pass to be stored or served, such as
+        :func:`~ghillie.reporting.validation.is_valid_report`. Defaults to
+        keeping every result.
+
+    """
+
+    def __init__(  # noqa: PLR0913 - keyword-only tuning and hooks
+        self,
+        model: StatusModel,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        ttl: dt.timedelta = _DEFAULT_TTL,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        accept: ResultCheck | None = None,
+    ) -> None:
+        """Wrap ``model`` with a cache stored through ``session_factory``."""
+        if max_entries < 1:
+            msg = f"max_entries must be positive, got: {max_entries}"
+            raise ValueError(msg)
+        self._model = model
+        self._session_factory = session_factory
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._accept = accept
+        self._hits = 0
+        self._misses = 0
+        self._last_invocation_metrics: ModelInvocationMetrics | None = None
+
+    @property
+    def wrapped(self) -> StatusModel:
+        """Return the status model that results are requested from."""
+        return self._model
+
+    @property
+    def hits(self) -> int:
+        """Return the number of results served from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Return the number of results requested from the wrapped model."""
+        return self._misses
+
+    @property
+    def last_invocation_metrics(self) -> ModelInvocationMetrics | None:
+        """Return metrics captured from the most recent invocation."""
+        return self._last_invocation_metrics
+
+    async def aclose(self) -> None:
+        """Close the wrapped model's resources, if it holds any."""
+        aclose = getattr(self._model, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    async def summarize_repository(
+        self,
+        evidence: RepositoryEvidenceBundle,
+    ) -> RepositoryStatusResult:
+        """Return the cached result for this prompt, or generate and store it."""
+        fingerprint = status_prompt_fingerprint(self._model, evidence)
+        cached = await self._lookup(fingerprint)
+        if cached is not None and self._accepts(evidence, cached):
+            self._hits += 1
+            self._last_invocation_metrics = ModelInvocationMetrics(
+                prompt_tokens=0,
+                completion_tokens=0,
+                total_tokens=0,
+                cache_hits=1,
+                cache_misses=0,
+            )
+            return cached
+
+        result = await self._model.summarize_repository(evidence)
+        self._misses += 1
+        metrics = getattr(self._model, "last_invocation_metrics", None)
+        if not isinstance(metrics, ModelInvocationMetrics):
+            metrics = ModelInvocationMetrics()
+        self._last_invocation_metrics = dc.replace(
+            metrics, cache_hits=0, cache_misses=1
+        )
+        # The fingerprint names a hedged model's primary, so results from its
+        # secondary would be served as if the primary had written them.
+        if metrics.hedge_winner != SECONDARY and self._accepts(evidence, result):
+            await self._store(fingerprint, result, metrics)
+        return result
+
+    def _accepts(
+        self, evidence: RepositoryEvidenceBundle, result: RepositoryStatusResult
+    ) -> bool:
+        return self._accept is None or self._accept(evidence, result)
+
+    async def _lookup(self, fingerprint: str) -> RepositoryStatusResult | None:
+        """Return a live cached result and refresh its recency."""
+        async with self._session_factory() as session, session.begin():
+            entry = await session.get(StatusModelCacheEntry, fingerprint)
+            if entry is None or entry.created_at <= utcnow() - self._ttl:
+                return None
+            entry.last_used_at = utcnow()
+            return msgspec.convert(entry.result, RepositoryStatusResult)
+
+    async def _store(
+        self,
+        fingerprint: str,
+        result: RepositoryStatusResult,
+        metrics: ModelInvocationMetrics,
+    ) -> None:
+        """Persist a fresh result, then apply expiry and size eviction."""
+        now = utcnow()
+        async with self._session_factory() as session:
+            entry = await session.get(StatusModelCacheEntry, fingerprint)
+            if entry is None:
+                entry = StatusModelCacheEntry(fingerprint=fingerprint)
+                session.add(entry)
+            entry.model = _model_identity(self._model)[0]
+            entry.result = msgspec.to_builtins(result)
+            entry.prompt_tokens = metrics.prompt_tokens
+            entry.completion_tokens = metrics.completion_tokens
+            entry.total_tokens = metrics.total_tokens
+            entry.created_at = now
+            entry.last_used_at = now
+            try:
+                await session.commit()
+            except IntegrityError:
+                # A concurrent run stored the same prompt first; its result
+                # serves just as well.
+                await session.rollback()
+                return
+            await self._evict(session, now)
+
+    async def _evict(self, session: AsyncSession, now: dt.datetime) -> None:
+        """Drop expired entries and those beyond the size limit."""
+        recent = (
+            select(StatusModelCacheEntry.fingerprint)
+            .order_by(StatusModelCacheEntry.last_used_at.desc())
+            .limit(self._max_entries)
+        )
+        await session.execute(
+            delete(StatusModelCacheEntry).where(
+                (StatusModelCacheEntry.created_at <= now - self._ttl)
+                | StatusModelCacheEntry.fingerprint.not_in(recent.scalar_subquery())
+            )
+        )
+        await session.commit()
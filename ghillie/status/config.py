@@ -5,6 +5,8 @@ import os
 
 from ghillie.status.constants import MAX_TEMPERATURE, MIN_TEMPERATURE
 from ghillie.status.errors import OpenAIConfigError, StatusModelConfigError
+from ghillie.status.hedging import HedgingPolicy
+from ghillie.status.resilience import CircuitBreakerPolicy, RetryPolicy
 
 # Default configuration values - single source of truth
 _DEFAULT_ENDPOINT = "https://api.openai.com/v1/chat/completions"
@@ -12,6 +14,49 @@ _DEFAULT_MODEL = "gpt-5.1-thinking"
 _DEFAULT_TIMEOUT_S = 120.0
 _DEFAULT_TEMPERATURE = 0.3
 _DEFAULT_MAX_TOKENS = 2048
+_DEFAULT_PROMPT_TOKEN_BUDGET = 8000
+_MAX_HEDGE_PERCENTILE = 100.0
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class BatchSubmissionConfig:
+    """How the batch backend groups requests and waits for results.
+
+    Attributes
+    ----------
+    max_batch_size
+        Most requests submitted in one batch (default 500). A full batch is
+        submitted immediately.
+    collect_window_s
+        Seconds to wait for further requests after the first one arrives
+        before submitting a partial batch (default 2 seconds).
+    poll_interval_s
+        Seconds between batch status checks (default 30 seconds).
+    max_wait_s
+        Seconds a batch is polled before its waiting requests fail with a
+        retryable error (default 45 minutes), keeping report jobs inside
+        their time limit. The batch keeps running and a retried job resumes
+        it.
+    completion_window
+        Turnaround the provider is asked for (default ``"24h"``).
+
+    """
+
+    max_batch_size: int = 500
+    collect_window_s: float = 2.0
+    poll_interval_s: float = 30.0
+    max_wait_s: float = 2700.0
+    completion_window: str = "24h"
+
+    def __post_init__(self) -> None:
+        """Validate that the batch size is positive and intervals not."""
+        if self.max_batch_size < 1:
+            msg = f"max_batch_size must be positive, got: {self.max_batch_size}"
+            raise ValueError(msg)
+        for interval in (self.collect_window_s, self.poll_interval_s, self.max_wait_s):
+            if interval < 0:
+                msg = f"batch intervals must be non-negative, got: {interval}"
+                raise ValueError(msg)
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
@@ -32,6 +77,30 @@ class OpenAIStatusModelConfig:
         Sampling temperature (0.0 to 2.0).
     max_tokens
         Maximum tokens in the completion response.
+    retry
+        How transient failures (timeouts, 429 and 5xx responses) are retried.
+    circuit_breaker
+        When repeated failures stop requests reaching the provider.
+    stream
+        Request the completion as server-sent events, so generation can be
+        abandoned as soon as the output is certain to be rejected.
+    max_completion_chars
+        Optional length budget for streamed completions; generation stops
+        once the output grows past it.
+    prompt_token_budget
+        Estimated tokens the user prompt may use (default 8000). Lower-value
+        evidence is summarised as counts to stay within it; ``None`` renders
+        the evidence in full, capped at ten pull requests and ten issues.
+    batch
+        Grouping and polling settings used by the batch backend.
+    hedge_model
+        Optional secondary model asked when a request is slow or fails; see
+        ``HedgedStatusModel``. ``None`` (the default) disables hedging.
+    hedge_endpoint
+        Chat completions endpoint of the secondary model; defaults to
+        ``endpoint``.
+    hedging
+        When hedged requests are sent to the secondary model.
 
     """
 
@@ -41,6 +110,19 @@ class OpenAIStatusModelConfig:
     timeout_s: float = _DEFAULT_TIMEOUT_S
     temperature: float = _DEFAULT_TEMPERATURE
     max_tokens: int = _DEFAULT_MAX_TOKENS
+    retry: RetryPolicy = dataclasses.field(default_factory=RetryPolicy)
+    circuit_breaker: CircuitBreakerPolicy = dataclasses.field(
+        default_factory=CircuitBreakerPolicy
+    )
+    stream: bool = False
+    max_completion_chars: int | None = None
+    prompt_token_budget: int | None = _DEFAULT_PROMPT_TOKEN_BUDGET
+    batch: BatchSubmissionConfig = dataclasses.field(
+        default_factory=BatchSubmissionConfig
+    )
+    hedge_model: str | None = None
+    hedge_endpoint: str | None = None
+    hedging: HedgingPolicy = dataclasses.field(default_factory=HedgingPolicy)
 
     @staticmethod
     def _parse_temperature_from_env() -> float:
@@ -100,6 +182,160 @@ class OpenAIStatusModelConfig:
 
         return max_tokens
 
+    @staticmethod
+    def _parse_number_from_env[T: (int, float)](
+        env_var: str, parse: type[T], default: T, *, minimum: T
+    ) -> T:
+        """Parse a numeric setting that must be at least ``minimum``.
+
+        Raises
+        ------
+        StatusModelConfigError
+            If the value is not a number of the expected type or is below
+            ``minimum``.
+
+        """
+        raw = os.environ.get(env_var)
+        if raw is None:
+            return default
+        constraint = f"Must be a {parse.__name__} of at least {minimum}"
+        try:
+            value = parse(raw)
+        except ValueError as exc:
+            raise StatusModelConfigError.invalid_parameter(
+                env_var, raw, constraint
+            ) from exc
+        if value < minimum:
+            raise StatusModelConfigError.invalid_parameter(env_var, raw, constraint)
+        return value
+
+    @classmethod
+    def _parse_streaming_from_env(cls) -> tuple[bool, int | None]:
+        """Parse streaming mode and the completion length budget."""
+        raw_stream = os.environ.get("GHILLIE_OPENAI_STREAM", "")
+        stream = raw_stream.strip().lower() in {"1", "true", "yes", "on"}
+        max_completion_chars = None
+        if os.environ.get("GHILLIE_OPENAI_MAX_COMPLETION_CHARS") is not None:
+            max_completion_chars = cls._parse_number_from_env(
+                "GHILLIE_OPENAI_MAX_COMPLETION_CHARS", int, 0, minimum=1
+            )
+        return stream, max_completion_chars
+
+    @classmethod
+    def _parse_prompt_token_budget_from_env(cls) -> int | None:
+        """Parse the prompt token budget; ``0`` disables budgeting."""
+        budget = cls._parse_number_from_env(
+            "GHILLIE_OPENAI_PROMPT_TOKEN_BUDGET",
+            int,
+            _DEFAULT_PROMPT_TOKEN_BUDGET,
+            minimum=0,
+        )
+        return budget or None
+
+    @classmethod
+    def _parse_batch_from_env(cls) -> BatchSubmissionConfig:
+        """Parse batch backend grouping and polling settings."""
+        defaults = BatchSubmissionConfig()
+        return BatchSubmissionConfig(
+            max_batch_size=cls._parse_number_from_env(
+                "GHILLIE_OPENAI_BATCH_MAX_SIZE",
+                int,
+                defaults.max_batch_size,
+                minimum=1,
+            ),
+            collect_window_s=cls._parse_number_from_env(
+                "GHILLIE_OPENAI_BATCH_COLLECT_S",
+                float,
+                defaults.collect_window_s,
+                minimum=0.0,
+            ),
+            poll_interval_s=cls._parse_number_from_env(
+                "GHILLIE_OPENAI_BATCH_POLL_S",
+                float,
+                defaults.poll_interval_s,
+                minimum=0.0,
+            ),
+            max_wait_s=cls._parse_number_from_env(
+                "GHILLIE_OPENAI_BATCH_MAX_WAIT_S",
+                float,
+                defaults.max_wait_s,
+                minimum=0.0,
+            ),
+        )
+
+    @classmethod
+    def _parse_hedging_from_env(cls) -> HedgingPolicy:
+        """Parse when hedged requests are sent to the secondary model."""
+        defaults = HedgingPolicy()
+        percentile = cls._parse_number_from_env(
+            "GHILLIE_OPENAI_HEDGE_PERCENTILE",
+            float,
+            defaults.percentile,
+            minimum=1.0,
+        )
+        if percentile > _MAX_HEDGE_PERCENTILE:
+            raise StatusModelConfigError.invalid_parameter(
+                "GHILLIE_OPENAI_HEDGE_PERCENTILE",
+                os.environ["GHILLIE_OPENAI_HEDGE_PERCENTILE"],
+                f"Must be at most {_MAX_HEDGE_PERCENTILE}",
+            )
+        return HedgingPolicy(
+            percentile=percentile,
+            initial_delay_s=cls._parse_number_from_env(
+                "GHILLIE_OPENAI_HEDGE_INITIAL_DELAY_S",
+                float,
+                defaults.initial_delay_s,
+                minimum=0.0,
+            ),
+        )
+
+    @classmethod
+    def _parse_resilience_from_env(cls) -> tuple[RetryPolicy, CircuitBreakerPolicy]:
+        """Parse retry and circuit breaker settings from environment."""
+        retry_defaults = RetryPolicy()
+        breaker_defaults = CircuitBreakerPolicy()
+        retry = RetryPolicy(
+            max_attempts=cls._parse_number_from_env(
+                "GHILLIE_OPENAI_MAX_ATTEMPTS",
+                int,
+                retry_defaults.max_attempts,
+                minimum=1,
+            ),
+            base_delay_s=cls._parse_number_from_env(
+                "GHILLIE_OPENAI_BACKOFF_BASE_S",
+                float,
+                retry_defaults.base_delay_s,
+                minimum=0.0,
+            ),
+            max_delay_s=cls._parse_number_from_env(
+                "GHILLIE_OPENAI_BACKOFF_MAX_S",
+                float,
+                retry_defaults.max_delay_s,
+                minimum=0.0,
+            ),
+            max_retry_after_s=cls._parse_number_from_env(
+                "GHILLIE_OPENAI_MAX_RETRY_AFTER_S",
+                float,
+                retry_defaults.max_retry_after_s,
+                minimum=0.0,
+            ),
+        )
+        breaker = CircuitBreakerPolicy(
+            failure_threshold=cls._parse_number_from_env(
+                "GHILLIE_OPENAI_BREAKER_THRESHOLD",
+                int,
+                breaker_defaults.failure_threshold,
+                minimum=1,
+            ),
+            reset_timeout_s=cls._parse_number_from_env(
+                "GHILLIE_OPENAI_BREAKER_RESET_S",
+                float,
+                breaker_defaults.reset_timeout_s,
+                minimum=0.0,
+            ),
+        )
+        return retry, breaker
+
     @classmethod
     def from_env(cls) -> OpenAIStatusModelConfig:
         """Build configuration from environment variables.
@@ -111,6 +347,31 @@ class OpenAIStatusModelConfig:
         - ``GHILLIE_OPENAI_MODEL``: Optional model override
         - ``GHILLIE_OPENAI_TEMPERATURE``: Optional temperature (0.0 to 2.0)
         - ``GHILLIE_OPENAI_MAX_TOKENS``: Optional max tokens (positive integer)
+        - ``GHILLIE_OPENAI_MAX_ATTEMPTS``: Optional attempts per request,
+          including retries (positive integer)
+        - ``GHILLIE_OPENAI_BACKOFF_BASE_S`` and ``GHILLIE_OPENAI_BACKOFF_MAX_S``:
+          Optional first and largest backoff ceilings in seconds
+        - ``GHILLIE_OPENAI_MAX_RETRY_AFTER_S``: Optional longest
+          ``Retry-After`` honoured, in seconds
+        - ``GHILLIE_OPENAI_BREAKER_THRESHOLD``: Optional consecutive
+          failures that open the circuit breaker (positive integer)
+        - ``GHILLIE_OPENAI_BREAKER_RESET_S``: Optional seconds the breaker
+          stays open before a trial request
+        - ``GHILLIE_OPENAI_STREAM``: Optional; ``true`` streams completions
+        - ``GHILLIE_OPENAI_MAX_COMPLETION_CHARS``: Optional length budget for
+          streamed completions (positive integer)
+        - ``GHILLIE_OPENAI_PROMPT_TOKEN_BUDGET``: Optional estimated tokens
+          the user prompt may use (non-negative integer; ``0`` disables)
+        - ``GHILLIE_OPENAI_BATCH_MAX_SIZE``, ``GHILLIE_OPENAI_BATCH_COLLECT_S``,
+          ``GHILLIE_OPENAI_BATCH_POLL_S`` and ``GHILLIE_OPENAI_BATCH_MAX_WAIT_S``:
+          Optional batch backend size, collection window, polling interval,
+          and longest wait per attempt
+        - ``GHILLIE_OPENAI_HEDGE_MODEL`` and ``GHILLIE_OPENAI_HEDGE_ENDPOINT``:
+          Optional secondary model, and its endpoint, for hedged requests
+        - ``GHILLIE_OPENAI_HEDGE_PERCENTILE`` and
+          ``GHILLIE_OPENAI_HEDGE_INITIAL_DELAY_S``: Optional primary latency
+          percentile (1 to 100) after which a request is hedged, and the
+          delay used before enough latencies are known
 
         Returns
         -------
@@ -122,7 +383,8 @@ class OpenAIStatusModelConfig:
         OpenAIConfigError
             If required environment variables are missing or invalid.
         StatusModelConfigError
-            If temperature or max_tokens values are invalid.
+            If temperature, max_tokens, retry, or circuit breaker values are
+            invalid.
 
         """
         raw_api_key = os.environ.get("GHILLIE_OPENAI_API_KEY")
@@ -137,6 +399,15 @@ class OpenAIStatusModelConfig:
 
         temperature = cls._parse_temperature_from_env()
         max_tokens = cls._parse_max_tokens_from_env()
+        retry, circuit_breaker = cls._parse_resilience_from_env()
+        stream, max_completion_chars = cls._parse_streaming_from_env()
+        prompt_token_budget = cls._parse_prompt_token_budget_from_env()
+        batch = cls._parse_batch_from_env()
+        hedge_model = os.environ.get("GHILLIE_OPENAI_HEDGE_MODEL", "").strip() or None
+        hedge_endpoint = (
+            os.environ.get("GHILLIE_OPENAI_HEDGE_ENDPOINT", "").strip() or None
+        )
+        hedging = cls._parse_hedging_from_env()
 
         return cls(
             api_key=api_key,
@@ -144,4 +415,13 @@ class OpenAIStatusModelConfig:
             model=model,
             temperature=temperature,
             max_tokens=max_tokens,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            stream=stream,
+            max_completion_chars=max_completion_chars,
+            prompt_token_budget=prompt_token_budget,
+            batch=batch,
+            hedge_model=hedge_model,
+            hedge_endpoint=hedge_endpoint,
+            hedging=hedging,
         )
@@ -29,10 +29,22 @@ class OpenAIAPIError(OpenAIStatusError):
     ----------
     status_code
         HTTP status code from the API response, if available.
+    retry_after
+        Seconds the provider asked clients to wait, from ``Retry-After``.
+    retryable
+        Whether the failure is transient, so the request may succeed if
+        repeated.
 
     """
 
-    def __init__(self, message: str, *, status_code: int | None = None) -> None:
+    def __init__(
+        self,
+        message: str,
+        *,
+        status_code: int | None = None,
+        retry_after: int | None = None,
+        retryable: bool = False,
+    ) -> None:
         """Initialise the error with message and optional status code.
 
         Parameters
@@ -41,9 +53,15 @@ class OpenAIAPIError(OpenAIStatusError):
             Human-readable error description.
         status_code
             HTTP status code from the API response.
+        retry_after
+            Seconds to wait before retrying, from the Retry-After header.
+        retryable
+            Whether the failure is transient.
 
         """
         self.status_code = status_code
+        self.retry_after = retry_after
+        self.retryable = retryable
         super().__init__(message)
 
     @classmethod
@@ -58,11 +76,15 @@ class OpenAIAPIError(OpenAIStatusError):
         Returns
         -------
         OpenAIAPIError
-            Error with status code context.
+            Error with status code context; server errors are retryable.
 
         """
         msg = f"OpenAI API HTTP error {status_code}"
-        return cls(msg, status_code=status_code)
+        return cls(
+            msg,
+            status_code=status_code,
+            retryable=status_code >= HTTPStatus.INTERNAL_SERVER_ERROR,
+        )
 
     @classmethod
     def rate_limited(cls, retry_after: int | None = None) -> OpenAIAPIError:
@@ -82,7 +104,12 @@ class OpenAIAPIError(OpenAIStatusError):
         msg = "OpenAI API rate limited"
         if retry_after is not None:
             msg = f"{msg}, retry after {retry_after}s"
-        return cls(msg, status_code=HTTPStatus.TOO_MANY_REQUESTS)
+        return cls(
+            msg,
+            status_code=HTTPStatus.TOO_MANY_REQUESTS,
+            retry_after=retry_after,
+            retryable=True,
+        )
 
     @classmethod
     def timeout(cls) -> OpenAIAPIError:
@@ -94,7 +121,7 @@ class OpenAIAPIError(OpenAIStatusError):
             Error indicating request timeout.
 
         """
-        return cls("OpenAI API request timed out")
+        return cls("OpenAI API request timed out", retryable=True)
 
     @classmethod
     def network_error(cls, detail: str) -> OpenAIAPIError:
@@ -112,6 +139,95 @@ class OpenAIAPIError(OpenAIStatusError):
 
         """
         msg = f"OpenAI API network error: {detail}"
+        return cls(msg, retryable=True)
+
+    @classmethod
+    def circuit_open(cls, name: str, retry_in_s: float) -> OpenAIAPIError:
+        """Create error for requests refused by an open circuit breaker.
+
+        Parameters
+        ----------
+        name
+            Name of the circuit breaker, usually the endpoint URL.
+        retry_in_s
+            Seconds until the breaker lets a trial request through.
+
+        Returns
+        -------
+        OpenAIAPIError
+            Non-retryable error raised without contacting the provider.
+
+        """
+        msg = (
+            f"OpenAI API circuit breaker open for {name}; "
+            f"next trial request in {retry_in_s:.1f}s"
+        )
+        return cls(msg)
+
+    @classmethod
+    def batch_failed(cls, batch_id: str, status: str) -> OpenAIAPIError:
+        """Create error for a batch that ended without completing.
+
+        Parameters
+        ----------
+        batch_id
+            Provider identifier of the batch.
+        status
+            Terminal batch status, such as ``failed`` or ``expired``.
+
+        Returns
+        -------
+        OpenAIAPIError
+            Error raised for every request the batch did not answer.
+
+        """
+        msg = f"OpenAI batch {batch_id} ended with status '{status}'"
+        return cls(msg)
+
+    @classmethod
+    def batch_request_failed(cls, custom_id: str, detail: str) -> OpenAIAPIError:
+        """Create error for a single request that failed within a batch.
+
+        Parameters
+        ----------
+        custom_id
+            Identifier of the request within its batch.
+        detail
+            Provider error message or code.
+
+        Returns
+        -------
+        OpenAIAPIError
+            Error raised for that request only.
+
+        """
+        msg = f"OpenAI batch request {custom_id} failed: {detail}"
+        return cls(msg)
+
+    @classmethod
+    def batch_pending(cls, batch_id: str, waited_s: float) -> OpenAIAPIError:
+        """Create error for a batch still running when the wait ran out.
+
+        The batch keeps running on the provider; a later attempt with the
+        same requests resumes polling it rather than submitting again.
+
+        Parameters
+        ----------
+        batch_id
+            Provider identifier of the batch.
+        waited_s
+            Seconds the model waited for the batch.
+
+        Returns
+        -------
+        OpenAIAPIError
+            Error raised for every request still waiting on the batch.
+
+        """
+        msg = (
+            f"OpenAI batch {batch_id} still running after {waited_s:.0f}s; "
+            "retry to resume waiting for it"
+        )
         return cls(msg)
 
 
@@ -159,6 +275,59 @@ class OpenAIResponseShapeError(OpenAIStatusError):
         return cls(msg)
 
 
+class StatusGenerationAbortedError(OpenAIStatusError):
+    """Raised when a streamed completion is abandoned before it finishes.
+
+    Streaming status models stop generating as soon as partial output is
+    certain to fail validation, or grows past its length budget, rather than
+    paying for the rest of a completion that would be discarded.
+
+    Attributes
+    ----------
+    code
+        Machine-readable reason, matching report validation issue codes
+        where one applies (e.g. ``"empty_summary"``).
+    reason
+        Human-readable explanation of why generation stopped.
+
+    """
+
+    def __init__(self, code: str, reason: str) -> None:
+        """Initialise the error with a reason code and explanation.
+
+        Parameters
+        ----------
+        code
+            Machine-readable reason for aborting.
+        reason
+            Human-readable explanation.
+
+        """
+        self.code = code
+        self.reason = reason
+        super().__init__(f"Status generation aborted ({code}): {reason}")
+
+    @classmethod
+    def length_budget_exceeded(cls, budget: int) -> StatusGenerationAbortedError:
+        """Create error for completions longer than the character budget.
+
+        Parameters
+        ----------
+        budget
+            Maximum completion length in characters.
+
+        Returns
+        -------
+        StatusGenerationAbortedError
+            Error with the ``length_budget_exceeded`` code.
+
+        """
+        return cls(
+            "length_budget_exceeded",
+            f"Completion exceeded the {budget} character budget.",
+        )
+
+
 class OpenAIConfigError(OpenAIStatusError):
     """Raised when OpenAI client configuration is invalid."""
 
@@ -186,6 +355,27 @@ class OpenAIConfigError(OpenAIStatusError):
         """
         return cls("OpenAI API key must be non-empty")
 
+    @classmethod
+    def unsupported_batch_endpoint(cls, endpoint: str) -> OpenAIConfigError:
+        """Create error for an endpoint the batch backend cannot derive from.
+
+        Parameters
+        ----------
+        endpoint
+            The configured endpoint URL.
+
+        Returns
+        -------
+        OpenAIConfigError
+            Error explaining that a chat completions endpoint is required.
+
+        """
+        msg = (
+            "The batch backend requires a chat completions endpoint ending in "
+            f"'/chat/completions', got: {endpoint}"
+        )
+        return cls(msg)
+
 
 class StatusModelConfigError(OpenAIStatusError):
     """Raised when status model factory configuration is invalid.
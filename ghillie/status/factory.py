@@ -18,6 +18,7 @@ Set the required environment variable and call the factory::
 
 from __future__ import annotations
 
+import dataclasses as dc
 import os
 import typing as typ
 
@@ -25,25 +26,67 @@ from ghillie.status.errors import StatusModelConfigError
 from ghillie.status.mock import MockStatusModel
 
 if typ.TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from ghillie.reporting.observability import ReportingEventLogger
+    from ghillie.status.config import OpenAIStatusModelConfig
     from ghillie.status.protocol import StatusModel
+    from ghillie.status.rate_limit import SharedRateLimiter
 
-_VALID_BACKENDS = frozenset({"mock", "openai"})
+_VALID_BACKENDS = frozenset({"mock", "openai", "openai-batch"})
 
 
-def create_status_model() -> StatusModel:
+def create_status_model(
+    session_factory: async_sessionmaker[AsyncSession] | None = None,
+    *,
+    interactive: bool = False,
+    rate_limiter: SharedRateLimiter | None = None,
+) -> StatusModel:
     """Create a StatusModel implementation based on environment configuration.
 
     Reads the following environment variables:
 
-    - ``GHILLIE_STATUS_MODEL_BACKEND``: Required. Either 'mock' or 'openai'.
+    - ``GHILLIE_STATUS_MODEL_BACKEND``: Required. One of 'mock', 'openai', or
+      'openai-batch'.
 
-    For 'openai' backend, also reads:
+    For the 'openai' and 'openai-batch' backends, also reads:
 
     - ``GHILLIE_OPENAI_API_KEY``: Required API key
     - ``GHILLIE_OPENAI_ENDPOINT``: Optional endpoint override
     - ``GHILLIE_OPENAI_MODEL``: Optional model override
     - ``GHILLIE_OPENAI_TEMPERATURE``: Optional temperature (0.0-2.0)
     - ``GHILLIE_OPENAI_MAX_TOKENS``: Optional max tokens (positive integer)
+    - Retry and circuit breaker settings described in
+      :meth:`OpenAIStatusModelConfig.from_env`
+
+    The OpenAI model shares one circuit breaker per endpoint with every
+    other model built in the process, and reports retries and breaker state
+    through :class:`~ghillie.reporting.observability.ReportingEventLogger`.
+    Streamed completions are abandoned as soon as
+    :func:`~ghillie.reporting.validation.check_partial_report` rejects them.
+    The 'openai-batch' backend submits requests through the provider's batch
+    API instead (see :class:`~ghillie.status.batch.OpenAIBatchStatusModel`).
+    When ``GHILLIE_OPENAI_HEDGE_MODEL`` is set, the 'openai' backend hedges
+    slow requests with that model (see
+    :class:`~ghillie.status.hedging.HedgedStatusModel`); a result must pass
+    :func:`~ghillie.reporting.validation.validate_repository_report` to win.
+
+    Parameters
+    ----------
+    session_factory
+        Optional Gold database session factory. The 'openai-batch' backend
+        records submitted requests through it, so a retried report job
+        resumes batches still in flight instead of submitting them again.
+    interactive
+        Build the model for a caller waiting on the result, such as an
+        on-demand API report. Such callers cannot wait hours for a batch,
+        so 'openai-batch' then builds the synchronous 'openai' model with
+        the same settings.
+    rate_limiter
+        Optional shared limiter for the synchronous 'openai' models, which
+        meter every request they send, retries included. A hedge model on
+        the same endpoint shares it, so hedged requests count too. Batch
+        requests draw on a separate provider quota and are not metered.
 
     Returns
     -------
@@ -77,9 +120,78 @@ def create_status_model() -> StatusModel:
     if backend == "mock":
         return MockStatusModel()
 
-    # backend == "openai"
+    from ghillie.reporting.observability import ReportingEventLogger
     from ghillie.status.config import OpenAIStatusModelConfig
-    from ghillie.status.openai_client import OpenAIStatusModel
+    from ghillie.status.resilience import shared_circuit_breaker
 
     config = OpenAIStatusModelConfig.from_env()
-    return OpenAIStatusModel(config)
+    event_logger = ReportingEventLogger()
+    circuit_breaker = shared_circuit_breaker(
+        config.endpoint, config.circuit_breaker, listener=event_logger
+    )
+
+    if backend == "openai-batch" and not interactive:
+        from ghillie.status.batch import OpenAIBatchStatusModel
+
+        return OpenAIBatchStatusModel(
+            config,
+            session_factory=session_factory,
+            circuit_breaker=circuit_breaker,
+            event_listener=event_logger,
+        )
+
+    # backend == "openai", or "openai-batch" for an interactive caller
+    from ghillie.reporting.validation import check_partial_report
+    from ghillie.status.openai_client import OpenAIStatusModel
+
+    primary = OpenAIStatusModel(
+        config,
+        circuit_breaker=circuit_breaker,
+        event_listener=event_logger,
+        stream_check=check_partial_report,
+        rate_limiter=rate_limiter,
+    )
+    if config.hedge_model is None:
+        return primary
+    return _create_hedged_model(primary, config, event_logger, rate_limiter)
+
+
+def _create_hedged_model(
+    primary: StatusModel,
+    config: OpenAIStatusModelConfig,
+    event_logger: ReportingEventLogger,
+    rate_limiter: SharedRateLimiter | None,
+) -> StatusModel:
+    """Pair ``primary`` with the configured secondary model for hedging.
+
+    The secondary shares ``rate_limiter`` only when it calls the same
+    endpoint; another endpoint has limits the budget does not describe.
+    """
+    from ghillie.reporting.validation import check_partial_report, is_valid_report
+    from ghillie.status.hedging import HedgedStatusModel
+    from ghillie.status.openai_client import OpenAIStatusModel
+    from ghillie.status.resilience import shared_circuit_breaker
+
+    secondary_config = dc.replace(
+        config,
+        model=config.hedge_model or config.model,
+        endpoint=config.hedge_endpoint or config.endpoint,
+        hedge_model=None,
+        hedge_endpoint=None,
+    )
+    secondary = OpenAIStatusModel(
+        secondary_config,
+        circuit_breaker=shared_circuit_breaker(
+            secondary_config.endpoint,
+            secondary_config.circuit_breaker,
+            listener=event_logger,
+        ),
+        event_listener=event_logger,
+        stream_check=check_partial_report,
+        rate_limiter=(
+            rate_limiter if secondary_config.endpoint == config.endpoint else None
+        ),
+    )
+    return HedgedStatusModel(
+        primary, secondary, policy=config.hedging, accept=is_valid_report
+    )
@@ -0,0 +1,272 @@
+"""Hedged requests across two status model backends.
+
+Status model latency has a long tail: most completions arrive in seconds, but
+a provider's worst minute can hold an on-demand report far longer, and
+``ReportingService`` waits for its model without a deadline.
+``HedgedStatusModel`` bounds that tail. It sends each request to a primary
+model and, if no answer has arrived once a high percentile of the primary's
+recent latencies has passed, sends the same request to a secondary model
+(another model, endpoint, or provider). The first acceptable result wins and
+the other request is cancelled, which closes its connection.
+
+A primary failure or rejected result starts the secondary at once rather than
+waiting for the hedge delay. The winning backend and its ``model_id`` are
+recorded in the invocation's ``ModelInvocationMetrics``, so reports name the
+model that wrote them and the status model cache skips secondary results.
+
+Example:
+-------
+>>> model = HedgedStatusModel(
+...     OpenAIStatusModel(config),
+...     OpenAIStatusModel(dc.replace(config, model="gpt-5.1-mini")),
+... )
+>>> result = await model.summarize_repository(bundle)
+>>> model.last_invocation_metrics.hedge_winner
+'primary'
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import dataclasses as dc
+import math
+import time
+import typing as typ
+
+from ghillie.status.metrics import ModelInvocationMetrics
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from ghillie.evidence.models import RepositoryEvidenceBundle
+    from ghillie.status.models import RepositoryStatusResult
+    from ghillie.status.protocol import ResultCheck, StatusModel
+
+type _Attempt = tuple[RepositoryStatusResult, ModelInvocationMetrics | None]
+
+PRIMARY = "primary"
+SECONDARY = "secondary"
+_MAX_PERCENTILE = 100.0
+
+
+@dc.dataclass(frozen=True, slots=True)
+class HedgingPolicy:
+    """When a hedged request is sent to the secondary model.
+
+    Attributes
+    ----------
+    percentile
+        Percentile of recent primary latencies after which the secondary
+        is asked as well (default 95). Lower values hedge sooner and more
+        often, spending more tokens on discarded completions.
+    initial_delay_s
+        Hedge delay used until ``min_samples`` latencies have been observed
+        (default 30 seconds).
+    sample_size
+        Number of recent primary latencies kept (default 100).
+    min_samples
+        Latencies required before the percentile replaces
+        ``initial_delay_s`` (default 20).
+
+    """
+
+    percentile: float = 95.0
+    initial_delay_s: float = 30.0
+    sample_size: int = 100
+    min_samples: int = 20
+
+    def __post_init__(self) -> None:
+        """Validate the percentile, delay, and sample counts."""
+        if not 0 < self.percentile <= _MAX_PERCENTILE:
+            msg = f"percentile must be in (0, 100], got: {self.percentile}"
+            raise ValueError(msg)
+        if self.initial_delay_s < 0:
+            msg = f"initial_delay_s must be non-negative, got: {self.initial_delay_s}"
+            raise ValueError(msg)
+        if not 1 <= self.min_samples <= self.sample_size:
+            msg = (
+                "min_samples must be between 1 and sample_size, got: "
+                f"{self.min_samples} and {self.sample_size}"
+            )
+            raise ValueError(msg)
+
+
+class HedgedStatusModel:
+    """Status model that hedges slow primary requests with a secondary model.
+
+    Parameters
+    ----------
+    primary
+        Model every request is sent to first. Its identity keys the status
+        model cache, which therefore only stores results the primary
+        produced.
+    secondary
+        Model asked when the primary is slow, fails, or is rejected.
+    policy
+        When the secondary is asked.
+    accept
+        Optional check a result must pass to win; a rejected result loses to
+        the other model's answer. Defaults to accepting every result.
+    clock
+        Monotonic clock measuring primary latency; injectable for tests.
+
+    """
+
+    def __init__(  # noqa: PLR0913 - keyword-only injection points
+        self,
+        primary: StatusModel,
+        secondary: StatusModel,
+        *,
+        policy: HedgingPolicy | None = None,
+        accept: ResultCheck | None = None,
+        clock: cabc.Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Wrap ``primary`` and ``secondary`` with an empty latency history."""
+        self._primary = primary
+        self._secondary = secondary
+        self._policy = policy or HedgingPolicy()
+        self._accept = accept
+        self._clock = clock
+        self._latencies: collections.deque[float] = collections.deque(
+            maxlen=self._policy.sample_size
+        )
+        self._last_invocation_metrics: ModelInvocationMetrics | None = None
+
+    @property
+    def wrapped(self) -> StatusModel:
+        """Return the primary model, which identifies the request."""
+        return self._primary
+
+    @property
+    def secondary(self) -> StatusModel:
+        """Return the model hedged requests are sent to."""
+        return self._secondary
+
+    @property
+    def hedge_delay_s(self) -> float:
+        """Return how long a request waits before the secondary is asked.
+
+        The percentile covers primary requests that produced a result and
+        those abandoned for a faster secondary answer. The latter count at
+        the time they were abandoned; their true latency is longer, so the
+        estimate errs towards hedging later, not sooner.
+        """
+        if len(self._latencies) < self._policy.min_samples:
+            return self._policy.initial_delay_s
+        ordered = sorted(self._latencies)
+        rank = math.ceil(self._policy.percentile / _MAX_PERCENTILE * len(ordered))
+        return ordered[max(rank, 1) - 1]
+
+    @property
+    def last_invocation_metrics(self) -> ModelInvocationMetrics | None:
+        """Return the winning model's metrics from the latest invocation."""
+        return self._last_invocation_metrics
+
+    async def aclose(self) -> None:
+        """Close both models' resources, if they hold any."""
+        for model in (self._primary, self._secondary):
+            aclose = getattr(model, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    async def summarize_repository(
+        self,
+        evidence: RepositoryEvidenceBundle,
+    ) -> RepositoryStatusResult:
+        """Return the first acceptable result from either model.
+
+        When neither result is acceptable, the primary's result is returned
+        if it produced one, otherwise the secondary's, so the caller's own
+        validation reports the problem. When neither model produced a
+        result, the primary's error is raised.
+        """
+        started_at = self._clock()
+        primary = asyncio.create_task(self._attempt(self._primary, evidence))
+        labels = {primary: PRIMARY}
+        running: set[asyncio.Task[_Attempt]] = {primary}
+        outcomes: dict[str, _Attempt | BaseException] = {}
+        try:
+            while running:
+                hedge_pending = len(labels) == 1
+                done, running = await asyncio.wait(
+                    running,
+                    timeout=self.hedge_delay_s if hedge_pending else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if primary in done and primary.exception() is None:
+                    self._latencies.append(self._clock() - started_at)
+                for task in done:
+                    outcome = task.exception() or task.result()
+                    outcomes[labels[task]] = outcome
+                    if not isinstance(outcome, BaseException) and self._accepts(
+                        evidence, outcome[0]
+                    ):
+                        return self._finish(
+                            labels[task], outcome, hedged=not hedge_pending
+                        )
+                if hedge_pending:
+                    secondary = asyncio.create_task(
+                        self._attempt(self._secondary, evidence)
+                    )
+                    labels[secondary] = SECONDARY
+                    running.add(secondary)
+        finally:
+            if primary in running:
+                self._latencies.append(self._clock() - started_at)
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+        return self._fall_back(outcomes)
+
+    async def _attempt(
+        self, model: StatusModel, evidence: RepositoryEvidenceBundle
+    ) -> _Attempt:
+        """Request a result and capture the metrics of that invocation."""
+        result = await model.summarize_repository(evidence)
+        metrics = getattr(model, "last_invocation_metrics", None)
+        if not isinstance(metrics, ModelInvocationMetrics):
+            metrics = None
+        return result, metrics
+
+    def _accepts(
+        self, evidence: RepositoryEvidenceBundle, result: RepositoryStatusResult
+    ) -> bool:
+        return self._accept is None or self._accept(evidence, result)
+
+    def _finish(
+        self, winner: str, attempt: _Attempt, *, hedged: bool
+    ) -> RepositoryStatusResult:
+        """Record the winner's metrics and return its result."""
+        result, metrics = attempt
+        model = self._primary if winner == PRIMARY else self._secondary
+        self._last_invocation_metrics = dc.replace(
+            metrics or ModelInvocationMetrics(),
+            hedged=hedged,
+            hedge_winner=winner,
+            model_id=_model_id(model),
+        )
+        return result
+
+    def _fall_back(
+        self, outcomes: cabc.Mapping[str, _Attempt | BaseException]
+    ) -> RepositoryStatusResult:
+        """Return a rejected result, or raise, when nothing was accepted."""
+        for label in (PRIMARY, SECONDARY):
+            outcome = outcomes.get(label)
+            if outcome is not None and not isinstance(outcome, BaseException):
+                return self._finish(label, outcome, hedged=SECONDARY in outcomes)
+        # Without a result, the primary's outcome can only be its error.
+        raise typ.cast("BaseException", outcomes[PRIMARY])
+
+
+def _model_id(model: object) -> str | None:
+    """Return the ``model_id`` of *model* or of a model it wraps."""
+    current: object | None = model
+    while current is not None:
+        model_id = getattr(current, "model_id", None)
+        if model_id is not None:
+            return str(model_id)
+        current = getattr(current, "wrapped", None)
+    return None
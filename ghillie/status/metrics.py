@@ -17,6 +17,24 @@ class ModelInvocationMetrics:
         Total token count for the invocation, when known.
     latency_ms
         Invocation latency in milliseconds, when measured.
+    cache_hits
+        Number of results served from the status model cache, when the
+        model is wrapped by one.
+    cache_misses
+        Number of results the cache had to request from the model, when the
+        model is wrapped by one.
+    estimated_prompt_tokens
+        Prompt size estimated before sending, for comparison with
+        ``prompt_tokens`` and the configured prompt token budget.
+    hedged
+        Whether a hedged request was sent to a secondary model, when the
+        model is wrapped by ``HedgedStatusModel``.
+    hedge_winner
+        Which model's result was used (``"primary"`` or ``"secondary"``),
+        when the model is wrapped by ``HedgedStatusModel``.
+    model_id
+        Identifier of the model that produced the result, when it can differ
+        between invocations, as with ``HedgedStatusModel``.
 
     """
 
@@ -24,3 +42,9 @@ class ModelInvocationMetrics:
     completion_tokens: int | None = None
     total_tokens: int | None = None
     latency_ms: float | None = None
+    cache_hits: int | None = None
+    cache_misses: int | None = None
+    estimated_prompt_tokens: int | None = None
+    hedged: bool | None = None
+    hedge_winner: str | None = None
+    model_id: str | None = None
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses as dc
 import json
 import typing as typ
 from http import HTTPStatus
@@ -14,14 +16,22 @@ from ghillie.status.errors import (
     OpenAIAPIError,
     OpenAIConfigError,
     OpenAIResponseShapeError,
+    StatusGenerationAbortedError,
 )
 from ghillie.status.metrics import ModelInvocationMetrics
 from ghillie.status.models import RepositoryStatusResult
-from ghillie.status.prompts import SYSTEM_PROMPT, build_user_prompt
+from ghillie.status.prompts import SYSTEM_PROMPT, build_user_prompt, estimate_tokens
+from ghillie.status.resilience import CircuitBreaker
+from ghillie.status.streaming import StreamAssembler, iter_sse_data
 
 if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
     from ghillie.common.json import JSONLike
     from ghillie.status.config import OpenAIStatusModelConfig
+    from ghillie.status.rate_limit import SharedRateLimiter
+    from ghillie.status.resilience import ResilienceEventListener
+    from ghillie.status.streaming import PartialStatusReport, StreamCheck
 
 _HTTP_ERROR_STATUS_THRESHOLD = int(HTTPStatus.BAD_REQUEST)
 _HTTP_RATE_LIMITED = int(HTTPStatus.TOO_MANY_REQUESTS)
@@ -118,6 +128,23 @@ class OpenAIStatusModel:
     http_client
         Optional httpx.AsyncClient for testing. If not provided,
         the instance creates and owns its own client.
+    circuit_breaker
+        Breaker guarding the endpoint. Pass a shared breaker so every model
+        in a process fails fast together; by default the instance gets its
+        own, configured from ``config.circuit_breaker``.
+    event_listener
+        Optional receiver of retry events (and, for the default breaker,
+        state transitions).
+    sleep
+        Awaitable used to wait between retries; injectable for tests.
+    stream_check
+        Optional early-abort hook applied to the partial output of streamed
+        completions (see ``config.stream``).
+    rate_limiter
+        Optional shared limiter metering every request sent. Each summary
+        reserves its estimated tokens and one request, and each retry
+        reserves one more request, so retried calls count against the
+        requests-per-minute budget as often as they reach the provider.
 
     Examples
     --------
@@ -130,11 +157,16 @@ class OpenAIStatusModel:
 
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913 - keyword-only injection points
         self,
         config: OpenAIStatusModelConfig,
         *,
         http_client: httpx.AsyncClient | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        event_listener: ResilienceEventListener | None = None,
+        sleep: cabc.Callable[[float], cabc.Awaitable[object]] = asyncio.sleep,
+        stream_check: StreamCheck | None = None,
+        rate_limiter: SharedRateLimiter | None = None,
     ) -> None:
         """Initialise the client with configuration."""
         if not config.api_key.strip():
@@ -144,11 +176,17 @@ class OpenAIStatusModel:
         self._owns_client = http_client is None
         self._client = http_client or httpx.AsyncClient(
             timeout=config.timeout_s,
-            headers={
-                "Authorization": f"Bearer {config.api_key}",
-                "Content-Type": "application/json",
-            },
+            # httpx sets Content-Type per request: JSON bodies and batch
+            # file uploads need different ones.
+            headers={"Authorization": f"Bearer {config.api_key}"},
+        )
+        self._breaker = circuit_breaker or CircuitBreaker(
+            config.endpoint, config.circuit_breaker, listener=event_listener
         )
+        self._event_listener = event_listener
+        self._sleep = sleep
+        self._stream_check = stream_check
+        self._rate_limiter = rate_limiter
         self._last_invocation_metrics: ModelInvocationMetrics | None = None
 
     @property
@@ -163,6 +201,21 @@ class OpenAIStatusModel:
         """
         return self._config
 
+    @property
+    def model_id(self) -> str:
+        """Return the configured model name, used in report metadata."""
+        return self._config.model
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        """Return the breaker guarding this model's endpoint."""
+        return self._breaker
+
+    @property
+    def rate_limiter(self) -> SharedRateLimiter | None:
+        """Return the limiter metering this model's requests, if any."""
+        return self._rate_limiter
+
     @property
     def last_invocation_metrics(self) -> ModelInvocationMetrics | None:
         """Return metrics captured from the most recent invocation."""
@@ -193,13 +246,36 @@ class OpenAIStatusModel:
         Raises
         ------
         OpenAIAPIError
-            If the API returns an error response or times out.
+            If the API returns an error response or times out once retries
+            are exhausted, or the circuit breaker is open.
         OpenAIResponseShapeError
             If the response is missing expected fields or contains invalid JSON.
+        StatusGenerationAbortedError
+            If a streamed completion was abandoned early.
 
         """
-        user_prompt = build_user_prompt(evidence)
+        user_prompt = build_user_prompt(
+            evidence, token_budget=self._config.prompt_token_budget
+        )
+        prompt_tokens = estimate_tokens(SYSTEM_PROMPT) + estimate_tokens(user_prompt)
+        limiter = self._rate_limiter
+        reservation_id = (
+            await limiter.acquire(prompt_tokens + self._config.max_tokens)
+            if limiter is not None
+            else None
+        )
         response_content = await self._call_chat_completion(user_prompt)
+        self._last_invocation_metrics = dc.replace(
+            self._last_invocation_metrics or ModelInvocationMetrics(),
+            estimated_prompt_tokens=prompt_tokens,
+        )
+        total_tokens = self._last_invocation_metrics.total_tokens
+        if (
+            limiter is not None
+            and reservation_id is not None
+            and total_tokens is not None
+        ):
+            await limiter.record_usage(reservation_id, total_tokens)
         parsed = self._parse_response(response_content)
         return self._build_result(parsed)
 
@@ -223,10 +299,160 @@ class OpenAIStatusModel:
 
         """
         payload = self._build_payload(user_prompt)
-        response = await self._send_request(payload)
-        self._check_response_errors(response)
+        if self._config.stream:
+            return await self._stream_chat_completion(payload)
+        response = await self._send_with_retries(payload)
         return self._parse_json_response(response)
 
+    async def _stream_chat_completion(self, payload: dict[str, object]) -> str:
+        """Stream the completion, assembling content and checking it en route.
+
+        Closing the response on abort drops the connection, which stops the
+        provider generating (and billing) the rest of the completion.
+
+        Parameters
+        ----------
+        payload
+            Request payload dictionary for the API call.
+
+        Returns
+        -------
+        str
+            Assembled assistant message content.
+
+        Raises
+        ------
+        StatusGenerationAbortedError
+            If the stream check rejects the partial output or the content
+            exceeds ``config.max_completion_chars``.
+
+        """
+        stream_payload = {
+            **payload,
+            "stream": True,
+            "stream_options": {"include_usage": True},
+        }
+        self._last_invocation_metrics = ModelInvocationMetrics()
+        response = await self._send_with_retries(stream_payload, stream=True)
+        assembler = StreamAssembler()
+        try:
+            async for data in iter_sse_data(response.aiter_lines()):
+                fragment = self._consume_stream_chunk(data)
+                if fragment:
+                    self._check_partial(assembler.append(fragment))
+        except httpx.TimeoutException as exc:
+            raise OpenAIAPIError.timeout() from exc
+        except httpx.RequestError as exc:
+            raise OpenAIAPIError.network_error(str(exc)) from exc
+        finally:
+            await response.aclose()
+        return assembler.content
+
+    def _consume_stream_chunk(self, data: str) -> str | None:
+        """Record usage from a stream chunk and return its content fragment."""
+        try:
+            chunk = json.loads(data)
+        except json.JSONDecodeError as exc:
+            raise OpenAIResponseShapeError.invalid_json(data) from exc
+        if _is_object_dict(chunk) and _is_object_dict(chunk.get("usage")):
+            self._last_invocation_metrics = self._extract_usage_metrics(chunk)
+        choices = _get_nested(chunk, "choices")
+        if not isinstance(choices, list) or not choices:
+            return None
+        choice = choices[0]
+        if not _is_object_dict(choice):
+            return None
+        fragment = _get_nested(choice, "delta", "content")
+        return fragment if isinstance(fragment, str) else None
+
+    def _check_partial(self, partial: PartialStatusReport) -> None:
+        """Abort generation when partial output is certain to be rejected."""
+        budget = self._config.max_completion_chars
+        if budget is not None and partial.length > budget:
+            raise StatusGenerationAbortedError.length_budget_exceeded(budget)
+        if self._stream_check is None:
+            return
+        issue = self._stream_check(partial)
+        if issue is not None:
+            raise StatusGenerationAbortedError(issue.code, issue.message)
+
+    async def _send_with_retries(
+        self, payload: dict[str, object], *, stream: bool = False
+    ) -> httpx.Response:
+        """Send the request, retrying transient failures under the breaker.
+
+        Parameters
+        ----------
+        payload
+            Request payload dictionary for the API call.
+        stream
+            Return as soon as headers arrive, leaving the body to be read
+            (and the response closed) by the caller.
+
+        Returns
+        -------
+        httpx.Response
+            First successful HTTP response.
+
+        Raises
+        ------
+        OpenAIAPIError
+            If the breaker is open, the failure is not transient, or the
+            retry policy gives up.
+
+        """
+        return await self._with_retries(
+            lambda: self._send_request(payload, stream=stream), metered=True
+        )
+
+    async def _with_retries(
+        self,
+        send: cabc.Callable[[], cabc.Awaitable[httpx.Response]],
+        *,
+        metered: bool = False,
+    ) -> httpx.Response:
+        """Call ``send`` until it succeeds, under the retry policy and breaker.
+
+        ``send`` maps transport failures to ``OpenAIAPIError``; error
+        statuses are checked here. When ``metered``, each retry waits for
+        one more request from the rate limiter; the caller reserves the
+        first attempt along with the request's tokens.
+        """
+        attempt = 1
+        while True:
+            if metered and attempt > 1 and self._rate_limiter is not None:
+                await self._rate_limiter.acquire(0)
+            self._breaker.before_call()
+            try:
+                response = await send()
+                try:
+                    self._check_response_errors(response)
+                except OpenAIAPIError:
+                    await response.aclose()
+                    raise
+            except OpenAIAPIError as exc:
+                # Non-transient errors (such as 400 or 401) still show the
+                # provider is up, so only transient ones count against it.
+                if exc.retryable:
+                    self._breaker.record_failure()
+                else:
+                    self._breaker.record_success()
+                delay = self._config.retry.delay_for(attempt, exc)
+                if delay is None:
+                    raise
+                if self._event_listener is not None:
+                    self._event_listener.log_model_retry(
+                        model=self._config.model,
+                        attempt=attempt,
+                        delay_s=delay,
+                        error=exc,
+                    )
+                await self._sleep(delay)
+                attempt += 1
+            else:
+                self._breaker.record_success()
+                return response
+
     def _build_payload(self, user_prompt: str) -> dict[str, object]:
         """Construct the request payload for chat completion.
 
@@ -255,6 +481,8 @@ class OpenAIStatusModel:
     async def _send_request(
         self,
         payload: dict[str, object],
+        *,
+        stream: bool = False,
     ) -> httpx.Response:
         """Perform HTTP POST request to the chat completions endpoint.
 
@@ -262,6 +490,8 @@ class OpenAIStatusModel:
         ----------
         payload
             Request payload dictionary for the API call.
+        stream
+            Return once headers arrive without reading the body.
 
         Returns
         -------
@@ -275,6 +505,11 @@ class OpenAIStatusModel:
 
         """
         try:
+            if stream:
+                request = self._client.build_request(
+                    "POST", self._config.endpoint, json=payload
+                )
+                return await self._client.send(request, stream=True)
             return await self._client.post(
                 self._config.endpoint,
                 json=payload,
@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+import collections
+import dataclasses as dc
 import typing as typ
 from string.templatelib import Interpolation, Template, convert
 
 if typ.TYPE_CHECKING:
-    from ghillie.evidence.models import RepositoryEvidenceBundle
+    import collections.abc as cabc
+
+    from ghillie.evidence.models import RepositoryEvidenceBundle, WorkTypeGrouping
 
 type TemplateLike = str | Template
 
+# Share of the budget each optional section receives when all of them need
+# more than is available. Delivered work carries the report, and previous
+# reports keep it from repeating itself.
+_PREVIOUS_REPORTS_WEIGHT = 2
+_WORK_TYPES_WEIGHT = 1
+_PULL_REQUESTS_WEIGHT = 3
+_ISSUES_WEIGHT = 2
+# Lower ranks are kept first when a section must be cut.
+_STATE_RANK = {"merged": 0, "open": 1}
+
 
 class _NumberedItem(typ.Protocol):
     """Structural type for evidence items with a number, title and state."""
@@ -96,24 +110,72 @@ def _render_lines(lines: typ.Iterable[TemplateLike]) -> list[str]:
     return [_render_template(line) for line in lines]
 
 
+def _previous_report_blocks(
+    evidence: RepositoryEvidenceBundle,
+) -> list[list[TemplateLike]]:
+    """Return the lines describing each previous report."""
+    blocks: list[list[TemplateLike]] = []
+    for prev in evidence.previous_reports:
+        block: list[TemplateLike] = [
+            "",
+            t"### Report from {prev.window_start.date()} to {prev.window_end.date()}",
+            t"- Status: {prev.status.value}",
+        ]
+        if prev.highlights:
+            highlights_str = ", ".join(prev.highlights[:3])
+            block.append(t"- Highlights: {highlights_str}")
+        if prev.risks:
+            risks_str = ", ".join(prev.risks[:3])
+            block.append(t"- Risks: {risks_str}")
+        blocks.append(block)
+    return blocks
+
+
 def _format_previous_reports(evidence: RepositoryEvidenceBundle) -> list[TemplateLike]:
     """Format previous reports section."""
     if not evidence.previous_reports:
         return []
 
     sections: list[TemplateLike] = ["", "## Previous Reports"]
-    for prev in evidence.previous_reports:
-        sections.append("")
+    for block in _previous_report_blocks(evidence):
+        sections.extend(block)
+    return sections
+
+
+def _format_activity_summary(
+    evidence: RepositoryEvidenceBundle,
+) -> list[TemplateLike]:
+    """Format activity counts, noting when the evidence lists are truncated."""
+    truncation = evidence.truncation
+    if truncation is None:
+        counts = (
+            len(evidence.commits),
+            len(evidence.pull_requests),
+            len(evidence.issues),
+            len(evidence.documentation_changes),
+        )
+    else:
+        counts = (
+            truncation.commit_count,
+            truncation.pull_request_count,
+            truncation.issue_count,
+            truncation.documentation_change_count,
+        )
+    commits, prs, issues, docs = counts
+    sections: list[TemplateLike] = [
+        "",
+        "## Activity Summary",
+        t"- Commits: {commits}",
+        t"- Pull requests: {prs}",
+        t"- Issues: {issues}",
+        t"- Documentation changes: {docs}",
+    ]
+    if truncation is not None:
         sections.append(
-            t"### Report from {prev.window_start.date()} to {prev.window_end.date()}"
+            "- Note: the items listed below are the most significant of a "
+            "larger window (merged and open work first, then the most recent); "
+            "the counts above and the work type breakdown cover every item."
         )
-        sections.append(t"- Status: {prev.status.value}")
-        if prev.highlights:
-            highlights_str = ", ".join(prev.highlights[:3])
-            sections.append(t"- Highlights: {highlights_str}")
-        if prev.risks:
-            risks_str = ", ".join(prev.risks[:3])
-            sections.append(t"- Risks: {risks_str}")
     return sections
 
 
@@ -126,12 +188,23 @@ def _format_work_type_breakdown(
 
     sections: list[TemplateLike] = ["", "## Work Type Breakdown"]
     for grouping in evidence.work_type_groupings:
-        total = grouping.commit_count + grouping.pr_count + grouping.issue_count
-        sections.append(t"- {grouping.work_type.value}: {total} items")
-        sections.extend(t"  - {title}" for title in grouping.sample_titles[:2])
+        sections.extend(_work_type_block(grouping))
     return sections
 
 
+def _work_type_total(grouping: WorkTypeGrouping) -> int:
+    """Return the number of items in a work type grouping."""
+    return grouping.commit_count + grouping.pr_count + grouping.issue_count
+
+
+def _work_type_block(grouping: WorkTypeGrouping) -> list[TemplateLike]:
+    """Return the lines describing one work type grouping."""
+    total = _work_type_total(grouping)
+    block: list[TemplateLike] = [t"- {grouping.work_type.value}: {total} items"]
+    block.extend(t"  - {title}" for title in grouping.sample_titles[:2])
+    return block
+
+
 def _format_numbered_items(
     heading: str,
     items: typ.Sequence[_NumberedItem],
@@ -143,12 +216,15 @@ def _format_numbered_items(
         return []
 
     sections: list[TemplateLike] = ["", heading]
-    sections.extend(
-        t"- #{item.number}: {item.title} [{item.state}]" for item in items[:limit]
-    )
+    sections.extend(_numbered_item_line(item) for item in items[:limit])
     return sections
 
 
+def _numbered_item_line(item: _NumberedItem) -> TemplateLike:
+    """Return the line describing one pull request or issue."""
+    return t"- #{item.number}: {item.title} [{item.state}]"
+
+
 def _format_pull_requests(evidence: RepositoryEvidenceBundle) -> list[TemplateLike]:
     """Format pull requests section."""
     return _format_numbered_items("## Pull Requests", evidence.pull_requests)
@@ -159,13 +235,168 @@ def _format_issues(evidence: RepositoryEvidenceBundle) -> list[TemplateLike]:
     return _format_numbered_items("## Issues", evidence.issues)
 
 
-def build_user_prompt(evidence: RepositoryEvidenceBundle) -> str:
+@dc.dataclass(frozen=True, slots=True)
+class _BudgetedSection:
+    """An optional prompt section that may be cut to fit a token budget."""
+
+    heading: str
+    blocks: tuple[tuple[str, ...], ...]
+    overflow: cabc.Callable[[int], str]
+    weight: int
+
+    @property
+    def cost(self) -> int:
+        """Return the estimated tokens of the complete section."""
+        return _line_tokens(["", self.heading]) + sum(
+            _line_tokens(block) for block in self.blocks
+        )
+
+    def fit(self, allowance: int) -> list[str]:
+        """Return the section cut to ``allowance`` tokens.
+
+        Blocks are kept in priority order, and any that do not fit are
+        replaced by a count. A section that cannot hold even its heading and
+        that count is dropped; the activity summary still counts its items.
+        """
+        if not self.blocks:
+            return []
+        lines = ["", self.heading]
+        if self.cost <= allowance:
+            return lines + [line for block in self.blocks for line in block]
+        used = _line_tokens(lines) + _line_tokens([self.overflow(0)])
+        kept = 0
+        for block in self.blocks:
+            block_cost = _line_tokens(block)
+            if used + block_cost > allowance:
+                break
+            used += block_cost
+            kept += 1
+        if used > allowance:
+            return []
+        for block in self.blocks[:kept]:
+            lines.extend(block)
+        lines.append(self.overflow(kept))
+        return lines
+
+
+def _line_tokens(lines: typ.Iterable[str]) -> int:
+    """Estimate the tokens of rendered lines, including line breaks."""
+    return sum(estimate_tokens(f"{line}\n") for line in lines)
+
+
+def _count_states(items: typ.Iterable[_NumberedItem]) -> str:
+    """Summarise items by state, e.g. ``"3 merged, 2 open"``."""
+    counts = collections.Counter(item.state for item in items)
+    return ", ".join(f"{count} {state}" for state, count in counts.most_common())
+
+
+def _numbered_section(
+    heading: str, items: typ.Sequence[_NumberedItem], noun: str, weight: int
+) -> _BudgetedSection:
+    """Build a budgeted pull request or issue section, merged and open first."""
+    ranked = sorted(items, key=lambda item: _STATE_RANK.get(item.state, 2))
+
+    def overflow(kept: int) -> str:
+        omitted = ranked[kept:]
+        return f"- ... and {len(omitted)} more {noun} ({_count_states(omitted)})"
+
+    return _BudgetedSection(
+        heading=heading,
+        blocks=tuple((_render_template(_numbered_item_line(item)),) for item in ranked),
+        overflow=overflow,
+        weight=weight,
+    )
+
+
+def _budgeted_sections(
+    evidence: RepositoryEvidenceBundle,
+) -> tuple[_BudgetedSection, ...]:
+    """Return the optional sections in prompt order, ready for fitting."""
+    previous_count = len(evidence.previous_reports)
+    groupings = sorted(evidence.work_type_groupings, key=_work_type_total, reverse=True)
+
+    def work_type_overflow(kept: int) -> str:
+        omitted = groupings[kept:]
+        items = sum(_work_type_total(grouping) for grouping in omitted)
+        return f"- ... and {len(omitted)} more work types ({items} items)"
+
+    return (
+        _BudgetedSection(
+            heading="## Previous Reports",
+            blocks=tuple(
+                tuple(_render_lines(block))
+                for block in _previous_report_blocks(evidence)
+            ),
+            overflow=lambda kept: (
+                f"- ... and {previous_count - kept} more previous reports"
+            ),
+            weight=_PREVIOUS_REPORTS_WEIGHT,
+        ),
+        _BudgetedSection(
+            heading="## Work Type Breakdown",
+            blocks=tuple(
+                tuple(_render_lines(_work_type_block(grouping)))
+                for grouping in groupings
+            ),
+            overflow=work_type_overflow,
+            weight=_WORK_TYPES_WEIGHT,
+        ),
+        _numbered_section(
+            "## Pull Requests",
+            evidence.pull_requests,
+            "pull requests",
+            _PULL_REQUESTS_WEIGHT,
+        ),
+        _numbered_section("## Issues", evidence.issues, "issues", _ISSUES_WEIGHT),
+    )
+
+
+def _allocate(sections: typ.Sequence[_BudgetedSection], budget: int) -> list[int]:
+    """Share ``budget`` tokens between sections by weight.
+
+    Sections needing less than their share get exactly what they need, and
+    the surplus is shared again among the rest.
+    """
+    allowances = [0] * len(sections)
+    pending = {index for index, section in enumerate(sections) if section.blocks}
+    remaining = max(budget, 0)
+    while pending and remaining > 0:
+        total_weight = sum(sections[index].weight for index in pending)
+        shares = {
+            index: remaining * sections[index].weight // total_weight
+            for index in pending
+        }
+        satisfied = {
+            index for index in pending if sections[index].cost <= shares[index]
+        }
+        if not satisfied:
+            for index, share in shares.items():
+                allowances[index] = share
+            break
+        for index in satisfied:
+            allowances[index] = sections[index].cost
+            remaining -= sections[index].cost
+        pending -= satisfied
+    return allowances
+
+
+def build_user_prompt(
+    evidence: RepositoryEvidenceBundle,
+    *,
+    token_budget: int | None = None,
+) -> str:
     """Build user prompt from evidence bundle.
 
     Parameters
     ----------
     evidence
         Complete evidence bundle for the repository and reporting window.
+    token_budget
+        Optional limit on the prompt's estimated tokens. When set, pull
+        requests and issues are no longer capped at ten each; instead every
+        optional section is fitted to its share of the budget. The header,
+        activity summary, and instructions are always included, so a budget
+        smaller than those is exceeded.
 
     Returns
     -------
@@ -173,42 +404,63 @@ def build_user_prompt(evidence: RepositoryEvidenceBundle) -> str:
         Formatted user prompt for the LLM.
 
     """
-    sections: list[TemplateLike] = [
+    header: list[TemplateLike] = [
         t"# Repository Status Report: {evidence.repository.slug}",
         "",
         t"Reporting window: {evidence.window_start.isoformat()} to "
         t"{evidence.window_end.isoformat()}",
     ]
+    activity = _format_activity_summary(evidence)
+    instructions: list[TemplateLike] = [
+        "",
+        "## Instructions",
+        (
+            "Analyze the above evidence and respond with a JSON status report "
+            "following the schema in the system prompt."
+        ),
+    ]
 
-    # Add optional sections
-    sections.extend(_format_previous_reports(evidence))
-
-    # Activity summary
-    sections.extend(
-        [
-            "",
-            "## Activity Summary",
-            t"- Commits: {len(evidence.commits)}",
-            t"- Pull requests: {len(evidence.pull_requests)}",
-            t"- Issues: {len(evidence.issues)}",
-            t"- Documentation changes: {len(evidence.documentation_changes)}",
+    if token_budget is None:
+        previous = _format_previous_reports(evidence)
+        details = [
+            *_format_work_type_breakdown(evidence),
+            *_format_pull_requests(evidence),
+            *_format_issues(evidence),
         ]
+    else:
+        sections = _budgeted_sections(evidence)
+        fixed_cost = _line_tokens(_render_lines([*header, *activity, *instructions]))
+        fitted = [
+            section.fit(allowance)
+            for section, allowance in zip(
+                sections, _allocate(sections, token_budget - fixed_cost), strict=True
+            )
+        ]
+        previous = fitted[0]
+        details = [line for lines in fitted[1:] for line in lines]
+
+    return "\n".join(
+        _render_lines([*header, *previous, *activity, *details, *instructions])
     )
 
-    sections.extend(_format_work_type_breakdown(evidence))
-    sections.extend(_format_pull_requests(evidence))
-    sections.extend(_format_issues(evidence))
 
-    # Instructions
-    sections.extend(
-        [
-            "",
-            "## Instructions",
-            (
-                "Analyze the above evidence and respond with a JSON status report "
-                "following the schema in the system prompt."
-            ),
-        ]
-    )
+# English prose and Markdown average about four characters per token; three
+# overestimates slightly, so budgets built on these estimates err low.
+_CHARS_PER_TOKEN = 3
 
-    return "\n".join(_render_lines(sections))
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the tokens ``text`` consumes without a provider tokenizer.
+
+    Parameters
+    ----------
+    text
+        Prompt or completion text.
+
+    Returns
+    -------
+    int
+        A deliberately conservative token estimate.
+
+    """
+    return -(-len(text) // _CHARS_PER_TOKEN)
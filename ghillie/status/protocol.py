@@ -5,9 +5,16 @@ from __future__ import annotations
 import typing as typ
 
 if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
     from ghillie.evidence.models import RepositoryEvidenceBundle
     from ghillie.status.models import RepositoryStatusResult
 
+# Decides whether a status model result is good enough to use or keep.
+type ResultCheck = cabc.Callable[
+    [RepositoryEvidenceBundle, RepositoryStatusResult], bool
+]
+
 
 @typ.runtime_checkable
 class StatusModel(typ.Protocol):
@@ -0,0 +1,329 @@
+"""Shared token and request rate limiting for status models.
+
+Estate runs cap concurrency per process, but every Dramatiq worker runs its
+own reports, and none of them know the provider's tokens-per-minute (TPM) or
+requests-per-minute (RPM) limits. ``SharedRateLimiter`` meters requests
+against those budgets across all processes that share a Gold database.
+
+Each request reserves its estimated tokens in ``status_model_usage`` over a
+sliding one-minute window. Reservations first update the limiter's
+``status_model_rate_limits`` row, which holds a row lock on PostgreSQL (and
+the write lock on SQLite) until the transaction commits. This serialises
+concurrent reservations from every worker. A request that does not fit waits
+until enough earlier reservations leave the window, rather than polling or
+waiting for a 429. Once the model reports actual usage, the reservation is
+corrected, so throughput stays just under the configured budgets.
+
+``OpenAIStatusModel`` takes a limiter directly and meters every HTTP request
+it sends, so its retries count against the RPM budget too.
+``RateLimitedStatusModel`` wraps any other ``StatusModel`` with a limiter,
+reserving one request per invocation.
+
+Example:
+-------
+>>> limiter = SharedRateLimiter(
+...     session_factory, RateLimitBudget(tokens_per_minute=90_000)
+... )
+>>> model = create_status_model(session_factory, rate_limiter=limiter)
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses as dc
+import datetime as dt
+import math
+import typing as typ
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+
+from ghillie.common.time import utcnow
+from ghillie.gold.storage import StatusModelRateLimit, StatusModelUsage
+from ghillie.status.metrics import ModelInvocationMetrics
+from ghillie.status.prompts import SYSTEM_PROMPT, build_user_prompt, estimate_tokens
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from ghillie.evidence.models import RepositoryEvidenceBundle
+    from ghillie.status.models import RepositoryStatusResult
+    from ghillie.status.protocol import StatusModel
+
+_WINDOW = dt.timedelta(minutes=1)
+_DEFAULT_LIMITER_NAME = "status-model"
+
+
+@dc.dataclass(frozen=True, slots=True)
+class RateLimitBudget:
+    """Provider limits a status model limiter keeps under.
+
+    Attributes
+    ----------
+    tokens_per_minute
+        Prompt plus completion tokens allowed per minute, or ``None`` for no
+        token limit.
+    requests_per_minute
+        Requests allowed per minute, or ``None`` for no request limit.
+    headroom
+        Fraction of each limit actually used, leaving room for estimation
+        error and traffic from outside the limiter (default 0.95).
+
+    """
+
+    tokens_per_minute: int | None = None
+    requests_per_minute: int | None = None
+    headroom: float = 0.95
+
+    def __post_init__(self) -> None:
+        """Validate that limits are positive and headroom is a fraction."""
+        for limit in (self.tokens_per_minute, self.requests_per_minute):
+            if limit is not None and limit < 1:
+                msg = f"rate limits must be positive, got: {limit}"
+                raise ValueError(msg)
+        if not 0 < self.headroom <= 1:
+            msg = f"headroom must be in (0, 1], got: {self.headroom}"
+            raise ValueError(msg)
+
+    def _effective(self, limit: int | None) -> int | None:
+        if limit is None:
+            return None
+        return max(1, math.floor(limit * self.headroom))
+
+    @property
+    def effective_tokens_per_minute(self) -> int | None:
+        """Return the token limit after headroom."""
+        return self._effective(self.tokens_per_minute)
+
+    @property
+    def effective_requests_per_minute(self) -> int | None:
+        """Return the request limit after headroom."""
+        return self._effective(self.requests_per_minute)
+
+
+def _wait_for_requests(
+    reserved_at: list[dt.datetime], limit: int | None, now: dt.datetime
+) -> dt.timedelta:
+    """Return how long until one more request fits under ``limit``."""
+    if limit is None or len(reserved_at) < limit:
+        return dt.timedelta(0)
+    # The oldest requests must leave the window until only limit - 1 remain.
+    return reserved_at[len(reserved_at) - limit] + _WINDOW - now
+
+
+def _wait_for_tokens(
+    usage: list[tuple[dt.datetime, int]],
+    tokens: int,
+    limit: int | None,
+    now: dt.datetime,
+) -> dt.timedelta:
+    """Return how long until ``tokens`` more fit under ``limit``."""
+    if limit is None:
+        return dt.timedelta(0)
+    # A request larger than the whole budget waits for an empty window
+    # rather than forever.
+    excess = sum(used for _, used in usage) + min(tokens, limit) - limit
+    wait = dt.timedelta(0)
+    for reserved_at, used in usage:
+        if excess <= 0:
+            break
+        excess -= used
+        wait = reserved_at + _WINDOW - now
+    return wait
+
+
+class SharedRateLimiter:
+    """Meter status model requests against TPM and RPM budgets.
+
+    Parameters
+    ----------
+    session_factory
+        Async session factory for the Gold database shared by all workers.
+    budget
+        Limits to keep under.
+    name
+        Identifies the limiter; processes sharing a name share a budget, so
+        use one name per provider account.
+    sleep
+        Awaitable used to wait for capacity; injectable for tests.
+
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        budget: RateLimitBudget,
+        *,
+        name: str = _DEFAULT_LIMITER_NAME,
+        sleep: cabc.Callable[[float], cabc.Awaitable[object]] = asyncio.sleep,
+    ) -> None:
+        """Configure the limiter's storage, budget, and identity."""
+        self._session_factory = session_factory
+        self._budget = budget
+        self._name = name
+        self._sleep = sleep
+
+    @property
+    def budget(self) -> RateLimitBudget:
+        """Return the limits this limiter keeps under."""
+        return self._budget
+
+    async def acquire(self, tokens: int) -> int:
+        """Wait until ``tokens`` fit the budget, then reserve them.
+
+        Returns
+        -------
+        int
+            Reservation ID for :meth:`record_usage`.
+
+        """
+        while True:
+            reservation_id, wait = await self._try_reserve(tokens)
+            if reservation_id is not None:
+                return reservation_id
+            await self._sleep(wait.total_seconds())
+
+    async def record_usage(self, reservation_id: int, tokens: int) -> None:
+        """Replace a reservation's estimate with the tokens actually used."""
+        async with self._session_factory() as session, session.begin():
+            await session.execute(
+                update(StatusModelUsage)
+                .where(StatusModelUsage.id == reservation_id)
+                .values(tokens=tokens)
+            )
+
+    async def _try_reserve(self, tokens: int) -> tuple[int | None, dt.timedelta]:
+        """Reserve ``tokens`` now, or return how long to wait for capacity."""
+        try:
+            async with self._session_factory() as session, session.begin():
+                now = utcnow()
+                await self._lock(session, now)
+                await session.execute(
+                    delete(StatusModelUsage).where(
+                        StatusModelUsage.limiter == self._name,
+                        StatusModelUsage.reserved_at <= now - _WINDOW,
+                    )
+                )
+                usage = list(
+                    (
+                        await session.execute(
+                            select(
+                                StatusModelUsage.reserved_at, StatusModelUsage.tokens
+                            )
+                            .where(StatusModelUsage.limiter == self._name)
+                            .order_by(StatusModelUsage.reserved_at)
+                        )
+                    ).tuples()
+                )
+                wait = max(
+                    _wait_for_requests(
+                        [reserved_at for reserved_at, _ in usage],
+                        self._budget.effective_requests_per_minute,
+                        now,
+                    ),
+                    _wait_for_tokens(
+                        usage, tokens, self._budget.effective_tokens_per_minute, now
+                    ),
+                )
+                if wait > dt.timedelta(0):
+                    return None, wait
+                reservation = StatusModelUsage(
+                    limiter=self._name, reserved_at=now, tokens=tokens
+                )
+                session.add(reservation)
+                await session.flush()
+                return reservation.id, dt.timedelta(0)
+        except IntegrityError:
+            # Another process created the limiter row first; try again.
+            return None, dt.timedelta(0)
+
+    async def _lock(self, session: AsyncSession, now: dt.datetime) -> None:
+        """Take the limiter's row lock, creating the row on first use."""
+        result = await session.execute(
+            update(StatusModelRateLimit)
+            .where(StatusModelRateLimit.name == self._name)
+            .values(updated_at=now)
+        )
+        if typ.cast("typ.Any", result).rowcount == 0:
+            session.add(StatusModelRateLimit(name=self._name, updated_at=now))
+            await session.flush()
+
+
+def estimate_request_tokens(
+    model: StatusModel, evidence: RepositoryEvidenceBundle
+) -> int:
+    """Estimate the prompt and completion tokens a request will consume.
+
+    The prompt is built with the model's ``prompt_token_budget`` and the
+    completion is assumed to use its whole ``max_tokens`` allowance when its
+    configuration exposes them.
+    """
+    inner: object = model
+    while (wrapped := getattr(inner, "wrapped", None)) is not None:
+        inner = wrapped
+    config = getattr(inner, "config", None)
+    budget = getattr(config, "prompt_token_budget", None)
+    prompt_tokens = estimate_tokens(SYSTEM_PROMPT) + estimate_tokens(
+        build_user_prompt(
+            evidence, token_budget=budget if isinstance(budget, int) else None
+        )
+    )
+    max_tokens = getattr(config, "max_tokens", None)
+    return prompt_tokens + (max_tokens if isinstance(max_tokens, int) else 0)
+
+
+class RateLimitedStatusModel:
+    """Status model wrapper that waits for shared rate-limit capacity.
+
+    Each invocation reserves a single request, which suits models that make
+    one provider request per summary. Models that retry or fan out
+    requests internally, such as ``OpenAIStatusModel``, should be given the
+    limiter instead so every request they send is metered.
+
+    Parameters
+    ----------
+    model
+        Status model that produces results.
+    limiter
+        Limiter shared with every other process calling the same provider.
+
+    """
+
+    def __init__(self, model: StatusModel, limiter: SharedRateLimiter) -> None:
+        """Wrap ``model`` so each invocation is metered by ``limiter``."""
+        self._model = model
+        self._limiter = limiter
+
+    @property
+    def wrapped(self) -> StatusModel:
+        """Return the status model that results are requested from."""
+        return self._model
+
+    @property
+    def last_invocation_metrics(self) -> ModelInvocationMetrics | None:
+        """Return metrics captured by the wrapped model's latest invocation."""
+        metrics = getattr(self._model, "last_invocation_metrics", None)
+        return metrics if isinstance(metrics, ModelInvocationMetrics) else None
+
+    async def aclose(self) -> None:
+        """Close the wrapped model's resources, if it holds any."""
+        aclose = getattr(self._model, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    async def summarize_repository(
+        self,
+        evidence: RepositoryEvidenceBundle,
+    ) -> RepositoryStatusResult:
+        """Wait for budget, then summarise and record the actual usage."""
+        reservation_id = await self._limiter.acquire(
+            estimate_request_tokens(self._model, evidence)
+        )
+        result = await self._model.summarize_repository(evidence)
+        metrics = self.last_invocation_metrics
+        if metrics is not None and metrics.total_tokens is not None:
+            await self._limiter.record_usage(reservation_id, metrics.total_tokens)
+        return result
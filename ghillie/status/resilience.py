@@ -0,0 +1,301 @@
+"""Retry policy and circuit breaker for status model providers.
+
+A single provider wobble (a burst of 429s, a few gateway errors, or slow
+responses) used to fail every report in an estate batch, and the immediate
+re-runs added load to a provider that was already struggling. This module
+provides the two pieces ``OpenAIStatusModel`` uses to ride out such wobbles:
+
+``RetryPolicy``
+    Decides whether and how long to wait before repeating a transient
+    failure. Waits honour ``Retry-After`` and otherwise use exponential
+    backoff with full jitter, so retries from many workers spread out instead
+    of arriving together.
+``CircuitBreaker``
+    Counts consecutive transient failures. Once the threshold is reached it
+    opens and refuses requests without contacting the provider until the
+    reset timeout passes, then lets a single trial request through. Success
+    closes the breaker; failure opens it again.
+
+State transitions and retries are reported to a ``ResilienceEventListener``;
+``ReportingEventLogger`` implements it, so breaker state appears in the
+reporting event log.
+
+Example:
+-------
+>>> breaker = shared_circuit_breaker(
+...     "https://api.openai.com/v1/chat/completions", CircuitBreakerPolicy()
+... )
+>>> breaker.state
+<CircuitState.CLOSED: 'closed'>
+
+"""
+
+from __future__ import annotations
+
+import dataclasses as dc
+import enum
+import random
+import threading
+import time
+import typing as typ
+
+from ghillie.status.errors import OpenAIAPIError
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+_JITTER = random.Random()  # noqa: S311 - jitter, not cryptography
+
+
+class CircuitState(enum.StrEnum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class ResilienceEventListener(typ.Protocol):
+    """Receives retry and circuit breaker events for observability."""
+
+    def log_model_retry(
+        self,
+        *,
+        model: str,
+        attempt: int,
+        delay_s: float,
+        error: BaseException,
+    ) -> None:
+        """Record that a failed model request will be retried."""
+        ...
+
+    def log_circuit_state_changed(
+        self,
+        *,
+        name: str,
+        state: CircuitState,
+        consecutive_failures: int,
+    ) -> None:
+        """Record a circuit breaker state transition."""
+        ...
+
+
+@dc.dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """How transient status model failures are retried.
+
+    Attributes
+    ----------
+    max_attempts
+        Total attempts per request, including the first (default 3). ``1``
+        disables retries.
+    base_delay_s
+        Backoff ceiling for the first retry; it doubles on each further
+        retry (default 1 second).
+    max_delay_s
+        Upper bound on the backoff ceiling (default 30 seconds).
+    max_retry_after_s
+        Longest ``Retry-After`` the client will wait. Longer requests fail
+        immediately rather than holding a worker (default 120 seconds).
+
+    """
+
+    max_attempts: int = 3
+    base_delay_s: float = 1.0
+    max_delay_s: float = 30.0
+    max_retry_after_s: float = 120.0
+
+    def __post_init__(self) -> None:
+        """Validate that attempts are positive and delays non-negative."""
+        if self.max_attempts < 1:
+            msg = f"max_attempts must be positive, got: {self.max_attempts}"
+            raise ValueError(msg)
+        for delay in (self.base_delay_s, self.max_delay_s, self.max_retry_after_s):
+            if delay < 0:
+                msg = f"retry delays must be non-negative, got: {delay}"
+                raise ValueError(msg)
+
+    def delay_for(self, attempt: int, error: OpenAIAPIError) -> float | None:
+        """Return the wait before retrying after ``attempt`` failed.
+
+        Parameters
+        ----------
+        attempt
+            One-based number of the attempt that just failed.
+        error
+            Failure raised by that attempt.
+
+        Returns
+        -------
+        float | None
+            Seconds to wait before the next attempt, or ``None`` when the
+            request should not be retried.
+
+        """
+        if not error.retryable or attempt >= self.max_attempts:
+            return None
+        if error.retry_after is not None:
+            if error.retry_after > self.max_retry_after_s:
+                return None
+            return float(error.retry_after)
+        ceiling = min(self.max_delay_s, self.base_delay_s * 2 ** (attempt - 1))
+        return _JITTER.uniform(0, ceiling)
+
+
+@dc.dataclass(frozen=True, slots=True)
+class CircuitBreakerPolicy:
+    """When a circuit breaker opens and how long it stays open.
+
+    Attributes
+    ----------
+    failure_threshold
+        Consecutive transient failures that open the breaker (default 5).
+    reset_timeout_s
+        Seconds the breaker stays open before a trial request (default 30).
+
+    """
+
+    failure_threshold: int = 5
+    reset_timeout_s: float = 30.0
+
+    def __post_init__(self) -> None:
+        """Validate that the threshold is positive and the timeout not."""
+        if self.failure_threshold < 1:
+            msg = f"failure_threshold must be positive, got: {self.failure_threshold}"
+            raise ValueError(msg)
+        if self.reset_timeout_s < 0:
+            msg = f"reset_timeout_s must be non-negative, got: {self.reset_timeout_s}"
+            raise ValueError(msg)
+
+
+class CircuitBreaker:
+    """Fail fast while a provider is failing persistently.
+
+    The breaker is safe to share between threads, so one instance can guard
+    every request a worker process makes to the same endpoint.
+
+    Parameters
+    ----------
+    name
+        Identifies the guarded provider in errors and events.
+    policy
+        Failure threshold and reset timeout.
+    listener
+        Optional receiver of state transition events.
+    clock
+        Monotonic clock returning seconds; injectable for tests.
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        policy: CircuitBreakerPolicy | None = None,
+        *,
+        listener: ResilienceEventListener | None = None,
+        clock: cabc.Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a closed breaker for ``name``."""
+        self._name = name
+        self._policy = policy or CircuitBreakerPolicy()
+        self._listener = listener
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_started_at: float | None = None
+
+    @property
+    def name(self) -> str:
+        """Return the name of the guarded provider."""
+        return self._name
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the breaker's current state."""
+        return self._state
+
+    def before_call(self) -> None:
+        """Admit a request, or refuse it while the breaker is open.
+
+        Raises
+        ------
+        OpenAIAPIError
+            If the breaker is open, or half-open with a trial in flight.
+
+        """
+        with self._lock:
+            now = self._clock()
+            if self._state is CircuitState.CLOSED:
+                return
+            if self._state is CircuitState.OPEN:
+                retry_in = self._opened_at + self._policy.reset_timeout_s - now
+                if retry_in > 0:
+                    raise OpenAIAPIError.circuit_open(self._name, retry_in)
+                self._transition(CircuitState.HALF_OPEN)
+            # A trial abandoned without an outcome (e.g. cancelled) must not
+            # hold the breaker half-open forever.
+            elif (
+                self._trial_started_at is not None
+                and now - self._trial_started_at < self._policy.reset_timeout_s
+            ):
+                raise OpenAIAPIError.circuit_open(
+                    self._name,
+                    self._trial_started_at + self._policy.reset_timeout_s - now,
+                )
+            self._trial_started_at = now
+
+    def record_success(self) -> None:
+        """Record that the provider answered, closing the breaker."""
+        with self._lock:
+            self._failures = 0
+            self._trial_started_at = None
+            if self._state is not CircuitState.CLOSED:
+                self._transition(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a transient failure, opening the breaker at the threshold."""
+        with self._lock:
+            self._failures += 1
+            self._trial_started_at = None
+            if self._state is CircuitState.HALF_OPEN or (
+                self._state is CircuitState.CLOSED
+                and self._failures >= self._policy.failure_threshold
+            ):
+                self._opened_at = self._clock()
+                self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        """Move to ``state`` and notify the listener; caller holds the lock."""
+        self._state = state
+        if self._listener is not None:
+            self._listener.log_circuit_state_changed(
+                name=self._name,
+                state=state,
+                consecutive_failures=self._failures,
+            )
+
+
+_SHARED_BREAKERS: dict[str, CircuitBreaker] = {}
+_SHARED_BREAKERS_LOCK = threading.Lock()
+
+
+def shared_circuit_breaker(
+    name: str,
+    policy: CircuitBreakerPolicy,
+    *,
+    listener: ResilienceEventListener | None = None,
+) -> CircuitBreaker:
+    """Return the process-wide breaker for ``name``, creating it if needed.
+
+    Each worker thread builds its own status models, as does the API, so
+    breakers are kept per process to share provider health between them.
+    The policy and listener of the first caller for a name are kept.
+    """
+    with _SHARED_BREAKERS_LOCK:
+        breaker = _SHARED_BREAKERS.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name, policy, listener=listener)
+            _SHARED_BREAKERS[name] = breaker
+        return breaker
@@ -0,0 +1,191 @@
+"""Incremental assembly of streamed status model completions.
+
+OpenAI-compatible endpoints stream chat completions as server-sent events
+(SSE), each carrying a fragment of the assistant's JSON answer. This module
+parses the event stream and assembles the fragments, exposing the partial
+answer after every fragment so callers can stop generation early.
+
+A ``StreamCheck`` hook inspects each ``PartialStatusReport`` and returns an
+issue once the output is certain to be rejected; the status model then
+closes the stream, which cancels generation on the provider side.
+``ghillie.reporting.validation.check_partial_report`` applies the report
+validation rules this way.
+
+Example:
+-------
+>>> assembler = StreamAssembler()
+>>> partial = assembler.append('{"status": "on_track", "summary": ""')
+>>> partial.summary
+''
+
+"""
+
+from __future__ import annotations
+
+import dataclasses as dc
+import json
+import re
+import typing as typ
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+_DONE_SENTINEL = "[DONE]"
+# The "summary" key up to the quote opening its value. Quotes inside JSON
+# strings are always escaped, so an unescaped "summary" followed by a colon
+# can only be the key.
+_SUMMARY_KEY = '"summary"'
+_SUMMARY_KEY_PATTERN = re.compile(r'"summary"\s*:\s*"')
+# What may follow the key before its value opens.
+_SUMMARY_KEY_SEPARATOR = re.compile(r"\s*(?::\s*)?")
+# The longest run of a JSON string body: unescaped characters and escapes.
+_STRING_BODY = re.compile(r'(?:[^"\\]|\\.)*')
+
+
+class AbortIssue(typ.Protocol):
+    """Reason a stream check gives for stopping generation."""
+
+    @property
+    def code(self) -> str:
+        """Machine-readable reason code."""
+        ...
+
+    @property
+    def message(self) -> str:
+        """Human-readable explanation."""
+        ...
+
+
+@dc.dataclass(frozen=True, slots=True)
+class PartialStatusReport:
+    """Status model output assembled so far from a stream.
+
+    Attributes
+    ----------
+    length
+        Characters of content received.
+    summary
+        The ``summary`` value once its string has been closed, otherwise
+        ``None``.
+
+    """
+
+    length: int
+    summary: str | None = None
+
+
+type StreamCheck = cabc.Callable[[PartialStatusReport], AbortIssue | None]
+
+
+class StreamAssembler:
+    """Accumulate streamed content fragments into the full completion."""
+
+    def __init__(self) -> None:
+        """Start with no content."""
+        self._parts: list[str] = []
+        self._length = 0
+        self._summary: str | None = None
+        # Unmatched text that may still begin the summary key.
+        self._key_tail = ""
+        # Body of the summary string so far, once its opening quote is seen.
+        self._value_parts: list[str] | None = None
+        # A trailing backslash whose escaped character has not arrived yet.
+        self._pending_escape = ""
+
+    @property
+    def content(self) -> str:
+        """Return the content received so far."""
+        return "".join(self._parts)
+
+    def append(self, fragment: str) -> PartialStatusReport:
+        """Add a content fragment and return the partial report.
+
+        Each fragment is scanned once, resuming from the last unmatched
+        offset, and the summary is searched for only until it is found, so
+        assembly stays linear in the length of the completion.
+        """
+        self._parts.append(fragment)
+        self._length += len(fragment)
+        text = fragment
+        while self._summary is None and text:
+            value_parts = self._value_parts
+            text = (
+                self._scan_key(text)
+                if value_parts is None
+                else self._scan_value(value_parts, text)
+            )
+        return PartialStatusReport(length=self._length, summary=self._summary)
+
+    def _scan_key(self, fragment: str) -> str:
+        """Look for the summary key, returning the text after its value opens."""
+        text = self._key_tail + fragment
+        match = _SUMMARY_KEY_PATTERN.search(text)
+        if match is not None:
+            self._key_tail = ""
+            self._value_parts = []
+            return text[match.end() :]
+        # Keep only a key that may still be completed by later fragments.
+        start = text.rfind(_SUMMARY_KEY)
+        if start != -1 and _SUMMARY_KEY_SEPARATOR.fullmatch(
+            text, start + len(_SUMMARY_KEY)
+        ):
+            self._key_tail = text[start:]
+        else:
+            self._key_tail = text[-(len(_SUMMARY_KEY) - 1) :]
+        return ""
+
+    def _scan_value(self, value_parts: list[str], fragment: str) -> str:
+        """Extend the summary string, returning any text left to scan."""
+        text = self._pending_escape + fragment
+        self._pending_escape = ""
+        body = _STRING_BODY.match(text)
+        end = 0 if body is None else body.end()
+        value_parts.append(text[:end])
+        if end == len(text):
+            return ""
+        if text[end] == '"':
+            self._summary = _decode_json_string("".join(value_parts))
+            return ""
+        if end == len(text) - 1:
+            self._pending_escape = text[end:]
+            return ""
+        # Not a JSON string after all; look for another summary key.
+        self._value_parts = None
+        return text[end:]
+
+
+def _decode_json_string(raw: str) -> str:
+    """Decode the body of a JSON string literal, tolerating bad escapes."""
+    try:
+        return json.loads(f'"{raw}"')
+    except json.JSONDecodeError:
+        return raw
+
+
+async def iter_sse_data(lines: cabc.AsyncIterable[str]) -> cabc.AsyncIterator[str]:
+    """Yield the ``data`` payload of each server-sent event.
+
+    Multi-line payloads are joined with newlines, comments and other fields
+    are ignored, and iteration stops at the ``[DONE]`` sentinel.
+
+    Parameters
+    ----------
+    lines
+        Lines of the event stream without line terminators.
+
+    """
+    data: list[str] = []
+    async for line in lines:
+        if line:
+            field, _, value = line.partition(":")
+            if field != "data":
+                continue
+            value = value.removeprefix(" ")
+            if not data and value == _DONE_SENTINEL:
+                return
+            data.append(value)
+        elif data:
+            yield "\n".join(data)
+            data = []
+    if data:
+        yield "\n".join(data)
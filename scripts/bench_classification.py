@@ -0,0 +1,179 @@
+"""Benchmark compiled work type classification against per-pattern matching.
+
+Classification is the main Python CPU cost of building large evidence bundles.
+This script generates synthetic commit messages and pull request titles with
+labels, then times the compiled single-pass classifier (per-item
+``classify_entity`` and the ``classify_many`` batch API) against a reference
+implementation that normalises the configured labels and searches each title
+pattern one at a time, as classification did before compilation.
+
+Run from the repository root inside the project environment:
+
+    uv run python scripts/bench_classification.py --titles 100000
+"""
+
+import dataclasses
+import random
+import time
+import typing as typ
+
+from cyclopts import App
+
+from ghillie.evidence import (
+    DEFAULT_CLASSIFICATION_CONFIG,
+    ClassificationConfig,
+    WorkType,
+    classify_entity,
+    classify_many,
+)
+
+if typ.TYPE_CHECKING:
+    import re
+
+app = App(help="Benchmark work type classification.")
+
+_PREFIXES = (
+    "feat: ",
+    "fix(api): ",
+    "chore: ",
+    "ci: ",
+    "refactor: ",
+    "docs: ",
+    "add ",
+    "update ",
+    "",
+    "",
+)
+_WORDS = (
+    "parser",
+    "widget",
+    "cleanup",
+    "cache",
+    "fixes",
+    "dependency",
+    "bump",
+    "handler",
+    "timeout",
+    "prefix",
+    "refactor",
+    "report",
+)
+_LABELS = ("bug", "enhancement", "docs", "ci", "triage", "needs review")
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Item:
+    labels: tuple[str, ...]
+    title: str
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Timing:
+    label: str
+    seconds: float
+    items: int
+
+    def render(self) -> str:
+        per_item_us = self.seconds / self.items * 1_000_000
+        return (
+            f"{self.label:<28} {self.seconds * 1000:9.1f} ms {per_item_us:8.2f} us/item"
+        )
+
+
+def _build_items(count: int) -> list[_Item]:
+    rng = random.Random(42)  # noqa: S311 - deterministic synthetic data
+    items: list[_Item] = []
+    for _ in range(count):
+        words = " ".join(rng.choices(_WORDS, k=rng.randint(2, 8)))
+        labels = tuple(rng.sample(_LABELS, k=rng.randint(0, 2)))
+        items.append(_Item(labels=labels, title=f"{rng.choice(_PREFIXES)}{words}"))
+    return items
+
+
+def _reference_classify(
+    config: ClassificationConfig, labels: typ.Sequence[str], title: str
+) -> WorkType:
+    """Classify with per-call label sets and one search per pattern."""
+
+    def labels_match(patterns: tuple[str, ...]) -> bool:
+        wanted = {p.strip().lower() for p in patterns}
+        return any(label.strip().lower() in wanted for label in labels)
+
+    def title_matches(patterns: tuple[re.Pattern[str], ...]) -> bool:
+        lowered = title.lower()
+        return any(pattern.search(lowered) for pattern in patterns)
+
+    for work_type, label_set in (
+        (WorkType.BUG, config.bug_labels),
+        (WorkType.FEATURE, config.feature_labels),
+        (WorkType.REFACTOR, config.refactor_labels),
+        (WorkType.DOCUMENTATION, config.documentation_labels),
+        (WorkType.CHORE, config.chore_labels),
+    ):
+        if labels_match(label_set):
+            return work_type
+    general = (
+        (WorkType.BUG, config.compiled_bug_patterns),
+        (WorkType.FEATURE, config.compiled_feature_patterns),
+        (WorkType.REFACTOR, config.compiled_refactor_patterns),
+        (WorkType.CHORE, config.compiled_chore_patterns),
+    )
+    prefix_order = (general[0], general[3], general[1], general[2])
+    for work_type, patterns in prefix_order:
+        if title_matches(tuple(p for p in patterns if p.pattern.startswith("^"))):
+            return work_type
+    for work_type, patterns in general:
+        if title_matches(patterns):
+            return work_type
+    return WorkType.UNKNOWN
+
+
+def _time(label: str, items: int, func: typ.Callable[[], object]) -> _Timing:
+    started = time.perf_counter()
+    func()
+    return _Timing(label=label, seconds=time.perf_counter() - started, items=items)
+
+
+@app.default
+def main(*, titles: int = 100_000) -> int:
+    """Time reference, compiled per-item, and batch classification."""
+    config = DEFAULT_CLASSIFICATION_CONFIG
+    items = _build_items(titles)
+
+    expected = [_reference_classify(config, i.labels, i.title) for i in items]
+    if classify_many([i.title for i in items], [i.labels for i in items]) != expected:
+        print("compiled classification disagrees with the reference")
+        return 1
+
+    reference = _time(
+        "reference (per pattern)",
+        titles,
+        lambda: [_reference_classify(config, i.labels, i.title) for i in items],
+    )
+    single = _time(
+        "compiled classify_entity",
+        titles,
+        lambda: [classify_entity(item, config) for item in items],
+    )
+    batch = _time(
+        "compiled classify_many",
+        titles,
+        lambda: classify_many(
+            [i.title for i in items], [i.labels for i in items], config
+        ),
+    )
+    messages = _time(
+        "classify_many (messages)",
+        titles,
+        lambda: classify_many([i.title for i in items], config=config),
+    )
+
+    print(f"{titles} titles with 0-2 labels each")
+    for timing in (reference, single, batch, messages):
+        print(timing.render())
+    print(f"speed-up (classify_many): {reference.seconds / batch.seconds:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(app())
@@ -0,0 +1,202 @@
+"""Load-test GitHub ingestion against the offline GraphQL stand-in.
+
+Runs ``GitHubIngestionWorker`` with the real ``GitHubGraphQLClient`` against
+``ghillie.github.standin`` through an in-process ASGI transport, writing to a
+temporary SQLite database. Every repository is ingested from an empty
+watermark, so each run fetches the full synthetic history. The report lists
+events ingested per second, GraphQL requests per ingested event, and the
+p50/p99 latency of individual GraphQL pages, which makes throughput
+regressions in the client, the worker pipeline, or Bronze writes visible
+before they reach production.
+
+Run from the repository root inside the project environment:
+
+    uv run python scripts/bench_github_ingestion.py --repos 8 --commits 2000
+"""
+
+import asyncio
+import dataclasses
+import datetime as dt
+import pathlib
+import statistics
+import tempfile
+import time
+
+import httpx
+from cyclopts import App
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from ghillie.bronze import init_bronze_storage
+from ghillie.catalogue import init_catalogue_storage
+from ghillie.github import (
+    GitHubGraphQLClient,
+    GitHubGraphQLConfig,
+    GitHubIngestionConfig,
+    GitHubIngestionResult,
+    GitHubIngestionWorker,
+)
+from ghillie.github.standin import (
+    StandInConfig,
+    create_standin_app,
+    standin_transport,
+)
+from ghillie.registry.models import RepositoryInfo
+
+app = App(help="Benchmark GitHub ingestion against an offline GraphQL stand-in.")
+
+
+class _TimedTransport(httpx.AsyncBaseTransport):
+    """Record the wall-clock latency of every request."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport) -> None:
+        self._inner = inner
+        self.latencies: list[float] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        response = await self._inner.handle_async_request(request)
+        self.latencies.append(time.perf_counter() - started)
+        return response
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Outcome:
+    events: int
+    failures: int
+    seconds: float
+
+
+def _repositories(count: int) -> list[RepositoryInfo]:
+    return [
+        RepositoryInfo(
+            id=f"bench-{index}",
+            owner="bench",
+            name=f"repo-{index}",
+            default_branch="main",
+            ingestion_enabled=True,
+            documentation_paths=("docs/roadmap.md", "docs/adr"),
+            estate_id=None,
+        )
+        for index in range(count)
+    ]
+
+
+def _events(result: GitHubIngestionResult) -> int:
+    return (
+        result.commits_ingested
+        + result.pull_requests_ingested
+        + result.issues_ingested
+        + result.doc_changes_ingested
+    )
+
+
+async def _run(
+    standin: StandInConfig, *, repos: int, concurrency: int, database: pathlib.Path
+) -> tuple[_Outcome, _TimedTransport, int]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{database}")
+    await init_bronze_storage(engine)
+    await init_catalogue_storage(engine)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    asgi_app = create_standin_app(standin)
+    transport = _TimedTransport(standin_transport(asgi_app))
+    http_client = httpx.AsyncClient(transport=transport)
+    client = GitHubGraphQLClient(
+        GitHubGraphQLConfig(
+            token="standin",  # noqa: S106 - the stand-in accepts any token
+            endpoint="http://standin/graphql",
+        ),
+        http_client=http_client,
+    )
+    history_start = standin.end - standin.span
+    worker = GitHubIngestionWorker(
+        session_factory,
+        client,
+        config=GitHubIngestionConfig(
+            initial_lookback=dt.datetime.now(dt.UTC) - history_start,
+            max_events_per_kind=max(
+                standin.commits, standin.pull_requests, standin.issues
+            )
+            * 2,
+        ),
+    )
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _ingest(repo: RepositoryInfo) -> GitHubIngestionResult:
+        async with semaphore:
+            return await worker.ingest_repository(repo)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(_ingest(repo) for repo in _repositories(repos)), return_exceptions=True
+    )
+    elapsed = time.perf_counter() - started
+    await http_client.aclose()
+    await engine.dispose()
+
+    ingested = [item for item in results if isinstance(item, GitHubIngestionResult)]
+    outcome = _Outcome(
+        events=sum(_events(item) for item in ingested),
+        failures=len(results) - len(ingested),
+        seconds=elapsed,
+    )
+    return outcome, transport, asgi_app.stats.requests
+
+
+@app.default
+def main(  # noqa: PLR0913 - flat CLI surface
+    *,
+    repos: int = 4,
+    concurrency: int = 4,
+    commits: int = 1_000,
+    pull_requests: int = 300,
+    issues: int = 300,
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    error_rate: float = 0.0,
+    seed: int = 0,
+) -> int:
+    """Ingest synthetic repositories and report throughput and latency."""
+    standin = StandInConfig(
+        seed=seed,
+        commits=commits,
+        pull_requests=pull_requests,
+        issues=issues,
+        latency_s=latency_ms / 1000,
+        latency_jitter_s=jitter_ms / 1000,
+        error_rate=error_rate,
+    )
+    with tempfile.TemporaryDirectory() as scratch:
+        outcome, transport, requests = asyncio.run(
+            _run(
+                standin,
+                repos=repos,
+                concurrency=concurrency,
+                database=pathlib.Path(scratch) / "bench.db",
+            )
+        )
+
+    latencies_ms = sorted(value * 1000 for value in transport.latencies)
+    percentiles = (
+        statistics.quantiles(latencies_ms, n=100) if len(latencies_ms) > 1 else []
+    )
+    print(
+        f"{repos} repos x ({commits} commits, {pull_requests} PRs, "
+        f"{issues} issues), concurrency {concurrency}"
+    )
+    print(f"events ingested      {outcome.events}")
+    print(f"failed repositories  {outcome.failures}")
+    print(f"elapsed              {outcome.seconds:.2f} s")
+    print(f"events/sec           {outcome.events / outcome.seconds:.0f}")
+    print(f"GraphQL requests     {requests}")
+    if outcome.events:
+        print(f"requests/event       {requests / outcome.events:.4f}")
+    if percentiles:
+        print(f"page latency p50     {percentiles[49]:.2f} ms")
+        print(f"page latency p99     {percentiles[98]:.2f} ms")
+    return 1 if outcome.failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(app())
@@ -0,0 +1,128 @@
+"""Benchmark compiled noise filter evaluation against per-pattern matching.
+
+Estates with large bot and path deny-lists evaluate every fetched GitHub event
+against hundreds of patterns. This script builds synthetic deny-lists and a
+synthetic page stream, then times the compiled ``CompiledNoiseFilters``
+engine (``should_drop`` and the ``partition`` batch API) against a reference
+implementation that calls ``fnmatch.fnmatchcase`` and ``str.startswith`` once
+per pattern, as the filters did before compilation.
+
+Run from the repository root inside the project environment:
+
+    uv run python scripts/bench_noise_filters.py --patterns 500 --events 20000
+"""
+
+import dataclasses
+import datetime as dt
+import fnmatch
+import random
+import time
+import typing as typ
+
+from cyclopts import App
+
+from ghillie.catalogue.models import NoiseFilters
+from ghillie.github.models import GitHubIngestedEvent
+from ghillie.github.noise import CompiledNoiseFilters, compile_noise_filters
+
+app = App(help="Benchmark GitHub ingestion noise filters.")
+
+_PAGE_SIZE = 100
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Timing:
+    label: str
+    seconds: float
+    events: int
+
+    def render(self) -> str:
+        per_event_us = self.seconds / self.events * 1_000_000
+        return (
+            f"{self.label:<28} {self.seconds * 1000:9.1f} ms "
+            f"{per_event_us:8.2f} us/event"
+        )
+
+
+def _reference_should_drop(
+    compiled: CompiledNoiseFilters, payload: dict[str, typ.Any]
+) -> bool:
+    """Evaluate title prefixes and path globs one pattern at a time."""
+    title = payload.get("title")
+    if isinstance(title, str):
+        lowered = title.strip().lower()
+        if any(lowered.startswith(p) for p in compiled.ignore_title_prefixes):
+            return True
+    path = payload.get("path")
+    if isinstance(path, str):
+        return any(fnmatch.fnmatchcase(path, p) for p in compiled.ignore_paths)
+    return False
+
+
+def _build_filters(pattern_count: int) -> CompiledNoiseFilters:
+    paths = [f"generated/module-{idx}/**" for idx in range(pattern_count)]
+    prefixes = [f"chore(scope-{idx}):" for idx in range(pattern_count)]
+    return compile_noise_filters(
+        [NoiseFilters(ignore_paths=paths, ignore_title_prefixes=prefixes)]
+    )
+
+
+def _build_events(count: int, pattern_count: int) -> list[GitHubIngestedEvent]:
+    rng = random.Random(42)  # noqa: S311 - deterministic synthetic data
+    now = dt.datetime.now(dt.UTC)
+    events: list[GitHubIngestedEvent] = []
+    for idx in range(count):
+        module = rng.randrange(pattern_count * 2)
+        if idx % 2:
+            payload: dict[str, typ.Any] = {"path": f"generated/module-{module}/x.md"}
+        else:
+            payload = {"title": f"chore(scope-{module}): bump {idx}"}
+        events.append(
+            GitHubIngestedEvent(
+                event_type="github.doc_change",
+                source_event_id=str(idx),
+                occurred_at=now,
+                payload=payload,
+            )
+        )
+    return events
+
+
+def _time(label: str, events: int, func: typ.Callable[[], object]) -> _Timing:
+    started = time.perf_counter()
+    func()
+    return _Timing(label=label, seconds=time.perf_counter() - started, events=events)
+
+
+@app.default
+def main(*, patterns: int = 500, events: int = 20_000) -> int:
+    """Time reference, compiled, and batch noise filter evaluation."""
+    compiled = _build_filters(patterns)
+    stream = _build_events(events, patterns)
+    pages = [stream[i : i + _PAGE_SIZE] for i in range(0, len(stream), _PAGE_SIZE)]
+
+    reference = _time(
+        "reference (per pattern)",
+        events,
+        lambda: [_reference_should_drop(compiled, e.payload) for e in stream],
+    )
+    single = _time(
+        "compiled should_drop",
+        events,
+        lambda: [compiled.should_drop(e) for e in stream],
+    )
+    batch = _time(
+        "compiled partition (pages)",
+        events,
+        lambda: [compiled.partition(page) for page in pages],
+    )
+
+    print(f"{patterns} path globs + {patterns} title prefixes, {events} events")
+    for timing in (reference, single, batch):
+        print(timing.render())
+    print(f"speed-up (partition): {reference.seconds / batch.seconds:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(app())
@@ -160,6 +160,7 @@ def when_request_status_report(
     """Request status report from OpenAI model."""
     from ghillie.status.config import OpenAIStatusModelConfig
     from ghillie.status.openai_client import OpenAIStatusModel
+    from ghillie.status.resilience import RetryPolicy
 
     async def _request_report() -> None:
         evidence = llm_context["evidence"]
@@ -167,6 +168,7 @@ def when_request_status_report(
         config = OpenAIStatusModelConfig(
             api_key="test-key",
             endpoint=f"{vidaimock_server}/v1/chat/completions",
+            retry=RetryPolicy(max_attempts=1),
         )
 
         http_client: httpx.AsyncClient | None = None
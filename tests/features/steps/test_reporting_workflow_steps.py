@@ -10,7 +10,7 @@ from pytest_bdd import given, scenario, then, when
 
 from ghillie.bronze import RawEventWriter
 from ghillie.evidence import EvidenceBundleService
-from ghillie.gold import Report, ReportCoverage, ReportScope
+from ghillie.gold import Report, ReportCoverageRange, ReportScope
 from ghillie.reporting import (
     ReportingConfig,
     ReportingService,
@@ -252,10 +252,12 @@ def then_report_links_events(reporting_context: ReportingContext) -> None:
         async with session_factory() as session:
             coverage = (
                 await session.scalars(
-                    select(ReportCoverage).where(ReportCoverage.report_id == report.id)
+                    select(ReportCoverageRange).where(
+                        ReportCoverageRange.report_id == report.id
+                    )
                 )
             ).all()
-            assert len(coverage) >= 1, "Report should have at least one coverage record"
+            assert coverage, "Report should have at least one coverage range"
 
     asyncio.run(_assert())
 
@@ -63,13 +63,18 @@ class FakeGitHubClient:
         return 0
 
     async def iter_commits(
-        self, repo: RepositoryInfo, *, since: dt.datetime, after: str | None = None
+        self,
+        repo: RepositoryInfo,
+        *,
+        since: dt.datetime,
+        after: str | None = None,
+        until: dt.datetime | None = None,
     ) -> typ.AsyncIterator[GitHubIngestedEvent]:
-        """Yield commit events newer than `since`."""
+        """Yield commit events newer than `since` and no later than `until`."""
         del repo
         start = self._find_start_index(self._commits, after)
         for event in self._commits[start:]:
-            if event.occurred_at > since:
+            if _within(event, since=since, until=until):
                 yield event
 
     async def iter_pull_requests(
@@ -92,22 +97,32 @@ class FakeGitHubClient:
             if event.occurred_at > since:
                 yield event
 
-    async def iter_doc_changes(
+    async def iter_doc_changes(  # noqa: PLR0913
         self,
         repo: RepositoryInfo,
         *,
         since: dt.datetime,
         documentation_paths: typ.Sequence[str],
         after: str | None = None,
+        until: dt.datetime | None = None,
     ) -> typ.AsyncIterator[GitHubIngestedEvent]:
         """Yield documentation change events newer than `since`."""
         del repo, documentation_paths
         start = self._find_start_index(self._doc_changes, after)
         for event in self._doc_changes[start:]:
-            if event.occurred_at > since:
+            if _within(event, since=since, until=until):
                 yield event
 
 
+def _within(
+    event: GitHubIngestedEvent, *, since: dt.datetime, until: dt.datetime | None
+) -> bool:
+    """Return True when the event falls in the ``(since, until]`` bounds."""
+    if event.occurred_at <= since:
+        return False
+    return until is None or event.occurred_at <= until
+
+
 class FailingGitHubClient:
     """GitHubActivityClient implementation that raises errors for testing."""
 
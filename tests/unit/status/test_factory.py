@@ -70,6 +70,53 @@ class TestCreateStatusModelOpenAIBackend:
             "Expected OpenAIStatusModel instance"
         )
 
+    def test_creates_batch_model(self) -> None:
+        """Factory creates OpenAIBatchStatusModel for 'openai-batch' backend."""
+        from ghillie.status.batch import OpenAIBatchStatusModel
+
+        env = {
+            "GHILLIE_STATUS_MODEL_BACKEND": "openai-batch",
+            "GHILLIE_OPENAI_API_KEY": "test-key",
+            "GHILLIE_OPENAI_BATCH_MAX_SIZE": "50",
+        }
+        with mock.patch.dict(os.environ, env, clear=True):
+            model = create_status_model()
+        assert isinstance(model, OpenAIBatchStatusModel), (
+            "Expected OpenAIBatchStatusModel instance"
+        )
+        assert model.config.batch.max_batch_size == 50, (
+            "Expected batch size from environment"
+        )
+
+    def test_creates_hedged_model_when_hedge_model_set(self) -> None:
+        """Factory hedges the 'openai' backend with the configured model."""
+        from ghillie.status.hedging import HedgedStatusModel
+        from ghillie.status.openai_client import OpenAIStatusModel
+
+        env = {
+            "GHILLIE_STATUS_MODEL_BACKEND": "openai",
+            "GHILLIE_OPENAI_API_KEY": "test-key",
+            "GHILLIE_OPENAI_HEDGE_MODEL": "backup-model",
+            "GHILLIE_OPENAI_HEDGE_PERCENTILE": "90",
+        }
+        with mock.patch.dict(os.environ, env, clear=True):
+            model = create_status_model()
+        assert isinstance(model, HedgedStatusModel), (
+            "Expected HedgedStatusModel instance"
+        )
+        primary, secondary = model.wrapped, model.secondary
+        assert isinstance(primary, OpenAIStatusModel)
+        assert isinstance(secondary, OpenAIStatusModel)
+        assert secondary.config.model == "backup-model", (
+            "Expected the secondary to use the hedge model"
+        )
+        assert secondary.config.endpoint == primary.config.endpoint, (
+            "Expected the secondary to default to the primary endpoint"
+        )
+        assert primary.config.hedging.percentile == 90, (
+            "Expected hedge percentile from environment"
+        )
+
     def test_openai_model_uses_default_config(self) -> None:
         """OpenAI model uses default configuration when only API key provided."""
         from ghillie.status.openai_client import OpenAIStatusModel
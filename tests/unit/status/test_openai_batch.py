@@ -0,0 +1,312 @@
+"""Unit tests for the OpenAI batch-submission status model."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import typing as typ
+from http import HTTPStatus
+
+import httpx
+import pytest
+from sqlalchemy import func, select
+
+from ghillie.gold import StatusModelBatchRequest
+from ghillie.status.batch import OpenAIBatchStatusModel
+from ghillie.status.config import BatchSubmissionConfig, OpenAIStatusModelConfig
+from ghillie.status.errors import OpenAIAPIError, OpenAIConfigError
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from ghillie.evidence.models import RepositoryEvidenceBundle
+
+_ENDPOINT = "http://batch.local/v1/chat/completions"
+_USAGE = {"prompt_tokens": 90, "completion_tokens": 30, "total_tokens": 120}
+
+# Receives each request's position in its batch and returns its result line.
+type _Responder = cabc.Callable[[int], dict[str, object]]
+
+
+def _completion(index: int | str) -> dict[str, object]:
+    """Return a successful batch result summarised as ``index``."""
+    content = json.dumps({"status": "on_track", "summary": f"request-{index}"})
+    return {
+        "response": {
+            "status_code": int(HTTPStatus.OK),
+            "body": {"choices": [{"message": {"content": content}}], "usage": _USAGE},
+        },
+        "error": None,
+    }
+
+
+class _BatchServer:
+    """In-memory stand-in for the files and batches endpoints."""
+
+    def __init__(
+        self,
+        respond: _Responder | None = None,
+        *,
+        final_status: str = "completed",
+    ) -> None:
+        self._respond = respond or _completion
+        self._final_status = final_status
+        self._files: dict[str, str] = {}
+        self.batches: list[list[dict[str, object]]] = []
+        self.polls = 0
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "POST" and path == "/v1/files":
+            lines = [
+                json.loads(line)
+                for line in request.read().decode().splitlines()
+                if line.startswith('{"custom_id"')
+            ]
+            return self._store(lines)
+        if request.method == "POST" and path == "/v1/batches":
+            body = json.loads(request.content)
+            self.batches.append(self._inputs[body["input_file_id"]])
+            return httpx.Response(
+                HTTPStatus.OK, json={"id": "batch-1", "status": "validating"}
+            )
+        if path.startswith("/v1/batches/"):
+            self.polls += 1
+            return httpx.Response(HTTPStatus.OK, json=self._batch_state())
+        file_id = path.removeprefix("/v1/files/").removesuffix("/content")
+        return httpx.Response(HTTPStatus.OK, text=self._files[file_id])
+
+    @property
+    def _inputs(self) -> dict[str, list[dict[str, object]]]:
+        return {
+            file_id: [json.loads(line) for line in content.splitlines()]
+            for file_id, content in self._files.items()
+        }
+
+    def _store(self, lines: list[dict[str, object]]) -> httpx.Response:
+        file_id = f"file-{len(self._files)}"
+        self._files[file_id] = "\n".join(json.dumps(line) for line in lines)
+        return httpx.Response(HTTPStatus.OK, json={"id": file_id})
+
+    def _batch_state(self) -> dict[str, object]:
+        if self.polls < 2:
+            return {"id": "batch-1", "status": "in_progress"}
+        results = [
+            {"custom_id": line["custom_id"], **outcome}
+            for index, line in enumerate(self.batches[-1])
+            if (outcome := self._respond(index))
+        ]
+        output = [result for result in results if result["error"] is None]
+        errors = [result for result in results if result["error"] is not None]
+        self._files["output"] = "\n".join(json.dumps(line) for line in output)
+        self._files["errors"] = "\n".join(json.dumps(line) for line in errors)
+        return {
+            "id": "batch-1",
+            "status": self._final_status,
+            "output_file_id": "output",
+            "error_file_id": "errors",
+        }
+
+
+def _model(
+    server: _BatchServer,
+    batch: BatchSubmissionConfig,
+    sleeps: list[float],
+    session_factory: async_sessionmaker[AsyncSession] | None = None,
+) -> OpenAIBatchStatusModel:
+    async def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    config = OpenAIStatusModelConfig(
+        api_key="test-key", endpoint=_ENDPOINT, batch=batch
+    )
+    return OpenAIBatchStatusModel(
+        config,
+        session_factory=session_factory,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(server.handle)),
+        sleep=sleep,
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_batch(
+    feature_evidence: RepositoryEvidenceBundle,
+    empty_evidence: RepositoryEvidenceBundle,
+    bug_heavy_evidence: RepositoryEvidenceBundle,
+) -> None:
+    """Requests arriving together are submitted, polled, and fanned out once."""
+    server = _BatchServer()
+    sleeps: list[float] = []
+    model = _model(
+        server, BatchSubmissionConfig(collect_window_s=0, poll_interval_s=5), sleeps
+    )
+
+    results = await asyncio.gather(
+        *(
+            model.summarize_repository(evidence)
+            for evidence in (feature_evidence, empty_evidence, bug_heavy_evidence)
+        )
+    )
+
+    assert [result.summary for result in results] == [
+        "request-0",
+        "request-1",
+        "request-2",
+    ]
+    assert len(server.batches) == 1
+    assert [line["url"] for line in server.batches[0]] == ["/v1/chat/completions"] * 3
+    assert sleeps == [5, 5]
+    metrics = model.last_invocation_metrics
+    assert metrics is not None
+    assert metrics.total_tokens == 120
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_submitted_without_waiting(
+    feature_evidence: RepositoryEvidenceBundle,
+    empty_evidence: RepositoryEvidenceBundle,
+) -> None:
+    """Reaching the batch size submits at once, ignoring the collect window."""
+    server = _BatchServer()
+    model = _model(
+        server, BatchSubmissionConfig(max_batch_size=2, collect_window_s=3600), []
+    )
+
+    async with asyncio.timeout(5):
+        await asyncio.gather(
+            model.summarize_repository(feature_evidence),
+            model.summarize_repository(empty_evidence),
+        )
+
+    assert [len(batch) for batch in server.batches] == [2]
+
+
+@pytest.mark.asyncio
+async def test_failures_reach_only_the_affected_requests(
+    feature_evidence: RepositoryEvidenceBundle,
+    empty_evidence: RepositoryEvidenceBundle,
+    bug_heavy_evidence: RepositoryEvidenceBundle,
+) -> None:
+    """Rejected and unanswered requests fail; finished ones still succeed."""
+
+    def respond(index: int) -> dict[str, object]:
+        if index == 1:
+            return {"response": None, "error": {"message": "invalid prompt"}}
+        if index == 2:
+            return {}
+        return _completion("done")
+
+    server = _BatchServer(respond, final_status="expired")
+    model = _model(server, BatchSubmissionConfig(collect_window_s=0), [])
+
+    done, rejected, unanswered = await asyncio.gather(
+        *(
+            model.summarize_repository(evidence)
+            for evidence in (feature_evidence, empty_evidence, bug_heavy_evidence)
+        ),
+        return_exceptions=True,
+    )
+
+    assert not isinstance(done, BaseException)
+    assert done.summary == "request-done"
+    assert isinstance(rejected, OpenAIAPIError)
+    assert "invalid prompt" in str(rejected)
+    assert isinstance(unanswered, OpenAIAPIError)
+    assert "expired" in str(unanswered)
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_share_one_line(
+    feature_evidence: RepositoryEvidenceBundle,
+) -> None:
+    """The same request made twice is submitted once and answered twice."""
+    server = _BatchServer()
+    model = _model(server, BatchSubmissionConfig(collect_window_s=0), [])
+
+    first, second = await asyncio.gather(
+        *(model.summarize_repository(feature_evidence) for _ in range(2))
+    )
+
+    assert first == second
+    assert [len(batch) for batch in server.batches] == [1]
+
+
+@pytest.mark.asyncio
+async def test_retried_request_resumes_the_recorded_batch(
+    session_factory: async_sessionmaker[AsyncSession],
+    feature_evidence: RepositoryEvidenceBundle,
+) -> None:
+    """A request that outwaited its batch resumes it instead of resubmitting."""
+    server = _BatchServer()
+    impatient = _model(
+        server,
+        BatchSubmissionConfig(collect_window_s=0, max_wait_s=0),
+        [],
+        session_factory,
+    )
+
+    with pytest.raises(OpenAIAPIError, match="still running"):
+        await impatient.summarize_repository(feature_evidence)
+
+    # A retried job builds a new model, as a fresh worker would.
+    retried = _model(
+        server, BatchSubmissionConfig(collect_window_s=0), [], session_factory
+    )
+    result = await retried.summarize_repository(feature_evidence)
+
+    assert result.summary == "request-0"
+    assert len(server.batches) == 1
+    async with session_factory() as session:
+        remaining = await session.scalar(
+            select(func.count()).select_from(StatusModelBatchRequest)
+        )
+    assert remaining == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_batch_releases_its_requests(
+    feature_evidence: RepositoryEvidenceBundle,
+) -> None:
+    """Requests of a cancelled batch are released so a later call starts over."""
+    server = _BatchServer()
+    polling, resume = asyncio.Event(), asyncio.Event()
+
+    async def sleep(_seconds: float) -> None:
+        polling.set()
+        await resume.wait()
+
+    model = OpenAIBatchStatusModel(
+        OpenAIStatusModelConfig(
+            api_key="test-key",
+            endpoint=_ENDPOINT,
+            batch=BatchSubmissionConfig(collect_window_s=0),
+        ),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(server.handle)),
+        sleep=sleep,
+    )
+    caller = asyncio.create_task(model.summarize_repository(feature_evidence))
+    await polling.wait()
+
+    # Cancel everything left running, as a worker does after a failed message.
+    leftovers = asyncio.all_tasks() - {asyncio.current_task()}
+    for task in leftovers:
+        task.cancel()
+    await asyncio.gather(*leftovers, return_exceptions=True)
+    resume.set()
+
+    async with asyncio.timeout(5):
+        result = await model.summarize_repository(feature_evidence)
+
+    assert caller.cancelled()
+    assert result.summary == "request-0"
+    assert len(server.batches) == 2
+
+
+def test_rejects_endpoints_without_a_batch_api() -> None:
+    """The batch API location is derived from a chat completions endpoint."""
+    config = OpenAIStatusModelConfig(api_key="test-key", endpoint="http://proxy.local")
+
+    with pytest.raises(OpenAIConfigError, match="chat completions endpoint"):
+        OpenAIBatchStatusModel(config)
@@ -16,6 +16,7 @@ from ghillie.status.openai_client import (
     OpenAIStatusModel,
     _parse_status,
 )
+from ghillie.status.resilience import RetryPolicy
 
 if typ.TYPE_CHECKING:
     import collections.abc as cabc
@@ -301,9 +302,11 @@ class TestOpenAIHTTPErrorHandling:
 
     @pytest.fixture
     def config(self) -> OpenAIStatusModelConfig:
-        """Create config for testing."""
+        """Create config for testing, with retries disabled."""
         return OpenAIStatusModelConfig(
-            api_key="test-key", endpoint="http://test.local/v1/chat/completions"
+            api_key="test-key",
+            endpoint="http://test.local/v1/chat/completions",
+            retry=RetryPolicy(max_attempts=1),
         )
 
     @pytest.mark.asyncio
@@ -400,6 +403,9 @@ class TestOpenAIInvocationMetrics:
             assert metrics.total_tokens == 150, (
                 "Expected total token count to match usage payload"
             )
+            assert metrics.estimated_prompt_tokens is not None, (
+                "Expected the sent prompt's estimated size to be recorded"
+            )
 
     @pytest.mark.asyncio
     async def test_missing_usage_sets_empty_metrics(
@@ -17,7 +17,7 @@ from ghillie.evidence.models import (
     WorkType,
     WorkTypeGrouping,
 )
-from ghillie.status.prompts import SYSTEM_PROMPT, build_user_prompt
+from ghillie.status.prompts import SYSTEM_PROMPT, build_user_prompt, estimate_tokens
 
 EXPECTED_REPRESENTATIVE_PROMPT = (
     "# Repository Status Report: octo/reef\n"
@@ -214,6 +214,53 @@ class TestBuildUserPrompt:
             build_user_prompt(representative_evidence) == EXPECTED_REPRESENTATIVE_PROMPT
         )
 
+    def test_generous_budget_keeps_representative_prompt(
+        self, representative_evidence: RepositoryEvidenceBundle
+    ) -> None:
+        """Evidence that fits the budget is rendered exactly as without one."""
+        prompt = build_user_prompt(representative_evidence, token_budget=10_000)
+
+        assert prompt == EXPECTED_REPRESENTATIVE_PROMPT
+
+    def test_budget_keeps_merged_work_and_counts_the_rest(
+        self, repository_metadata: RepositoryMetadata
+    ) -> None:
+        """A tight budget keeps merged PRs first and summarises the overflow."""
+        states = ("closed", "open", "merged")
+        evidence = RepositoryEvidenceBundle(
+            repository=repository_metadata,
+            window_start=dt.datetime(2024, 7, 1, tzinfo=dt.UTC),
+            window_end=dt.datetime(2024, 7, 8, tzinfo=dt.UTC),
+            pull_requests=tuple(
+                PullRequestEvidence(
+                    id=number,
+                    number=number,
+                    title=f"Change number {number} to the widget pipeline",
+                    state=states[number % 3],
+                )
+                for number in range(60)
+            ),
+            issues=tuple(
+                IssueEvidence(
+                    id=100 + number,
+                    number=100 + number,
+                    title=f"Investigate report {number} from the widget pipeline",
+                    state=states[number % 2],
+                )
+                for number in range(30)
+            ),
+        )
+
+        prompt = build_user_prompt(evidence, token_budget=600)
+
+        assert estimate_tokens(prompt) <= 600
+        assert "- Pull requests: 60" in prompt
+        pull_requests = prompt.split("## Pull Requests\n", 1)[1].splitlines()
+        assert pull_requests[0].endswith("[merged]")
+        assert re.search(r"- \.\.\. and \d+ more pull requests \(", prompt)
+        assert re.search(r"- \.\.\. and \d+ more issues \(", prompt)
+        assert prompt.endswith("following the schema in the system prompt.")
+
     def test_includes_activity_summary(
         self, repository_metadata: RepositoryMetadata
     ) -> None:
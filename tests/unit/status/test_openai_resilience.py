@@ -0,0 +1,222 @@
+"""Unit tests for OpenAI status model retries and circuit breaking."""
+
+from __future__ import annotations
+
+import typing as typ
+from http import HTTPStatus
+
+import httpx
+import pytest
+
+from ghillie.status.config import OpenAIStatusModelConfig
+from ghillie.status.errors import OpenAIAPIError
+from ghillie.status.openai_client import OpenAIStatusModel
+from ghillie.status.resilience import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitState,
+    RetryPolicy,
+)
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+_ENDPOINT = "http://test.local/v1/chat/completions"
+_COMPLETION = {
+    "choices": [
+        {"message": {"content": '{"status": "on_track", "summary": "ok"}'}},
+    ],
+}
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Recorder:
+    """Collects sleeps and resilience events instead of acting on them."""
+
+    def __init__(self) -> None:
+        self.sleeps: list[float] = []
+        self.retries: list[int] = []
+        self.states: list[CircuitState] = []
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+
+    def log_model_retry(
+        self, *, model: str, attempt: int, delay_s: float, error: BaseException
+    ) -> None:
+        self.retries.append(attempt)
+
+    def log_circuit_state_changed(
+        self, *, name: str, state: CircuitState, consecutive_failures: int
+    ) -> None:
+        self.states.append(state)
+
+
+def _model(
+    responses: cabc.Iterable[httpx.Response],
+    recorder: _Recorder,
+    *,
+    retry: RetryPolicy | None = None,
+    breaker: CircuitBreaker | None = None,
+) -> tuple[OpenAIStatusModel, list[httpx.Request]]:
+    """Build a model whose transport replays ``responses`` in order."""
+    pending = iter(responses)
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return next(pending)
+
+    config = OpenAIStatusModelConfig(
+        api_key="test-key", endpoint=_ENDPOINT, retry=retry or RetryPolicy()
+    )
+    model = OpenAIStatusModel(
+        config,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        circuit_breaker=breaker,
+        event_listener=recorder,
+        sleep=recorder.sleep,
+    )
+    return model, requests
+
+
+def _status(code: HTTPStatus, **headers: str) -> httpx.Response:
+    return httpx.Response(status_code=code, headers=headers, json={"error": {}})
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried_with_jittered_backoff() -> None:
+    """Server errors are retried within the exponential backoff ceilings."""
+    recorder = _Recorder()
+    model, requests = _model(
+        [
+            _status(HTTPStatus.BAD_GATEWAY),
+            _status(HTTPStatus.SERVICE_UNAVAILABLE),
+            httpx.Response(HTTPStatus.OK, json=_COMPLETION),
+        ],
+        recorder,
+        retry=RetryPolicy(max_attempts=3, base_delay_s=2.0),
+    )
+
+    content = await model._call_chat_completion("prompt")
+
+    assert "on_track" in content
+    assert len(requests) == 3
+    assert recorder.retries == [1, 2]
+    first, second = recorder.sleeps
+    assert 0 <= first <= 2.0
+    assert 0 <= second <= 4.0
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_waits_for_retry_after() -> None:
+    """A 429 waits exactly as long as the provider asked."""
+    recorder = _Recorder()
+    model, _ = _model(
+        [
+            _status(HTTPStatus.TOO_MANY_REQUESTS, **{"Retry-After": "7"}),
+            httpx.Response(HTTPStatus.OK, json=_COMPLETION),
+        ],
+        recorder,
+    )
+
+    await model._call_chat_completion("prompt")
+
+    assert recorder.sleeps == [7.0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("response", "policy"),
+    [
+        (_status(HTTPStatus.BAD_REQUEST), RetryPolicy()),
+        (
+            _status(HTTPStatus.TOO_MANY_REQUESTS, **{"Retry-After": "600"}),
+            RetryPolicy(max_retry_after_s=60),
+        ),
+    ],
+    ids=["client_error", "retry_after_too_long"],
+)
+async def test_unretryable_failures_raise_immediately(
+    response: httpx.Response, policy: RetryPolicy
+) -> None:
+    """Client errors and excessive Retry-After values are not retried."""
+    recorder = _Recorder()
+    model, requests = _model([response], recorder, retry=policy)
+
+    with pytest.raises(OpenAIAPIError):
+        await model._call_chat_completion("prompt")
+
+    assert len(requests) == 1
+    assert recorder.sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_fails_fast_until_a_trial_succeeds() -> None:
+    """Consecutive failures open the breaker; a later trial closes it."""
+    recorder = _Recorder()
+    clock = _Clock()
+    breaker = CircuitBreaker(
+        _ENDPOINT,
+        CircuitBreakerPolicy(failure_threshold=2, reset_timeout_s=30.0),
+        listener=recorder,
+        clock=clock,
+    )
+    model, requests = _model(
+        [
+            _status(HTTPStatus.BAD_GATEWAY),
+            _status(HTTPStatus.BAD_GATEWAY),
+            httpx.Response(HTTPStatus.OK, json=_COMPLETION),
+        ],
+        recorder,
+        retry=RetryPolicy(max_attempts=5),
+        breaker=breaker,
+    )
+
+    with pytest.raises(OpenAIAPIError, match="circuit breaker open"):
+        await model._call_chat_completion("prompt")
+    assert len(requests) == 2
+    assert breaker.state is CircuitState.OPEN
+
+    clock.now = 31.0
+    await model._call_chat_completion("prompt")
+
+    assert len(requests) == 3
+    assert recorder.states == [
+        CircuitState.OPEN,
+        CircuitState.HALF_OPEN,
+        CircuitState.CLOSED,
+    ]
+
+
+def test_failed_trial_reopens_the_breaker() -> None:
+    """A failure while half-open opens the breaker for another timeout."""
+    clock = _Clock()
+    breaker = CircuitBreaker(
+        "provider",
+        CircuitBreakerPolicy(failure_threshold=1, reset_timeout_s=10.0),
+        clock=clock,
+    )
+    breaker.record_failure()
+
+    clock.now = 10.0
+    breaker.before_call()
+    assert breaker.state is CircuitState.HALF_OPEN
+    with pytest.raises(OpenAIAPIError):
+        breaker.before_call()
+
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+    clock.now = 19.0
+    with pytest.raises(OpenAIAPIError):
+        breaker.before_call()
@@ -0,0 +1,156 @@
+"""Unit tests for streamed OpenAI chat completions."""
+
+from __future__ import annotations
+
+import json
+import typing as typ
+from http import HTTPStatus
+
+import httpx
+import pytest
+
+from ghillie.reporting.validation import check_partial_report
+from ghillie.status.config import OpenAIStatusModelConfig
+from ghillie.status.errors import StatusGenerationAbortedError
+from ghillie.status.openai_client import OpenAIStatusModel
+from ghillie.status.streaming import StreamAssembler, iter_sse_data
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from ghillie.status.streaming import StreamCheck
+
+
+def _event(content: str | None = None, usage: dict[str, int] | None = None) -> str:
+    """Render one SSE chunk carrying a content delta and/or usage."""
+    chunk: dict[str, object] = {
+        "choices": [] if content is None else [{"delta": {"content": content}}],
+    }
+    if usage is not None:
+        chunk["usage"] = usage
+    return f"data: {json.dumps(chunk)}\n\n"
+
+
+class _StreamingTransport(httpx.AsyncBaseTransport):
+    """Transport that streams the given events and counts those sent."""
+
+    def __init__(self, events: list[str]) -> None:
+        self._events = events
+        self.sent = 0
+        self.payload: dict[str, object] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.payload = json.loads(request.content)
+        return httpx.Response(HTTPStatus.OK, content=self._body())
+
+    async def _body(self) -> cabc.AsyncIterator[bytes]:
+        for event in self._events:
+            self.sent += 1
+            yield event.encode()
+
+
+def _model(
+    transport: httpx.AsyncBaseTransport,
+    *,
+    max_completion_chars: int | None = None,
+    stream_check: StreamCheck | None = check_partial_report,
+) -> OpenAIStatusModel:
+    config = OpenAIStatusModelConfig(
+        api_key="test-key",
+        endpoint="http://test.local/v1/chat/completions",
+        stream=True,
+        max_completion_chars=max_completion_chars,
+    )
+    return OpenAIStatusModel(
+        config,
+        http_client=httpx.AsyncClient(transport=transport),
+        stream_check=stream_check,
+    )
+
+
+@pytest.mark.asyncio
+async def test_sse_parser_joins_data_lines_and_stops_at_done() -> None:
+    """Multi-line payloads are joined; comments and [DONE] end cleanly."""
+
+    async def lines() -> cabc.AsyncIterator[str]:
+        for line in [": keep-alive", "", "data: {", "data: }", "", "data: [DONE]"]:
+            yield line
+        yield "data: never"
+
+    assert [payload async for payload in iter_sse_data(lines())] == ["{\n}"]
+
+
+def test_summary_is_found_across_fragment_boundaries() -> None:
+    """Keys, escapes, and closing quotes split between fragments are joined."""
+    content = '{"note": "summary", "summary" : "said \\"hi\\"", "risks": []}'
+    assembler = StreamAssembler()
+
+    summaries = [assembler.append(char).summary for char in content]
+
+    closing = content.index('", "risks"')
+    assert summaries[closing - 1] is None
+    assert summaries[closing] == 'said "hi"'
+    assert summaries[-1] == 'said "hi"'
+    assert assembler.content == content
+
+
+@pytest.mark.asyncio
+async def test_streamed_content_is_assembled_with_usage() -> None:
+    """Deltas are concatenated and final-chunk usage becomes the metrics."""
+    transport = _StreamingTransport(
+        [
+            _event('{"status": "on_track", '),
+            _event('"summary": "Healthy progress."}'),
+            _event(
+                usage={"prompt_tokens": 9, "completion_tokens": 4, "total_tokens": 13}
+            ),
+            "data: [DONE]\n\n",
+        ]
+    )
+    model = _model(transport)
+
+    content = await model._call_chat_completion("prompt")
+
+    assert json.loads(content)["summary"] == "Healthy progress."
+    assert transport.payload["stream"] is True
+    metrics = model.last_invocation_metrics
+    assert metrics is not None
+    assert metrics.total_tokens == 13
+
+
+@pytest.mark.asyncio
+async def test_empty_summary_aborts_before_generation_finishes() -> None:
+    """An empty summary stops the stream without reading further chunks."""
+    transport = _StreamingTransport(
+        [
+            _event('{"status": "on_track", "summary": ""'),
+            _event(', "highlights": ["never read"]'),
+            _event("}"),
+            "data: [DONE]\n\n",
+        ]
+    )
+    model = _model(transport)
+
+    with pytest.raises(StatusGenerationAbortedError) as excinfo:
+        await model._call_chat_completion("prompt")
+
+    assert excinfo.value.code == "empty_summary"
+    assert transport.sent < 4
+
+
+@pytest.mark.asyncio
+async def test_length_budget_aborts_long_completions() -> None:
+    """Output past the character budget is abandoned."""
+    transport = _StreamingTransport(
+        [
+            _event('{"status": "on_track", "summary": "'),
+            _event("x" * 100),
+            _event('"}'),
+        ]
+    )
+    model = _model(transport, max_completion_chars=64, stream_check=None)
+
+    with pytest.raises(StatusGenerationAbortedError) as excinfo:
+        await model._call_chat_completion("prompt")
+
+    assert excinfo.value.code == "length_budget_exceeded"
@@ -0,0 +1,181 @@
+"""Unit tests for the shared status model rate limiter."""
+
+from __future__ import annotations
+
+import typing as typ
+from http import HTTPStatus
+
+import httpx
+import pytest
+from sqlalchemy import select
+
+from ghillie.gold import StatusModelUsage
+from ghillie.status import (
+    MockStatusModel,
+    RateLimitBudget,
+    RateLimitedStatusModel,
+    SharedRateLimiter,
+    estimate_request_tokens,
+)
+from ghillie.status.config import OpenAIStatusModelConfig
+from ghillie.status.openai_client import OpenAIStatusModel
+from ghillie.status.resilience import RetryPolicy
+
+if typ.TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from ghillie.evidence.models import RepositoryEvidenceBundle
+
+
+class _WouldWaitError(Exception):
+    """Raised by the fake sleep instead of waiting for capacity."""
+
+
+async def _refuse_to_wait(seconds: float) -> None:
+    raise _WouldWaitError(seconds)
+
+
+def _limiter(
+    session_factory: async_sessionmaker[AsyncSession], budget: RateLimitBudget
+) -> SharedRateLimiter:
+    return SharedRateLimiter(session_factory, budget, sleep=_refuse_to_wait)
+
+
+@pytest.mark.asyncio
+async def test_requests_beyond_rpm_wait_for_the_window(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """A request over the RPM budget waits until the oldest leaves the window."""
+    limiter = _limiter(
+        session_factory, RateLimitBudget(requests_per_minute=2, headroom=1.0)
+    )
+
+    await limiter.acquire(1)
+    await limiter.acquire(1)
+    with pytest.raises(_WouldWaitError) as excinfo:
+        await limiter.acquire(1)
+
+    (wait,) = excinfo.value.args
+    assert 59 < wait <= 60
+
+
+@pytest.mark.asyncio
+async def test_processes_sharing_a_name_share_the_budget(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Separate limiter instances draw on one budget through the database."""
+    budget = RateLimitBudget(tokens_per_minute=1_000, headroom=1.0)
+    first = _limiter(session_factory, budget)
+    second = _limiter(session_factory, budget)
+
+    await first.acquire(600)
+
+    with pytest.raises(_WouldWaitError):
+        await second.acquire(600)
+    await SharedRateLimiter(
+        session_factory, budget, name="other-account", sleep=_refuse_to_wait
+    ).acquire(600)
+
+
+@pytest.mark.asyncio
+async def test_recorded_usage_releases_overestimated_tokens(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Correcting an estimate to actual usage frees budget for new requests."""
+    limiter = _limiter(
+        session_factory, RateLimitBudget(tokens_per_minute=1_000, headroom=1.0)
+    )
+    reservation = await limiter.acquire(900)
+
+    await limiter.record_usage(reservation, 100)
+
+    await limiter.acquire(900)
+
+
+@pytest.mark.asyncio
+async def test_oversized_request_runs_in_an_empty_window(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """A request larger than the whole budget is not blocked forever."""
+    limiter = _limiter(session_factory, RateLimitBudget(tokens_per_minute=100))
+
+    await limiter.acquire(10_000)
+
+    with pytest.raises(_WouldWaitError):
+        await limiter.acquire(1)
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_model_records_actual_usage(
+    session_factory: async_sessionmaker[AsyncSession],
+    feature_evidence: RepositoryEvidenceBundle,
+) -> None:
+    """The wrapper reserves an estimate, then records the model's usage."""
+    inner = MockStatusModel()
+    model = RateLimitedStatusModel(
+        inner,
+        _limiter(session_factory, RateLimitBudget(tokens_per_minute=1_000_000)),
+    )
+
+    result = await model.summarize_repository(feature_evidence)
+
+    assert result.summary
+    assert model.last_invocation_metrics is inner.last_invocation_metrics
+    assert estimate_request_tokens(model, feature_evidence) > 0
+    async with session_factory() as session:
+        tokens = list(await session.scalars(select(StatusModelUsage.tokens)))
+    assert tokens == [0]
+
+
+@pytest.mark.asyncio
+async def test_openai_model_meters_every_attempt(
+    session_factory: async_sessionmaker[AsyncSession],
+    feature_evidence: RepositoryEvidenceBundle,
+) -> None:
+    """A retried request reserves one request per attempt sent."""
+    responses = iter(
+        [
+            httpx.Response(HTTPStatus.SERVICE_UNAVAILABLE, json={"error": {}}),
+            httpx.Response(
+                HTTPStatus.OK,
+                json={
+                    "choices": [
+                        {
+                            "message": {
+                                "content": '{"status": "on_track", "summary": "ok"}'
+                            }
+                        },
+                    ],
+                    "usage": {"total_tokens": 42},
+                },
+            ),
+        ]
+    )
+
+    async def no_sleep(seconds: float) -> None:
+        pass
+
+    model = OpenAIStatusModel(
+        OpenAIStatusModelConfig(
+            api_key="test-key",
+            endpoint="http://test.local/v1/chat/completions",
+            retry=RetryPolicy(max_attempts=2),
+        ),
+        http_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda _request: next(responses))
+        ),
+        sleep=no_sleep,
+        rate_limiter=_limiter(
+            session_factory, RateLimitBudget(tokens_per_minute=1_000_000)
+        ),
+    )
+
+    await model.summarize_repository(feature_evidence)
+
+    async with session_factory() as session:
+        tokens = list(
+            await session.scalars(
+                select(StatusModelUsage.tokens).order_by(StatusModelUsage.id)
+            )
+        )
+    assert tokens == [42, 0]
@@ -0,0 +1,218 @@
+"""Unit tests for the persistent status model result cache."""
+
+from __future__ import annotations
+
+import dataclasses as dc
+import datetime as dt
+import typing as typ
+
+import msgspec
+import pytest
+
+from ghillie.evidence.models import PullRequestEvidence
+from ghillie.reporting.validation import is_valid_report
+from ghillie.status import (
+    CachingStatusModel,
+    HedgedStatusModel,
+    HedgingPolicy,
+    MockStatusModel,
+    OpenAIStatusModelConfig,
+    status_prompt_fingerprint,
+)
+from ghillie.status.errors import OpenAIAPIError
+
+if typ.TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from ghillie.evidence.models import RepositoryEvidenceBundle
+    from ghillie.status import RepositoryStatusResult
+
+
+class _CountingModel(MockStatusModel):
+    """Mock status model that counts invocations and exposes a config."""
+
+    def __init__(self, config: OpenAIStatusModelConfig | None = None) -> None:
+        super().__init__()
+        self.config = config or OpenAIStatusModelConfig(api_key="sk-test")
+        self.calls = 0
+
+    async def summarize_repository(
+        self, evidence: RepositoryEvidenceBundle
+    ) -> RepositoryStatusResult:
+        self.calls += 1
+        return await super().summarize_repository(evidence)
+
+
+@pytest.mark.asyncio
+async def test_identical_prompt_is_served_from_cache(
+    session_factory: async_sessionmaker[AsyncSession],
+    feature_evidence: RepositoryEvidenceBundle,
+) -> None:
+    """The second identical request is answered without calling the model."""
+    inner = _CountingModel()
+    model = CachingStatusModel(inner, session_factory)
+
+    first = await model.summarize_repository(feature_evidence)
+    assert model.last_invocation_metrics is not None
+    assert model.last_invocation_metrics.cache_misses == 1
+
+    # A rebuilt bundle differs only in generation time, which the prompt omits.
+    rebuilt = msgspec.structs.replace(
+        feature_evidence, generated_at=dt.datetime(2024, 8, 1, tzinfo=dt.UTC)
+    )
+    second = await model.summarize_repository(rebuilt)
+
+    assert second == first
+    assert inner.calls == 1
+    assert (model.hits, model.misses) == (1, 1)
+    metrics = model.last_invocation_metrics
+    assert metrics is not None
+    assert (metrics.cache_hits, metrics.cache_misses) == (1, 0)
+    assert metrics.total_tokens == 0
+
+
+class _FlakyModel(_CountingModel):
+    """Counting model whose first result has an empty summary."""
+
+    async def summarize_repository(
+        self, evidence: RepositoryEvidenceBundle
+    ) -> RepositoryStatusResult:
+        result = await super().summarize_repository(evidence)
+        if self.calls == 1:
+            return msgspec.structs.replace(result, summary="")
+        return result
+
+
+@pytest.mark.asyncio
+async def test_results_failing_validation_are_not_cached(
+    session_factory: async_sessionmaker[AsyncSession],
+    feature_evidence: RepositoryEvidenceBundle,
+) -> None:
+    """A rejected result is not stored, so the retry reaches the model."""
+    inner = _FlakyModel()
+    model = CachingStatusModel(inner, session_factory, accept=is_valid_report)
+
+    invalid = await model.summarize_repository(feature_evidence)
+    valid = await model.summarize_repository(feature_evidence)
+    cached = await model.summarize_repository(feature_evidence)
+
+    assert invalid.summary == ""
+    assert valid.summary
+    assert cached == valid
+    assert inner.calls == 2
+    assert (model.hits, model.misses) == (1, 2)
+
+
+class _FailsOnceModel(_CountingModel):
+    """Counting model whose first call times out."""
+
+    async def summarize_repository(
+        self, evidence: RepositoryEvidenceBundle
+    ) -> RepositoryStatusResult:
+        result = await super().summarize_repository(evidence)
+        if self.calls == 1:
+            raise OpenAIAPIError.timeout()
+        return result
+
+
+@pytest.mark.asyncio
+async def test_hedge_secondary_results_are_not_cached(
+    session_factory: async_sessionmaker[AsyncSession],
+    feature_evidence: RepositoryEvidenceBundle,
+) -> None:
+    """Only the primary's results are stored under the primary's fingerprint."""
+    primary, secondary = _FailsOnceModel(), _CountingModel()
+    model = CachingStatusModel(
+        HedgedStatusModel(
+            primary, secondary, policy=HedgingPolicy(initial_delay_s=3600.0)
+        ),
+        session_factory,
+    )
+
+    for _ in range(3):
+        await model.summarize_repository(feature_evidence)
+
+    assert (primary.calls, secondary.calls) == (2, 1)
+    assert (model.hits, model.misses) == (1, 2)
+
+
+def test_fingerprint_covers_parameters_but_not_credentials(
+    feature_evidence: RepositoryEvidenceBundle,
+) -> None:
+    """Generation parameters change the fingerprint; the API key does not."""
+    base = OpenAIStatusModelConfig(api_key="sk-one")
+
+    fingerprint = status_prompt_fingerprint(_CountingModel(base), feature_evidence)
+
+    assert fingerprint == status_prompt_fingerprint(
+        _CountingModel(dc.replace(base, api_key="sk-two", timeout_s=5.0)),
+        feature_evidence,
+    )
+    assert fingerprint != status_prompt_fingerprint(
+        _CountingModel(dc.replace(base, temperature=0.9)), feature_evidence
+    )
+    assert fingerprint != status_prompt_fingerprint(
+        _CountingModel(dc.replace(base, model="other-model")), feature_evidence
+    )
+
+
+def test_fingerprint_uses_the_budgeted_prompt(
+    feature_evidence: RepositoryEvidenceBundle,
+) -> None:
+    """Evidence only a budgeted prompt includes still changes the fingerprint."""
+    model = _CountingModel(
+        OpenAIStatusModelConfig(api_key="sk-test", prompt_token_budget=10_000)
+    )
+    pull_requests = tuple(
+        PullRequestEvidence(
+            id=number, number=number, title=f"Change {number}", state="merged"
+        )
+        for number in range(12)
+    )
+    bundle = msgspec.structs.replace(feature_evidence, pull_requests=pull_requests)
+    retitled = msgspec.structs.replace(
+        bundle,
+        pull_requests=(
+            *pull_requests[:-1],
+            msgspec.structs.replace(pull_requests[-1], title="Renamed change"),
+        ),
+    )
+
+    assert status_prompt_fingerprint(model, bundle) != status_prompt_fingerprint(
+        model, retitled
+    )
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_regenerated(
+    session_factory: async_sessionmaker[AsyncSession],
+    feature_evidence: RepositoryEvidenceBundle,
+) -> None:
+    """Results older than the TTL are not reused."""
+    inner = _CountingModel()
+    model = CachingStatusModel(inner, session_factory, ttl=dt.timedelta(0))
+
+    await model.summarize_repository(feature_evidence)
+    await model.summarize_repository(feature_evidence)
+
+    assert inner.calls == 2
+    assert model.hits == 0
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entries_are_evicted(
+    session_factory: async_sessionmaker[AsyncSession],
+    feature_evidence: RepositoryEvidenceBundle,
+    empty_evidence: RepositoryEvidenceBundle,
+) -> None:
+    """Entries beyond the size limit are dropped, oldest use first."""
+    inner = _CountingModel()
+    model = CachingStatusModel(inner, session_factory, max_entries=1)
+
+    await model.summarize_repository(feature_evidence)
+    await model.summarize_repository(empty_evidence)
+    await model.summarize_repository(empty_evidence)
+    await model.summarize_repository(feature_evidence)
+
+    assert inner.calls == 3
+    assert model.hits == 1
@@ -0,0 +1,166 @@
+"""Unit tests for hedged requests across status models."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import typing as typ
+
+import msgspec
+import pytest
+
+from ghillie.status import HedgedStatusModel, HedgingPolicy, MockStatusModel
+from ghillie.status.errors import OpenAIAPIError
+
+if typ.TYPE_CHECKING:
+    from ghillie.evidence.models import RepositoryEvidenceBundle
+    from ghillie.status import RepositoryStatusResult
+
+
+class _ScriptedModel(MockStatusModel):
+    """Mock status model that can stall, fail, or rename its summary."""
+
+    def __init__(
+        self,
+        *,
+        stall: bool = False,
+        error: Exception | None = None,
+        summary: str | None = None,
+        model_id: str | None = None,
+    ) -> None:
+        super().__init__()
+        self.model_id = model_id
+        self._stall = stall
+        self._error = error
+        self._summary = summary
+        self.calls = 0
+        self.cancelled = False
+
+    async def summarize_repository(
+        self, evidence: RepositoryEvidenceBundle
+    ) -> RepositoryStatusResult:
+        self.calls += 1
+        if self._stall:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+        if self._error is not None:
+            raise self._error
+        result = await super().summarize_repository(evidence)
+        if self._summary is None:
+            return result
+        return msgspec.structs.replace(result, summary=self._summary)
+
+
+def _hedged(
+    primary: _ScriptedModel,
+    secondary: _ScriptedModel,
+    *,
+    initial_delay_s: float = 3600.0,
+) -> HedgedStatusModel:
+    return HedgedStatusModel(
+        primary,
+        secondary,
+        policy=HedgingPolicy(initial_delay_s=initial_delay_s),
+        accept=lambda _evidence, result: bool(result.summary),
+    )
+
+
+@pytest.mark.asyncio
+async def test_prompt_primary_answers_without_hedging(
+    feature_evidence: RepositoryEvidenceBundle,
+) -> None:
+    """A primary answering before the delay is used; the secondary is idle."""
+    primary, secondary = _ScriptedModel(), _ScriptedModel()
+    model = _hedged(primary, secondary)
+
+    await model.summarize_repository(feature_evidence)
+
+    assert secondary.calls == 0
+    metrics = model.last_invocation_metrics
+    assert metrics is not None
+    assert (metrics.hedged, metrics.hedge_winner) == (False, "primary")
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_cancelled(
+    feature_evidence: RepositoryEvidenceBundle,
+) -> None:
+    """Past the delay the secondary is asked, wins, and the primary stops."""
+    primary = _ScriptedModel(stall=True, model_id="primary-model")
+    secondary = _ScriptedModel(model_id="secondary-model")
+    model = _hedged(primary, secondary, initial_delay_s=0.01)
+
+    async with asyncio.timeout(5):
+        await model.summarize_repository(feature_evidence)
+
+    assert primary.cancelled
+    metrics = model.last_invocation_metrics
+    assert metrics is not None
+    assert (metrics.hedged, metrics.hedge_winner) == (True, "secondary")
+    assert metrics.model_id == "secondary-model"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "primary",
+    [
+        pytest.param(_ScriptedModel(error=OpenAIAPIError.timeout()), id="failed"),
+        pytest.param(_ScriptedModel(summary=""), id="rejected"),
+    ],
+)
+async def test_unusable_primary_hedges_immediately(
+    primary: _ScriptedModel,
+    feature_evidence: RepositoryEvidenceBundle,
+) -> None:
+    """Failed or rejected primary results do not wait for the hedge delay."""
+    model = _hedged(primary, _ScriptedModel(summary="From the secondary."))
+
+    async with asyncio.timeout(5):
+        result = await model.summarize_repository(feature_evidence)
+
+    assert result.summary == "From the secondary."
+    metrics = model.last_invocation_metrics
+    assert metrics is not None
+    assert metrics.hedge_winner == "secondary"
+
+
+@pytest.mark.asyncio
+async def test_primary_error_is_raised_when_both_fail(
+    feature_evidence: RepositoryEvidenceBundle,
+) -> None:
+    """Without any result, the primary's error reaches the caller."""
+    model = _hedged(
+        _ScriptedModel(error=OpenAIAPIError.timeout()),
+        _ScriptedModel(error=OpenAIAPIError.network_error("refused")),
+    )
+
+    with pytest.raises(OpenAIAPIError, match="timed out"):
+        await model.summarize_repository(feature_evidence)
+
+
+@pytest.mark.asyncio
+async def test_delay_tracks_the_primary_latency_percentile(
+    feature_evidence: RepositoryEvidenceBundle,
+) -> None:
+    """Once enough latencies are seen, the delay is their percentile."""
+    # Each call reads the clock at its start and end: latencies 1, 2, 3, 4.
+    ticks = itertools.chain.from_iterable((0.0, float(n)) for n in range(1, 5))
+    model = HedgedStatusModel(
+        _ScriptedModel(),
+        _ScriptedModel(),
+        policy=HedgingPolicy(
+            percentile=50, initial_delay_s=9.0, sample_size=4, min_samples=4
+        ),
+        clock=lambda: next(ticks),
+    )
+
+    delays = []
+    for _ in range(4):
+        delays.append(model.hedge_delay_s)
+        await model.summarize_repository(feature_evidence)
+
+    assert delays == [9.0] * 4
+    assert model.hedge_delay_s == 2.0
@@ -175,3 +175,53 @@ def test_ingest_is_idempotent_under_concurrency(
 
     count = asyncio.run(_count_rows())
     assert count == 1
+
+
+def _envelope(source_event_id: str, occurred_at: dt.datetime) -> RawEventEnvelope:
+    return RawEventEnvelope(
+        source_system="github",
+        source_event_id=source_event_id,
+        event_type="github.commit",
+        repo_external_id="org/repo",
+        occurred_at=occurred_at,
+        payload={"sha": source_event_id},
+    )
+
+
+@pytest.mark.asyncio
+async def test_ingest_many_skips_existing_and_in_batch_duplicates(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Bulk ingestion inserts only events that are not already stored."""
+    writer = RawEventWriter(session_factory)
+    occurred_at = dt.datetime(2024, 6, 1, 8, 30, tzinfo=dt.UTC)
+    await writer.ingest(_envelope("sha-1", occurred_at))
+
+    inserted = await writer.ingest_many(
+        [
+            _envelope("sha-1", occurred_at),
+            _envelope("sha-2", occurred_at),
+            _envelope("sha-2", occurred_at),
+            _envelope("sha-3", occurred_at),
+        ]
+    )
+
+    assert inserted == 2
+    async with session_factory() as session:
+        count = await session.scalar(select(func.count()).select_from(RawEvent))
+        states = set((await session.scalars(select(RawEvent.transform_state))).all())
+    assert count == 3
+    assert states == {RawEventState.PENDING.value}
+
+
+@pytest.mark.asyncio
+async def test_ingest_many_rejects_naive_occurred_at(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Bulk ingestion validates every envelope before writing."""
+    writer = RawEventWriter(session_factory)
+
+    with pytest.raises(TimezoneAwareRequiredError):
+        await writer.ingest_many(
+            [_envelope("sha-1", dt.datetime(2024, 6, 1, 8, 30))]  # noqa: DTZ001
+        )
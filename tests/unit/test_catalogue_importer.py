@@ -142,6 +142,25 @@ def test_importer_allows_same_commit_per_estate(
     assert count == EXPECTED_IMPORT_RECORDS
 
 
+def test_importer_records_imports_without_commit_sha(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    importer = CatalogueImporter(session_factory, estate_key="demo")
+    catalogue = Path("examples/wildside-catalogue.yaml")
+
+    for _ in range(EXPECTED_IMPORT_RECORDS):
+        result = asyncio.run(importer.import_path(catalogue))
+        assert result.skipped is False, "imports without a SHA are never skipped"
+
+    async def _recorded_shas() -> list[str | None]:
+        async with session_factory() as session:
+            return list(await session.scalars(select(CatalogueImportRecord.commit_sha)))
+
+    assert asyncio.run(_recorded_shas()) == [None] * EXPECTED_IMPORT_RECORDS, (
+        "every applied import should append an audit record"
+    )
+
+
 def test_importer_rolls_back_on_invalid_catalogue(
     session_factory: async_sessionmaker[AsyncSession], tmp_path: Path
 ) -> None:
@@ -0,0 +1,270 @@
+"""Unit tests for memory-bounded evidence bundles."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import typing as typ
+
+import msgspec
+import pytest
+from sqlalchemy import select
+
+from ghillie.bronze import RawEventWriter
+from ghillie.evidence import (
+    BundleLimits,
+    BundleTruncation,
+    EvidenceBundleService,
+    RollingBundleMaintainer,
+)
+from ghillie.evidence import service as evidence_service
+from ghillie.evidence.bounded import BoundedEvidenceLoader
+from ghillie.silver import RawEventTransformer, Repository
+from ghillie.status.prompts import build_user_prompt
+from tests.helpers.event_builders import (
+    DocChangeEventSpec,
+    IssueEventSpec,
+    PREventSpec,
+    commit_envelope,
+)
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from sqlalchemy import ColumnElement
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from ghillie.evidence import RepositoryEvidenceBundle
+    from ghillie.evidence.rolling import WindowEvidence
+
+_REPO_SLUG = "octo/reef"
+_WINDOW_START = dt.datetime(2024, 7, 1, tzinfo=dt.UTC)
+_WINDOW_END = dt.datetime(2024, 7, 8, tzinfo=dt.UTC)
+
+
+def _day(day: int) -> dt.datetime:
+    return dt.datetime(2024, 7, day, tzinfo=dt.UTC)
+
+
+def _comparable(bundle: RepositoryEvidenceBundle) -> RepositoryEvidenceBundle:
+    """Blank the generation timestamp so bundles can be compared."""
+    return msgspec.structs.replace(bundle, generated_at=None)
+
+
+async def _ingest_window(session_factory: async_sessionmaker[AsyncSession]) -> str:
+    """Ingest several items of every kind and return the repository ID."""
+    writer = RawEventWriter(session_factory)
+    await writer.ingest(commit_envelope(_REPO_SLUG, "aaa111", _day(2), "feat: add"))
+    await writer.ingest(commit_envelope(_REPO_SLUG, "bbb222", _day(3), "fix: crash"))
+    await writer.ingest(
+        commit_envelope(_REPO_SLUG, "ccc333", _day(4), "Merge pull request #7")
+    )
+    await writer.ingest(
+        PREventSpec(
+            repo_slug=_REPO_SLUG,
+            pr_id=501,
+            pr_number=7,
+            created_at=_day(2),
+            title="fix: resolve bug",
+            state="closed",
+            labels=("bug",),
+            merged_at=_day(4),
+        ).build()
+    )
+    await writer.ingest(
+        PREventSpec(
+            repo_slug=_REPO_SLUG,
+            pr_id=502,
+            pr_number=8,
+            created_at=_day(5),
+            title="feat: new widget",
+        ).build()
+    )
+    for issue_id, number, state in ((601, 9, "open"), (602, 10, "closed")):
+        await writer.ingest(
+            IssueEventSpec(
+                repo_slug=_REPO_SLUG,
+                issue_id=issue_id,
+                issue_number=number,
+                created_at=_day(number - 6),
+                title=f"Issue {number}",
+                state=state,
+                labels=("bug",),
+            ).build()
+        )
+    for path, day, is_roadmap in (
+        ("docs/roadmap.md", 2, True),
+        ("docs/guide.md", 3, False),
+    ):
+        await writer.ingest(
+            DocChangeEventSpec(
+                repo_slug=_REPO_SLUG,
+                commit_sha="aaa111",
+                path=path,
+                occurred_at=_day(day),
+                is_roadmap=is_roadmap,
+            ).build()
+        )
+    await RawEventTransformer(
+        session_factory, observers=[RollingBundleMaintainer()]
+    ).process_pending()
+    async with session_factory() as session:
+        repo_id = await session.scalar(select(Repository.id))
+    assert repo_id is not None
+    return repo_id
+
+
+@pytest.mark.asyncio
+async def test_bounded_bundle_matches_unbounded_within_limits(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Limits above the window's size leave the bundle unchanged."""
+    repo_id = await _ingest_window(session_factory)
+
+    bounded = await EvidenceBundleService(
+        session_factory, limits=BundleLimits()
+    ).build_bundle(repo_id, _WINDOW_START, _WINDOW_END)
+    full = await EvidenceBundleService(session_factory).build_bundle(
+        repo_id, _WINDOW_START, _WINDOW_END
+    )
+
+    assert not bounded.is_truncated
+    assert _comparable(bounded) == _comparable(full)
+
+
+@pytest.mark.asyncio
+async def test_bounded_bundle_keeps_most_significant_items(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Over-limit windows keep top items and record full totals."""
+    repo_id = await _ingest_window(session_factory)
+    limits = BundleLimits.uniform(1)
+
+    bounded = await EvidenceBundleService(session_factory, limits=limits).build_bundle(
+        repo_id, _WINDOW_START, _WINDOW_END
+    )
+    full = await EvidenceBundleService(session_factory).build_bundle(
+        repo_id, _WINDOW_START, _WINDOW_END
+    )
+
+    assert [c.sha for c in bounded.commits] == ["bbb222"]
+    assert [pr.id for pr in bounded.pull_requests] == [501]
+    assert [issue.id for issue in bounded.issues] == [601]
+    assert [doc.path for doc in bounded.documentation_changes] == ["docs/roadmap.md"]
+    assert bounded.truncation == BundleTruncation(
+        limits=limits,
+        commit_count=3,
+        pull_request_count=2,
+        issue_count=2,
+        documentation_change_count=2,
+    )
+    assert bounded.total_event_count == full.total_event_count
+    assert bounded.work_type_groupings == full.work_type_groupings
+    assert bounded.event_fact_ids == full.event_fact_ids
+
+
+@pytest.mark.asyncio
+async def test_rolling_bundle_truncates_like_bounded_rebuild(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Rolling state is cut to the limits in the same significance order."""
+    repo_id = await _ingest_window(session_factory)
+    limits = BundleLimits.uniform(1)
+
+    rolling = await EvidenceBundleService(
+        session_factory, rolling_state=True, limits=limits
+    ).build_bundle(repo_id, _WINDOW_START, _WINDOW_END)
+    rebuilt = await EvidenceBundleService(session_factory, limits=limits).build_bundle(
+        repo_id, _WINDOW_START, _WINDOW_END
+    )
+
+    assert _comparable(rolling) == _comparable(rebuilt)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("rolling_state", [False, True], ids=["rebuild", "rolling"])
+async def test_batched_limited_bundle_matches_single_build(
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    rolling_state: bool,
+) -> None:
+    """Limited bundles from ``build_bundles`` equal those of ``build_bundle``."""
+    repo_id = await _ingest_window(session_factory)
+    service = EvidenceBundleService(
+        session_factory,
+        rolling_state=rolling_state,
+        limits=BundleLimits.uniform(1),
+    )
+
+    [batched] = await service.build_bundles([repo_id], [(_WINDOW_START, _WINDOW_END)])
+    single = await service.build_bundle(repo_id, _WINDOW_START, _WINDOW_END)
+
+    assert batched.is_truncated
+    assert _comparable(batched) == _comparable(single)
+
+
+@pytest.mark.asyncio
+async def test_batched_limited_bundles_load_concurrently_under_bound(
+    session_factory: async_sessionmaker[AsyncSession],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Bounded loaders overlap up to the bound and keep the request order."""
+    repo_id = await _ingest_window(session_factory)
+    writer = RawEventWriter(session_factory)
+    for slug in ("octo/kelp", "octo/shoal"):
+        await writer.ingest(commit_envelope(slug, f"{slug[-4:]}1", _day(3)))
+    await RawEventTransformer(session_factory).process_pending()
+    async with session_factory() as session:
+        others = list(
+            await session.scalars(
+                select(Repository.id)
+                .where(Repository.id != repo_id)
+                .order_by(Repository.github_name)
+            )
+        )
+    repository_ids = [*others, repo_id]
+    monkeypatch.setattr(evidence_service, "_BOUNDED_LOADER_CONCURRENCY", 2)
+    running = peak = 0
+    load = BoundedEvidenceLoader.load
+
+    async def tracked_load(
+        self: BoundedEvidenceLoader,
+        repository_id: str,
+        fact_conditions: cabc.Sequence[ColumnElement[bool]],
+    ) -> WindowEvidence:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            await asyncio.sleep(0)
+            return await load(self, repository_id, fact_conditions)
+        finally:
+            running -= 1
+
+    monkeypatch.setattr(BoundedEvidenceLoader, "load", tracked_load)
+    service = EvidenceBundleService(session_factory, limits=BundleLimits.uniform(1))
+
+    bundles = await service.build_bundles(
+        repository_ids, [(_WINDOW_START, _WINDOW_END)] * len(repository_ids)
+    )
+
+    assert [bundle.repository.id for bundle in bundles] == repository_ids
+    assert peak == 2
+    assert bundles[-1].is_truncated
+
+
+@pytest.mark.asyncio
+async def test_prompt_reports_window_totals_for_truncated_bundle(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """The prompt counts the whole window and flags the truncated lists."""
+    repo_id = await _ingest_window(session_factory)
+
+    bundle = await EvidenceBundleService(
+        session_factory, limits=BundleLimits.uniform(1)
+    ).build_bundle(repo_id, _WINDOW_START, _WINDOW_END)
+    prompt = build_user_prompt(bundle)
+
+    assert "- Commits: 3" in prompt
+    assert "- Pull requests: 2" in prompt
+    assert "most significant of a larger window" in prompt
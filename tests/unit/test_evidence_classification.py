@@ -9,6 +9,8 @@ from ghillie.evidence import (
     classify_by_title,
     classify_commit,
     classify_entity,
+    classify_many,
+    compile_classification,
     is_merge_commit,
 )
 
@@ -244,3 +246,59 @@ class TestIsMergeCommit:
         commit.message = None
 
         assert is_merge_commit(commit) is False
+
+
+class TestCompiledClassification:
+    """Tests for the single-pass compiled classifier and batch API."""
+
+    def test_general_patterns_follow_precedence_not_position(self) -> None:
+        # The refactor match comes first in the title, but bug outranks it.
+        assert classify_by_title("cleanup leftovers and fixes typos") == WorkType.BUG
+
+    def test_prefix_patterns_outrank_general_patterns(self) -> None:
+        assert classify_by_title("ci: fix flaky job") == WorkType.CHORE
+
+    def test_prefix_patterns_only_match_at_start(self) -> None:
+        assert classify_by_title("please add feat: support") is None
+
+    def test_general_patterns_match_on_later_lines(self) -> None:
+        assert classify_by_title("Tidy module\n\nFixes #12") == WorkType.BUG
+
+    def test_shared_label_uses_highest_precedence(self) -> None:
+        config = ClassificationConfig(
+            feature_labels=("triage",), chore_labels=("triage",)
+        )
+
+        assert compile_classification(config).by_labels(["Triage "]) == (
+            WorkType.FEATURE
+        )
+
+    def test_compilation_is_cached_per_config(self) -> None:
+        config = ClassificationConfig(bug_labels=("oops",))
+
+        assert compile_classification(config) is compile_classification(config)
+
+    def test_classify_many_matches_entity_classification(self) -> None:
+        items = [
+            (["bug"], "feat: add thing"),
+            ([], "refactor: tidy"),
+            (["docs"], None),
+            ([], "Update README"),
+        ]
+        entities = []
+        for labels, title in items:
+            entity = mock.MagicMock()
+            entity.labels = labels
+            entity.title = title
+            entities.append(entity)
+
+        assert classify_many(
+            [title for _, title in items], [labels for labels, _ in items]
+        ) == [classify_entity(entity) for entity in entities]
+
+    def test_classify_many_without_labels_classifies_messages(self) -> None:
+        assert classify_many(["fix: crash", None, "bump deps"]) == [
+            WorkType.BUG,
+            WorkType.UNKNOWN,
+            WorkType.CHORE,
+        ]
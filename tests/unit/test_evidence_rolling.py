@@ -0,0 +1,304 @@
+"""Unit tests for incrementally maintained rolling evidence state."""
+
+from __future__ import annotations
+
+import dataclasses as dc
+import datetime as dt
+import typing as typ
+
+import msgspec
+import pytest
+from sqlalchemy import func, select
+
+from ghillie.bronze import RawEventWriter
+from ghillie.evidence import EvidenceBundleService, RollingBundleMaintainer
+from ghillie.evidence.rolling import prune_rolling_state
+from ghillie.evidence.storage import RollingEvidenceEntry, RollingEvidenceFact
+from ghillie.gold import Report, ReportScope, record_repository_coverage
+from ghillie.reporting.config import ReportingConfig
+from ghillie.reporting.service import ReportingService, ReportingServiceDependencies
+from ghillie.silver import EventFact, RawEventTransformer, Repository
+from ghillie.status import MockStatusModel
+from tests.helpers.event_builders import (
+    DocChangeEventSpec,
+    IssueEventSpec,
+    PREventSpec,
+    commit_envelope,
+)
+
+if typ.TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from ghillie.evidence import RepositoryEvidenceBundle
+
+_REPO_SLUG = "octo/reef"
+_WINDOW_START = dt.datetime(2024, 7, 1, tzinfo=dt.UTC)
+_WINDOW_END = dt.datetime(2024, 7, 8, tzinfo=dt.UTC)
+
+
+def _comparable(bundle: RepositoryEvidenceBundle) -> RepositoryEvidenceBundle:
+    """Blank the generation timestamp so bundles can be compared."""
+    return msgspec.structs.replace(bundle, generated_at=None)
+
+
+async def _repo_id(session_factory: async_sessionmaker[AsyncSession]) -> str:
+    async with session_factory() as session:
+        repo_id = await session.scalar(select(Repository.id))
+    assert repo_id is not None
+    return repo_id
+
+
+async def _ingest_window(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> RawEventTransformer:
+    """Ingest one event of every kind and transform with rolling state."""
+    writer = RawEventWriter(session_factory)
+    day = dt.datetime(2024, 7, 3, tzinfo=dt.UTC)
+    await writer.ingest(commit_envelope(_REPO_SLUG, "abc123", day, "feat: add"))
+    await writer.ingest(
+        PREventSpec(
+            repo_slug=_REPO_SLUG,
+            pr_id=101,
+            pr_number=7,
+            created_at=day,
+            title="fix: resolve bug",
+            labels=("bug",),
+        ).build()
+    )
+    await writer.ingest(
+        IssueEventSpec(
+            repo_slug=_REPO_SLUG,
+            issue_id=202,
+            issue_number=9,
+            created_at=day,
+            title="Feature request",
+            labels=("enhancement",),
+        ).build()
+    )
+    await writer.ingest(
+        DocChangeEventSpec(
+            repo_slug=_REPO_SLUG,
+            commit_sha="abc123",
+            path="docs/roadmap.md",
+            occurred_at=day,
+            is_roadmap=True,
+        ).build()
+    )
+    transformer = RawEventTransformer(
+        session_factory, observers=[RollingBundleMaintainer()]
+    )
+    await transformer.process_pending()
+    return transformer
+
+
+@pytest.mark.asyncio
+async def test_rolling_bundle_matches_full_rebuild(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Bundles read from rolling state equal a rebuild from Silver."""
+    await _ingest_window(session_factory)
+    repo_id = await _repo_id(session_factory)
+    service = EvidenceBundleService(session_factory, rolling_state=True)
+
+    rolling = await service.build_bundle(repo_id, _WINDOW_START, _WINDOW_END)
+    rebuilt = await service.rebuild_bundle(repo_id, _WINDOW_START, _WINDOW_END)
+
+    assert len(rolling.commits) == 1
+    assert len(rolling.pull_requests) == 1
+    assert len(rolling.issues) == 1
+    assert len(rolling.documentation_changes) == 1
+    assert _comparable(rolling) == _comparable(rebuilt)
+
+
+@pytest.mark.asyncio
+async def test_batched_rolling_bundles_match_single_builds(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """One rolling state query serves every repository of a batch."""
+    transformer = await _ingest_window(session_factory)
+    await RawEventWriter(session_factory).ingest(
+        commit_envelope(
+            "octo/kelp", "kelp1", dt.datetime(2024, 7, 4, tzinfo=dt.UTC), "fix: leak"
+        )
+    )
+    await transformer.process_pending()
+    async with session_factory() as session:
+        repo_ids = list(
+            await session.scalars(
+                select(Repository.id).order_by(Repository.github_name)
+            )
+        )
+    service = EvidenceBundleService(session_factory, rolling_state=True)
+
+    batched = await service.build_bundles(
+        repo_ids, [(_WINDOW_START, _WINDOW_END)] * len(repo_ids)
+    )
+    single = [
+        await service.build_bundle(repo_id, _WINDOW_START, _WINDOW_END)
+        for repo_id in repo_ids
+    ]
+
+    assert [bundle.total_event_count for bundle in batched] == [1, 4]
+    assert [_comparable(bundle) for bundle in batched] == [
+        _comparable(bundle) for bundle in single
+    ]
+
+
+@pytest.mark.asyncio
+async def test_entity_update_refreshes_rolling_entry(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """A later pull request event replaces the stored evidence."""
+    transformer = await _ingest_window(session_factory)
+    merged_at = dt.datetime(2024, 7, 4, tzinfo=dt.UTC)
+    update = PREventSpec(
+        repo_slug=_REPO_SLUG,
+        pr_id=101,
+        pr_number=7,
+        created_at=dt.datetime(2024, 7, 3, tzinfo=dt.UTC),
+        title="fix: resolve bug",
+        state="closed",
+        labels=("bug",),
+        merged_at=merged_at,
+    ).build()
+    await RawEventWriter(session_factory).ingest(
+        dc.replace(update, source_event_id="pr-101-merged", occurred_at=merged_at)
+    )
+    await transformer.process_pending()
+    repo_id = await _repo_id(session_factory)
+
+    bundle = await EvidenceBundleService(
+        session_factory, rolling_state=True
+    ).build_bundle(repo_id, _WINDOW_START, _WINDOW_END)
+
+    assert len(bundle.pull_requests) == 1
+    assert bundle.pull_requests[0].state == "closed"
+    assert bundle.pull_requests[0].merged_at == merged_at
+
+
+@pytest.mark.asyncio
+async def test_report_coverage_prunes_rolling_state(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Covered facts and their orphaned entries leave the rolling state."""
+    await _ingest_window(session_factory)
+    repo_id = await _repo_id(session_factory)
+    async with session_factory() as session, session.begin():
+        fact_ids = list(await session.scalars(select(EventFact.id)))
+        report = Report(
+            scope=ReportScope.REPOSITORY,
+            repository_id=repo_id,
+            window_start=_WINDOW_START,
+            window_end=_WINDOW_END,
+        )
+        session.add(report)
+        await session.flush()
+        await record_repository_coverage(
+            session,
+            report_id=report.id,
+            repository_id=repo_id,
+            repo_external_id=_REPO_SLUG,
+            event_fact_ids=fact_ids,
+        )
+        await prune_rolling_state(
+            session,
+            repository_id=repo_id,
+            repo_external_id=_REPO_SLUG,
+            window_end=_WINDOW_END,
+        )
+
+    async with session_factory() as session:
+        facts = await session.scalar(
+            select(func.count(RollingEvidenceFact.event_fact_id))
+        )
+        entries = await session.scalar(select(func.count(RollingEvidenceEntry.id)))
+    assert facts == 0
+    assert entries == 0
+
+
+@pytest.mark.asyncio
+async def test_prune_drops_uncovered_facts_before_window_end(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Facts no later window can read leave the state even when uncovered."""
+    await _ingest_window(session_factory)
+    repo_id = await _repo_id(session_factory)
+    late = dt.datetime(2024, 7, 10, tzinfo=dt.UTC)
+    await RawEventWriter(session_factory).ingest(
+        commit_envelope(_REPO_SLUG, "def456", late, "fix: after the window")
+    )
+    await RawEventTransformer(
+        session_factory, observers=[RollingBundleMaintainer()]
+    ).process_pending()
+
+    async with session_factory() as session, session.begin():
+        await prune_rolling_state(
+            session,
+            repository_id=repo_id,
+            repo_external_id=_REPO_SLUG,
+            window_end=_WINDOW_END,
+        )
+
+    async with session_factory() as session:
+        remaining = list(await session.scalars(select(RollingEvidenceFact.occurred_at)))
+        entries = list(await session.scalars(select(RollingEvidenceEntry.entity_key)))
+    assert remaining == [late]
+    assert entries == ["def456"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("rolling_state", "remaining"), [(True, 0), (False, 4)], ids=["rolling", "rebuild"]
+)
+async def test_reporting_prunes_only_when_rolling_state_is_read(
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    rolling_state: bool,
+    remaining: int,
+) -> None:
+    """Reports leave rolling state alone unless bundles are read from it."""
+    await _ingest_window(session_factory)
+    repo_id = await _repo_id(session_factory)
+    service = ReportingService(
+        ReportingServiceDependencies(
+            session_factory=session_factory,
+            evidence_service=EvidenceBundleService(
+                session_factory, rolling_state=rolling_state
+            ),
+            status_model=MockStatusModel(),
+        ),
+        config=ReportingConfig(),
+    )
+
+    await service.generate_report(
+        repository_id=repo_id, window_start=_WINDOW_START, window_end=_WINDOW_END
+    )
+
+    async with session_factory() as session:
+        facts = await session.scalar(
+            select(func.count(RollingEvidenceFact.event_fact_id))
+        )
+    assert facts == remaining
+
+
+@pytest.mark.asyncio
+async def test_rebuild_repopulates_state_from_silver(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """State ingested without the observer is recovered by a rebuild."""
+    writer = RawEventWriter(session_factory)
+    day = dt.datetime(2024, 7, 3, tzinfo=dt.UTC)
+    await writer.ingest(commit_envelope(_REPO_SLUG, "abc123", day, "feat: add"))
+    await RawEventTransformer(session_factory).process_pending()
+    repo_id = await _repo_id(session_factory)
+
+    async with session_factory() as session, session.begin():
+        replayed = await RollingBundleMaintainer().rebuild(
+            session, repository_id=repo_id, repo_external_id=_REPO_SLUG
+        )
+    bundle = await EvidenceBundleService(
+        session_factory, rolling_state=True
+    ).build_bundle(repo_id, _WINDOW_START, _WINDOW_END)
+
+    assert replayed == 1
+    assert [commit.sha for commit in bundle.commits] == ["abc123"]
@@ -6,7 +6,9 @@ import dataclasses as dc
 import datetime as dt
 import typing as typ
 
+import msgspec
 import pytest
+from sqlalchemy import event
 
 from ghillie.bronze import RawEventWriter
 from ghillie.evidence import (
@@ -15,7 +17,13 @@ from ghillie.evidence import (
     WorkType,
 )
 from ghillie.gold import Report, ReportCoverage, ReportProject, ReportScope
-from ghillie.silver import EventFact, RawEventTransformer, Repository
+from ghillie.silver import (
+    Commit,
+    EventFact,
+    Issue,
+    RawEventTransformer,
+    Repository,
+)
 from tests.helpers.event_builders import (
     DocChangeEventSpec,
     IssueEventSpec,
@@ -831,3 +839,186 @@ class TestEvidenceBundleServiceBuildBundle:
 
         assert bundle.generated_at is not None
         assert before <= bundle.generated_at <= after
+
+    @pytest.mark.asyncio
+    async def test_fetches_entities_on_separate_sessions(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        evidence_service_stack: EvidenceServiceStack,
+    ) -> None:
+        """Entity lookups run on their own sessions, skipping empty kinds."""
+        writer, transformer, _service = evidence_service_stack
+
+        repo_slug = "octo/reef"
+        event_time = dt.datetime(2024, 7, 5, tzinfo=dt.UTC)
+        await writer.ingest(commit_envelope(repo_slug, "abc123", event_time))
+        await writer.ingest(
+            PREventSpec(
+                repo_slug=repo_slug,
+                pr_id=100,
+                pr_number=10,
+                created_at=event_time,
+                title="Add feature",
+            ).build()
+        )
+        await transformer.process_pending()
+        repo_id = await get_repo_id(session_factory)
+
+        opened: list[AsyncSession] = []
+
+        def counting_factory() -> AsyncSession:
+            session = session_factory()
+            opened.append(session)
+            return session
+
+        service = EvidenceBundleService(
+            typ.cast("async_sessionmaker[AsyncSession]", counting_factory)
+        )
+        bundle = await service.build_bundle(
+            repo_id,
+            dt.datetime(2024, 7, 1, tzinfo=dt.UTC),
+            dt.datetime(2024, 7, 8, tzinfo=dt.UTC),
+        )
+
+        assert [commit.sha for commit in bundle.commits] == ["abc123"]
+        assert [pr.number for pr in bundle.pull_requests] == [10]
+        assert len(opened) == 3
+
+    @pytest.mark.asyncio
+    async def test_builds_evidence_without_loading_entities(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        evidence_service_stack: EvidenceServiceStack,
+    ) -> None:
+        """Evidence is built from column rows without loading ORM instances."""
+        writer, transformer, _service = evidence_service_stack
+
+        repo_slug = "octo/reef"
+        event_time = dt.datetime(2024, 7, 5, tzinfo=dt.UTC)
+        await writer.ingest(commit_envelope(repo_slug, "abc123", event_time))
+        await writer.ingest(
+            IssueEventSpec(
+                repo_slug=repo_slug,
+                issue_id=200,
+                issue_number=20,
+                created_at=event_time,
+                labels=("bug",),
+            ).build()
+        )
+        await transformer.process_pending()
+        repo_id = await get_repo_id(session_factory)
+
+        loaded: list[object] = []
+
+        def record_load(target: object, _context: object) -> None:
+            loaded.append(target)
+
+        for entity in (Commit, Issue):
+            event.listen(entity, "load", record_load)
+        try:
+            bundle = await EvidenceBundleService(session_factory).build_bundle(
+                repo_id,
+                dt.datetime(2024, 7, 1, tzinfo=dt.UTC),
+                dt.datetime(2024, 7, 8, tzinfo=dt.UTC),
+            )
+        finally:
+            for entity in (Commit, Issue):
+                event.remove(entity, "load", record_load)
+
+        assert [commit.sha for commit in bundle.commits] == ["abc123"]
+        assert [issue.work_type for issue in bundle.issues] == [WorkType.BUG]
+        assert loaded == []
+
+
+class TestEvidenceBundleServiceBuildBundles:
+    """Tests for the set-based EvidenceBundleService.build_bundles."""
+
+    @pytest.mark.asyncio
+    async def test_matches_per_repository_bundles(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        evidence_service_stack: EvidenceServiceStack,
+    ) -> None:
+        """Each batched bundle equals the bundle built for its repository."""
+        from sqlalchemy import select
+
+        writer, transformer, service = evidence_service_stack
+        event_time = dt.datetime(2024, 7, 10, tzinfo=dt.UTC)
+        for slug, sha, pr_id in (
+            ("octo/reef", "reef1", 501),
+            ("octo/kelp", "kelp1", 502),
+        ):
+            await writer.ingest(commit_envelope(slug, sha, event_time, "fix: bug"))
+            await writer.ingest(
+                PREventSpec(
+                    repo_slug=slug,
+                    pr_id=pr_id,
+                    pr_number=1,
+                    created_at=event_time,
+                    title="Add feature",
+                ).build()
+            )
+        await writer.ingest(
+            commit_envelope(
+                "octo/kelp", "kelp0", dt.datetime(2024, 7, 3, tzinfo=dt.UTC)
+            )
+        )
+        await transformer.process_pending()
+
+        async with session_factory() as session:
+            repos = {
+                repo.github_name: repo.id
+                for repo in await session.scalars(select(Repository))
+            }
+            session.add(
+                Report(
+                    scope=ReportScope.REPOSITORY,
+                    repository_id=repos["reef"],
+                    window_start=dt.datetime(2024, 7, 1, tzinfo=dt.UTC),
+                    window_end=dt.datetime(2024, 7, 8, tzinfo=dt.UTC),
+                    machine_summary={"status": "on_track"},
+                )
+            )
+            await session.commit()
+
+        repository_ids = [repos["reef"], repos["kelp"]]
+        windows = [
+            (
+                dt.datetime(2024, 7, 8, tzinfo=dt.UTC),
+                dt.datetime(2024, 7, 15, tzinfo=dt.UTC),
+            ),
+            (
+                dt.datetime(2024, 7, 1, tzinfo=dt.UTC),
+                dt.datetime(2024, 7, 15, tzinfo=dt.UTC),
+            ),
+        ]
+        batched = await service.build_bundles(repository_ids, windows)
+        single = [
+            await service.build_bundle(repo_id, start, end)
+            for repo_id, (start, end) in zip(repository_ids, windows, strict=True)
+        ]
+
+        assert [bundle.repository.id for bundle in batched] == repository_ids
+        assert [bundle.total_event_count for bundle in batched] == [2, 3]
+        assert len(batched[0].previous_reports) == 1
+        for got, expected in zip(batched, single, strict=True):
+            assert msgspec.structs.replace(
+                got, generated_at=None
+            ) == msgspec.structs.replace(expected, generated_at=None)
+
+    @pytest.mark.asyncio
+    async def test_rejects_mismatched_and_missing_repositories(
+        self,
+        evidence_service_stack: EvidenceServiceStack,
+    ) -> None:
+        """Windows must pair with repositories, which must exist."""
+        _writer, _transformer, service = evidence_service_stack
+        window = (
+            dt.datetime(2024, 7, 1, tzinfo=dt.UTC),
+            dt.datetime(2024, 7, 8, tzinfo=dt.UTC),
+        )
+
+        with pytest.raises(ValueError, match="one window per repository"):
+            await service.build_bundles(["a", "b"], [window])
+        with pytest.raises(ValueError, match="Repository not found: nonexistent-id"):
+            await service.build_bundles(["nonexistent-id"], [window])
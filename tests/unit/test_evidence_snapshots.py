@@ -0,0 +1,148 @@
+"""Unit tests for evidence bundle snapshots stored with reports."""
+
+from __future__ import annotations
+
+import datetime as dt
+import typing as typ
+
+import pytest
+
+from ghillie.evidence import (
+    BundleLimits,
+    BundleTruncation,
+    CommitEvidence,
+    PullRequestEvidence,
+    RepositoryEvidenceBundle,
+    RepositoryMetadata,
+    WorkType,
+    WorkTypeGrouping,
+    decode_bundle_snapshot,
+    encode_bundle_snapshot,
+)
+from ghillie.reporting.config import ReportingConfig
+from ghillie.reporting.service import ReportingService, ReportingServiceDependencies
+from ghillie.status import MockStatusModel
+
+if typ.TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from ghillie.evidence import EvidenceBundleService
+    from ghillie.gold import Report
+
+
+def _bundle() -> RepositoryEvidenceBundle:
+    day = dt.datetime(2024, 7, 3, tzinfo=dt.UTC)
+    return RepositoryEvidenceBundle(
+        repository=RepositoryMetadata(
+            id="repo-1", owner="octo", name="reef", default_branch="main"
+        ),
+        window_start=dt.datetime(2024, 7, 1, tzinfo=dt.UTC),
+        window_end=dt.datetime(2024, 7, 8, tzinfo=dt.UTC),
+        commits=(
+            CommitEvidence(
+                sha="abc123",
+                message="feat: add reef",
+                committed_at=day,
+                work_type=WorkType.FEATURE,
+            ),
+        ),
+        pull_requests=(
+            PullRequestEvidence(
+                id=501,
+                number=7,
+                title="fix: resolve bug",
+                labels=("bug",),
+                created_at=day,
+                work_type=WorkType.BUG,
+            ),
+        ),
+        work_type_groupings=(
+            WorkTypeGrouping(
+                work_type=WorkType.FEATURE,
+                commit_count=1,
+                sample_titles=("feat: add reef",),
+            ),
+        ),
+        event_fact_ids=(1, 2),
+        generated_at=day,
+        truncation=BundleTruncation(
+            limits=BundleLimits.uniform(1), commit_count=3, pull_request_count=1
+        ),
+    )
+
+
+class _SilverForbidden:
+    """Evidence service stand-in that fails if a bundle is rebuilt."""
+
+    async def build_bundle(self, *_args: object, **_kwargs: object) -> typ.NoReturn:
+        pytest.fail("regeneration must not rebuild evidence from Silver")
+
+
+def test_snapshot_round_trips_bundle() -> None:
+    """Encoded snapshots decode to an identical bundle."""
+    bundle = _bundle()
+
+    payload, raw_size = encode_bundle_snapshot(bundle)
+
+    assert decode_bundle_snapshot(payload) == bundle
+    assert raw_size > 0
+
+
+def test_snapshot_rejects_unknown_encoding() -> None:
+    """Payloads in an unsupported encoding are refused."""
+    payload, _ = encode_bundle_snapshot(_bundle())
+
+    with pytest.raises(ValueError, match="Unsupported evidence snapshot encoding"):
+        decode_bundle_snapshot(payload, "json")
+
+
+@pytest.mark.asyncio
+async def test_report_stores_bundle_snapshot(
+    generated_report: tuple[Report, str],
+    reporting_service: ReportingService,
+) -> None:
+    """Generated reports keep the bundle the status model saw."""
+    report, repo_id = generated_report
+
+    bundle = await reporting_service.load_report_bundle(report.id)
+
+    assert bundle is not None
+    assert bundle.repository.id == repo_id
+    assert bundle.window_end == report.window_end
+    assert [commit.sha for commit in bundle.commits] == ["abc123"]
+
+
+@pytest.mark.asyncio
+async def test_regenerate_report_reads_only_the_snapshot(
+    generated_report: tuple[Report, str],
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Regeneration re-summarises the stored bundle without Silver queries."""
+    original, repo_id = generated_report
+    service = ReportingService(
+        ReportingServiceDependencies(
+            session_factory=session_factory,
+            evidence_service=typ.cast("EvidenceBundleService", _SilverForbidden()),
+            status_model=MockStatusModel(),
+        ),
+        config=ReportingConfig(),
+    )
+
+    regenerated = await service.regenerate_report(original.id)
+
+    assert regenerated.id != original.id
+    assert regenerated.repository_id == repo_id
+    assert regenerated.window_start == original.window_start
+    assert regenerated.window_end == original.window_end
+    assert await service.load_report_bundle(regenerated.id) == (
+        await service.load_report_bundle(original.id)
+    )
+
+
+@pytest.mark.asyncio
+async def test_regenerate_report_requires_snapshot(
+    reporting_service: ReportingService,
+) -> None:
+    """Reports without a snapshot cannot be regenerated."""
+    with pytest.raises(ValueError, match="has no evidence snapshot"):
+        await reporting_service.regenerate_report("missing-report")
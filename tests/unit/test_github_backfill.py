@@ -0,0 +1,156 @@
+"""Unit tests for parallel, restartable GitHub historical backfill."""
+
+from __future__ import annotations
+
+import datetime as dt
+import typing as typ
+
+import pytest
+from sqlalchemy import func, select
+
+from ghillie.bronze import GithubBackfillSlice, GithubIngestionOffset, RawEvent
+from ghillie.github import (
+    GitHubBackfillConfig,
+    GitHubBackfillWorker,
+    plan_backfill_slices,
+)
+from tests.unit.github_ingestion_test_helpers import (
+    FakeGitHubClient,
+    make_commit_events_with_cursors,
+    make_repo_info,
+)
+
+if typ.TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from ghillie.github.models import GitHubIngestedEvent
+    from ghillie.registry.models import RepositoryInfo
+
+_START = dt.datetime(2020, 1, 1, tzinfo=dt.UTC)
+_END = dt.datetime(2020, 1, 31, tzinfo=dt.UTC)
+
+
+class _CountingClient(FakeGitHubClient):
+    """Fake client that records the bounds of each commit history request."""
+
+    def __init__(self, commits: list[GitHubIngestedEvent]) -> None:
+        super().__init__(commits=commits, pull_requests=[], issues=[], doc_changes=[])
+        self.commit_calls: list[tuple[dt.datetime, dt.datetime | None]] = []
+
+    def iter_commits(
+        self,
+        repo: RepositoryInfo,
+        *,
+        since: dt.datetime,
+        after: str | None = None,
+        until: dt.datetime | None = None,
+    ) -> typ.AsyncIterator[GitHubIngestedEvent]:
+        self.commit_calls.append((since, until))
+        return super().iter_commits(repo, since=since, after=after, until=until)
+
+
+def _daily_commits(repo: RepositoryInfo, days: int) -> list[GitHubIngestedEvent]:
+    return make_commit_events_with_cursors(
+        repo,
+        [
+            (f"sha-{day}", _START + dt.timedelta(days=day, hours=12), f"c-{day}")
+            for day in range(days)
+        ],
+    )
+
+
+def test_plan_backfill_slices_clips_final_slice() -> None:
+    """Commit history is sliced; pull requests span the whole window."""
+    slices = plan_backfill_slices(
+        _START,
+        _END,
+        slice_span=dt.timedelta(days=7),
+        kinds=("commit", "pull_request"),
+    )
+
+    commit_slices = [item for item in slices if item.kind == "commit"]
+    assert [item.start for item in commit_slices] == [
+        _START + dt.timedelta(days=offset) for offset in (0, 7, 14, 21, 28)
+    ]
+    assert commit_slices[-1].end == _END
+    assert [
+        (item.start, item.end) for item in slices if item.kind == "pull_request"
+    ] == [(_START, _END)]
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "span"),
+    [
+        (_END, _START, dt.timedelta(days=1)),
+        (_START, _END, dt.timedelta(0)),
+        (_START.replace(tzinfo=None), _END, dt.timedelta(days=1)),
+    ],
+)
+def test_plan_backfill_slices_rejects_invalid_bounds(
+    start: dt.datetime, end: dt.datetime, span: dt.timedelta
+) -> None:
+    """Empty windows, non-positive spans, and naive bounds are rejected."""
+    with pytest.raises(ValueError, match="must"):
+        plan_backfill_slices(start, end, slice_span=span, kinds=("commit",))
+
+
+@pytest.mark.asyncio
+async def test_backfill_ingests_all_slices_and_advances_watermark(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Every slice is fetched with bounds and the watermark moves to the end."""
+    repo = make_repo_info()
+    client = _CountingClient(_daily_commits(repo, 30))
+    worker = GitHubBackfillWorker(
+        session_factory,
+        client,
+        config=GitHubBackfillConfig(
+            slice_span=dt.timedelta(days=10), batch_size=4, kinds=("commit",)
+        ),
+    )
+
+    result = await worker.backfill_repository(repo, start=_START, end=_END)
+
+    assert result.slices_total == 3
+    assert result.slices_completed == 3
+    assert result.events_ingested == 30
+    assert all(until is not None for _, until in client.commit_calls)
+    async with session_factory() as session:
+        raw_count = await session.scalar(select(func.count()).select_from(RawEvent))
+        offsets = await session.scalar(
+            select(GithubIngestionOffset).where(
+                GithubIngestionOffset.repo_external_id == repo.slug
+            )
+        )
+    assert raw_count == 30
+    assert offsets is not None
+    assert offsets.last_commit_ingested_at == _END
+
+
+@pytest.mark.asyncio
+async def test_backfill_skips_completed_slices_on_restart(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """A re-run only fetches slices that were not recorded as complete."""
+    repo = make_repo_info()
+    config = GitHubBackfillConfig(slice_span=dt.timedelta(days=10), kinds=("commit",))
+    first = _CountingClient(_daily_commits(repo, 30))
+    await GitHubBackfillWorker(
+        session_factory, first, config=config
+    ).backfill_repository(repo, start=_START, end=_END)
+    async with session_factory() as session, session.begin():
+        latest = await session.scalar(
+            select(GithubBackfillSlice).order_by(GithubBackfillSlice.slice_start.desc())
+        )
+        assert latest is not None
+        await session.delete(latest)
+
+    second = _CountingClient(_daily_commits(repo, 30))
+    result = await GitHubBackfillWorker(
+        session_factory, second, config=config
+    ).backfill_repository(repo, start=_START, end=_END)
+
+    assert result.slices_skipped == 2
+    assert result.slices_completed == 1
+    assert result.events_ingested == 0
+    assert second.commit_calls == [(_START + dt.timedelta(days=20), _END)]
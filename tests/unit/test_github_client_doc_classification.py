@@ -2,7 +2,7 @@
 
 import pytest
 
-from ghillie.github.client import _classify_documentation_path
+from ghillie.github.client import classify_documentation_path
 
 
 @pytest.mark.parametrize(
@@ -25,4 +25,4 @@ from ghillie.github.client import _classify_documentation_path
 )
 def test_classify_documentation_path(path: str, expected: tuple[bool, bool]) -> None:
     """Path classification handles both POSIX and Windows separators."""
-    assert _classify_documentation_path(path) == expected
+    assert classify_documentation_path(path) == expected
@@ -0,0 +1,195 @@
+"""Unit tests for pooled GitHub credentials."""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import typing as typ
+
+import httpx
+import pytest
+
+from ghillie.github import (
+    AppInstallationCredential,
+    FileInstallationTokenCache,
+    GitHubGraphQLClient,
+    GitHubGraphQLConfig,
+    GitHubTokenPool,
+    StaticTokenCredential,
+)
+from ghillie.github.errors import GitHubConfigError
+from ghillie.registry.models import RepositoryInfo
+
+if typ.TYPE_CHECKING:
+    import pathlib
+
+
+def _repo(owner: str = "octo", name: str = "reef") -> RepositoryInfo:
+    return RepositoryInfo(
+        id=f"{owner}-{name}",
+        owner=owner,
+        name=name,
+        default_branch="main",
+        ingestion_enabled=True,
+        documentation_paths=(),
+        estate_id=None,
+    )
+
+
+def _pool(**routes: str) -> GitHubTokenPool:
+    return GitHubTokenPool(
+        [
+            StaticTokenCredential(name="a", value="token-a"),
+            StaticTokenCredential(name="b", value="token-b"),
+        ],
+        routes=routes,
+    )
+
+
+def test_pool_routes_to_credential_with_most_budget() -> None:
+    """Selection follows the budgets reported by GitHub."""
+    pool = _pool()
+    reset = int((dt.datetime.now(dt.UTC) + dt.timedelta(hours=1)).timestamp())
+    pool.record(
+        StaticTokenCredential(name="a", value="token-a"),
+        {"x-ratelimit-remaining": "10", "x-ratelimit-reset": str(reset)},
+    )
+
+    assert pool.select(_repo()).name == "b"
+    assert pool.remaining("a") == 10
+
+
+def test_pool_spreads_concurrent_selections() -> None:
+    """Provisional spending alternates credentials before headers arrive."""
+    pool = _pool()
+
+    names = [pool.select(_repo()).name for _ in range(4)]
+
+    assert sorted(names) == ["a", "a", "b", "b"]
+
+
+def test_pool_restores_budget_after_reset() -> None:
+    """A credential whose reset time has passed is assumed to be full again."""
+    pool = _pool()
+    past = int((dt.datetime.now(dt.UTC) - dt.timedelta(minutes=1)).timestamp())
+    pool.record(
+        StaticTokenCredential(name="b", value="token-b"),
+        {"x-ratelimit-remaining": "0", "x-ratelimit-reset": str(past)},
+    )
+
+    assert pool.remaining("b") == pool.remaining("a")
+
+
+def test_pool_honours_pinned_routes() -> None:
+    """Slug routes take precedence over owner routes and budgets."""
+    pool = _pool(octo="b", **{"octo/kelp": "a"})
+    pool.record(
+        StaticTokenCredential(name="b", value="token-b"),
+        {"x-ratelimit-remaining": "1"},
+    )
+
+    assert pool.select(_repo()).name == "b"
+    assert pool.select(_repo(name="kelp")).name == "a"
+
+
+def test_pool_rejects_unknown_route_target() -> None:
+    """Routes must name a pooled credential."""
+    with pytest.raises(GitHubConfigError, match="unknown GitHub credential"):
+        _pool(octo="missing")
+
+
+def test_pool_from_env_reads_token_list(monkeypatch: pytest.MonkeyPatch) -> None:
+    """GHILLIE_GITHUB_TOKENS provides one static credential per token."""
+    monkeypatch.setenv("GHILLIE_GITHUB_TOKENS", "one, two ,")
+
+    pool = GitHubTokenPool.from_env()
+
+    assert {pool.select().name for _ in range(2)} == {"token-1", "token-2"}
+
+
+@pytest.mark.asyncio
+async def test_installation_tokens_are_cached_across_credentials(
+    tmp_path: pathlib.Path,
+) -> None:
+    """A minted token is reused by another credential sharing the cache."""
+    exchanges: list[httpx.Request] = []
+    expires = dt.datetime.now(dt.UTC) + dt.timedelta(hours=1)
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        exchanges.append(request)
+        return httpx.Response(
+            201,
+            json={"token": "ghs_minted", "expires_at": expires.isoformat()},
+        )
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as http:
+
+        def _credential() -> AppInstallationCredential:
+            return AppInstallationCredential(
+                name="org",
+                installation_id=42,
+                jwt_factory=lambda: "app-jwt",
+                http_client=http,
+                cache=FileInstallationTokenCache(tmp_path),
+            )
+
+        first = await _credential().token()
+        second = await _credential().token()
+
+    assert first == second == "ghs_minted"
+    assert len(exchanges) == 1
+    assert exchanges[0].url.path == "/app/installations/42/access_tokens"
+    assert exchanges[0].headers["Authorization"] == "Bearer app-jwt"
+
+
+@pytest.mark.asyncio
+async def test_installation_token_refreshes_before_expiry() -> None:
+    """Tokens inside the refresh margin are minted again."""
+    minted: list[str] = []
+
+    def _handler(_request: httpx.Request) -> httpx.Response:
+        minted.append(f"ghs_{len(minted)}")
+        expires = dt.datetime.now(dt.UTC) + dt.timedelta(minutes=2)
+        return httpx.Response(
+            201, json={"token": minted[-1], "expires_at": expires.isoformat()}
+        )
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as http:
+        credential = AppInstallationCredential(
+            name="org",
+            installation_id=7,
+            jwt_factory=lambda: "app-jwt",
+            http_client=http,
+            refresh_margin=dt.timedelta(minutes=5),
+        )
+        tokens = [await credential.token(), await credential.token()]
+
+    assert tokens == ["ghs_0", "ghs_1"]
+
+
+@pytest.mark.asyncio
+async def test_graphql_client_authenticates_with_pool() -> None:
+    """Pooled clients send the selected token and record rate-limit headers."""
+    seen: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["Authorization"])
+        body = json.loads(request.content.decode("utf-8"))
+        assert body["variables"]["owner"] == "octo"
+        return httpx.Response(
+            200,
+            json={"data": {}},
+            headers={"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "4102444800"},
+        )
+
+    pool = _pool()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as http:
+        client = GitHubGraphQLClient(
+            GitHubGraphQLConfig(endpoint="https://x.test/gql"),
+            http_client=http,
+            token_pool=pool,
+        )
+        await client._graphql("query", {"owner": "octo"}, repo=_repo())
+
+    assert seen == ["Bearer token-a"]
+    assert pool.remaining("a") == 3
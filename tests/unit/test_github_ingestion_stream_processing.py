@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 import typing as typ
 
 import pytest
 
-from ghillie.bronze import RawEventWriter
+from ghillie.bronze import RawEventEnvelope, RawEventWriter
 from ghillie.github import GitHubIngestionConfig, GitHubIngestionWorker
+from ghillie.github.errors import GitHubAPIError
 from ghillie.github.ingestion import _StreamIngestionResult
 from ghillie.github.noise import CompiledNoiseFilters
 from tests.unit.github_ingestion_test_helpers import (
@@ -149,3 +151,87 @@ async def test_ingest_events_stream_advances_cursors_for_dropped_events(
     assert result.truncated is True
     assert result.resume_cursor == "cursor-2"
     assert result.max_seen == newest
+
+
+class _RecordingWriter:
+    """Writer stand-in that logs bulk writes and yields to the event loop."""
+
+    def __init__(self, log: list[str]) -> None:
+        self._log = log
+
+    async def ingest_many(self, envelopes: typ.Sequence[RawEventEnvelope]) -> int:
+        ids = ",".join(str(envelope.source_event_id) for envelope in envelopes)
+        self._log.append(f"write-start:{ids}")
+        await asyncio.sleep(0.01)
+        self._log.append(f"write-end:{ids}")
+        return len(envelopes)
+
+
+@pytest.mark.asyncio
+async def test_ingest_events_stream_prefetches_while_writing(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """The next batch is fetched while the previous batch is being written."""
+    repo = make_repo_info()
+    now = dt.datetime.now(dt.UTC)
+    worker = GitHubIngestionWorker(
+        session_factory,
+        FakeGitHubClient(commits=[], pull_requests=[], issues=[], doc_changes=[]),
+        config=GitHubIngestionConfig(write_batch_size=1, pipeline_depth=1),
+    )
+    events = make_commit_events_with_cursors(
+        repo,
+        [(f"e{idx}", now - dt.timedelta(minutes=idx), f"c{idx}") for idx in range(3)],
+    )
+    log: list[str] = []
+
+    async def _events() -> typ.AsyncIterator[GitHubIngestedEvent]:
+        for event in events:
+            log.append(f"fetch:{event.source_event_id}")
+            yield event
+
+    result = await worker._ingest_events_stream(
+        repo,
+        typ.cast("RawEventWriter", _RecordingWriter(log)),
+        _events(),
+        noise=CompiledNoiseFilters(),
+    )
+
+    assert result.ingested == 3
+    assert log.index("fetch:e1") < log.index("write-end:e0")
+    assert [entry for entry in log if entry.startswith("write-start")] == [
+        "write-start:e0",
+        "write-start:e1",
+        "write-start:e2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_ingest_events_stream_writes_fetched_events_before_fetch_error(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Events fetched before a GitHub failure are written; the error propagates."""
+    repo = make_repo_info()
+    now = dt.datetime.now(dt.UTC)
+    worker = GitHubIngestionWorker(
+        session_factory,
+        FakeGitHubClient(commits=[], pull_requests=[], issues=[], doc_changes=[]),
+        config=GitHubIngestionConfig(write_batch_size=1),
+    )
+    events = make_commit_events_with_cursors(repo, [("e1", now, "c1")])
+    log: list[str] = []
+
+    async def _events() -> typ.AsyncIterator[GitHubIngestedEvent]:
+        for event in events:
+            yield event
+        raise GitHubAPIError.http_error(502)
+
+    with pytest.raises(GitHubAPIError):
+        await worker._ingest_events_stream(
+            repo,
+            typ.cast("RawEventWriter", _RecordingWriter(log)),
+            _events(),
+            noise=CompiledNoiseFilters(),
+        )
+
+    assert log == ["write-start:e1", "write-end:e1"]
@@ -0,0 +1,282 @@
+"""Unit tests for the local git-mirror activity client."""
+
+from __future__ import annotations
+
+import datetime as dt
+import os
+import shutil
+import subprocess
+import typing as typ
+
+import pytest
+from sqlalchemy import select
+
+from ghillie.bronze import RawEvent, make_dedupe_key
+from ghillie.github import (
+    GitHubIngestionConfig,
+    GitHubIngestionWorker,
+    GitMirrorActivityClient,
+    GitMirrorConfig,
+)
+from ghillie.github.client import (
+    _commit_event_from_node,
+    _doc_change_event_from_edge,
+    _DocChangeSpec,
+    classify_documentation_path,
+)
+from ghillie.github.errors import GitMirrorError
+from ghillie.github.ingestion import envelope_from_event
+from tests.unit.github_ingestion_test_helpers import (
+    FakeGitHubClient,
+    make_repo_info,
+)
+
+if typ.TYPE_CHECKING:
+    import pathlib
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from ghillie.github.models import GitHubIngestedEvent
+
+_BASE = dt.datetime(2024, 1, 1, tzinfo=dt.UTC)
+_SINCE = _BASE - dt.timedelta(days=1)
+
+
+def _git(*args: str, cwd: pathlib.Path, when: dt.datetime | None = None) -> str:
+    git_executable = shutil.which("git")
+    if git_executable is None:
+        message = "git binary required for mirror tests"
+        raise FileNotFoundError(message)
+    env = dict(os.environ)
+    if when is not None:
+        env["GIT_AUTHOR_DATE"] = env["GIT_COMMITTER_DATE"] = when.isoformat()
+    result = subprocess.run(  # noqa: S603  # fixed git argv in a temp repo
+        [git_executable, *args],
+        cwd=cwd,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=10,
+    )
+    return result.stdout.strip()
+
+
+def _commit(
+    work: pathlib.Path, message: str, day: int, files: dict[str, str | None]
+) -> str:
+    """Write (or delete, for ``None``) files and commit them on ``day``."""
+    for name, content in files.items():
+        target = work / name
+        if content is None:
+            _git("rm", "-q", name, cwd=work)
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content, encoding="utf-8")
+        _git("add", name, cwd=work)
+    _git("commit", "-q", "-m", message, cwd=work, when=_BASE + dt.timedelta(days=day))
+    return _git("rev-parse", "HEAD", cwd=work)
+
+
+@pytest.fixture
+def mirror_root(tmp_path: pathlib.Path) -> tuple[pathlib.Path, list[str]]:
+    """Build ``octo/reef`` with three commits and mirror it under a root."""
+    work = tmp_path / "work"
+    work.mkdir()
+    _git("init", "-q", "-b", "main", cwd=work)
+    _git("config", "user.email", "ghillie@example.com", cwd=work)
+    _git("config", "user.name", "Ghillie", cwd=work)
+    shas = [
+        _commit(work, "Add roadmap", 0, {"docs/roadmap.md": "v1\n"}),
+        _commit(work, "Update code", 1, {"src/app.py": "print()\n"}),
+        _commit(work, "Drop roadmap", 2, {"docs/roadmap.md": None}),
+    ]
+    root = tmp_path / "mirrors"
+    (root / "octo").mkdir(parents=True)
+    _git(
+        "clone",
+        "-q",
+        "--mirror",
+        str(work),
+        str(root / "octo" / "reef.git"),
+        cwd=tmp_path,
+    )
+    return root, shas
+
+
+def _client(root: pathlib.Path) -> GitMirrorActivityClient:
+    return GitMirrorActivityClient(
+        GitMirrorConfig(root=root),
+        api_client=FakeGitHubClient(
+            commits=[], pull_requests=[], issues=[], doc_changes=[]
+        ),
+    )
+
+
+async def _collect(
+    stream: typ.AsyncIterator[GitHubIngestedEvent],
+) -> list[GitHubIngestedEvent]:
+    return [event async for event in stream]
+
+
+@pytest.mark.asyncio
+async def test_iter_commits_reads_history_newest_first(
+    mirror_root: tuple[pathlib.Path, list[str]],
+) -> None:
+    """Commits match GraphQL payloads and honour since/until bounds."""
+    root, shas = mirror_root
+    client = _client(root)
+    repo = make_repo_info()
+
+    events = await _collect(client.iter_commits(repo, since=_SINCE))
+    bounded = await _collect(
+        client.iter_commits(
+            repo,
+            since=_BASE,
+            until=_BASE + dt.timedelta(days=1),
+        )
+    )
+
+    assert [event.source_event_id for event in events] == shas[::-1]
+    newest = events[0]
+    assert newest.event_type == "github.commit"
+    assert newest.cursor == shas[2]
+    assert newest.occurred_at == _BASE + dt.timedelta(days=2)
+    assert newest.payload["message"] == "Drop roadmap"
+    assert newest.payload["author_name"] == "Ghillie"
+    assert newest.payload["repo_name"] == repo.name
+    assert [event.source_event_id for event in bounded] == [shas[1]]
+
+
+@pytest.mark.asyncio
+async def test_iter_commits_resumes_after_sha_cursor(
+    mirror_root: tuple[pathlib.Path, list[str]],
+) -> None:
+    """A SHA cursor skips through that commit; unknown cursors replay."""
+    root, shas = mirror_root
+    client = _client(root)
+    repo = make_repo_info()
+
+    resumed = await _collect(client.iter_commits(repo, since=_SINCE, after=shas[2]))
+    replayed = await _collect(
+        client.iter_commits(repo, since=_SINCE, after="not-a-sha")
+    )
+
+    assert [event.source_event_id for event in resumed] == shas[1::-1]
+    assert len(replayed) == len(shas)
+
+
+@pytest.mark.asyncio
+async def test_iter_doc_changes_reads_history_per_path(
+    mirror_root: tuple[pathlib.Path, list[str]],
+) -> None:
+    """Documentation changes carry GitHub's change type and doc cursors."""
+    root, shas = mirror_root
+    client = _client(root)
+    repo = make_repo_info()
+
+    events = await _collect(
+        client.iter_doc_changes(
+            repo, since=_SINCE, documentation_paths=["docs/roadmap.md"]
+        )
+    )
+    resumed = await _collect(
+        client.iter_doc_changes(
+            repo,
+            since=_SINCE,
+            documentation_paths=["docs/roadmap.md"],
+            after=events[0].cursor,
+        )
+    )
+
+    assert [event.source_event_id for event in events] == [
+        f"{shas[2]}:docs/roadmap.md",
+        f"{shas[0]}:docs/roadmap.md",
+    ]
+    assert {event.payload["change_type"] for event in events} == {"modified"}
+    assert events[0].payload["is_roadmap"] is True
+    assert [event.source_event_id for event in resumed] == [
+        f"{shas[0]}:docs/roadmap.md"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_events_share_dedupe_keys_with_graphql_client(
+    mirror_root: tuple[pathlib.Path, list[str]],
+) -> None:
+    """Mirror and GraphQL events for the same commit dedupe to one row."""
+    root, shas = mirror_root
+    client = _client(root)
+    repo = make_repo_info()
+    node = {
+        "oid": shas[2],
+        "committedDate": "2024-01-03T00:00:00Z",
+        "authoredDate": "2024-01-03T00:00:00Z",
+        "message": "Drop roadmap",
+        "author": {"name": "Ghillie", "email": "ghillie@example.com"},
+    }
+    path = "docs/roadmap.md"
+    is_roadmap, is_adr = classify_documentation_path(path)
+
+    commit = (await _collect(client.iter_commits(repo, since=_SINCE)))[0]
+    doc_change = (
+        await _collect(
+            client.iter_doc_changes(repo, since=_SINCE, documentation_paths=[path])
+        )
+    )[0]
+    graphql_commit = _commit_event_from_node(repo, node, _SINCE)
+    graphql_doc_change = _doc_change_event_from_edge(
+        repo,
+        {"cursor": "c1", "node": node},
+        since=_SINCE,
+        spec=_DocChangeSpec(path=path, is_roadmap=is_roadmap, is_adr=is_adr),
+    )
+
+    assert graphql_commit is not None
+    assert graphql_doc_change is not None
+    for mirrored, fetched in (
+        (commit, graphql_commit),
+        (doc_change, graphql_doc_change),
+    ):
+        assert make_dedupe_key(envelope_from_event(repo, mirrored)) == (
+            make_dedupe_key(envelope_from_event(repo, fetched))
+        )
+
+
+@pytest.mark.asyncio
+async def test_missing_mirror_raises(tmp_path: pathlib.Path) -> None:
+    """Repositories without a mirror fail with a GitMirrorError."""
+    client = _client(tmp_path)
+
+    with pytest.raises(GitMirrorError, match="mirror not found"):
+        await _collect(client.iter_commits(make_repo_info(), since=_SINCE))
+
+
+@pytest.mark.asyncio
+async def test_worker_ingests_commits_from_mirror(
+    session_factory: async_sessionmaker[AsyncSession],
+    mirror_root: tuple[pathlib.Path, list[str]],
+) -> None:
+    """The ingestion worker accepts the mirror client as a drop-in backend."""
+    root, shas = mirror_root
+    worker = GitHubIngestionWorker(
+        session_factory,
+        _client(root),
+        config=GitHubIngestionConfig(
+            overlap=dt.timedelta(0),
+            initial_lookback=dt.datetime.now(dt.UTC) - _SINCE,
+        ),
+    )
+
+    result = await worker.ingest_repository(make_repo_info())
+
+    assert result.commits_ingested == len(shas)
+    async with session_factory() as session:
+        ids = set(
+            await session.scalars(
+                select(RawEvent.source_event_id).where(
+                    RawEvent.event_type == "github.commit"
+                )
+            )
+        )
+    assert ids == set(shas)
@@ -0,0 +1,213 @@
+"""Unit tests for the estate-wide noise filter cache."""
+
+from __future__ import annotations
+
+import dataclasses
+import typing as typ
+
+import msgspec
+import pytest
+from sqlalchemy import update
+
+from ghillie.catalogue.models import NoiseFilters
+from ghillie.catalogue.storage import (
+    CatalogueImportRecord,
+    ComponentRecord,
+    Estate,
+    ProjectRecord,
+    RepositoryRecord,
+)
+from ghillie.github import NoiseFilterCache
+from ghillie.github.noise import CompiledNoiseFilters
+from tests.unit.github_ingestion_test_helpers import make_repo_info
+
+if typ.TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+async def _seed_estate(
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    repo_names: tuple[str, ...],
+    noise: NoiseFilters,
+) -> str:
+    """Create an estate whose single project owns each named repository."""
+    async with session_factory() as session, session.begin():
+        estate = Estate(key="cache-estate", name="Cache Estate")
+        session.add(estate)
+        await session.flush()
+        project = ProjectRecord(
+            estate_id=estate.id,
+            key="cache-project",
+            name="Cache Project",
+            noise=msgspec.to_builtins(noise),
+            status_preferences={},
+            documentation_paths=[],
+        )
+        session.add(project)
+        await session.flush()
+        for name in repo_names:
+            repo_record = RepositoryRecord(
+                owner="octo", name=name, default_branch="main", documentation_paths=[]
+            )
+            session.add(repo_record)
+            await session.flush()
+            session.add(
+                ComponentRecord(
+                    project_id=project.id,
+                    repository_id=repo_record.id,
+                    key=f"{name}-component",
+                    name=f"{name} Component",
+                    type="service",
+                    lifecycle="active",
+                    notes=[],
+                )
+            )
+        return estate.id
+
+
+async def _record_import(
+    session_factory: async_sessionmaker[AsyncSession],
+    estate_id: str,
+    sha: str | None,
+) -> None:
+    async with session_factory() as session, session.begin():
+        session.add(CatalogueImportRecord(estate_id=estate_id, commit_sha=sha))
+
+
+async def _set_noise(
+    session_factory: async_sessionmaker[AsyncSession], noise: NoiseFilters
+) -> None:
+    async with session_factory() as session, session.begin():
+        await session.execute(
+            update(ProjectRecord).values(noise=msgspec.to_builtins(noise))
+        )
+
+
+class _FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _CountingSessionFactory:
+    """Wrap a session factory and count the sessions it opens."""
+
+    def __init__(self, inner: async_sessionmaker[AsyncSession]) -> None:
+        self.inner = inner
+        self.sessions = 0
+
+    def __call__(self) -> AsyncSession:
+        self.sessions += 1
+        return self.inner()
+
+
+@pytest.mark.asyncio
+async def test_cache_compiles_estate_once_per_catalogue_import(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Repositories share one estate load until a new import is recorded."""
+    estate_id = await _seed_estate(
+        session_factory,
+        repo_names=("reef", "kelp"),
+        noise=NoiseFilters(ignore_authors=["dependabot[bot]"]),
+    )
+    await _record_import(session_factory, estate_id, "sha-1")
+    counting = _CountingSessionFactory(session_factory)
+    clock = _FakeClock()
+    cache = NoiseFilterCache(
+        typ.cast("async_sessionmaker[AsyncSession]", counting),
+        revalidate_after_s=60.0,
+        clock=clock,
+    )
+    reef = make_repo_info(estate_id=estate_id)
+    kelp = dataclasses.replace(reef, id="repo-2", name="kelp")
+
+    first = await cache.filters_for(reef)
+    second = await cache.filters_for(kelp)
+
+    assert first.ignore_authors == frozenset({"dependabot[bot]"})
+    assert second == first
+    # One version check and one estate-wide load serve both repositories.
+    assert counting.sessions == 2
+
+    await _set_noise(session_factory, NoiseFilters(ignore_labels=["chore"]))
+    clock.now = 61.0
+    stale = await cache.filters_for(reef)
+    assert stale.ignore_authors == frozenset({"dependabot[bot]"})
+    assert counting.sessions == 3
+
+    await _record_import(session_factory, estate_id, "sha-2")
+    assert (await cache.filters_for(reef)).ignore_authors == frozenset(
+        {"dependabot[bot]"}
+    )
+    clock.now = 122.0
+    refreshed = await cache.filters_for(reef)
+    assert refreshed.ignore_authors == frozenset()
+    assert refreshed.ignore_labels == frozenset({"chore"})
+
+
+@pytest.mark.asyncio
+async def test_imports_without_commit_sha_refresh_the_cache(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Imports made without a commit SHA still move the estate version."""
+    estate_id = await _seed_estate(
+        session_factory,
+        repo_names=("reef",),
+        noise=NoiseFilters(ignore_authors=["dependabot[bot]"]),
+    )
+    await _record_import(session_factory, estate_id, None)
+    cache = NoiseFilterCache(session_factory, revalidate_after_s=0.0)
+    repo = make_repo_info(estate_id=estate_id)
+    await cache.filters_for(repo)
+
+    await _set_noise(session_factory, NoiseFilters())
+    await _record_import(session_factory, estate_id, None)
+
+    assert await cache.filters_for(repo) == CompiledNoiseFilters()
+
+
+@pytest.mark.asyncio
+async def test_cache_reads_live_filters_without_import_record(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Estates with no recorded import are never served from the cache."""
+    estate_id = await _seed_estate(
+        session_factory,
+        repo_names=("reef",),
+        noise=NoiseFilters(ignore_authors=["dependabot[bot]"]),
+    )
+    cache = NoiseFilterCache(session_factory)
+    repo = make_repo_info(estate_id=estate_id)
+
+    assert (await cache.filters_for(repo)).ignore_authors == frozenset(
+        {"dependabot[bot]"}
+    )
+    await _set_noise(session_factory, NoiseFilters())
+    assert await cache.filters_for(repo) == CompiledNoiseFilters()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_reload(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Invalidating an estate discards its compiled filters."""
+    estate_id = await _seed_estate(
+        session_factory,
+        repo_names=("reef",),
+        noise=NoiseFilters(ignore_authors=["dependabot[bot]"]),
+    )
+    await _record_import(session_factory, estate_id, "sha-1")
+    cache = NoiseFilterCache(session_factory)
+    repo = make_repo_info(estate_id=estate_id)
+    await cache.filters_for(repo)
+
+    await _set_noise(session_factory, NoiseFilters())
+    cache.invalidate(estate_id)
+
+    assert await cache.filters_for(repo) == CompiledNoiseFilters()
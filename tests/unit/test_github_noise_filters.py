@@ -2,6 +2,7 @@
 
 import dataclasses as dc
 import datetime as dt
+import fnmatch
 
 import pytest
 
@@ -281,3 +282,64 @@ def test_compile_noise_filters_deduplicates_paths_and_prefixes() -> None:
     )
     assert compiled.ignore_paths == ("docs", "src/**")
     assert compiled.ignore_title_prefixes == ("chore:", "fix:")
+
+
+def _path_event(path: str) -> GitHubIngestedEvent:
+    return GitHubIngestedEvent(
+        event_type="github.doc_change",
+        source_event_id=f"abc123:{path}",
+        occurred_at=dt.datetime.now(dt.UTC),
+        payload={"path": path},
+    )
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "docs/generated/index.md",
+        "docs\\generated\\nested\\page.md",
+        "poetry.lock",
+        "src/a1/xy.py",
+        "src/c1/xy.py",
+        "vendor/lib/module.py",
+        "README.md",
+    ],
+)
+def test_compiled_path_regex_matches_fnmatchcase(path: str) -> None:
+    """The combined path regex agrees with per-pattern fnmatchcase evaluation."""
+    patterns = ["docs/generated/**", "*.lock", "src/[ab]*/x?.py", "vendor/*"]
+    compiled = compile_noise_filters([NoiseFilters(ignore_paths=patterns)])
+    normalised = path.replace("\\", "/")
+
+    expected = any(fnmatch.fnmatchcase(normalised, pattern) for pattern in patterns)
+
+    assert compiled.should_drop(_path_event(path)) is expected
+
+
+def test_partition_splits_page_preserving_order() -> None:
+    """CompiledNoiseFilters.partition keeps original event order."""
+    compiled = compile_noise_filters(
+        [NoiseFilters(ignore_title_prefixes=["chore:", "build(deps)"])]
+    )
+    titles = ["feat: a", "Chore: b", "fix: c", "build(deps): d", "docs: e"]
+    events = [
+        GitHubIngestedEvent(
+            event_type="github.issue",
+            source_event_id=str(idx),
+            occurred_at=dt.datetime.now(dt.UTC),
+            payload={"title": title},
+        )
+        for idx, title in enumerate(titles)
+    ]
+
+    kept, dropped = compiled.partition(events)
+
+    assert [event.payload["title"] for event in kept] == [
+        "feat: a",
+        "fix: c",
+        "docs: e",
+    ]
+    assert [event.payload["title"] for event in dropped] == [
+        "Chore: b",
+        "build(deps): d",
+    ]
@@ -0,0 +1,136 @@
+"""Unit tests for the offline GitHub GraphQL stand-in."""
+
+from __future__ import annotations
+
+import datetime as dt
+import typing as typ
+
+import httpx
+import pytest
+
+from ghillie.github import (
+    GitHubGraphQLClient,
+    GitHubGraphQLConfig,
+    GitHubIngestionConfig,
+    GitHubIngestionWorker,
+)
+from ghillie.github.errors import GitHubAPIError
+from ghillie.github.standin import (
+    StandInApp,
+    StandInConfig,
+    create_standin_app,
+    standin_transport,
+)
+from tests.unit.github_ingestion_test_helpers import make_repo_info
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+_CONFIG = StandInConfig(seed=3, commits=25, pull_requests=12, issues=7, page_size=10)
+_SINCE = _CONFIG.end - _CONFIG.span - dt.timedelta(days=1)
+
+
+def _client(app: StandInApp) -> GitHubGraphQLClient:
+    return GitHubGraphQLClient(
+        GitHubGraphQLConfig(
+            token="standin",  # noqa: S106 - the stand-in accepts any token
+            endpoint="http://standin/graphql",
+        ),
+        http_client=httpx.AsyncClient(transport=standin_transport(app)),
+    )
+
+
+async def _collect(stream: cabc.AsyncIterator[object]) -> list[object]:
+    return [item async for item in stream]
+
+
+@pytest.mark.asyncio
+async def test_standin_paginates_full_history() -> None:
+    """Every stream pages through the configured synthetic history."""
+    app = create_standin_app(_CONFIG)
+    client = _client(app)
+    repo = make_repo_info()
+
+    commits = await _collect(client.iter_commits(repo, since=_SINCE))
+    pull_requests = await _collect(client.iter_pull_requests(repo, since=_SINCE))
+    issues = await _collect(client.iter_issues(repo, since=_SINCE))
+    await client.aclose()
+
+    assert (len(commits), len(pull_requests), len(issues)) == (25, 12, 7)
+    assert app.stats.by_kind == {"commits": 3, "pull_requests": 2, "issues": 1}
+
+
+@pytest.mark.asyncio
+async def test_standin_history_is_seeded() -> None:
+    """The same seed and repository always yield the same history."""
+    repo = make_repo_info()
+    runs = []
+    for _ in range(2):
+        client = _client(create_standin_app(_CONFIG))
+        runs.append(
+            [
+                event.source_event_id
+                async for event in client.iter_commits(repo, since=_SINCE)
+            ]
+        )
+        await client.aclose()
+
+    assert runs[0] == runs[1]
+
+
+@pytest.mark.asyncio
+async def test_standin_emits_rate_limit_headers_and_enforces_budget() -> None:
+    """Each bearer token has its own budget and is refused once it is spent."""
+    app = create_standin_app(StandInConfig(rate_limit=1))
+    async with httpx.AsyncClient(transport=standin_transport(app)) as http:
+        first = await http.post(
+            "http://standin/graphql",
+            json={"query": "{ viewer { login } }"},
+            headers={"Authorization": "Bearer one"},
+        )
+        second = await http.post(
+            "http://standin/graphql",
+            json={"query": "{ viewer { login } }"},
+            headers={"Authorization": "Bearer one"},
+        )
+
+    assert first.headers["X-RateLimit-Remaining"] == "0"
+    assert first.json()["errors"][0]["message"] == "stand-in: unsupported query"
+    assert second.status_code == 403
+    assert app.stats.rate_limited == 1
+
+
+@pytest.mark.asyncio
+async def test_standin_injects_errors() -> None:
+    """A full error rate surfaces as GitHubAPIError with the chosen status."""
+    client = _client(create_standin_app(StandInConfig(error_rate=1.0)))
+
+    with pytest.raises(GitHubAPIError) as exc:
+        await _collect(client.iter_issues(make_repo_info(), since=_SINCE))
+    await client.aclose()
+
+    assert exc.value.status_code == 502
+
+
+@pytest.mark.asyncio
+async def test_worker_ingests_from_standin(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """A full ingestion run completes offline against the stand-in."""
+    client = _client(create_standin_app(_CONFIG))
+    worker = GitHubIngestionWorker(
+        session_factory,
+        client,
+        config=GitHubIngestionConfig(
+            initial_lookback=dt.datetime.now(dt.UTC) - _SINCE,
+        ),
+    )
+
+    result = await worker.ingest_repository(make_repo_info())
+    await client.aclose()
+
+    assert result.commits_ingested == 25
+    assert result.pull_requests_ingested == 12
+    assert result.issues_ingested == 7
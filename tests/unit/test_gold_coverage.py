@@ -0,0 +1,181 @@
+"""Unit tests for range-encoded repository report coverage."""
+
+from __future__ import annotations
+
+import datetime as dt
+import typing as typ
+
+import pytest
+from sqlalchemy import delete, func, select
+
+from ghillie.bronze import RawEventWriter
+from ghillie.evidence import EvidenceBundleService
+from ghillie.gold import (
+    CoverageRange,
+    Report,
+    ReportCoverage,
+    ReportCoverageRange,
+    ReportScope,
+    encode_coverage_ranges,
+    init_gold_storage,
+    record_repository_coverage,
+)
+from ghillie.silver import EventFact, RawEventTransformer, Repository
+from tests.helpers.event_builders import commit_envelope
+
+if typ.TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+_WINDOW_START = dt.datetime(2024, 7, 1, tzinfo=dt.UTC)
+_WINDOW_END = dt.datetime(2024, 7, 8, tzinfo=dt.UTC)
+
+
+def test_encode_coverage_ranges_breaks_on_uncovered_facts() -> None:
+    """Runs follow the repository sequence and stop at uncovered facts."""
+    ranges = encode_coverage_ranges([9, 2, 4, 5, 11], [2, 4, 5, 7, 9, 11])
+
+    assert ranges == [CoverageRange(2, 5, 3), CoverageRange(9, 11, 2)]
+
+
+def test_encode_coverage_ranges_handles_empty_input() -> None:
+    """No covered facts produce no ranges."""
+    assert encode_coverage_ranges([], [1, 2, 3]) == []
+
+
+async def _seed_interleaved(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> tuple[str, list[int]]:
+    """Ingest interleaved commits for two repositories; return reef's facts."""
+    writer = RawEventWriter(session_factory)
+    for day in range(2, 6):
+        occurred_at = dt.datetime(2024, 7, day, tzinfo=dt.UTC)
+        await writer.ingest(commit_envelope("octo/reef", f"reef{day}", occurred_at))
+        await writer.ingest(commit_envelope("octo/kelp", f"kelp{day}", occurred_at))
+    await RawEventTransformer(session_factory).process_pending()
+
+    async with session_factory() as session:
+        repo_id = await session.scalar(
+            select(Repository.id).where(Repository.github_name == "reef")
+        )
+        fact_ids = list(
+            await session.scalars(
+                select(EventFact.id)
+                .where(EventFact.repo_external_id == "octo/reef")
+                .order_by(EventFact.id)
+            )
+        )
+    assert repo_id is not None
+    return repo_id, fact_ids
+
+
+async def _record(
+    session_factory: async_sessionmaker[AsyncSession],
+    repo_id: str,
+    fact_ids: list[int],
+) -> list[CoverageRange]:
+    async with session_factory() as session, session.begin():
+        report = Report(
+            scope=ReportScope.REPOSITORY,
+            repository_id=repo_id,
+            window_start=_WINDOW_START,
+            window_end=_WINDOW_END,
+        )
+        session.add(report)
+        await session.flush()
+        return await record_repository_coverage(
+            session,
+            report_id=report.id,
+            repository_id=repo_id,
+            repo_external_id="octo/reef",
+            event_fact_ids=fact_ids,
+        )
+
+
+@pytest.mark.asyncio
+async def test_record_repository_coverage_writes_compact_ranges(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Interleaved facts from other repositories do not split ranges."""
+    repo_id, fact_ids = await _seed_interleaved(session_factory)
+
+    ranges = await _record(session_factory, repo_id, fact_ids)
+
+    assert ranges == [CoverageRange(fact_ids[0], fact_ids[-1], len(fact_ids))]
+    async with session_factory() as session:
+        per_fact = await session.scalar(select(func.count(ReportCoverage.id)))
+        stored = await session.scalar(select(func.count(ReportCoverageRange.id)))
+    assert per_fact == 0
+    assert stored == 1
+
+
+@pytest.mark.asyncio
+async def test_record_repository_coverage_ignores_gaps_when_idle(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Missing ids cannot hide facts of a repository with no transforms due."""
+    repo_id, fact_ids = await _seed_interleaved(session_factory)
+    async with session_factory() as session, session.begin():
+        await session.execute(
+            delete(EventFact).where(
+                EventFact.id.between(fact_ids[0] + 1, fact_ids[1] - 1)
+            )
+        )
+
+    ranges = await _record(session_factory, repo_id, fact_ids)
+
+    assert ranges == [CoverageRange(fact_ids[0], fact_ids[-1], len(fact_ids))]
+
+
+@pytest.mark.asyncio
+async def test_record_repository_coverage_splits_ranges_at_id_gaps(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Ranges never span an id that may belong to an uncommitted fact."""
+    repo_id, fact_ids = await _seed_interleaved(session_factory)
+    # An unprocessed raw event means a transform of the repository may hold
+    # an id between its visible facts until it commits.
+    await RawEventWriter(session_factory).ingest(
+        commit_envelope("octo/reef", "reef9", dt.datetime(2024, 7, 9, tzinfo=dt.UTC))
+    )
+
+    ranges = await _record(session_factory, repo_id, fact_ids)
+
+    assert ranges == [CoverageRange(fact_id, fact_id, 1) for fact_id in fact_ids]
+
+
+@pytest.mark.asyncio
+async def test_bundle_excludes_facts_inside_covered_ranges(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Only facts outside every covered range remain in the bundle."""
+    repo_id, fact_ids = await _seed_interleaved(session_factory)
+    skipped = fact_ids[1]
+
+    ranges = await _record(
+        session_factory, repo_id, [fid for fid in fact_ids if fid != skipped]
+    )
+    bundle = await EvidenceBundleService(session_factory).build_bundle(
+        repo_id, _WINDOW_START, _WINDOW_END
+    )
+
+    assert len(ranges) == 2
+    assert bundle.event_fact_ids == (skipped,)
+
+
+@pytest.mark.asyncio
+async def test_init_backfills_ranges_for_legacy_coverage(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Coverage written before the range index existed is indexed at init."""
+    repo_id, fact_ids = await _seed_interleaved(session_factory)
+    await _record(session_factory, repo_id, fact_ids)
+    async with session_factory() as session, session.begin():
+        await session.execute(delete(ReportCoverageRange))
+
+    await init_gold_storage(session_factory.kw["bind"])
+
+    async with session_factory() as session:
+        starts = set(
+            await session.scalars(select(ReportCoverageRange.start_event_fact_id))
+        )
+    assert starts == set(fact_ids)
@@ -0,0 +1,139 @@
+"""Unit tests for estate-wide project evidence bundle generation.
+
+Verifies that ``ProjectEvidenceBundleService.build_bundles_for_estate``
+returns the same bundles as per-project ``build_bundle`` calls while
+issuing a constant number of queries.
+
+Examples
+--------
+Run these tests::
+
+    pytest tests/unit/test_project_evidence_estate.py -q
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import typing as typ
+
+import msgspec
+import pytest
+from sqlalchemy import event
+
+from tests.fixtures.specs import (
+    ProjectReportParams,
+    ReportSummaryParams,
+    RepositoryParams,
+)
+from tests.unit.project_evidence_helpers import (
+    create_project_report,
+    create_silver_repo_and_report,
+    get_catalogue_repo_ids,
+    get_estate_id,
+)
+
+if typ.TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from ghillie.evidence.models import ProjectEvidenceBundle
+    from ghillie.evidence.project_service import ProjectEvidenceBundleService
+
+
+def _comparable(bundle: ProjectEvidenceBundle) -> ProjectEvidenceBundle:
+    """Blank the timestamp and order dependencies so bundles can be compared."""
+    return msgspec.structs.replace(
+        bundle,
+        generated_at=None,
+        dependencies=tuple(
+            sorted(
+                bundle.dependencies,
+                key=lambda d: (d.from_component, d.to_component, d.relationship),
+            )
+        ),
+    )
+
+
+def _seed_reports(session_factory: async_sessionmaker[AsyncSession]) -> str:
+    """Create repository and project reports and return the estate ID."""
+    eid = get_estate_id(session_factory)
+    repo_ids = get_catalogue_repo_ids(session_factory)
+    create_silver_repo_and_report(
+        session_factory,
+        RepositoryParams(
+            owner="leynos",
+            name="wildside",
+            catalogue_repository_id=repo_ids["leynos/wildside"],
+            estate_id=eid,
+        ),
+        ReportSummaryParams(status="on_track", summary="Good progress."),
+    )
+    for month in (1, 2, 3):
+        create_project_report(
+            session_factory,
+            ProjectReportParams(
+                project_key="wildside",
+                project_name="Wildside",
+                estate_id=eid,
+                window_start=dt.datetime(2024, month, 1, tzinfo=dt.UTC),
+                window_end=dt.datetime(2024, month, 28, tzinfo=dt.UTC),
+                generated_at=dt.datetime(2024, month, 28, tzinfo=dt.UTC),
+                highlights=(f"Month {month}",),
+            ),
+        )
+    return eid
+
+
+@pytest.mark.usefixtures("_import_wildside")
+class TestProjectEvidenceEstate:
+    """Tests for building every project bundle in an estate at once."""
+
+    def test_estate_bundles_match_per_project_bundles(
+        self,
+        project_evidence_service: ProjectEvidenceBundleService,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        """Each estate bundle equals the bundle built for that project alone."""
+        eid = _seed_reports(session_factory)
+
+        bundles = asyncio.run(project_evidence_service.build_bundles_for_estate(eid))
+
+        keys = [bundle.project.key for bundle in bundles]
+        assert keys == sorted(keys), f"bundles should be ordered by key: {keys}"
+        assert "wildside" in keys, f"wildside missing from estate bundles: {keys}"
+        for bundle in bundles:
+            single = asyncio.run(
+                project_evidence_service.build_bundle(bundle.project.key, eid)
+            )
+            assert _comparable(bundle) == _comparable(single), (
+                f"estate bundle for {bundle.project.key!r} differs from build_bundle"
+            )
+
+    def test_estate_bundles_use_constant_queries(
+        self,
+        project_evidence_service: ProjectEvidenceBundleService,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        """Adding projects does not add queries to an estate rollup."""
+        eid = _seed_reports(session_factory)
+        statements: list[str] = []
+
+        def _record(*args: object) -> None:
+            statements.append(typ.cast("str", args[2]))
+
+        engine = session_factory.kw["bind"].sync_engine
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            bundles = asyncio.run(
+                project_evidence_service.build_bundles_for_estate(eid)
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+        assert len(bundles) > 1, "the example estate should have several projects"
+        # Projects, components, repositories, edges, Silver repositories,
+        # latest repository reports, and previous project reports.
+        assert len(statements) == 7, (
+            f"expected 7 queries, got {len(statements)}: {statements}"
+        )
@@ -0,0 +1,192 @@
+"""Unit tests for the dependency-tracked project rollup cache.
+
+Verifies that ``ProjectRollupCache`` reuses cached project bundles and
+estate overviews, marks only the projects that depend on a repository stale
+when it gets a new report, and rebuilds just those projects.
+
+Examples
+--------
+Run these tests::
+
+    pytest tests/unit/test_project_rollup_cache.py -q
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import typing as typ
+
+import pytest
+
+from ghillie.catalogue import CatalogueImporter
+from ghillie.evidence import ProjectEvidenceBundleService, ProjectRollupCache
+from tests.fixtures.specs import ReportSummaryParams, RepositoryParams
+from tests.unit.project_evidence_helpers import (
+    create_silver_repo_and_report,
+    get_catalogue_repo_ids,
+    get_estate_id,
+)
+
+if typ.TYPE_CHECKING:
+    from pathlib import Path
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from ghillie.evidence import ProjectEvidenceBundle
+
+
+class _RecordingService(ProjectEvidenceBundleService):
+    """Bundle service that records individual and whole-estate rebuilds."""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        super().__init__(session_factory, session_factory)
+        self.built: list[str] = []
+        self.estate_builds = 0
+
+    async def build_bundle(
+        self, project_key: str, estate_id: str
+    ) -> ProjectEvidenceBundle:
+        self.built.append(project_key)
+        return await super().build_bundle(project_key, estate_id)
+
+    async def build_bundles_for_estate(
+        self, estate_id: str
+    ) -> list[ProjectEvidenceBundle]:
+        self.estate_builds += 1
+        return await super().build_bundles_for_estate(estate_id)
+
+
+def _land_wildside_report(
+    session_factory: async_sessionmaker[AsyncSession], estate_id: str
+) -> str:
+    """Create a repository report for Wildside and return its catalogue ID."""
+    catalogue_id = get_catalogue_repo_ids(session_factory)["leynos/wildside"]
+    create_silver_repo_and_report(
+        session_factory,
+        RepositoryParams(
+            owner="leynos",
+            name="wildside",
+            catalogue_repository_id=catalogue_id,
+            estate_id=estate_id,
+        ),
+        ReportSummaryParams(status="on_track", summary="Good progress."),
+    )
+    return catalogue_id
+
+
+@pytest.mark.usefixtures("_import_wildside")
+class TestProjectRollupCache:
+    """Tests for cached project and estate rollups."""
+
+    def test_unchanged_estate_reuses_cached_overview(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        """An estate with no new reports is served from the cache."""
+        eid = get_estate_id(session_factory)
+        service = _RecordingService(session_factory)
+        cache = ProjectRollupCache(service)
+
+        first = asyncio.run(cache.estate_bundles(eid))
+        second = asyncio.run(cache.estate_bundles(eid))
+
+        assert second is first, "unchanged estate should reuse the overview"
+        assert service.built == [], f"no project should be rebuilt: {service.built}"
+        staleness = asyncio.run(cache.refresh_staleness(eid))
+        assert staleness.cached, "estate should be cached after a rollup"
+        assert not staleness.estate_stale, f"nothing should be stale: {staleness}"
+
+    def test_new_repository_report_rebuilds_only_dependent_project(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        """A landed repository report rebuilds just the projects using it."""
+        eid = get_estate_id(session_factory)
+        service = _RecordingService(session_factory)
+        cache = ProjectRollupCache(service)
+        before = {b.project.key: b for b in asyncio.run(cache.estate_bundles(eid))}
+
+        _land_wildside_report(session_factory, eid)
+        staleness = asyncio.run(cache.refresh_staleness(eid))
+        after = {b.project.key: b for b in asyncio.run(cache.estate_bundles(eid))}
+
+        assert staleness.stale_projects == {"wildside"}, (
+            f"only wildside should be stale: {staleness.stale_projects}"
+        )
+        assert service.built == ["wildside"], (
+            f"only wildside should be rebuilt: {service.built}"
+        )
+        core = next(c for c in after["wildside"].components if c.key == "wildside-core")
+        assert core.repository_summary is not None, (
+            "rebuilt wildside bundle should include the new report"
+        )
+        for key, bundle in before.items():
+            if key != "wildside":
+                assert after[key] is bundle, f"{key!r} should be served from cache"
+        assert not cache.staleness(eid).estate_stale, "rebuild should clear staleness"
+
+    def test_catalogue_edge_change_rebuilds_without_a_new_report(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        wildside_catalogue_path: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Re-importing a catalogue with a changed edge refreshes bundles."""
+        eid = get_estate_id(session_factory)
+        service = _RecordingService(session_factory)
+        cache = ProjectRollupCache(service)
+        before = {b.project.key: b for b in asyncio.run(cache.estate_bundles(eid))}
+        edge = (
+            "        emits_events_to:\n"
+            "          - component: wildside-mockup\n"
+            "            rationale: Mock UI consumes telemetry events.\n"
+        )
+        edited = tmp_path / "catalogue.yaml"
+        edited.write_text(
+            wildside_catalogue_path.read_text(encoding="utf-8").replace(edge, ""),
+            encoding="utf-8",
+        )
+        importer = CatalogueImporter(
+            session_factory, estate_key="demo", estate_name="Demo Estate"
+        )
+        asyncio.run(importer.import_path(edited, commit_sha="def456"))
+
+        staleness = asyncio.run(cache.refresh_staleness(eid))
+        after = {b.project.key: b for b in asyncio.run(cache.estate_bundles(eid))}
+
+        assert "wildside" in staleness.stale_projects, (
+            f"wildside should be stale: {staleness.stale_projects}"
+        )
+        relationships = [
+            {d.relationship for d in bundles["wildside"].dependencies}
+            for bundles in (before, after)
+        ]
+        assert "emits_events_to" in relationships[0], "edge should start cached"
+        assert "emits_events_to" not in relationships[1], (
+            "rebuilt wildside bundle should drop the removed edge"
+        )
+        assert service.built == [], (
+            f"a new catalogue should not rebuild projects one by one: {service.built}"
+        )
+        assert service.estate_builds == 2, "the estate should be rolled up again"
+        assert not cache.staleness(eid).estate_stale, "rollup should clear staleness"
+
+    def test_mark_repository_report_flags_dependants_without_queries(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        """Pushing a report marks dependent projects stale immediately."""
+        eid = get_estate_id(session_factory)
+        cache = ProjectRollupCache(_RecordingService(session_factory))
+        asyncio.run(cache.estate_bundles(eid))
+
+        catalogue_id = _land_wildside_report(session_factory, eid)
+        affected = cache.mark_repository_report(eid, catalogue_id)
+
+        assert affected == {"wildside"}, f"unexpected affected projects: {affected}"
+        staleness = cache.staleness(eid)
+        assert staleness.stale_projects == {"wildside"}, (
+            f"wildside should be stale: {staleness.stale_projects}"
+        )
+        assert staleness.estate_stale, "estate overview should be stale"
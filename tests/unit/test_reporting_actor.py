@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import dataclasses
 import datetime as dt
+import threading
 import typing as typ
 
+import dramatiq
 import pytest
 
 from ghillie.bronze import RawEventWriter
@@ -288,26 +291,22 @@ def _build_service_caches(
     *,
     session_factory: async_sessionmaker[AsyncSession] | None = None,
 ) -> typ.Generator[None]:
-    """Context manager that cleans up module-level engine and session caches.
+    """Context manager that cleans up the worker thread's session factory cache.
 
-    When *session_factory* is provided, pre-seeds the actor caches so that
+    When *session_factory* is provided, pre-seeds the thread's cache so that
     ``_build_service`` reuses the test database rather than creating a new
     in-memory one.
     """
-    from ghillie.reporting.actor import _ENGINE_CACHE, _SESSION_FACTORY_CACHE
+    from ghillie.reporting.actor import _thread_resources
 
+    resources = _thread_resources()
     if session_factory is not None:
-        _SESSION_FACTORY_CACHE[db_url] = session_factory
-        # The engine cache entry is not strictly needed when the session
-        # factory is already cached, but we populate it to keep the two
-        # caches consistent.
-        _ENGINE_CACHE[db_url] = session_factory.kw["bind"]
+        resources.session_factories[db_url] = session_factory
 
     try:
         yield
     finally:
-        _ENGINE_CACHE.pop(db_url, None)
-        _SESSION_FACTORY_CACHE.pop(db_url, None)
+        resources.session_factories.pop(db_url, None)
 
 
 # Synthetic URL used as the cache key in TestBuildServiceWiring tests.
@@ -415,3 +414,136 @@ class TestBuildServiceWiring:
         assert not sink_path.exists(), (
             "No report directory should be created when sink env var is unset"
         )
+
+
+class TestWorkerResources:
+    """Tests for the per-thread event loop and resource reuse."""
+
+    def test_messages_on_one_thread_share_loop_and_service(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Later messages reuse the loop and service; shutdown closes them."""
+        from ghillie.reporting.actor import (
+            _run_actor_async,
+            _WorkerResourcesMiddleware,
+        )
+
+        monkeypatch.setenv("GHILLIE_STATUS_MODEL_BACKEND", "mock")
+        monkeypatch.delenv("GHILLIE_REPORT_SINK_PATH", raising=False)
+        seen: list[tuple[asyncio.AbstractEventLoop, object]] = []
+
+        async def record(
+            service: object, _factory: object, _as_of: dt.datetime | None
+        ) -> None:
+            seen.append((asyncio.get_running_loop(), service))
+
+        def work() -> None:
+            for _ in range(2):
+                _run_actor_async("sqlite+aiosqlite:///:memory:", None, record)
+            _WorkerResourcesMiddleware().before_worker_thread_shutdown(
+                dramatiq.get_broker(), threading.current_thread()
+            )
+
+        worker = threading.Thread(target=work)
+        worker.start()
+        worker.join()
+
+        assert len(seen) == 2, "Both messages should run"
+        (first_loop, first_service), (second_loop, second_service) = seen
+        assert first_loop is second_loop, "Messages should share the thread's loop"
+        assert first_service is second_service, "The service should be reused"
+        assert first_loop.is_closed(), "Thread shutdown should close the loop"
+
+    def test_failed_message_does_not_leak_tasks_into_the_next(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Tasks left by a failing message are cancelled before the next runs."""
+        from ghillie.reporting.actor import (
+            _run_actor_async,
+            _WorkerResourcesMiddleware,
+        )
+
+        monkeypatch.setenv("GHILLIE_STATUS_MODEL_BACKEND", "mock")
+        monkeypatch.delenv("GHILLIE_REPORT_SINK_PATH", raising=False)
+        leftovers: list[asyncio.Task[object]] = []
+        pending_after_failure: list[int] = []
+
+        async def fail(
+            _service: object, _factory: object, _as_of: dt.datetime | None
+        ) -> None:
+            leftovers.append(asyncio.create_task(asyncio.Event().wait()))
+            msg = "message failed"
+            raise RuntimeError(msg)
+
+        async def count_tasks(
+            _service: object, _factory: object, _as_of: dt.datetime | None
+        ) -> None:
+            pending_after_failure.append(len(asyncio.all_tasks()) - 1)
+
+        def work() -> None:
+            with pytest.raises(RuntimeError, match="message failed"):
+                _run_actor_async("sqlite+aiosqlite:///:memory:", None, fail)
+            _run_actor_async("sqlite+aiosqlite:///:memory:", None, count_tasks)
+            _WorkerResourcesMiddleware().before_worker_thread_shutdown(
+                dramatiq.get_broker(), threading.current_thread()
+            )
+
+        worker = threading.Thread(target=work)
+        worker.start()
+        worker.join()
+
+        assert len(leftovers) == 1, "The failing message should run"
+        assert leftovers[0].cancelled(), "Its leftover task should be cancelled"
+        assert pending_after_failure == [0], (
+            "The next message should start without leftover tasks"
+        )
+
+
+class TestAsOfPinning:
+    """Tests for keeping a report job's window across Dramatiq retries."""
+
+    def test_retried_job_keeps_the_first_window(self) -> None:
+        """A job sent without as_of_iso is retried with its first window."""
+        from dramatiq.brokers.stub import StubBroker
+
+        from ghillie.reporting.actor import _PinAsOfMiddleware
+
+        broker = StubBroker()
+        broker.emit_after("process_boot")
+        broker.add_middleware(_PinAsOfMiddleware({"retried_report_job"}))
+        seen: list[str | None] = []
+
+        @dramatiq.actor(
+            broker=broker,
+            actor_name="retried_report_job",
+            max_retries=1,
+            min_backoff=1,
+            max_backoff=1,
+        )
+        def job(repository_id: str, *, as_of_iso: str | None = None) -> None:
+            seen.append(as_of_iso)
+            if len(seen) == 1:
+                msg = f"batch for {repository_id} still running"
+                raise RuntimeError(msg)
+
+        job.send("repo-1")
+        worker = dramatiq.Worker(broker, worker_timeout=100)
+        worker.start()
+        try:
+            broker.join(job.queue_name)
+            worker.join()
+        finally:
+            worker.stop()
+
+        assert len(seen) == 2, "The failed attempt should be retried"
+        assert seen[0] is not None, "The first delivery should pin as_of_iso"
+        assert seen[1] == seen[0], "The retry should reuse the pinned window"
+
+    def test_report_actors_are_pinned(self) -> None:
+        """Both report actors' broker pins their messages."""
+        from ghillie.reporting.actor import _PinAsOfMiddleware, generate_report_job
+
+        assert any(
+            isinstance(middleware, _PinAsOfMiddleware)
+            for middleware in generate_report_job.broker.middleware
+        )
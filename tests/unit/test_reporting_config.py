@@ -1,10 +1,13 @@
 """Unit tests for ReportingConfig."""
 
+import datetime as dt
 from pathlib import Path
 
 import pytest
 
+from ghillie.evidence import BundleLimits
 from ghillie.reporting.config import ReportingConfig
+from ghillie.status import RateLimitBudget
 
 
 class TestReportingConfig:
@@ -72,3 +75,66 @@ class TestReportingConfig:
         assert config.report_sink_path == expected_sink_path, (
             f"Expected sink_path={expected_sink_path}, got {config.report_sink_path}"
         )
+
+    def test_from_env_evidence_item_limit(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """GHILLIE_EVIDENCE_ITEM_LIMIT caps every bundle category."""
+        monkeypatch.setenv("GHILLIE_EVIDENCE_ITEM_LIMIT", "50")
+
+        config = ReportingConfig.from_env()
+
+        assert config.evidence_item_limit == 50
+        assert config.bundle_limits == BundleLimits.uniform(50)
+
+    def test_bundle_limits_default_to_unbounded(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without GHILLIE_EVIDENCE_ITEM_LIMIT bundles are not limited."""
+        monkeypatch.delenv("GHILLIE_EVIDENCE_ITEM_LIMIT", raising=False)
+
+        assert ReportingConfig.from_env().bundle_limits is None
+
+    @pytest.mark.parametrize(
+        ("raw_ttl", "expected_ttl"),
+        [
+            (None, dt.timedelta(hours=720)),
+            ("24", dt.timedelta(hours=24)),
+            ("0", None),
+        ],
+    )
+    def test_from_env_status_cache_ttl(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        raw_ttl: str | None,
+        expected_ttl: dt.timedelta | None,
+    ) -> None:
+        """GHILLIE_STATUS_CACHE_TTL_HOURS sets or disables the result cache."""
+        if raw_ttl is None:
+            monkeypatch.delenv("GHILLIE_STATUS_CACHE_TTL_HOURS", raising=False)
+        else:
+            monkeypatch.setenv("GHILLIE_STATUS_CACHE_TTL_HOURS", raw_ttl)
+
+        assert ReportingConfig.from_env().status_cache_ttl == expected_ttl
+
+    def test_from_env_status_model_rate_limits(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """GHILLIE_STATUS_MODEL_TPM and _RPM configure the shared budget."""
+        monkeypatch.setenv("GHILLIE_STATUS_MODEL_TPM", "90000")
+        monkeypatch.setenv("GHILLIE_STATUS_MODEL_RPM", "500")
+
+        budget = ReportingConfig.from_env().rate_limit_budget
+
+        assert budget == RateLimitBudget(
+            tokens_per_minute=90_000, requests_per_minute=500
+        )
+
+    def test_rate_limit_budget_defaults_to_unmetered(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without TPM or RPM settings the status model is not metered."""
+        monkeypatch.delenv("GHILLIE_STATUS_MODEL_TPM", raising=False)
+        monkeypatch.delenv("GHILLIE_STATUS_MODEL_RPM", raising=False)
+
+        assert ReportingConfig.from_env().rate_limit_budget is None
@@ -0,0 +1,74 @@
+"""Unit tests for the shared reporting service factory."""
+
+from __future__ import annotations
+
+import os
+import typing as typ
+from unittest import mock
+
+import pytest
+
+from ghillie.api.factory import build_reporting_service as build_api_service
+from ghillie.reporting.factory import build_reporting_service
+from ghillie.status.batch import OpenAIBatchStatusModel
+from ghillie.status.openai_client import OpenAIStatusModel
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from ghillie.reporting.service import ReportingService
+
+_BATCH_ENV = {
+    "GHILLIE_STATUS_MODEL_BACKEND": "openai-batch",
+    "GHILLIE_OPENAI_API_KEY": "test-key",
+    "GHILLIE_STATUS_MODEL_RPM": "60",
+    "GHILLIE_STATUS_CACHE_TTL_HOURS": "0",
+}
+
+
+@pytest.fixture
+def batch_env() -> cabc.Iterator[None]:
+    """Configure the batch backend with a request budget and no cache."""
+    with mock.patch.dict(os.environ, _BATCH_ENV, clear=True):
+        yield
+
+
+@pytest.mark.usefixtures("batch_env")
+class TestBatchBackendWiring:
+    """Tests for how the batch backend is wired into a reporting service."""
+
+    def test_worker_service_uses_batch_model_unmetered(self) -> None:
+        """Report jobs submit batches outside the synchronous budget."""
+        service = build_reporting_service(mock.MagicMock())
+
+        assert isinstance(service.status_model, OpenAIBatchStatusModel), (
+            "Expected the batch model without a rate limiter"
+        )
+        assert service._config.validation_max_attempts == 1, (
+            "Expected validation retries to be disabled for batches"
+        )
+
+    @pytest.mark.parametrize(
+        "build",
+        [
+            lambda factory: build_reporting_service(factory, interactive=True),
+            build_api_service,
+        ],
+        ids=["interactive", "api"],
+    )
+    def test_interactive_service_uses_synchronous_model(
+        self, build: cabc.Callable[[mock.MagicMock], ReportingService]
+    ) -> None:
+        """On-demand reports call the synchronous endpoint under the budget."""
+        service = build(mock.MagicMock())
+
+        status_model = service.status_model
+        assert type(status_model) is OpenAIStatusModel, (
+            "Expected the synchronous model in place of the batch model"
+        )
+        assert status_model.rate_limiter is not None, (
+            "Expected synchronous requests to be metered"
+        )
+        assert service._config.validation_max_attempts == 2, (
+            "Expected the configured validation retries"
+        )
@@ -236,6 +236,25 @@ class TestReportingMetricsCapture:
             "Expected mock model total token usage to persist as zero"
         )
 
+    @pytest.mark.asyncio
+    async def test_report_model_comes_from_invocation_metrics(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        """A model named in the metrics, such as a hedge winner, is recorded."""
+        report = await self._generate_test_report(
+            session_factory,
+            _StaticMetricsStatusModel(
+                metrics=ModelInvocationMetrics(
+                    hedge_winner="secondary", model_id="backup-model"
+                )
+            ),
+        )
+
+        assert report.model == "backup-model", (
+            "Expected the report to name the model that produced it"
+        )
+
     @pytest.mark.asyncio
     async def test_missing_metrics_attribute_persists_null_columns(
         self,
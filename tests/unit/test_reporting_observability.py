@@ -6,6 +6,7 @@ import pytest
 
 from ghillie.reporting.observability import ReportingEventLogger, ReportingEventType
 from ghillie.status.metrics import ModelInvocationMetrics
+from ghillie.status.resilience import CircuitState
 from tests.helpers.femtologging_capture import capture_femto_logs
 
 
@@ -48,6 +49,9 @@ class TestReportingEventLogger:
                     prompt_tokens=200,
                     completion_tokens=80,
                     total_tokens=280,
+                    estimated_prompt_tokens=190,
+                    hedged=True,
+                    hedge_winner="secondary",
                 ),
             )
             capture.wait_for_count(1)
@@ -58,6 +62,8 @@ class TestReportingEventLogger:
             assert "prompt_tokens=200" in record.message
             assert "completion_tokens=80" in record.message
             assert "total_tokens=280" in record.message
+            assert "estimated_prompt_tokens=190" in record.message
+            assert "hedge_winner=secondary" in record.message
 
     def test_log_report_failed_emits_error(
         self,
@@ -79,3 +85,27 @@ class TestReportingEventLogger:
             assert "error_type=RuntimeError" in record.message
             assert "boom" in record.message
             assert record.exc_info is not None
+
+    @pytest.mark.parametrize(
+        ("state", "level"),
+        [(CircuitState.OPEN, "ERROR"), (CircuitState.CLOSED, "INFO")],
+    )
+    def test_log_circuit_state_changed_levels(
+        self,
+        logger_instance: ReportingEventLogger,
+        state: CircuitState,
+        level: str,
+    ) -> None:
+        """Opening the breaker is an error; recovery is informational."""
+        with capture_femto_logs("ghillie.reporting.observability") as capture:
+            logger_instance.log_circuit_state_changed(
+                name="https://llm.example/v1/chat/completions",
+                state=state,
+                consecutive_failures=5,
+            )
+            capture.wait_for_count(1)
+            record = capture.records[0]
+            assert record.level == level
+            assert ReportingEventType.CIRCUIT_STATE_CHANGED in record.message
+            assert f"state={state}" in record.message
+            assert "consecutive_failures=5" in record.message
@@ -25,6 +25,7 @@ from ghillie.gold.storage import Report, ReportReview, ReviewState
 from ghillie.reporting.config import ReportingConfig
 from ghillie.reporting.errors import ReportValidationError
 from ghillie.reporting.service import ReportingService, ReportingServiceDependencies
+from ghillie.status.errors import StatusGenerationAbortedError
 from ghillie.status.models import RepositoryStatusResult
 from tests.unit.conftest import create_test_repository
 
@@ -149,6 +150,36 @@ class TestGenerateReportRetriesAfterValidationFailure:
             "Status model should be invoked once plus one retry"
         )
 
+    @pytest.mark.asyncio
+    async def test_aborted_stream_counts_as_failed_attempt(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        """An early-aborted generation is retried like a validation failure."""
+        repo_id = await create_test_repository(session_factory)
+        bundle = _make_bundle(repo_id)
+
+        status_model = mock.AsyncMock()
+        status_model.summarize_repository = mock.AsyncMock(
+            side_effect=[
+                StatusGenerationAbortedError("empty_summary", "Summary is empty."),
+                _valid_result(),
+            ]
+        )
+
+        service = _build_service(session_factory, status_model, max_attempts=2)
+
+        report = await service.generate_report(
+            repository_id=repo_id,
+            window_start=bundle.window_start,
+            window_end=bundle.window_end,
+            bundle=bundle,
+        )
+
+        assert report.human_text == "acme/widget is on track with 3 events.", (
+            "Persisted report should use the attempt after the abort"
+        )
+
 
 class TestMarksForHumanReviewAfterExhaustedRetries:
     """Exhausted retries persist a review marker and raise."""
@@ -7,6 +7,7 @@ import typing as typ
 
 import pytest
 
+from ghillie.gold import Report
 from tests.helpers.event_builders import commit_envelope
 from tests.unit.conftest import create_test_repository, get_repo_id
 
@@ -65,3 +66,60 @@ class TestReportingServiceRunForRepository:
         # May return None or a report with empty bundle - implementation choice
         # For now, expect None when there are no events
         assert result is None, "Should return None when no events in window"
+
+
+class TestReportingServiceRunForRepositories:
+    """Tests for the batched run_for_repositories workflow."""
+
+    @pytest.mark.asyncio
+    async def test_reports_active_and_skips_empty_repositories(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        reporting_service: ReportingService,
+        writer: RawEventWriter,
+        transformer: RawEventTransformer,
+    ) -> None:
+        """Outcomes follow request order with None for empty windows."""
+        now = dt.datetime(2024, 7, 14, tzinfo=dt.UTC)
+        commit_time = dt.datetime(2024, 7, 10, 10, 0, tzinfo=dt.UTC)
+        await writer.ingest(
+            commit_envelope("acme/widget", "mno345", commit_time, "feat: batch")
+        )
+        await transformer.process_pending()
+        active_id = await get_repo_id(session_factory)
+        empty_id = await create_test_repository(session_factory, name="gadget")
+
+        outcomes = await reporting_service.run_for_repositories(
+            [empty_id, active_id], as_of=now, max_concurrency=2
+        )
+
+        assert outcomes[0] is None, "Empty window should produce no report"
+        report = outcomes[1]
+        assert isinstance(report, Report), "Active repository should be reported"
+        assert report.repository_id == active_id
+        assert report.window_end == now
+
+    @pytest.mark.asyncio
+    async def test_window_errors_are_returned_per_repository(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        reporting_service: ReportingService,
+        writer: RawEventWriter,
+        transformer: RawEventTransformer,
+    ) -> None:
+        """A repository whose last report postdates as_of yields its error."""
+        commit_time = dt.datetime(2024, 7, 10, 10, 0, tzinfo=dt.UTC)
+        await writer.ingest(
+            commit_envelope("acme/widget", "pqr678", commit_time, "feat: late")
+        )
+        await transformer.process_pending()
+        repo_id = await get_repo_id(session_factory)
+        await reporting_service.run_for_repository(
+            repo_id, as_of=dt.datetime(2024, 7, 14, tzinfo=dt.UTC)
+        )
+
+        outcomes = await reporting_service.run_for_repositories(
+            [repo_id], as_of=dt.datetime(2024, 7, 12, tzinfo=dt.UTC)
+        )
+
+        assert isinstance(outcomes[0], ValueError)
@@ -1,7 +1,8 @@
 """Unit tests for report validation rules.
 
 Tests the ``validate_repository_report`` function that checks generated
-reports for basic correctness before persistence.
+reports for basic correctness before persistence, and the
+``check_partial_report`` hook that applies the same rules to streams.
 """
 
 import datetime as dt
@@ -14,8 +15,12 @@ from ghillie.evidence.models import (
     RepositoryEvidenceBundle,
     RepositoryMetadata,
 )
-from ghillie.reporting.validation import validate_repository_report
+from ghillie.reporting.validation import (
+    check_partial_report,
+    validate_repository_report,
+)
 from ghillie.status.models import RepositoryStatusResult
+from ghillie.status.streaming import PartialStatusReport
 
 
 def _make_bundle(*, commit_count: int = 3) -> RepositoryEvidenceBundle:
@@ -191,3 +196,28 @@ class TestValidationResultStructure:
             "First issue should report empty_summary for empty summaries"
         )
         assert issue.message, "Issue message should be non-empty"
+
+
+class TestChecksPartialStreamedReports:
+    """check_partial_report applies summary rules before generation ends."""
+
+    @pytest.mark.parametrize(
+        ("summary", "expected_code"),
+        [
+            (None, None),
+            ("acme/widget is on track.", None),
+            ("  ", "empty_summary"),
+            ("acme/widget is...", "truncated_summary"),
+        ],
+        ids=["summary_open", "valid", "empty", "truncated"],
+    )
+    def test_flags_only_closed_failing_summaries(
+        self, summary: str | None, expected_code: str | None
+    ) -> None:
+        """Only a completed summary that breaks a rule aborts generation."""
+        issue = check_partial_report(PartialStatusReport(length=40, summary=summary))
+
+        code = None if issue is None else issue.code
+        assert code == expected_code, (
+            f"Expected {expected_code!r} for summary {summary!r}, got {code!r}"
+        )